@@ -94,51 +94,36 @@ def predict_ai_recommend(articles):
         print(traceback.format_exc())
         return []
 
-def update_notion_ai_recommend_all():
-    """Notion DB의 모든 기사에 대해 AI추천 예측 및 컬럼 업데이트"""
+def update_notion_ai_recommend_all(notion_client: NotionClient = None):
+    """Notion DB의 모든 기사에 대해 AI추천 예측 및 컬럼 업데이트
+    
+    Args:
+        notion_client: NotionClient 인스턴스. None이면 새로 생성 (주간 DB ID는 공용 레지스트리에서 조회)
+    """
     try:
-        notion = NotionClient()
+        notion = notion_client or NotionClient()
         dbid = notion.get_weekly_database_id()
         
-        # 1. 모든 기사 추출
-        results = []
-        query = notion.client.databases.query(database_id=dbid, page_size=100)
-        results.extend(query.get('results', []))
-        while query.get('has_more'):
-            query = notion.client.databases.query(
-                database_id=dbid,
-                start_cursor=query['next_cursor'],
-                page_size=100
-            )
-            results.extend(query.get('results', []))
-        
-        # 2. 기사 정보 추출
-        articles = []
-        for page in results:
-            props = page['properties']
-            def safe_get_text(prop, key):
-                arr = prop.get(key, {}).get('title' if key == '제목' else 'rich_text', [])
-                return arr[0].get('plain_text', '') if arr and 'plain_text' in arr[0] else ''
-            
-            articles.append({
-                'page_id': page['id'],
-                'title': safe_get_text(props, '제목'),
-                'summary': safe_get_text(props, '한줄요약'),
-                'content': safe_get_text(props, '핵심 내용')
-            })
+        # 1. 모든 기사 추출 (로컬 미러 조회, 변경분만 Notion에서 갱신)
+        articles = [{
+            'page_id': article['page_id'],
+            'title': article['title'],
+            'summary': article['summary'],
+            'content': article['key_points'],
+            'ai_recommend': article['ai_recommend']
+        } for article in notion.get_all_articles_from_database(dbid)]
+        current = {article['page_id']: article['ai_recommend'] for article in articles}
         
         # 3. AI 추천 예측
         results = predict_ai_recommend(articles)
         
-        # 4. Notion에 업데이트
-        for r in results:
+        # 4. Notion에 업데이트 (추천 값이 바뀐 기사만, 요청 실행기로 동시에)
+        changed = [r for r in results if current.get(r['page_id']) != r['ai_recommend']]
+        for r in changed:
             print(f"[AI추천 업데이트] page_id={r['page_id']} title={r['title']} ai_recommend={r['ai_recommend']}")
-            try:
-                notion.update_ai_recommendation(r['page_id'], r['ai_recommend'])
-            except Exception as e:
-                print(f"[ERROR] page_id={r['page_id']} title={r['title']} 예외: {e}")
+        updated = notion.update_ai_recommendations({r['page_id']: r['ai_recommend'] for r in changed})
         
-        print(f"총 {len(results)}건의 AI추천 결과를 Notion에 반영 완료.")
+        print(f"총 {len(results)}건 중 {updated}건의 AI추천 결과를 Notion에 반영 완료.")
         
     except Exception as e:
         print(f"AI 추천 업데이트 중 오류 발생: {str(e)}")
@@ -149,7 +134,7 @@ if __name__ == '__main__':
     try:
         notion = NotionClient()
         fit_and_save_model(notion)
-        update_notion_ai_recommend_all()
+        update_notion_ai_recommend_all(notion)
     except Exception as e:
         import traceback
         print(f"[FATAL ERROR] {e}")
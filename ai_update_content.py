@@ -7,6 +7,8 @@ import requests
 import os
 from dotenv import load_dotenv
 from googletrans import Translator # googletrans-py 임포트
+from crawlers.rate_limiter import get_shared_rate_limiter
+from config.config import RATE_LIMIT_LLM_TARGET_LATENCY
 
 # .env 파일에서 환경변수 로드
 load_dotenv()
@@ -16,6 +18,25 @@ OLLAMA_API_URL = os.getenv('OLLAMA_API_URL', 'http://localhost:11434/v1/chat/com
 # 사용할 Ollama 모델 설정
 OLLAMA_MODEL = os.getenv('OLLAMA_MODEL', 'gemma2:9b-instruct-q5_K_M') # 기본 모델을 Gemma2 9B로 설정
 
+# Ollama 호출도 크롤러와 같은 호스트별 속도 제한기/서킷 브레이커 사용 (LLM은 응답이 느리므로 목표 지연시간 별도)
+get_shared_rate_limiter().configure_host(OLLAMA_API_URL, target_latency=RATE_LIMIT_LLM_TARGET_LATENCY)
+
+
+def _post_ollama(messages: list, timeout: float = 60) -> requests.Response:
+    """Ollama chat API 호출 (속도 제한 + 서킷 차단 시 CircuitOpenError)"""
+    with get_shared_rate_limiter().slot(OLLAMA_API_URL) as slot:
+        response = requests.post(
+            OLLAMA_API_URL,
+            json={
+                "model": OLLAMA_MODEL,
+                "messages": messages,
+                "stream": False
+            },
+            timeout=timeout
+        )
+        slot.observe(response)
+    return response
+
 # googletrans-py Translator 객체 초기화
 translator = Translator()
 
@@ -82,16 +103,11 @@ Article: {content[:800]}
 Korean summary (one sentence, 100-200 characters):"""
 
         print(f"[LLM:Summary] Generating Korean summary directly...")
-        response = requests.post(
-            OLLAMA_API_URL,
-            json={
-                "model": OLLAMA_MODEL,
-                "messages": [
-                    {"role": "system", "content": "당신은 한국의 전력산업 전문 기자입니다. 모든 답변은 반드시 한국어로만 작성하세요. 영어는 전문용어(ESS, VPP 등)만 허용됩니다."},
-                    {"role": "user", "content": korean_prompt}
-                ],
-                "stream": False
-            },
+        response = _post_ollama(
+            [
+                {"role": "system", "content": "당신은 한국의 전력산업 전문 기자입니다. 모든 답변은 반드시 한국어로만 작성하세요. 영어는 전문용어(ESS, VPP 등)만 허용됩니다."},
+                {"role": "user", "content": korean_prompt}
+            ],
             timeout=60
         )
 
@@ -165,16 +181,11 @@ def generate_key_content(content: str, use_llm: bool = True) -> str:
 핵심 내용:"""
 
         print(f"[LLM:KeyContent] Generating Korean key points directly...")
-        response = requests.post(
-            OLLAMA_API_URL,
-            json={
-                "model": OLLAMA_MODEL,
-                "messages": [
-                    {"role": "system", "content": "당신은 한국의 전력산업 전문가입니다. 기술적 내용을 일반인도 이해할 수 있도록 쉽게 설명하되, 정확성을 유지하세요. 모든 답변은 한국어로 작성하세요."},
-                    {"role": "user", "content": korean_prompt}
-                ],
-                "stream": False
-            },
+        response = _post_ollama(
+            [
+                {"role": "system", "content": "당신은 한국의 전력산업 전문가입니다. 기술적 내용을 일반인도 이해할 수 있도록 쉽게 설명하되, 정확성을 유지하세요. 모든 답변은 한국어로 작성하세요."},
+                {"role": "user", "content": korean_prompt}
+            ],
             timeout=60
         )
 
@@ -314,6 +325,8 @@ def main():
         # 스크립트 실행 중 전체 오류 발생 시 (DB 연결 등 초기 단계 오류)
         print(f"스크립트 실행 중 전체 오류 발생: {e}")
         print(traceback.format_exc())
+    finally:
+        crawler.close()
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
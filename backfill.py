@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📦 과거 기사 백필 실행 스크립트
+- 목록 페이지 구간을 샤드로 나눠 여러 프로세스에서 동시에 크롤링 (crawlers.backfill)
+- 수집 기간은 --days로 지정 (소스 코드 수정 불필요)
+- 병합된 기사는 중복 제거 후 이번 주 Notion 데이터베이스에 기록
+
+사용 예:
+    python backfill.py --days 90 --pages 1-60
+    python backfill.py --days 30 --sources 한국전력거래소 --workers 2 --dry-run
+"""
+
+import sys
+import argparse
+from dotenv import load_dotenv
+
+from config.config import BACKFILL_WORKERS, BACKFILL_SHARD_SIZE, BACKFILL_MAX_PAGES, ENABLED_SOURCES
+from crawlers.telemetry import export_metrics
+
+
+def parse_page_range(value: str):
+    """'1-60' 또는 '60' (1~60) 형식의 페이지 구간"""
+    try:
+        if '-' in value:
+            first, last = (int(part) for part in value.split('-', 1))
+        else:
+            first, last = 1, int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"페이지 구간 형식 오류: {value} (예: 1-60)")
+    if first < 1 or last < first:
+        raise argparse.ArgumentTypeError(f"잘못된 페이지 구간: {value}")
+    return first, last
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='과거 기사 백필 (프로세스 병렬 샤드 크롤링)')
+    parser.add_argument('--days', type=int, required=True,
+                        help='최근 N일 이내 기사까지 수집')
+    parser.add_argument('--pages', type=parse_page_range, default=(1, BACKFILL_MAX_PAGES),
+                        help=f'탐색할 목록 페이지 구간 (기본: 1-{BACKFILL_MAX_PAGES}, 기간 끝에 닿으면 조기 종료)')
+    parser.add_argument('--sources', nargs='+', default=ENABLED_SOURCES,
+                        help='백필할 소스 (기본: ENABLED_SOURCES)')
+    parser.add_argument('--workers', type=int, default=BACKFILL_WORKERS,
+                        help=f'프로세스 수 (기본: {BACKFILL_WORKERS})')
+    parser.add_argument('--shard-size', type=int, default=BACKFILL_SHARD_SIZE,
+                        help=f'샤드당 목록 페이지 수 (기본: {BACKFILL_SHARD_SIZE})')
+    parser.add_argument('--resync', action='store_true',
+                        help='URL 이력에 이미 있는 기사도 다시 Notion에 기록')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='크롤링/병합 결과만 출력하고 Notion에는 기록하지 않음')
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    load_dotenv()
+
+    from crawlers.backfill import BackfillCoordinator
+
+    notion, database_id = None, None
+    if not args.dry_run:
+        from notion.notion_client import NotionClient
+
+        notion = NotionClient()
+        database_id = notion.get_weekly_database_id()
+        if not database_id:
+            print("❌ Notion 데이터베이스 ID를 가져올 수 없습니다")
+            return 1
+
+    coordinator = BackfillCoordinator(
+        notion, database_id,
+        sources=args.sources,
+        window_days=args.days,
+        workers=args.workers,
+        shard_size=args.shard_size,
+        resync=args.resync,
+        dry_run=args.dry_run,
+    )
+    try:
+        stats = coordinator.run(*args.pages)
+    finally:
+        export_metrics()
+    print(f"🎉 백필 완료: 병합 {len(coordinator.articles)}건, Notion 기록 {stats['synced']}건")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📊 크롤링 기사 메모리 벤치마크 (합성 크롤링)
+- 목록 → 상세 → 키워드 필터를 거친 기사 N건(기본 1만 건)을 메모리에 보관할 때의 사용량 비교
+- 기존 방식: 기사 딕셔너리 + 상세 단계에서 {**목록, **상세} 새 딕셔너리 + 기사별 키워드 리스트
+- 개선 방식: card_news.types.CrawledArticle (__slots__ 레코드, 제자리 갱신, 공유 키워드 튜플)
+- tracemalloc으로 보관 중인 메모리(current)와 최대 사용량(peak) 측정
+
+사용법:
+    python benchmark_article_memory.py [--articles 10000] [--body-chars 1500]
+"""
+
+import argparse
+import random
+import tracemalloc
+from datetime import datetime, timedelta
+
+from card_news.types import CrawledArticle
+
+KEYWORDS = ['ESS', 'VPP', '재생에너지', '출력제어', '전력시장', '분산에너지', '수소', 'PPA', '계통', '태양광']
+SOURCES = ['전기신문', '한국전력거래소', '산업통상자원부']
+
+
+def _synthetic_crawl(count: int, body_chars: int, seed: int = 42):
+    """(목록 항목, 상세 내용, 매칭 키워드) 생성기 — 본문/제목 문자열은 두 방식이 같은 객체를 사용"""
+    rng = random.Random(seed)
+    now = datetime.now()
+    body = '전력 계통 안정화와 재생에너지 확대에 관한 기사 본문입니다. ' * (body_chars // 33 + 1)
+    for i in range(count):
+        listing = {
+            'title': f"[{i}] 합성 기사 제목 {rng.randint(0, 10 ** 6)}",
+            'url': f"https://www.electimes.com/news/articleView.html?idxno={100000 + i}",
+            'published_date': now - timedelta(minutes=i),
+            'source': SOURCES[i % len(SOURCES)],
+        }
+        details = {
+            'content': body[:body_chars - 8] + f"{i:08d}",  # 기사마다 다른 본문
+            'attachments': [],
+            'published_date': listing['published_date'],
+        }
+        # 키워드 매처는 기사마다 새 리스트를 반환 (조합은 소수)
+        keywords = [KEYWORDS[(i + k) % len(KEYWORDS)] for k in range(i % 3 + 1)]
+        yield listing, details, keywords
+
+
+def crawl_with_dicts(count: int, body_chars: int):
+    """기존 방식: 딕셔너리 목록 항목 → {**목록, **상세} → 키워드 리스트"""
+    summaries, articles = [], []
+    for listing, details, keywords in _synthetic_crawl(count, body_chars):
+        summary = {**listing, 'content': '', 'keywords': [], 'ai_recommend': False}
+        summaries.append(summary)  # 기존 crawl()은 상세 수집이 끝날 때까지 목록 항목도 보관
+        article = {**summary, **details}
+        article['keywords'] = list(keywords)
+        articles.append(article)
+    return articles
+
+
+def crawl_with_records(count: int, body_chars: int):
+    """개선 방식: CrawledArticle 레코드 제자리 갱신 + 공유 키워드 튜플"""
+    summaries = []
+    for listing, details, keywords in _synthetic_crawl(count, body_chars):
+        article = CrawledArticle.from_listing(listing['title'], listing['url'],
+                                              listing['published_date'], listing['source'])
+        article.update(details)
+        article['keywords'] = keywords
+        summaries.append(article)  # 목록 항목과 최종 기사가 같은 객체
+    return summaries
+
+
+def _measure(crawl_func, count: int, body_chars: int):
+    tracemalloc.start()
+    articles = crawl_func(count, body_chars)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(articles) == count
+    del articles
+    return current, peak
+
+
+def run(count: int, body_chars: int):
+    print(f"📊 기사 메모리 벤치마크 (합성 기사 {count:,}건, 본문 {body_chars:,}자)")
+    results = {}
+    for label, crawl_func in (('기존 딕셔너리', crawl_with_dicts), ('CrawledArticle', crawl_with_records)):
+        results[label] = _measure(crawl_func, count, body_chars)
+
+    # 본문 문자열은 두 방식 공통이므로 본문을 뺀 기사당 오버헤드도 함께 출력
+    body_size, _ = _measure(lambda n, chars: [details['content'] for _, details, _ in _synthetic_crawl(n, chars)],
+                            count, body_chars)
+    before, after = results['기존 딕셔너리'], results['CrawledArticle']
+    for label, (current, peak) in results.items():
+        overhead = (current - body_size) / count
+        print(f"  - {label:<14}: 보관 {current / 2 ** 20:8.2f} MiB | 최대 {peak / 2 ** 20:8.2f} MiB | "
+              f"본문 제외 기사당 {overhead:7.0f} B")
+    print(f"  → 보관 메모리 {1 - after[0] / before[0]:.1%} 감소 "
+          f"(본문 제외 {1 - (after[0] - body_size) / (before[0] - body_size):.1%} 감소)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="크롤링 기사 메모리 벤치마크")
+    parser.add_argument('--articles', type=int, default=10000, help='합성 기사 수')
+    parser.add_argument('--body-chars', type=int, default=1500, help='기사당 본문 글자 수')
+    args = parser.parse_args()
+    run(args.articles, args.body_chars)
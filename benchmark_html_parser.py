@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📊 HTML 파서 마이크로 벤치마크
+- 크롤러가 저장한 debug_article_*.html(.gz) (기사 상세) 파일 대상
+  (DEBUG_HTML_DUMP=true 로 크롤링하면 logs/debug_html 에 저장됨)
+- 기존 방식: html.parser 전체 트리
+- 개선 방식: crawlers.html_parser (lxml 우선 + SoupStrainer)
+- 페이지당 평균 파싱 시간 비교
+
+사용법:
+    python benchmark_html_parser.py [--repeat 20] [--dir logs/debug_html]
+"""
+
+import argparse
+import glob
+import gzip
+import os
+import time
+
+from bs4 import BeautifulSoup
+
+from crawlers.html_parser import (
+    parse_html, DEFAULT_PARSER, ARTICLE_BODY_STRAINER
+)
+
+
+def _time_per_page(files, parse_func, repeat):
+    """파일 목록을 repeat회 파싱하여 페이지당 평균 시간(ms) 반환"""
+    contents = []
+    for path in files:
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rt', encoding='utf-8', errors='ignore') as f:
+            contents.append(f.read())
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for html_content in contents:
+            parse_func(html_content)
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeat * len(contents)) * 1000
+
+
+def run(directory: str, repeat: int):
+    files = sorted(glob.glob(os.path.join(directory, 'debug_article_*.html')) +
+                   glob.glob(os.path.join(directory, 'debug_article_*.html.gz')))
+    if not files:
+        print("❌ 벤치마크 대상 파일 없음 (DEBUG_HTML_DUMP=true 크롤링으로 생성되는 debug_article_*.html.gz 필요)")
+        return
+
+    print(f"📊 HTML 파서 벤치마크 ({len(files)}개 파일, 반복: {repeat}회)")
+    before = _time_per_page(files, lambda html: BeautifulSoup(html, 'html.parser'), repeat)
+    after = _time_per_page(files, lambda html: parse_html(html, parse_only=ARTICLE_BODY_STRAINER), repeat)
+    speedup = before / after if after else float('inf')
+    print(f"  - 기존 html.parser 전체 트리      : {before:8.2f} ms/page")
+    print(f"  - {DEFAULT_PARSER} + SoupStrainer (본문) : {after:8.2f} ms/page  (x{speedup:.1f})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTML 파서 마이크로 벤치마크")
+    parser.add_argument('--repeat', type=int, default=20, help='파일당 반복 파싱 횟수')
+    parser.add_argument('--dir', default='logs/debug_html', help='debug_article_*.html(.gz) 파일이 있는 디렉토리')
+    args = parser.parse_args()
+    run(args.dir, args.repeat)
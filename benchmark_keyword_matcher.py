@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📊 키워드 매칭 벤치마크
+- 기존 방식: 호출부마다 키워드 하나씩 `keyword in text` (크롤러 / NewsProcessor / SectionSelector 각각)
+- 개선 방식: 공용 키워드 매처로 기사당 한 번 훑고 모든 호출부가 결과 공유
+- 기사 본문 길이별(기본 3천 / 2만 / 10만 자) 기사당 평균 시간 비교
+
+사용법:
+    python benchmark_keyword_matcher.py [--repeat 20] [--lengths 3000 20000 100000]
+"""
+
+import argparse
+import random
+import time
+
+from config.config import KEYWORDS
+from card_news.section_config import SectionConfig
+from processors.keyword_matcher import AHOCORASICK_AVAILABLE, get_keyword_matcher, register_keyword_group
+
+# 전기신문 크롤러 키워드 (crawlers.electimes_crawler.ElectimesCrawler.KEYWORDS와 동일)
+CRAWLER_KEYWORDS = [
+    '재생에너지', '전력중개사업', 'VPP', '전력시장', 'ESS',
+    '출력제어', '중앙계약', '저탄소 용량',
+    '재생에너지입찰', '보조서비스',
+    '예비력시장', '하향예비력', '계통포화',
+    '전력망', '기후에너지부', '태양광', '전력감독원'
+]
+
+SAMPLE_SENTENCES = [
+    "정부는 올해 재생에너지 입찰 제도를 개편하고 전력시장 가격 신호를 강화하기로 했다.",
+    "업계는 출력제어 증가와 계통포화 문제를 우려하며 ESS 확대와 보조서비스 시장 개설을 요구했다.",
+    "한편 해상풍력 사업자들은 전력망 접속 지연으로 어려움을 겪고 있다.",
+    "이날 행사에는 관계자 200여 명이 참석해 자리를 빛냈다.",
+    "회사 측은 앞으로도 지역 주민과의 소통을 이어가겠다고 밝혔다.",
+    "The company reported business growth of 12% with 300 MW of new capacity.",
+    "자세한 내용은 홈페이지에서 확인할 수 있다.",
+]
+
+
+def build_article(length: int) -> dict:
+    random.seed(length)
+    sentences = []
+    size = 0
+    while size < length:
+        sentence = random.choice(SAMPLE_SENTENCES)
+        sentences.append(sentence)
+        size += len(sentence) + 1
+    return {
+        'title': '재생에너지 입찰 제도 개편, 전력시장 변화 예고',
+        'content': ' '.join(sentences)[:length],
+        'keywords': ['재생에너지', '전력시장'],
+    }
+
+
+def legacy_scan(article: dict):
+    """기존 호출부 방식: 키워드마다 전체 텍스트를 다시 훑음"""
+    title_and_content = f"{article['title']} {article['content']}"
+    # ElectimesCrawler.contains_keywords_and_extract
+    crawler_hits = [keyword for keyword in CRAWLER_KEYWORDS if keyword in title_and_content]
+    # NewsProcessor.extract_keywords
+    processor_hits = [keyword for keyword in KEYWORDS if keyword in title_and_content]
+    # SectionSelector.analyze_article (트리거마다 lower() 반복)
+    text_lower = f"{title_and_content} {' '.join(article['keywords'])}".lower()
+    section_hits = {}
+    for section_id, section in SectionConfig.ALL_SECTIONS.items():
+        section_hits[section_id] = [
+            trigger for trigger in section.get('trigger_words', [])
+            if trigger.lower() in text_lower
+        ]
+        # 트리거마다 제목 가중치 확인
+        section_hits[section_id] = [
+            (trigger, trigger.lower() in article['title'].lower()) for trigger in section_hits[section_id]
+        ]
+    return crawler_hits, processor_hits, section_hits
+
+
+def matcher_scan(article: dict):
+    """공용 매처 방식: 기사당 한 번 훑고 결과 공유"""
+    matcher = get_keyword_matcher()
+    hits = matcher.scan_article(article)
+    by_group = matcher.keywords_by_group(hits)
+    in_title = {(hit.group, hit.keyword) for hit in hits if hit.field == 'title'}
+    crawler_hits = by_group.get('electimes', [])
+    processor_hits = by_group.get('config', [])
+    section_hits = {
+        group: [(trigger, (group, trigger) in in_title) for trigger in triggers]
+        for group, triggers in by_group.items() if group.startswith('section:')
+    }
+    return crawler_hits, processor_hits, section_hits
+
+
+def run(lengths, repeat):
+    register_keyword_group('electimes', CRAWLER_KEYWORDS)
+    matcher = get_keyword_matcher()  # 컴파일은 1회 (측정에서 제외)
+    backend = 'pyahocorasick' if AHOCORASICK_AVAILABLE else '정규식 대체 경로'
+    print(f"📊 키워드 매칭 벤치마크 (그룹 {len(matcher.groups())}개, 엔진: {backend}, 반복: {repeat}회)")
+
+    for length in lengths:
+        article = build_article(length)
+        timings = {}
+        for name, func in (('기존 in 반복', legacy_scan), ('공용 매처 1회', matcher_scan)):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                result = func(article)
+            timings[name] = (time.perf_counter() - start) / repeat * 1000
+        hits = len(matcher.scan_article(article))
+        print(f"  - 본문 {length:,}자 (매칭 위치 {hits:,}개)")
+        for name, elapsed in timings.items():
+            print(f"      {name:<16}: {elapsed:8.2f} ms/article")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="키워드 매칭 벤치마크")
+    parser.add_argument('--repeat', type=int, default=20, help='기사당 반복 횟수')
+    parser.add_argument('--lengths', type=int, nargs='+', default=[3000, 20000, 100000], help='본문 길이(자)')
+    args = parser.parse_args()
+    run(args.lengths, args.repeat)
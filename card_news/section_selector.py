@@ -10,6 +10,7 @@ from collections import Counter
 from datetime import datetime
 
 from .section_config import SectionConfig
+from processors.keyword_matcher import get_keyword_matcher
 
 class SectionSelector:
     """기사 내용에 따라 적절한 섹션을 선택하는 클래스"""
@@ -30,27 +31,29 @@ class SectionSelector:
         """
         scores = {}
         
-        # 분석할 텍스트 준비
-        text_to_analyze = f"{article.get('title', '')} {article.get('content', '')} {' '.join(article.get('keywords', []))}"
-        text_lower = text_to_analyze.lower()
+        # 제목/본문/키워드를 공용 키워드 매처로 한 번씩만 훑어 섹션 트리거 위치 수집
+        hits = get_keyword_matcher().scan_article(article)
+        matched = {(hit.group, hit.keyword) for hit in hits}
+        in_title = {(hit.group, hit.keyword) for hit in hits if hit.field == 'title'}
+        article_keywords = set(article.get('keywords', []))
         
         # 각 섹션별 점수 계산
         for section_id, section_info in self.config.SECTIONS.items():
             score = 0
+            group = f"section:{section_id}"
             trigger_words = section_info.get('trigger_words', [])
             
             # 트리거 단어 매칭
             for trigger in trigger_words:
-                # 정확한 단어 매칭 (부분 문자열이 아닌 전체 단어)
-                if trigger.lower() in text_lower:
+                if (group, trigger) in matched:
                     # 제목에 있으면 가중치 높임
-                    if trigger.lower() in article.get('title', '').lower():
+                    if (group, trigger) in in_title:
                         score += 3
                     else:
                         score += 1
                     
                     # 키워드에 있으면 추가 점수
-                    if trigger in article.get('keywords', []):
+                    if trigger in article_keywords:
                         score += 2
             
             # 특수 케이스 처리
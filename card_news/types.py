@@ -4,8 +4,10 @@
 목적: 시스템 전반의 타입 일관성 보장
 """
 
-from typing import Union, List, Tuple, Dict, Any, Optional
-from dataclasses import dataclass, field
+import sys
+import threading
+from typing import Union, List, Tuple, Dict, Any, Iterator, Optional, Sequence
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 
 # 기본 타입 정의
@@ -64,9 +66,9 @@ class Section:
             'metadata': self.metadata
         }
 
-@dataclass
+@dataclass(slots=True)
 class Article:
-    """기사 데이터 표준 모델"""
+    """기사 데이터 표준 모델 (__slots__: 인스턴스별 __dict__ 없음)"""
     id: str
     title: str
     content: str
@@ -93,6 +95,128 @@ class Article:
                                   '한줄요약', '키워드', '바로가기', '날짜']}
         )
 
+# 크롤링 기사 키워드 목록 공유 캐시 (같은 키워드 조합은 같은 튜플 객체 하나만 보관)
+_keyword_cache: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+_keyword_cache_lock = threading.Lock()
+
+
+def intern_keywords(keywords: Optional[Sequence[str]]) -> Tuple[str, ...]:
+    """키워드 목록 → 공유 튜플 (문자열도 sys.intern으로 공유)"""
+    key = tuple(keywords or ())
+    shared = _keyword_cache.get(key)
+    if shared is None:
+        with _keyword_cache_lock:
+            shared = _keyword_cache.setdefault(key, tuple(sys.intern(str(keyword)) for keyword in key))
+    return shared
+
+
+@dataclass(slots=True)
+class CrawledArticle(Article):
+    """
+    📦 크롤링 / 동기화 파이프라인용 기사 레코드 (Article 확장)
+
+    **특징**:
+    - __slots__ 레코드라 기사마다 dict 해시 테이블을 두지 않음
+    - 기존 기사 딕셔너리 API 호환 (article['url'], article.get(...), 키 추가, {**article})
+      'published_date' 키는 date 필드, 정해진 필드 외의 키는 metadata에 저장 (필요할 때만 생성)
+    - 키워드 목록은 intern_keywords()로 같은 조합끼리 공유, 출처 문자열도 intern
+    - 본문은 content 하나에만 보관 (상세 단계에서 같은 레코드를 제자리 갱신)
+    """
+    source: str = ""
+    key_points: str = ""
+    ai_recommend: bool = False
+    attachments: List[Dict[str, Any]] = field(default_factory=list)
+    search_term: Optional[str] = None
+    metadata: Optional[Dict[str, Any]] = None
+
+    def __post_init__(self):
+        self.keywords = intern_keywords(self.keywords)
+        self.source = sys.intern(self.source) if self.source else ""
+
+    def __setstate__(self, state):
+        # 프로세스 간 전달(pickle) 후에도 키워드 튜플 / 출처 문자열 공유 유지 (백필 워커 → 코디네이터)
+        _, slot_state = state if isinstance(state, tuple) else (None, state)
+        for name, value in (slot_state or {}).items():
+            setattr(self, name, value)
+        self.__post_init__()
+
+    @classmethod
+    def from_listing(cls, title: str, url: str, published_date: Optional[datetime],
+                     source: str, **extra) -> 'CrawledArticle':
+        """목록 페이지 항목 → 레코드 (id는 URL)"""
+        article = cls(id=url, title=title, content='', url=url, date=published_date, source=source)
+        article.update(extra)
+        return article
+
+    # ---- 기사 딕셔너리 호환 API ----
+
+    def __getitem__(self, key: str) -> Any:
+        name = _ARTICLE_KEY_ALIASES.get(key, key)
+        if name in _CRAWLED_FIELDS:
+            return getattr(self, name)
+        if self.metadata is not None and key in self.metadata:
+            return self.metadata[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        name = _ARTICLE_KEY_ALIASES.get(key, key)
+        if name == 'keywords':
+            value = intern_keywords(value)
+        elif name == 'source' and value:
+            value = sys.intern(value)
+        if name in _CRAWLED_FIELDS:
+            setattr(self, name, value)
+        else:
+            if self.metadata is None:
+                self.metadata = {}
+            self.metadata[key] = value
+
+    def __contains__(self, key: object) -> bool:
+        return key in _CRAWLED_FIELDS_BY_KEY or (self.metadata is not None and key in self.metadata)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(_CRAWLED_FIELDS_BY_KEY) + len(self.metadata or ())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, other: Optional[Dict[str, Any]] = None, **kwargs):
+        for source in (other or {}, kwargs):
+            for key in source.keys():
+                self[key] = source[key]
+
+    def keys(self) -> List[str]:
+        return list(_CRAWLED_FIELDS_BY_KEY) + list(self.metadata or ())
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(key, self[key]) for key in self.keys()]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """기존 기사 딕셔너리 형식 (체크포인트 저장 / 디버깅용)"""
+        article = dict(self.items())
+        article['keywords'] = list(self.keywords)
+        return article
+
+
+# 딕셔너리 키 ↔ 레코드 필드 (id / metadata는 딕셔너리 키로 노출하지 않음)
+_ARTICLE_KEY_ALIASES = {'published_date': 'date'}
+_CRAWLED_FIELDS = frozenset(f.name for f in fields(CrawledArticle)) - {'metadata'}
+_CRAWLED_FIELDS_BY_KEY = {
+    {'date': 'published_date'}.get(f.name, f.name): f.name
+    for f in fields(CrawledArticle) if f.name not in ('id', 'metadata')
+}
+
 @dataclass
 class GenerationRequest:
     """카드뉴스 생성 요청 표준 모델"""
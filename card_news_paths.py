@@ -93,7 +93,8 @@ class CardNewsPaths:
             'output_test': str(output_dir / 'test'),  # 테스트 출력 디렉토리 추가
             
             # 로그
-            'logs': str(self.PROJECT_ROOT / 'logs' / 'card_news')
+            'logs': str(self.PROJECT_ROOT / 'logs' / 'card_news'),
+            'debug_html': str(self.PROJECT_ROOT / 'logs' / 'debug_html')  # 크롤러 디버그 HTML (DEBUG_HTML_DUMP=true)
         }
     
     def get(self, key: str) -> Path:
@@ -12,6 +12,10 @@ MONGODB_DB = os.getenv('MONGODB_DB', 'power_news')
 NOTION_API_KEY = os.getenv('NOTION_API_KEY')
 NOTION_DATABASE_ID = os.getenv('NOTION_DATABASE_ID')
 NOTION_PARENT_PAGE_ID = os.getenv('NOTION_PARENT_PAGE_ID')
+NOTION_WRITE_WORKERS = int(os.getenv('NOTION_WRITE_WORKERS', '3'))  # Notion 요청 실행기 동시 쓰기 스레드 수 (속도는 공용 속도 제한기가 조절)
+NOTION_MAX_RETRIES = int(os.getenv('NOTION_MAX_RETRIES', '3'))  # Notion 요청당 최대 시도 횟수 (일시적 오류만 재시도)
+NOTION_WEEKLY_REGISTRY_PATH = os.getenv('NOTION_WEEKLY_REGISTRY_PATH', 'notion_weekly_databases.db')  # (ISO 연도, 주차) → 주간 데이터베이스 ID 저장 위치
+NOTION_WEEKLY_REGISTRY_MAX_AGE_HOURS = float(os.getenv('NOTION_WEEKLY_REGISTRY_MAX_AGE_HOURS', '24'))  # 주간 데이터베이스 목록 재조회 주기(시간)
 
 # Debug: Print loaded environment variables
 print(f"Loaded NOTION_API_KEY: {NOTION_API_KEY is not None}") # Check if key is loaded
@@ -36,4 +40,119 @@ NEWS_SOURCES = {
 }
 
 # Crawling Schedule (in hours)
-CRAWLING_INTERVAL = 6 
\ No newline at end of file
+CRAWLING_INTERVAL = 6
+CRAWL_WINDOW_DAYS = int(os.getenv('CRAWL_WINDOW_DAYS', '7'))  # 최근 N일 이내 기사만 수집 (main.py --days로 실행마다 지정 가능)
+
+# Concurrent Fetch Configuration
+CRAWL_MAX_WORKERS = int(os.getenv('CRAWL_MAX_WORKERS', '8'))  # 상세 페이지 동시 요청 수
+CRAWL_PER_HOST_LIMIT = int(os.getenv('CRAWL_PER_HOST_LIMIT', '4'))  # 호스트별 최대 동시 연결 수
+CRAWL_POLITENESS_DELAY = float(os.getenv('CRAWL_POLITENESS_DELAY', '0.3'))  # 같은 호스트 요청 간 최소 간격(초)
+
+# HTTP Connection Pool Configuration
+HTTP_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', '10'))  # 캐시할 호스트별 커넥션 풀 개수
+HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', str(max(CRAWL_MAX_WORKERS, 10))))  # 호스트당 keep-alive 커넥션 수
+
+# HTTP Cache Configuration (Conditional GET)
+HTTP_CACHE_DIR = os.getenv('HTTP_CACHE_DIR', 'cache/http')
+HTTP_CACHE_TTL = {  # URL 종류별 재검증 없이 캐시를 그대로 쓰는 시간(초)
+    'list': int(os.getenv('HTTP_CACHE_TTL_LIST', '300')),  # 목록 페이지: 5분
+    'article': int(os.getenv('HTTP_CACHE_TTL_ARTICLE', '86400')),  # 기사 페이지: 1일
+    'search': int(os.getenv('HTTP_CACHE_TTL_SEARCH', '3600')),  # 사이트 검색 결과 페이지: 1시간
+}
+
+# Incremental Crawl Watermark Configuration
+CRAWL_WATERMARK_FILE = os.getenv('CRAWL_WATERMARK_FILE', 'crawl_watermark.json')
+CRAWL_WATERMARK_OVERLAP_HOURS = float(os.getenv('CRAWL_WATERMARK_OVERLAP_HOURS', '6'))  # 늦은 수정 기사 재확인 구간
+
+# Crawled URL History Configuration
+URL_INDEX_PATH = os.getenv('URL_INDEX_PATH', 'crawled_articles.db')  # SQLite URL 이력 (구 crawled_articles.json 대체)
+
+# Crawl Checkpoint Configuration (main.py --resume)
+CRAWL_CHECKPOINT_PATH = os.getenv('CRAWL_CHECKPOINT_PATH', 'crawl_checkpoint.db')  # 실행 중 단계별 진행 상황 (완료 시 비움)
+
+# HTML Parser Configuration
+HTML_PARSER = os.getenv('HTML_PARSER', '')  # 비워두면 lxml 우선, 없으면 html.parser
+
+# Content Extraction Configuration (본문 블록 점수화 + 상용구 제거, 추출 결과 캐시)
+CONTENT_EXTRACT_CACHE_PATH = os.getenv('CONTENT_EXTRACT_CACHE_PATH', 'content_extract.db')  # SQLite 추출 결과 캐시 (HTML 해시 키)
+CONTENT_EXTRACT_CACHE_DAYS = int(os.getenv('CONTENT_EXTRACT_CACHE_DAYS', '30'))  # 이 기간 동안 쓰이지 않은 캐시 항목은 정리
+CONTENT_MIN_PARAGRAPH_CHARS = int(os.getenv('CONTENT_MIN_PARAGRAPH_CHARS', '10'))  # 이보다 짧은 문단은 버림 (소제목 제외)
+
+# Selenium Fallback Configuration
+SELENIUM_POOL_SIZE = int(os.getenv('SELENIUM_POOL_SIZE', '1'))  # 재사용할 WebDriver 최대 개수 (필요할 때만 기동)
+SELENIUM_WAIT_TIMEOUT = float(os.getenv('SELENIUM_WAIT_TIMEOUT', '15'))  # 목록 영역 로딩 대기 최대 시간(초)
+
+# Streaming Pipeline Configuration (목록 → 상세 → 필터 → 요약 → Notion)
+PIPELINE_QUEUE_SIZE = int(os.getenv('PIPELINE_QUEUE_SIZE', '16'))  # 단계 간 큐 크기 (가득 차면 앞 단계 대기)
+PIPELINE_DETAIL_WORKERS = int(os.getenv('PIPELINE_DETAIL_WORKERS', str(CRAWL_MAX_WORKERS)))  # 상세 페이지 수집 워커 수
+PIPELINE_FILTER_WORKERS = int(os.getenv('PIPELINE_FILTER_WORKERS', '1'))  # 키워드/AI 필터 워커 수
+PIPELINE_SUMMARY_WORKERS = int(os.getenv('PIPELINE_SUMMARY_WORKERS', '2'))  # 요약 단계 워커 수 (LLM_ENRICH_ENABLED=false일 때만 단계에서 LLM 호출)
+PIPELINE_NOTION_WORKERS = int(os.getenv('PIPELINE_NOTION_WORKERS', '2'))  # Notion 업서트 워커 수
+
+# Debug HTML Dump Configuration (기본 비활성화)
+DEBUG_HTML_DUMP = os.getenv('DEBUG_HTML_DUMP', 'false').lower() == 'true'  # true일 때만 수집 HTML 저장
+DEBUG_HTML_MAX_BYTES = int(os.getenv('DEBUG_HTML_MAX_BYTES', str(512 * 1024)))  # 파일당 최대 저장 크기 (압축 전)
+DEBUG_HTML_QUEUE_SIZE = int(os.getenv('DEBUG_HTML_QUEUE_SIZE', '100'))  # 백그라운드 저장 대기열 크기 (초과분은 버림)
+
+# Multi-Source Crawl Configuration
+ENABLED_SOURCES = [s.strip() for s in os.getenv('ENABLED_SOURCES', '전기신문,한국전력거래소').split(',') if s.strip()]  # 실행할 소스 (NEWS_SOURCES 키)
+SOURCE_POLITENESS_DELAYS = {  # 소스별 같은 호스트 요청 간 최소 간격(초), 없으면 CRAWL_POLITENESS_DELAY
+    '한국전력거래소': float(os.getenv('KPX_POLITENESS_DELAY', '1.0')),
+}
+SOURCE_QUEUE_SIZE = int(os.getenv('SOURCE_QUEUE_SIZE', '32'))  # 소스별 목록 결과를 합치는 큐 크기
+
+# Near-Duplicate Detection Configuration (SimHash)
+NEAR_DUP_ENABLED = os.getenv('NEAR_DUP_ENABLED', 'true').lower() == 'true'  # 요약/Notion 전에 유사 중복 기사 건너뛰기
+NEAR_DUP_INDEX_PATH = os.getenv('NEAR_DUP_INDEX_PATH', 'near_duplicates.db')  # SQLite 기사 지문 저장소
+NEAR_DUP_MAX_DISTANCE = int(os.getenv('NEAR_DUP_MAX_DISTANCE', '3'))  # 64비트 지문 해밍 거리가 이 값 이하면 중복
+NEAR_DUP_SHINGLE_SIZE = int(os.getenv('NEAR_DUP_SHINGLE_SIZE', '5'))  # 지문 계산용 문자 n-gram 길이
+NEAR_DUP_MIN_LENGTH = int(os.getenv('NEAR_DUP_MIN_LENGTH', '200'))  # 정규화 본문이 이보다 짧으면 검사 생략
+NEAR_DUP_RETENTION_DAYS = int(os.getenv('NEAR_DUP_RETENTION_DAYS', '30'))  # 이 기간 내 기사 지문만 비교 대상
+
+# Adaptive Rate Limit / Circuit Breaker Configuration (호스트별, 크롤러/Notion/Ollama 공용)
+RATE_LIMIT_INITIAL_RPS = float(os.getenv('RATE_LIMIT_INITIAL_RPS', '4.0'))  # 호스트별 시작 속도(초당 요청)
+RATE_LIMIT_MIN_RPS = float(os.getenv('RATE_LIMIT_MIN_RPS', '0.2'))  # 감속 하한
+RATE_LIMIT_MAX_RPS = float(os.getenv('RATE_LIMIT_MAX_RPS', '10.0'))  # 가속 상한
+RATE_LIMIT_BURST = float(os.getenv('RATE_LIMIT_BURST', '4'))  # 토큰 버킷 용량 (순간 동시 요청 허용량)
+RATE_LIMIT_TARGET_LATENCY = float(os.getenv('RATE_LIMIT_TARGET_LATENCY', '3.0'))  # 평균 응답 시간이 이보다 길면 감속(초)
+RATE_LIMIT_INCREASE_STEP = float(os.getenv('RATE_LIMIT_INCREASE_STEP', '0.5'))  # 성공 시 가산 증가폭
+RATE_LIMIT_DECREASE_FACTOR = float(os.getenv('RATE_LIMIT_DECREASE_FACTOR', '0.5'))  # 429/5xx/지연 시 곱셈 감소 비율
+RATE_LIMIT_HOST_OVERRIDES = {  # 호스트별 HostLimiter 설정 덮어쓰기
+    'api.notion.com': {'initial_rps': 3.0, 'max_rps': 3.0, 'burst': 3},  # Notion API 평균 3 req/s 제한
+}
+RATE_LIMIT_LLM_TARGET_LATENCY = float(os.getenv('RATE_LIMIT_LLM_TARGET_LATENCY', '60'))  # Ollama 응답 목표 시간(초)
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', '5'))  # 연속 실패 시 서킷 차단
+CIRCUIT_COOLDOWN = float(os.getenv('CIRCUIT_COOLDOWN', '30'))  # 차단 후 시험 요청까지 대기(초)
+
+# KPX Async Crawler Configuration
+KPX_MAX_PAGES = int(os.getenv('KPX_MAX_PAGES', '5'))  # 게시판별 최대 탐색 페이지
+KPX_PAGE_WINDOW = int(os.getenv('KPX_PAGE_WINDOW', '2'))  # 게시판별로 동시에 가져올 목록 페이지 수
+KPX_DETAIL_CONCURRENCY = int(os.getenv('KPX_DETAIL_CONCURRENCY', '4'))  # 상세 페이지/첨부파일 동시 요청 수
+KPX_FETCH_ATTACHMENT_INFO = os.getenv('KPX_FETCH_ATTACHMENT_INFO', 'true').lower() == 'true'  # 첨부파일 HEAD로 크기/형식 확인
+KPX_REQUEST_TIMEOUT = float(os.getenv('KPX_REQUEST_TIMEOUT', '15'))  # 요청 타임아웃(초)
+
+# Notion Mirror Configuration (주간 데이터베이스 로컬 SQLite 미러, 읽기 전용 조회용)
+NOTION_MIRROR_PATH = os.getenv('NOTION_MIRROR_PATH', 'notion_mirror.db')  # 미러 저장 위치
+NOTION_MIRROR_MAX_AGE = float(os.getenv('NOTION_MIRROR_MAX_AGE', '60'))  # 이보다 오래된(초) 미러만 읽기 전에 증분 갱신
+NOTION_MIRROR_FULL_SYNC_HOURS = float(os.getenv('NOTION_MIRROR_FULL_SYNC_HOURS', '24'))  # 삭제/보관 페이지 정리용 전체 재동기화 주기
+
+# LLM Enrichment Configuration (LLM 요약을 Notion 동기화와 분리해 백그라운드로 보강)
+LLM_ENRICH_ENABLED = os.getenv('LLM_ENRICH_ENABLED', 'true').lower() == 'true'  # false면 동기화 전에 LLM 요약 (기존 방식)
+LLM_ENRICH_WORKERS = int(os.getenv('LLM_ENRICH_WORKERS', '2'))  # LLM 보강 워커 수
+LLM_ENRICH_STATE_PATH = os.getenv('LLM_ENRICH_STATE_PATH', 'llm_enrichment.db')  # 본문 해시별 LLM 요약 / 보강 대기열 저장 위치
+
+# Crawl Telemetry Configuration
+TELEMETRY_ENABLED = os.getenv('TELEMETRY_ENABLED', 'true').lower() == 'true'  # 단계별 지표 수집 여부
+TELEMETRY_DIR = os.getenv('TELEMETRY_DIR', 'logs/metrics')  # 지표 내보내기 디렉토리
+TELEMETRY_JSONL_FILE = os.getenv('TELEMETRY_JSONL_FILE', 'crawl_metrics.jsonl')  # 실행마다 누적되는 JSON-lines
+TELEMETRY_PROM_FILE = os.getenv('TELEMETRY_PROM_FILE', 'crawl_metrics.prom')  # 최신 실행 Prometheus textfile
+TELEMETRY_BUCKETS = [0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120]  # 지연시간 히스토그램 버킷(초)
+
+# Backfill Configuration (backfill.py, 프로세스별 목록 페이지 샤드)
+BACKFILL_WORKERS = int(os.getenv('BACKFILL_WORKERS', '4'))  # 샤드를 처리할 프로세스 수
+BACKFILL_SHARD_SIZE = int(os.getenv('BACKFILL_SHARD_SIZE', '5'))  # 샤드 하나가 맡는 연속 목록 페이지 수
+BACKFILL_MAX_PAGES = int(os.getenv('BACKFILL_MAX_PAGES', '100'))  # --pages 미지정 시 탐색할 마지막 페이지
+
+# Site Search Configuration (search_specific_articles.py, 전기신문 sc_word 검색)
+SEARCH_MAX_PAGES = int(os.getenv('SEARCH_MAX_PAGES', '5'))  # 검색어별 최대 결과 페이지 수
+SEARCH_MAX_TERMS_CONCURRENCY = int(os.getenv('SEARCH_MAX_TERMS_CONCURRENCY', '4'))  # 동시에 검색할 검색어 수
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔧 프로세스 병렬 백필 크롤링
+- 목록 페이지 구간을 연속 페이지 샤드로 나눠 ProcessPoolExecutor에서 동시에 처리
+- 각 워커 프로세스가 목록 → 상세 → 필터까지 독립적으로 수행 (crawl_pages)
+- supports_backfill이 아닌 소스는 샤드를 만들기 전에 제외
+- 코디네이터가 샤드 결과를 URL / 기존 이력 / SimHash 유사 중복 기준으로 합친 뒤
+  요약 → Notion 파이프라인으로 기록하고 URL 이력에 반영
+- 수집 기간 이전 글에 닿은 샤드가 나오면 그 뒤 페이지 샤드는 제출하지 않음
+"""
+
+import os
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from config.config import (
+    BACKFILL_WORKERS, BACKFILL_SHARD_SIZE, CRAWL_WINDOW_DAYS, ENABLED_SOURCES,
+    NEAR_DUP_ENABLED, PIPELINE_SUMMARY_WORKERS, PIPELINE_NOTION_WORKERS
+)
+from crawlers.base_crawler import BaseCrawler
+from crawlers.url_index import UrlIndex
+
+Shard = Tuple[str, List[int]]  # (소스명, 목록 페이지 번호)
+
+# 워커 프로세스별 크롤러 (샤드마다 모델/세션을 다시 만들지 않도록 재사용)
+_worker_crawlers: Dict[str, BaseCrawler] = {}
+_worker_options: Dict[str, Any] = {}
+
+
+def plan_shards(sources: List[str], first_page: int, last_page: int,
+                shard_size: int = BACKFILL_SHARD_SIZE) -> List[Shard]:
+    """소스별 [first_page, last_page] 구간을 shard_size개씩 연속 페이지 샤드로 분할 (앞 페이지 우선)"""
+    shard_size = max(1, shard_size)
+    starts = range(first_page, last_page + 1, shard_size)
+    return [
+        (source, list(range(start, min(start + shard_size, last_page + 1))))
+        for start in starts
+        for source in sources
+    ]
+
+
+def _init_worker(window_days: int, workers: int):
+    """워커 프로세스 초기화: 수집 기간 + 호스트 속도 상한을 프로세스 수로 나눔"""
+    _worker_options['window_days'] = window_days
+    _worker_options['workers'] = max(1, workers)
+
+
+def _worker_crawler(source_name: str) -> BaseCrawler:
+    crawler = _worker_crawlers.get(source_name)
+    if crawler is not None:
+        return crawler
+
+    from crawlers.registry import build_crawlers
+
+    # 워커는 Notion에 접근하지 않음 (워터마크도 코디네이터/일반 실행 몫)
+    crawlers = build_crawlers(None, sources=[source_name], window_days=_worker_options.get('window_days'),
+                              use_watermark=False)
+    if not crawlers:
+        raise RuntimeError(f"{source_name} 크롤러를 만들 수 없습니다")
+    crawler = crawlers[0]
+
+    # 프로세스마다 속도 제한기가 따로 있으므로 호스트 상한을 워커 수로 나눠 전체 속도 유지
+    workers = _worker_options.get('workers', 1)
+    if workers > 1:
+        limiter = crawler.fetcher.rate_limiter
+        host_limiter = limiter.for_host(crawler.base_url)
+        max_rps = host_limiter.max_rps / workers
+        limiter.configure_host(crawler.base_url, max_rps=max_rps, initial_rps=min(host_limiter.rate, max_rps),
+                               burst=max(1.0, host_limiter.burst / workers))
+
+    _worker_crawlers[source_name] = crawler
+    return crawler
+
+
+def crawl_shard(source_name: str, pages: List[int]) -> Dict[str, Any]:
+    """
+    워커 프로세스에서 실행: 샤드 하나 (목록 → 상세 → 필터)
+
+    Returns:
+        Dict: crawl_pages() 결과 + {'source', 'pages', 'pid'}
+    """
+    result = _worker_crawler(source_name).crawl_pages(pages)
+    return {**result, 'source': source_name, 'pages': pages, 'pid': os.getpid()}
+
+
+class BackfillCoordinator:
+    """
+    🔧 샤드 분배 + 결과 병합 + Notion 기록 코디네이터
+
+    **특징**:
+    - 페이지 단위 백필을 지원하지 않는 소스는 시작 전에 제외 (실패할 샤드를 제출하지 않음)
+    - 샤드는 앞 페이지부터 프로세스 수의 2배까지만 미리 제출, 완료 순서대로 병합
+    - 소스별로 수집 기간 끝(exhausted)에 닿은 페이지 이후 샤드는 제출하지 않음 (대기 중이면 취소)
+    - 병합 시 중복 제거: 이번 백필 안의 같은 URL → URL 이력에 이미 있는 기사(resync=False) → SimHash 유사 중복
+    - Notion 기록에 성공한 기사만 URL 이력에 커밋
+    """
+
+    def __init__(self, notion_client: Any = None, database_id: Optional[str] = None,
+                 sources: Optional[List[str]] = None, window_days: int = CRAWL_WINDOW_DAYS,
+                 workers: int = BACKFILL_WORKERS, shard_size: int = BACKFILL_SHARD_SIZE,
+                 resync: bool = False, dry_run: bool = False):
+        self.notion = notion_client
+        self.database_id = database_id
+        self.sources = list(sources if sources is not None else ENABLED_SOURCES)
+        self.window_days = window_days
+        self.workers = max(1, workers)
+        self.shard_size = max(1, shard_size)
+        self.resync = resync
+        self.dry_run = dry_run or notion_client is None or not database_id
+        self.stats = {
+            'shards': 0, 'cancelled': 0, 'failed_shards': 0, 'listed': 0, 'selected': 0,
+            'duplicates': 0, 'known': 0, 'near_duplicates': 0, 'synced': 0,
+        }
+        self.articles: List[Dict[str, Any]] = []  # 병합된 (중복 제거 후) 기사
+
+    def _iter_shard_results(self, first_page: int, last_page: int) -> Iterator[Dict[str, Any]]:
+        """샤드를 프로세스 풀에 제출하고 완료 순서대로 결과 생성"""
+        shards = plan_shards(self.sources, first_page, last_page, self.shard_size)
+        exhausted_at: Dict[str, int] = {}  # 소스 → 수집 기간 끝에 닿은 샤드의 첫 페이지
+        print(f"[Backfill] {len(self.sources)}개 소스, 페이지 {first_page}~{last_page} → "
+              f"샤드 {len(shards)}개 (샤드당 {self.shard_size}페이지, 프로세스 {self.workers}개)")
+
+        queued = iter(shards)
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(self.window_days, self.workers)) as pool:
+            pending: Dict[Future, Shard] = {}
+
+            def top_up():
+                # 프로세스 수의 2배까지만 미리 제출 (기간 끝에 닿은 소스의 뒤 페이지는 제출하지 않음)
+                while len(pending) < self.workers * 2:
+                    shard = next(queued, None)
+                    if shard is None:
+                        return
+                    source, pages = shard
+                    if pages[0] > exhausted_at.get(source, last_page + 1):
+                        self.stats['cancelled'] += 1
+                        continue
+                    pending[pool.submit(crawl_shard, source, pages)] = shard
+
+            top_up()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    source, pages = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        self.stats['failed_shards'] += 1
+                        print(f"[Backfill] ❌ 샤드 실패 ({source} {pages[0]}~{pages[-1]}p): {type(e).__name__} - {e}")
+                        print(traceback.format_exc())
+                        continue
+
+                    self.stats['shards'] += 1
+                    print(f"[Backfill] ✅ 샤드 완료 ({source} {pages[0]}~{pages[-1]}p, pid {result['pid']}): "
+                          f"기간 내 {result['listed']}건 → 선택 {len(result['articles'])}건")
+                    if result['exhausted'] and pages[0] < exhausted_at.get(source, last_page + 1):
+                        exhausted_at[source] = pages[0]
+                        self._cancel_after(pending, source, pages[0])
+                    yield result
+                top_up()
+
+    def _cancel_after(self, pending: Dict[Future, Shard], source: str, page: int):
+        """수집 기간 끝에 닿은 샤드보다 뒤 페이지 샤드 취소 (이미 시작한 샤드는 끝까지 실행)"""
+        for future, (shard_source, shard_pages) in list(pending.items()):
+            if shard_source == source and shard_pages[0] > page and future.cancel():
+                pending.pop(future)
+                self.stats['cancelled'] += 1
+
+    def _merge(self, results: Iterator[Dict[str, Any]], url_index: UrlIndex,
+               near_duplicates: Optional[Any]) -> Iterator[Dict[str, Any]]:
+        """샤드 결과 병합: 중복 제거 후 기사 하나씩 생성"""
+        seen_urls = set()
+        for result in results:
+            self.stats['listed'] += result['listed']
+            for article in result['articles']:
+                self.stats['selected'] += 1
+                url = article.get('url')
+                if not url or url in seen_urls:
+                    self.stats['duplicates'] += 1
+                    continue
+                seen_urls.add(url)
+                if not self.resync and url in url_index:
+                    self.stats['known'] += 1
+                    continue
+                if near_duplicates is not None and near_duplicates.filter_article(article) is None:
+                    self.stats['near_duplicates'] += 1
+                    continue
+                self.articles.append(article)
+                yield article
+
+    def run(self, first_page: int, last_page: int) -> Dict[str, int]:
+        """
+        백필 실행
+
+        Args:
+            first_page: 첫 목록 페이지 (1부터)
+            last_page: 마지막 목록 페이지 (수집 기간 끝에 먼저 닿으면 그 전에 종료)
+
+        Returns:
+            Dict[str, int]: 샤드/병합/동기화 통계
+        """
+        from processors.streaming_pipeline import Stage, StreamingPipeline
+        from crawlers.registry import backfill_sources
+
+        self.sources = backfill_sources(self.sources)
+        if not self.sources:
+            print("[Backfill] 백필을 지원하는 소스가 없어 종료합니다")
+            return self.stats
+
+        url_index = UrlIndex()
+        near_duplicates = None
+        if NEAR_DUP_ENABLED:
+            from processors.near_duplicate import NearDuplicateIndex
+            near_duplicates = NearDuplicateIndex()
+
+        try:
+            merged = self._merge(self._iter_shard_results(first_page, last_page), url_index, near_duplicates)
+            if self.dry_run:
+                for article in merged:
+                    print(f"[Backfill] (dry-run) {article.get('source', '')} | {article.get('title', '제목 없음')}")
+                return self.stats
+
+            pipeline = StreamingPipeline([
+                Stage('summary', self.notion.prepare_article, workers=PIPELINE_SUMMARY_WORKERS),
+                Stage('notion', lambda article: (
+                    article if self.notion.sync_article(article, self.database_id) else None
+                ), workers=PIPELINE_NOTION_WORKERS),
+            ], name='Backfill→Notion')
+            for article in pipeline.run(merged):
+                url_index.add(article['url'])
+                self.stats['synced'] += 1
+            self.notion.drain_enrichment()
+
+            url_index.commit()
+            if near_duplicates is not None:
+                near_duplicates.commit()
+            return self.stats
+        finally:
+            if near_duplicates is not None:
+                near_duplicates.close()
+            url_index.close()
+            print(f"[Backfill] 종료: {self.stats}")
@@ -1,18 +1,39 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
 import requests
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
+from crawlers.resource_managers import get_shared_session
+from crawlers.html_parser import parse_html
+from crawlers.concurrent_fetcher import ConcurrentFetcher
+from crawlers.telemetry import get_metrics
+from config.config import CRAWL_POLITENESS_DELAY, SOURCE_POLITENESS_DELAYS, CRAWL_WINDOW_DAYS
 
 class BaseCrawler(ABC):
+    # 페이지 단위 백필 지원 여부 (True인 크롤러는 crawl_pages(pages)를 구현:
+    # 지정한 목록 페이지만 탐색 → 상세 → 필터, 반환 {'articles', 'listed', 'exhausted'})
+    supports_backfill = False
+
     def __init__(self, source_name: str, base_url: str):
         self.source_name = source_name
         self.base_url = base_url
         self.driver = None
+        self.session = get_shared_session()  # 크롤러 공용 커넥션 풀
+        # 소스별 요청 속도 제한 (호스트별 동시성 + 요청 간격)
+        self.fetcher = ConcurrentFetcher(
+            politeness_delay=SOURCE_POLITENESS_DELAYS.get(source_name, CRAWL_POLITENESS_DELAY)
+        )
+        self.metrics = get_metrics()  # 단계별 소요 시간 / 다운로드량 (실행 종료 시 내보내기)
+        self.window_days = CRAWL_WINDOW_DAYS  # 최근 N일 이내 기사만 수집
+
+    def stage_timer(self, stage: str):
+        """단계 소요 시간 측정 Context Manager (crawl_stage_seconds{stage, source})"""
+        return self.metrics.timer(stage, source=self.source_name)
 
     def setup_selenium(self):
         """Setup Selenium WebDriver with dynamic ChromeDriver path finding"""
@@ -54,18 +75,34 @@ class BaseCrawler(ABC):
             self.driver = None
 
     def get_page_content(self, url: str) -> str:
-        """Get page content using requests"""
+        """Get page content using the shared pooled session"""
         try:
-            response = requests.get(url, timeout=10)
+            with self.fetcher.host_slot(url):
+                response = self.session.get(url, timeout=10)
             response.raise_for_status()
             return response.text
         except Exception as e:
             print(f"Error fetching {url}: {str(e)}")
             return ""
 
-    def parse_html(self, html_content: str) -> BeautifulSoup:
-        """Parse HTML content"""
-        return BeautifulSoup(html_content, 'html.parser')
+    def parse_html(self, html_content: str, parse_only=None) -> BeautifulSoup:
+        """Parse HTML content (lxml 우선, parse_only로 파싱 범위 제한 가능)"""
+        with self.stage_timer('parse'):
+            return parse_html(html_content, parse_only=parse_only)
+
+    @contextmanager
+    def parsed_html(self, html_content: str, parse_only=None) -> Iterator[BeautifulSoup]:
+        """
+        파싱 트리 Context Manager: 블록을 벗어나면 트리 즉시 해제 (decompose)
+
+        BeautifulSoup 트리는 부모/자식 순환 참조라 참조가 끊겨도 GC 주기 전까지 메모리에 남으므로,
+        필요한 값(문자열)만 추출한 뒤 바로 해제합니다.
+        """
+        soup = self.parse_html(html_content, parse_only=parse_only)
+        try:
+            yield soup
+        finally:
+            soup.decompose()
 
     @abstractmethod
     def crawl(self) -> List[Dict[str, Any]]:
@@ -77,6 +114,33 @@ class BaseCrawler(ABC):
         """Get article content"""
         pass
 
+    # 스트리밍 파이프라인 / 멀티 소스 레지스트리용 단계 함수
+    # (기본 구현은 crawl() 결과를 그대로 흘려보내므로 crawl()만 구현한 크롤러도 동작)
+
+    def iter_recent_articles(self) -> Iterator[Dict[str, Any]]:
+        """목록 단계: 상세 내용을 가져올 기사 요약을 하나씩 생성"""
+        yield from self.crawl()
+
+    def fetch_article_details(self, article_summary: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """상세 단계: 기사 요약에 상세 내용을 합침 (실패 시 None)"""
+        return article_summary
+
+    def select_article(self, article: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """필터 단계: 최종 대상이면 기사, 아니면 None"""
+        return article
+
+    def mark_processed(self, article: Dict[str, Any]):
+        """후속 처리가 끝난 기사 알림 (Notion 기록 성공 또는 필터/중복 제외, 워터마크 전진 범위 계산용)"""
+        pass
+
+    def finalize_crawl(self):
+        """목록 탐색과 후속 처리가 모두 끝난 뒤 호출 (이력/워터마크 반영)"""
+        pass
+
+    def close(self):
+        """크롤러가 연 로컬 저장소 정리 (실행 종료 시 성공/실패와 관계없이 호출)"""
+        pass
+
     def format_article(self, title: str, content: str, url: str, 
                       published_date: datetime) -> Dict[str, Any]:
         """Format article data"""
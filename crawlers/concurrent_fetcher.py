@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔧 병렬 상세 페이지 수집기
+- 스레드 풀 기반 동시 fetch
+- 호스트별 동시성 제한 (Semaphore)
+- 호스트별 요청 간격 보장 (Politeness Delay)
+- 호스트별 적응형 속도 제한 + 서킷 브레이커 (crawlers.rate_limiter, 모든 크롤러 공유)
+- 입력 순서대로 결과 반환
+"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlparse
+
+from config.config import CRAWL_MAX_WORKERS, CRAWL_PER_HOST_LIMIT, CRAWL_POLITENESS_DELAY
+from crawlers.rate_limiter import AdaptiveRateLimiter, get_shared_rate_limiter
+
+
+class ConcurrentFetcher:
+    """
+    🔧 호스트별 동시성 제한이 적용된 병렬 fetch 실행기
+
+    **특징**:
+    - map()은 입력 URL 순서대로 결과를 반환
+    - host_slot()으로 감싼 구간만 호스트 동시성 제한을 받음
+      (재시도 대기 중에는 슬롯을 점유하지 않음)
+    - 같은 호스트에 대한 요청 시작 시각을 politeness_delay 이상 벌림
+    - 그 위에 공용 속도 제한기가 응답 지연/429/5xx에 맞춰 속도 조절, 연속 실패 시 CircuitOpenError
+    """
+
+    def __init__(self, max_workers: int = CRAWL_MAX_WORKERS,
+                 per_host_limit: int = CRAWL_PER_HOST_LIMIT,
+                 politeness_delay: float = CRAWL_POLITENESS_DELAY,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None):
+        self.max_workers = max(1, max_workers)
+        self.per_host_limit = max(1, per_host_limit)
+        self.politeness_delay = max(0.0, politeness_delay)
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter()
+
+        self._lock = threading.Lock()
+        self._host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_next_slot: Dict[str, float] = {}
+
+    def _get_semaphore(self, host: str) -> threading.BoundedSemaphore:
+        """호스트별 Semaphore 반환 (없으면 생성)"""
+        with self._lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host_limit)
+                self._host_semaphores[host] = semaphore
+            return semaphore
+
+    def _wait_politeness(self, host: str):
+        """같은 호스트에 대한 직전 요청과의 간격 보장"""
+        if not self.politeness_delay:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._host_next_slot.get(host, 0.0))
+            self._host_next_slot[host] = start_at + self.politeness_delay
+
+        delay = start_at - now
+        if delay > 0:
+            time.sleep(delay)
+
+    @contextmanager
+    def host_slot(self, url: str) -> Iterator[None]:
+        """
+        호스트 동시성 슬롯 점유 Context Manager
+
+        실제 네트워크 요청 구간만 감싸서 사용합니다.
+        구간 안에서 발생한 예외(연결 오류, raise_for_status 등)는 속도 제한기에 반영됩니다.
+        """
+        host = urlparse(url).netloc
+        semaphore = self._get_semaphore(host)
+        with semaphore:
+            self._wait_politeness(host)
+            with self.rate_limiter.slot(url):
+                yield
+
+    def map(self, func: Callable[[str], Any], urls: List[str]) -> List[Optional[Any]]:
+        """
+        URL 목록에 func를 병렬 적용하고 입력 순서대로 결과 반환
+
+        Args:
+            func: URL 하나를 받아 결과를 반환하는 함수 (재시도는 func 내부에서 처리)
+            urls: 처리할 URL 목록
+
+        Returns:
+            List[Optional[Any]]: urls와 같은 순서의 결과 (예외 발생 시 None)
+        """
+        if not urls:
+            return []
+
+        workers = min(self.max_workers, len(urls))
+        results: List[Optional[Any]] = [None] * len(urls)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fetch') as pool:
+            futures = [pool.submit(func, url) for url in urls]
+            for index, future in enumerate(futures):
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    print(f"[Fetcher] ❌ 병렬 fetch 실패 ({urls[index]}): {type(e).__name__} - {str(e)}")
+
+        return results
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔧 기사 본문 추출 엔진 (readability 방식)
+- 문단(p / td / pre / 본문 텍스트가 있는 div)마다 점수를 매겨 부모/조부모 블록에 누적,
+  링크 밀도로 보정한 최고 점수 블록을 본문 컨테이너로 선택
+- 스크립트/광고/공유/관련기사/사진 설명/기자 바이라인/저작권 문구 등 상용구 제거
+- 깨끗한 문단 목록(빈 줄로 구분)만 반환 → LLM 요약 입력이 짧고 밀도 높아짐
+- 추출 결과는 HTML 해시 기준으로 SQLite에 캐시 (같은 HTML은 다시 점수화하지 않음)
+"""
+
+import os
+import re
+import json
+import sqlite3
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+from config.config import (
+    CONTENT_EXTRACT_CACHE_PATH, CONTENT_EXTRACT_CACHE_DAYS, CONTENT_MIN_PARAGRAPH_CHARS
+)
+from crawlers.html_parser import parse_html
+from crawlers.telemetry import get_metrics
+
+# 추출 규칙이 바뀌면 올림 (이전 규칙으로 캐시된 결과는 다시 추출)
+EXTRACTOR_VERSION = 1
+
+# 본문일 수 없는 태그 (점수 계산 전에 제거)
+REMOVE_TAGS = [
+    'script', 'style', 'noscript', 'iframe', 'form', 'button', 'input', 'select', 'textarea',
+    'svg', 'nav', 'aside', 'footer', 'header', 'figure', 'figcaption',
+]
+PARAGRAPH_TAGS = ['p', 'td', 'pre', 'blockquote', 'div']
+BLOCK_TAGS = [
+    'p', 'div', 'section', 'article', 'table', 'tr', 'td', 'ul', 'ol', 'li', 'pre', 'blockquote',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+]
+
+# class / id 기반 가중치 (국내 언론사 / 기관 게시판 마크업 기준)
+UNLIKELY_PATTERN = re.compile(
+    r'comment|reply|footer|sidebar|aside|related|recommend|popular|ranking|share|sns|social|banner|'
+    r'advert|sponsor|promo|popup|menu|gnb|lnb|nav|breadcrumb|pagination|paging|byline|writer|reporter|'
+    r'copyright|caption|photo-?desc|tag-?group|hidden|(?:^|[-_\s])ads?(?:[-_\s]|$)',
+    re.IGNORECASE,
+)
+POSITIVE_PATTERN = re.compile(r'article|body|content|entry|main|post|text|story|view|cont|news', re.IGNORECASE)
+
+# 문단 단위 상용구 (바이라인 / 저작권 / 사진 출처 / 관련 기사 링크)
+BOILERPLATE_PATTERNS = [
+    re.compile(r'ⓒ|©|저작권자|무단\s*전재|재배포\s*금지|copyright', re.IGNORECASE),
+    re.compile(r'^\s*[\[(<]?\s*(?:사진|그래픽|자료|출처|제공)\s*[=:／/]'),
+    re.compile(r'^\s*(?:관련\s*기사|▶|☞|※\s*관련)'),
+]
+BYLINE_PATTERN = re.compile(r'[\w.+-]+@[\w-]+\.[\w.]+|기자\s*$|특파원\s*$')
+BYLINE_MAX_CHARS = 80  # 이보다 짧은 문단에 이메일/‘기자’가 있으면 바이라인으로 보고 제거
+
+
+def _class_weight(element: Tag) -> int:
+    """class / id 이름으로 본문 가능성 가중치 (readability 규칙)"""
+    weight = 0
+    for name in (' '.join(element.get('class') or []), element.get('id') or ''):
+        if not name:
+            continue
+        if UNLIKELY_PATTERN.search(name):
+            weight -= 25
+        if POSITIVE_PATTERN.search(name):
+            weight += 25
+    return weight
+
+
+def _text_length(element: Tag) -> int:
+    return len(' '.join(element.get_text(' ').split()))
+
+
+def _link_density(element: Tag) -> float:
+    """블록 텍스트 중 링크 텍스트 비율"""
+    length = _text_length(element)
+    if not length:
+        return 0.0
+    link_length = sum(_text_length(link) for link in element.find_all('a'))
+    return min(1.0, link_length / length)
+
+
+def _is_boilerplate(paragraph: str) -> bool:
+    if any(pattern.search(paragraph) for pattern in BOILERPLATE_PATTERNS):
+        return True
+    return len(paragraph) <= BYLINE_MAX_CHARS and bool(BYLINE_PATTERN.search(paragraph))
+
+
+class ContentExtractor:
+    """
+    🔧 본문 추출기 (점수 기반 본문 블록 선택 + 상용구 제거 + 결과 캐시)
+
+    **사용 예**:
+        extractor = get_shared_content_extractor()
+        content = extractor.extract(html_content, soup, selectors=['#article-view-content-div'])
+
+    **특징**:
+    - selectors: 사이트별로 알려진 본문 컨테이너 (점수 가산, 상용구 제거 대상에서 제외)
+    - soup을 넘기면 다시 파싱하지 않음 (트리를 수정하므로 날짜 등 다른 값은 먼저 추출)
+    - 캐시 키는 HTML + 추출 규칙 버전 + selectors + 파싱 방식의 SHA-1, 빈 결과는 캐시하지 않음
+      (일부만 파싱한 트리의 결과가 전체 파싱 재시도에 재사용되지 않도록 parse_mode로 구분)
+    """
+
+    def __init__(self, cache_path: Optional[str] = CONTENT_EXTRACT_CACHE_PATH,
+                 retention_days: int = CONTENT_EXTRACT_CACHE_DAYS,
+                 min_paragraph_chars: int = CONTENT_MIN_PARAGRAPH_CHARS):
+        self.min_paragraph_chars = min_paragraph_chars
+        self.metrics = get_metrics()
+        self.stats = {'hits': 0, 'misses': 0, 'empty': 0}
+        self._lock = threading.Lock()
+        self._conn = None
+        if cache_path:
+            self._open_cache(cache_path, retention_days)
+
+    def _open_cache(self, path: str, retention_days: int):
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS extracted_content (
+                    hash TEXT PRIMARY KEY,
+                    paragraphs TEXT NOT NULL,
+                    last_used TEXT NOT NULL
+                )
+            ''')
+            cutoff = (datetime.now() - timedelta(days=retention_days)).isoformat(timespec='seconds')
+            with self._conn:
+                self._conn.execute('DELETE FROM extracted_content WHERE last_used < ?', (cutoff,))
+        except sqlite3.Error as e:
+            print(f"[Extract] ⚠️ 추출 결과 캐시를 열 수 없어 캐시 없이 진행 ({path}): {e}")
+            self._conn = None
+
+    @staticmethod
+    def content_hash(html_content: str, selectors: Sequence[str] = (), parse_mode: str = 'full') -> str:
+        if parse_mode != 'full':
+            selectors = [*selectors, f'parse:{parse_mode}']
+        key = f"{EXTRACTOR_VERSION}\0{','.join(selectors)}\0{html_content}"
+        return hashlib.sha1(key.encode('utf-8', errors='replace')).hexdigest()
+
+    def _cached(self, key: str) -> Optional[List[str]]:
+        if self._conn is None:
+            return None
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock:
+            try:
+                row = self._conn.execute('SELECT paragraphs FROM extracted_content WHERE hash = ?',
+                                         (key,)).fetchone()
+                if row is None:
+                    return None
+                with self._conn:
+                    self._conn.execute('UPDATE extracted_content SET last_used = ? WHERE hash = ?', (now, key))
+            except sqlite3.Error as e:
+                print(f"[Extract] ⚠️ 캐시 조회 실패: {e}")
+                return None
+        return json.loads(row[0])
+
+    def _store(self, key: str, paragraphs: List[str]):
+        if self._conn is None:
+            return
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute('''
+                        INSERT OR REPLACE INTO extracted_content (hash, paragraphs, last_used) VALUES (?, ?, ?)
+                    ''', (key, json.dumps(paragraphs, ensure_ascii=False), now))
+            except sqlite3.Error as e:
+                print(f"[Extract] ⚠️ 캐시 기록 실패: {e}")
+
+    def extract(self, html_content: str, soup: Optional[BeautifulSoup] = None,
+                selectors: Sequence[str] = (), parse_mode: str = 'full') -> str:
+        """본문 문단을 빈 줄로 이어 붙인 문자열 (본문을 찾지 못하면 빈 문자열)"""
+        return '\n\n'.join(self.extract_paragraphs(html_content, soup, selectors, parse_mode))
+
+    def extract_paragraphs(self, html_content: str, soup: Optional[BeautifulSoup] = None,
+                           selectors: Sequence[str] = (), parse_mode: str = 'full') -> List[str]:
+        """
+        본문 문단 목록 추출 (캐시 우선)
+
+        Args:
+            html_content: 원본 HTML (캐시 키)
+            soup: 이미 파싱한 트리 (None이면 새로 파싱, 넘긴 트리는 상용구 제거로 수정됨)
+            selectors: 알려진 본문 컨테이너 CSS 선택자
+            parse_mode: soup을 만든 방식 ('full' 전체 파싱, 'strained' 등 일부 파싱은 캐시를 따로 씀)
+
+        Returns:
+            List[str]: 공백 정리된 본문 문단
+        """
+        if not html_content:
+            return []
+        key = self.content_hash(html_content, selectors, parse_mode)
+        cached = self._cached(key)
+        if cached is not None:
+            self._count('hits')
+            self.metrics.incr('content_extract_total', result='hit')
+            return cached
+
+        with self.metrics.timer('content_extract'):
+            paragraphs = self._extract(soup if soup is not None else parse_html(html_content), selectors)
+        if not paragraphs:
+            self._count('empty')
+            self.metrics.incr('content_extract_total', result='empty')
+            return []
+        self._count('misses')
+        self.metrics.incr('content_extract_total', result='miss')
+        self._store(key, paragraphs)
+        return paragraphs
+
+    def _count(self, name: str):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _extract(self, soup: BeautifulSoup, selectors: Sequence[str]) -> List[str]:
+        hinted = [element for selector in selectors for element in soup.select(selector)]
+        self._remove_unlikely(soup, hinted)
+        top = self._top_candidate(soup, hinted)
+        if top is None:
+            return []
+        self._remove_link_blocks(top)
+        return self._collect_paragraphs(top)
+
+    def _remove_unlikely(self, soup: BeautifulSoup, keep: List[Tag]):
+        """본문일 수 없는 태그 / class·id가 상용구 영역인 블록 제거 (알려진 본문 컨테이너와 그 조상은 유지)"""
+        protected = {id(element) for element in keep}
+        for element in keep:
+            protected.update(id(parent) for parent in element.parents)
+
+        for element in soup.find_all(REMOVE_TAGS):
+            if id(element) not in protected and not getattr(element, 'decomposed', False):
+                element.decompose()
+        for element in soup.find_all(True):
+            if getattr(element, 'decomposed', False) or id(element) in protected:
+                continue
+            if element.name in ('html', 'body', 'article'):
+                continue
+            name = f"{' '.join(element.get('class') or [])} {element.get('id') or ''}"
+            if UNLIKELY_PATTERN.search(name) and not POSITIVE_PATTERN.search(name):
+                element.decompose()
+
+    def _top_candidate(self, soup: BeautifulSoup, hinted: List[Tag]) -> Optional[Tag]:
+        """문단 점수를 부모(전부) / 조부모(절반)에 누적 → 링크 밀도 보정 후 최고 점수 블록"""
+        scores: Dict[int, List] = {}  # id(블록) → [블록, 점수]
+
+        def candidate(element: Tag) -> List:
+            entry = scores.get(id(element))
+            if entry is None:
+                base = {'div': 5, 'article': 5, 'section': 3, 'pre': 3, 'td': 3, 'blockquote': 3}.get(element.name, 0)
+                entry = scores[id(element)] = [element, base + _class_weight(element)]
+            return entry
+
+        for element in hinted:
+            candidate(element)[1] += 25
+
+        for paragraph in soup.find_all(PARAGRAPH_TAGS):
+            if getattr(paragraph, 'decomposed', False):
+                continue
+            if paragraph.name == 'div':
+                # 직접 텍스트를 가진 div만 문단으로 취급 (<br>로 줄을 나눈 본문 등)
+                text = ' '.join(str(child) for child in paragraph.children if isinstance(child, NavigableString))
+                text = ' '.join(text.split())
+            else:
+                text = ' '.join(paragraph.get_text(' ').split())
+            if len(text) < 25:
+                continue
+            score = 1 + text.count(',') + text.count('다.') + min(len(text) // 100, 3)
+            parent = paragraph.parent if paragraph.name != 'div' else paragraph
+            if parent is None or parent.name is None:
+                continue
+            candidate(parent)[1] += score
+            grandparent = parent.parent
+            if grandparent is not None and grandparent.name not in (None, '[document]'):
+                candidate(grandparent)[1] += score / 2
+
+        if not scores:
+            return soup.body or soup
+        top, _ = max(((element, score * (1 - _link_density(element))) for element, score in scores.values()),
+                     key=lambda item: item[1])
+        return top
+
+    def _remove_link_blocks(self, top: Tag):
+        """본문 안의 링크 위주 블록(관련 기사 목록 등) 제거"""
+        for element in top.find_all(['ul', 'ol', 'div', 'table', 'section', 'p']):
+            if getattr(element, 'decomposed', False):
+                continue
+            if _text_length(element) < 200 and _link_density(element) > 0.5:
+                element.decompose()
+
+    def _collect_paragraphs(self, top: Tag) -> List[str]:
+        """블록 경계 / <br>로 문단을 나누고 상용구·짧은 줄·중복 문단 제거"""
+        for br in top.find_all('br'):
+            br.replace_with('\n')
+        for element in top.find_all(BLOCK_TAGS):
+            element.insert_before('\n')
+            element.append('\n')
+
+        paragraphs, seen = [], set()
+        for line in top.get_text().split('\n'):
+            paragraph = ' '.join(line.split())
+            if len(paragraph) < self.min_paragraph_chars or paragraph in seen or _is_boilerplate(paragraph):
+                continue
+            seen.add(paragraph)
+            paragraphs.append(paragraph)
+        return paragraphs
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# 크롤러 공용 본문 추출기 (싱글톤 패턴)
+_shared_extractor: Optional[ContentExtractor] = None
+_shared_extractor_lock = threading.Lock()
+
+
+def get_shared_content_extractor() -> ContentExtractor:
+    """프로세스 전체가 공유하는 본문 추출기 반환"""
+    global _shared_extractor
+    with _shared_extractor_lock:
+        if _shared_extractor is None:
+            _shared_extractor = ContentExtractor()
+        return _shared_extractor
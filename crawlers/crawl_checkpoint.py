@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔧 크롤링 파이프라인 체크포인트 (main.py --resume)
+- 기사 URL마다 마지막으로 끝난 단계(목록 → 상세 → 요약 → Notion)와 그 결과를 SQLite에 즉시 기록
+- 중간에 죽은 실행을 --resume으로 이어가면 끝난 단계는 저장된 결과를 그대로 사용
+  (상세 페이지 재요청 / Ollama 재요약 / Notion 재기록 없음)
+- 전체 실행이 끝까지 완료되면 비움 (다음 일반 실행은 처음부터)
+"""
+
+import os
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from config.config import CRAWL_CHECKPOINT_PATH
+
+# 체크포인트 단계 순서 (뒤 단계까지 끝난 기사는 앞 단계도 끝난 것으로 취급)
+STAGE_ORDER = {'listed': 0, 'detail': 1, 'summary': 2, 'notion': 3}
+_DATETIME_KEY = '__datetime__'
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {_DATETIME_KEY: value.isoformat()}
+    if hasattr(value, 'to_dict'):
+        # CrawledArticle 레코드는 기사 딕셔너리 형식으로 저장 (재개 시 딕셔너리로 복원)
+        return value.to_dict()
+    raise TypeError(f"체크포인트에 저장할 수 없는 값: {type(value).__name__}")
+
+
+def _decode(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1 and _DATETIME_KEY in obj:
+        return datetime.fromisoformat(obj[_DATETIME_KEY])
+    return obj
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, default=_encode)
+
+
+def _loads(text: str) -> Any:
+    return json.loads(text, object_hook=_decode)
+
+
+class CrawlCheckpoint:
+    """
+    🔧 기사 단위 파이프라인 진행 상황 저장소
+
+    **사용 예**:
+        checkpoint = CrawlCheckpoint()
+        checkpoint.start(resume=args.resume)
+        stages = [Stage('detail', per_source(checkpoint.checkpointed('detail', fetch))), ...]
+        for result in pipeline.run(checkpoint.track_listing(sources)):
+            ...
+        checkpoint.clear()  # 실행 완료
+
+    **특징**:
+    - 단계 결과는 끝나는 즉시 커밋 (프로세스가 죽어도 그때까지의 결과 유지)
+    - 단계는 앞으로만 진행 (재실행된 앞 단계가 뒤 단계 결과를 덮어쓰지 않음)
+    - 단계 함수가 None을 반환(제외/실패)한 기사는 기록하지 않음 → 재개 시 다시 시도
+    - 키워드/AI 필터와 유사 중복 제거는 비용이 작아 재개 시 다시 실행
+    """
+
+    def __init__(self, path: str = CRAWL_CHECKPOINT_PATH):
+        self.path = path
+        self.stats = {'resumed': 0, 'skipped_synced': 0, 'recorded': 0}
+        self._lock = threading.Lock()
+        self._rows: Dict[str, Tuple[str, str]] = {}  # URL → (단계, 결과 JSON)
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS checkpoint_articles (
+                url TEXT PRIMARY KEY,
+                source TEXT,
+                stage TEXT NOT NULL,
+                result TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        ''')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS checkpoint_sources (
+                source TEXT PRIMARY KEY,
+                listed INTEGER NOT NULL DEFAULT 0,
+                listing_done INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT NOT NULL
+            )
+        ''')
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def stage_counts(self) -> Dict[str, int]:
+        """단계별 기사 수 (로그용)"""
+        counts = {stage: 0 for stage in STAGE_ORDER}
+        for stage, _ in self._rows.values():
+            counts[stage] += 1
+        return counts
+
+    def start(self, resume: bool = False) -> Dict[str, int]:
+        """
+        실행 시작: resume이면 저장된 진행 상황을 불러오고, 아니면 비우고 새로 시작
+
+        Returns:
+            Dict[str, int]: 불러온 단계별 기사 수 (새로 시작하면 모두 0)
+        """
+        with self._lock:
+            rows = self._conn.execute('SELECT url, stage, result FROM checkpoint_articles').fetchall()
+            if not resume:
+                if rows:
+                    print(f"[Checkpoint] 이전 실행 체크포인트 {len(rows)}건 폐기 (이어서 실행하려면 --resume)")
+                with self._conn:
+                    self._conn.execute('DELETE FROM checkpoint_articles')
+                    self._conn.execute('DELETE FROM checkpoint_sources')
+                self._rows = {}
+            else:
+                self._rows = {url: (stage, result) for url, stage, result in rows if stage in STAGE_ORDER}
+        counts = self.stage_counts()
+        if resume:
+            print(f"[Checkpoint] 이전 실행 이어서 진행: " + ', '.join(f"{k} {v}건" for k, v in counts.items()))
+        return counts
+
+    def _save(self, url: str, source: Optional[str], stage: str, result: Any):
+        """단계 결과 기록 (이미 더 뒤 단계까지 끝난 기사는 그대로 둠)"""
+        try:
+            payload = _dumps(result)
+        except (TypeError, ValueError) as e:
+            print(f"[Checkpoint] ⚠️ 직렬화할 수 없는 결과라 기록 생략 ({url}): {e}")
+            return
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock:
+            current = self._rows.get(url)
+            if current and STAGE_ORDER[current[0]] >= STAGE_ORDER[stage]:
+                return
+            try:
+                with self._conn:
+                    self._conn.execute('''
+                        INSERT OR REPLACE INTO checkpoint_articles (url, source, stage, result, updated_at)
+                        VALUES (?, ?, ?, ?, ?)
+                    ''', (url, source, stage, payload, now))
+            except sqlite3.Error as e:
+                print(f"[Checkpoint] ⚠️ 진행 상황 기록 실패 ({url}): {e}")
+                return
+            self._rows[url] = (stage, payload)
+            self.stats['recorded'] += 1
+
+    def _update_source(self, source: str, listed: int = 0, listing_done: bool = False):
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute('''
+                        INSERT INTO checkpoint_sources (source, listed, listing_done, updated_at) VALUES (?, ?, ?, ?)
+                        ON CONFLICT(source) DO UPDATE SET
+                            listed = listed + excluded.listed,
+                            listing_done = MAX(listing_done, excluded.listing_done),
+                            updated_at = excluded.updated_at
+                    ''', (source, listed, int(listing_done), now))
+            except sqlite3.Error as e:
+                print(f"[Checkpoint] ⚠️ 소스 진행 상황 기록 실패 ({source}): {e}")
+
+    def completed(self, url: str, stage: str) -> Optional[Any]:
+        """stage까지 끝난 기사면 저장된 결과(가장 뒤 단계 결과), 아니면 None"""
+        with self._lock:
+            row = self._rows.get(url)
+        if row is None or STAGE_ORDER[row[0]] < STAGE_ORDER[stage] or row[0] == 'listed':
+            return None
+        return _loads(row[1])
+
+    def track_listing(self, sources: Iterable[Tuple[Any, Dict[str, Any]]]
+                      ) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """
+        목록 단계 래퍼: 목록에 나온 기사를 기록하고 Notion 기록까지 끝난 기사는 파이프라인에서 제외
+
+        목록 페이지 자체는 재개 시에도 다시 탐색합니다 (워터마크/이력 마무리에 필요한 최신 기사 정보를
+        크롤러가 탐색 중에 모으기 때문, 목록 페이지는 HTTP 캐시 TTL 안이면 네트워크 요청 없음).
+        """
+        listed: Dict[str, int] = {}
+        for crawler, article in sources:
+            url = article.get('url')
+            source = getattr(crawler, 'source_name', None)
+            if url:
+                with self._lock:
+                    row = self._rows.get(url)
+                if row and row[0] == 'notion':
+                    self.stats['skipped_synced'] += 1
+                    if hasattr(crawler, 'mark_processed'):
+                        crawler.mark_processed(article)  # 이전 실행에서 기록 완료 (워터마크 전진 대상)
+                    continue
+                if row is None:
+                    self._save(url, source, 'listed', article)
+                    listed[source] = listed.get(source, 0) + 1
+            yield crawler, article
+
+        failed = set(getattr(sources, 'failed_sources', ()))
+        for crawler in getattr(sources, 'crawlers', ()):
+            name = crawler.source_name
+            self._update_source(name, listed.get(name, 0), listing_done=name not in failed)
+
+    def checkpointed(self, stage: str, func: Callable[[Any, Dict[str, Any]], Optional[Any]]
+                     ) -> Callable[[Any, Dict[str, Any]], Optional[Any]]:
+        """
+        per_source() 단계 함수 래퍼: 끝난 단계는 저장된 결과 반환, 아니면 실행 후 결과 기록
+
+        Args:
+            stage: STAGE_ORDER의 단계 이름 ('detail', 'summary', 'notion')
+            func: (크롤러, 기사) → 결과 (None이면 제외/실패)
+        """
+        if stage not in STAGE_ORDER:
+            raise ValueError(f"알 수 없는 체크포인트 단계: {stage}")
+
+        def run(crawler: Any, article: Dict[str, Any]) -> Optional[Any]:
+            url = article.get('url')
+            if url:
+                saved = self.completed(url, stage)
+                if saved is not None:
+                    with self._lock:
+                        self.stats['resumed'] += 1
+                    return saved
+            result = func(crawler, article)
+            if url and result is not None:
+                self._save(url, getattr(crawler, 'source_name', None), stage, result)
+            return result
+        return run
+
+    def clear(self):
+        """실행 완료: 체크포인트 비움"""
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute('DELETE FROM checkpoint_articles')
+                    self._conn.execute('DELETE FROM checkpoint_sources')
+            except sqlite3.Error as e:
+                print(f"[Checkpoint] ⚠️ 체크포인트 정리 실패: {e}")
+                return
+            self._rows = {}
+
+    def close(self):
+        """연결 종료 (기록은 단계마다 이미 커밋됨)"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔧 증분 크롤링 워터마크
+- 소스별로 지난 실행에서 본 가장 최신 기사(idxno + 게시 시각) 저장
+- 다음 실행은 워터마크를 지나는 순간 목록 페이지 탐색 중단
+- overlap 구간만큼은 다시 확인하여 늦은 수정 기사 반영
+- 저장 시 파일을 다시 읽어 이번 실행에서 전진한 소스만 병합 (다른 소스의 워터마크를 덮어쓰지 않음)
+- 전진은 이번 실행에서 후속 처리(상세 → 필터 → Notion)까지 끝난 기사 구간까지만 (WatermarkProgress)
+"""
+
+import os
+import json
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from config.config import CRAWL_WATERMARK_FILE, CRAWL_WATERMARK_OVERLAP_HOURS
+
+
+class CrawlWatermark:
+    """
+    🔧 소스별 크롤링 워터마크 저장소
+
+    파일 형식:
+        {"전기신문": {"idxno": 352001, "published_date": "2025-06-17T10:30:00", "updated_at": "..."}}
+    """
+
+    def __init__(self, path: str = CRAWL_WATERMARK_FILE,
+                 overlap_hours: float = CRAWL_WATERMARK_OVERLAP_HOURS):
+        self.path = path
+        self.overlap = timedelta(hours=overlap_hours)
+        self.marks: Dict[str, Dict[str, Any]] = self._load()
+        self._changed: set = set()  # 이번 실행에서 전진한 소스 (save()에서 이 소스만 기록)
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                print(f"[Watermark] ⚠️ 워터마크 로드 실패 - 전체 탐색으로 진행: {e}")
+        return {}
+
+    def get(self, source: str) -> Optional[Dict[str, Any]]:
+        """
+        소스의 워터마크 반환
+
+        Returns:
+            Optional[Dict]: {'idxno': Optional[int], 'published_date': datetime} 또는 None
+        """
+        mark = self.marks.get(source)
+        if not mark or not mark.get('published_date'):
+            return None
+        try:
+            published_date = datetime.fromisoformat(mark['published_date'])
+        except ValueError:
+            return None
+        return {'idxno': mark.get('idxno'), 'published_date': published_date}
+
+    def is_covered(self, source: str, idxno: Optional[int], published_date: datetime) -> bool:
+        """
+        기사가 지난 실행에서 이미 처리된 구간(워터마크 - overlap 이전)에 속하는지 확인
+
+        idxno가 워터마크보다 큰 기사는 날짜와 무관하게 새 기사로 취급합니다.
+        """
+        mark = self.get(source)
+        if not mark:
+            return False
+        if published_date >= mark['published_date'] - self.overlap:
+            return False
+        if idxno is not None and mark.get('idxno') is not None and idxno > mark['idxno']:
+            return False
+        return True
+
+    def advance(self, source: str, idxno: Optional[int], published_date: datetime):
+        """더 최신 기사일 때만 워터마크 전진 (저장은 save()에서)"""
+        current = self.get(source)
+        if current:
+            newer_idxno = idxno is not None and (current.get('idxno') is None or idxno > current['idxno'])
+            if not newer_idxno and published_date <= current['published_date']:
+                return
+            if current.get('idxno') is not None and (idxno is None or idxno < current['idxno']):
+                idxno = current['idxno']
+            published_date = max(published_date, current['published_date'])
+
+        with self._lock:
+            self.marks[source] = {
+                'idxno': idxno,
+                'published_date': published_date.isoformat(),
+                'updated_at': datetime.now().isoformat(),
+            }
+            self._changed.add(source)
+
+    def save(self):
+        """원자적 저장 (파일을 다시 읽어 전진한 소스만 병합 → 임시 파일 작성 후 교체)"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        with self._lock:
+            try:
+                marks = self._load()
+                marks.update({source: self.marks[source] for source in self._changed})
+                fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(marks, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.path)
+                self.marks = marks
+                self._changed.clear()
+            except Exception as e:
+                print(f"[Watermark] ⚠️ 워터마크 저장 실패: {e}")
+
+
+class WatermarkProgress:
+    """
+    🔧 이번 실행의 워터마크 전진 범위 계산
+
+    **사용 예**:
+        progress = WatermarkProgress()
+        progress.listed('전기신문', url, idxno, published_date)  # 목록 단계 (처리 대상 기사)
+        progress.processed(url)                                 # Notion 기록 성공 또는 필터/중복 제외
+        mark = progress.safe_mark('전기신문')                    # (idxno, 게시 시각) 또는 None
+
+    **특징**:
+    - 처리가 끝나지 않은 기사(상세 실패, 단계 오류, 실행 중단 등)가 있으면
+      그 기사보다 오래된 처리 완료 기사까지만 전진 → 다음 실행에서 다시 목록에 나옴
+    - 파이프라인 워커 여러 개가 동시에 processed()를 호출해도 안전
+    """
+
+    def __init__(self):
+        self._listed: Dict[str, Tuple[str, Optional[int], datetime]] = {}  # URL → (워터마크 키, idxno, 게시 시각)
+        self._processed: set = set()
+        self._lock = threading.Lock()
+
+    def listed(self, key: str, url: str, idxno: Optional[int], published_date: datetime):
+        """후속 처리 대상으로 목록에 나온 기사 기록"""
+        if not url:
+            return
+        with self._lock:
+            self._listed.setdefault(url, (key, idxno, published_date))
+
+    def processed(self, url: Optional[str]):
+        """후속 처리가 끝난 기사 기록"""
+        if not url:
+            return
+        with self._lock:
+            self._processed.add(url)
+
+    def _split(self, key: str):
+        with self._lock:
+            entries = [(url in self._processed, idxno, published_date)
+                       for url, (entry_key, idxno, published_date) in self._listed.items() if entry_key == key]
+        done = [(idxno, published_date) for finished, idxno, published_date in entries if finished]
+        pending = [(idxno, published_date) for finished, idxno, published_date in entries if not finished]
+        return done, pending
+
+    def pending(self, key: str) -> int:
+        """처리가 끝나지 않은 기사 수"""
+        return len(self._split(key)[1])
+
+    def safe_mark(self, key: str) -> Optional[Tuple[Optional[int], datetime]]:
+        """
+        전진해도 처리되지 않은 기사를 건너뛰지 않는 워터마크
+
+        Returns:
+            (idxno, 게시 시각): 처리되지 않은 가장 오래된 기사보다 오래된(게시 시각·번호 모두) 처리 완료 기사 중 최신,
+            전진할 구간이 없으면 None
+        """
+        done, pending = self._split(key)
+        if pending:
+            oldest_date = min(published_date for _, published_date in pending)
+            pending_ids = [idxno for idxno, _ in pending if idxno is not None]
+            oldest_id = min(pending_ids) if pending_ids else None
+            done = [(idxno, published_date) for idxno, published_date in done
+                    if published_date < oldest_date
+                    and (idxno is None or oldest_id is None or idxno < oldest_id)]
+        if not done:
+            return None
+        done_ids = [idxno for idxno, _ in done if idxno is not None]
+        return (max(done_ids) if done_ids else None), max(published_date for _, published_date in done)
+
+
+# 모든 크롤러가 공유하는 워터마크 (싱글톤 패턴)
+_shared_watermark: Optional[CrawlWatermark] = None
+_shared_watermark_lock = threading.Lock()
+
+
+def get_shared_watermark() -> CrawlWatermark:
+    """소스별 크롤러가 공유하는 워터마크 저장소 반환"""
+    global _shared_watermark
+    with _shared_watermark_lock:
+        if _shared_watermark is None:
+            _shared_watermark = CrawlWatermark()
+        return _shared_watermark
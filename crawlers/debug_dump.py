@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔧 디버그 HTML 덤프 (opt-in)
+- DEBUG_HTML_DUMP=true 일 때만 동작 (기본: 아무 디스크 I/O 없음)
+- gzip 압축 + 파일당 크기 제한
+- 백그라운드 스레드가 저장 (크롤링 경로는 큐에 넣기만 함)
+- 저장 위치: card_news_paths의 'debug_html' 경로
+"""
+
+import os
+import re
+import gzip
+import queue
+import threading
+from pathlib import Path
+from typing import Optional
+
+from config.config import DEBUG_HTML_DUMP, DEBUG_HTML_MAX_BYTES, DEBUG_HTML_QUEUE_SIZE
+
+
+def resolve_debug_dir() -> Path:
+    """card_news_paths 설정에서 디버그 HTML 디렉토리 조회 (키가 없는 기존 설정은 logs/debug_html)"""
+    from card_news_paths import get_paths
+
+    paths = get_paths()
+    try:
+        return paths.get('debug_html')
+    except KeyError:
+        return paths.PROJECT_ROOT / 'logs' / 'debug_html'
+
+
+class DebugHtmlWriter:
+    """
+    🔧 백그라운드 디버그 HTML 저장기
+
+    **특징**:
+    - dump()는 비활성화 시 즉시 반환, 활성화 시 큐에 넣고 즉시 반환
+    - 큐가 가득 차면 해당 덤프는 버림 (크롤링을 막지 않음)
+    - 저장 스레드는 첫 dump() 시점에 시작
+    """
+
+    def __init__(self, enabled: bool = DEBUG_HTML_DUMP,
+                 directory: Optional[Path] = None,
+                 max_bytes: int = DEBUG_HTML_MAX_BYTES,
+                 queue_size: int = DEBUG_HTML_QUEUE_SIZE):
+        self.enabled = enabled
+        self.directory = directory
+        self.max_bytes = max(1, max_bytes)
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _safe_name(name: str) -> str:
+        return re.sub(r'[^a-zA-Z0-9_.=-]', '_', name)[:150]
+
+    def _ensure_thread(self):
+        with self._lock:
+            if self._thread is None:
+                if self.directory is None:
+                    self.directory = resolve_debug_dir()
+                os.makedirs(self.directory, exist_ok=True)
+                self._thread = threading.Thread(target=self._run, name='debug-html-writer', daemon=True)
+                self._thread.start()
+                print(f"[DebugDump] 디버그 HTML 저장 활성화: {self.directory}")
+
+    def dump(self, name: str, html_content: str):
+        """
+        디버그 HTML 저장 요청 (비활성화 시 no-op)
+
+        Args:
+            name: 파일 이름 (확장자 제외, 예: 'debug_article_352001')
+            html_content: 저장할 HTML
+        """
+        if not self.enabled or not html_content:
+            return
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait((self._safe_name(name), html_content))
+        except queue.Full:
+            print(f"[DebugDump] ⚠️ 저장 대기열 가득 참 - 덤프 생략: {name}")
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                name, html_content = item
+                data = html_content.encode('utf-8')[:self.max_bytes]
+                path = os.path.join(self.directory, f"{name}.html.gz")
+                with gzip.open(path, 'wb') as f:
+                    f.write(data)
+            except Exception as e:
+                print(f"[DebugDump] ⚠️ 디버그 HTML 저장 실패: {e}")
+            finally:
+                self._queue.task_done()
+
+    def close(self):
+        """대기 중인 덤프를 모두 저장한 뒤 저장 스레드 종료"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+
+# 크롤러 공용 디버그 덤프 저장기 (싱글톤 패턴)
+_shared_writer: Optional[DebugHtmlWriter] = None
+_shared_writer_lock = threading.Lock()
+
+
+def get_debug_writer() -> DebugHtmlWriter:
+    """모든 크롤러가 공유하는 디버그 HTML 저장기 반환"""
+    global _shared_writer
+    with _shared_writer_lock:
+        if _shared_writer is None:
+            _shared_writer = DebugHtmlWriter()
+        return _shared_writer
+
+
+def close_debug_writer():
+    """공용 디버그 HTML 저장기 종료 (프로세스 종료 전 호출)"""
+    global _shared_writer
+    with _shared_writer_lock:
+        writer, _shared_writer = _shared_writer, None
+    if writer is not None:
+        writer.close()
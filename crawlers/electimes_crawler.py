@@ -1,27 +1,37 @@
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import quote
 from bs4 import BeautifulSoup
 import requests
-from selenium import webdriver # Selenium 관련 import 주석 처리
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-from webdriver_manager.chrome import ChromeDriverManager
 from crawlers.base_crawler import BaseCrawler
+from crawlers.registry import register_crawler
+from crawlers.resource_managers import get_shared_driver_pool
+from crawlers.http_cache import HttpCache
+from crawlers.crawl_watermark import WatermarkProgress, get_shared_watermark
+from crawlers.url_index import UrlIndex
+from crawlers.html_parser import ARTICLE_LIST_STRAINER, ARTICLE_BODY_STRAINER
+from crawlers.debug_dump import get_debug_writer
+from crawlers.content_extractor import get_shared_content_extractor
+from card_news.types import CrawledArticle
+from config.config import SELENIUM_WAIT_TIMEOUT, SEARCH_MAX_PAGES, SEARCH_MAX_TERMS_CONCURRENCY
 from recommenders.article_recommender import ArticleRecommender
 import json
 import os
 import re
 import time
+import traceback
 import pytz # pytz 라이브러리 추가
 from notion.notion_client import NotionClient
 import joblib
 from processors.keyword_processor import KeywordProcessor
+from processors.keyword_matcher import get_keyword_matcher, register_keyword_group
 from ai_update_content import clean_article_content, generate_one_line_summary_with_llm, generate_key_content
 
+@register_crawler('전기신문')
 class ElectimesCrawler(BaseCrawler):
     # 전력 산업 관련 키워드
     KEYWORDS = [
@@ -34,8 +44,14 @@ class ElectimesCrawler(BaseCrawler):
         '태양광', # 사용자 요청으로 추가
         '전력감독원'  # 사용자 요청으로 추가
     ]
+
+    # 알려진 본문 컨테이너 (본문 추출기 점수 가산)
+    CONTENT_SELECTORS = ['#article-view-content-div', '.view-cont', '.article-content', '.article-body']
+
+    supports_backfill = True  # crawl_pages로 페이지 단위 백필
     
-    def __init__(self, notion_client: NotionClient, recommender: Optional[Any] = None):
+    def __init__(self, notion_client: NotionClient, recommender: Optional[Any] = None,
+                 use_watermark: bool = True):
         super().__init__('전기신문', 'https://www.electimes.com')
         self._source_name = '전기신문' # Explicitly store source name
         # 모든 섹션의 기사를 크롤링하기 위해 URL 수정
@@ -45,77 +61,23 @@ class ElectimesCrawler(BaseCrawler):
         # 크롤링 이력 파일 경로
         self.history_file = 'crawled_articles.json'
         self.crawled_urls = self.load_crawled_urls()
+
+        # Conditional GET 디스크 캐시 (목록: 짧은 TTL, 기사: 긴 TTL)
+        self.http_cache = HttpCache()
+
+        # 증분 크롤링 워터마크 (지난 실행의 최신 기사 이후만 탐색)
+        self.use_watermark = use_watermark
+        self.watermark = get_shared_watermark()  # 소스 간 공유 (저장 시 서로 덮어쓰지 않도록)
+        self.progress = WatermarkProgress()  # 이번 실행에서 처리가 끝난 기사 (워터마크 전진 범위)
         
-        # Selenium 관련 초기화 제거 또는 주석 처리
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/113.0.0.0 Safari/537.36')
-        
-        # WebDriverManager 버그 해결: 동적 경로 탐색
-        def find_chromedriver_path():
-            """WebDriverManager 결과를 검증하고 올바른 chromedriver 찾기"""
-            import os
-            import glob
-            
-            try:
-                # 1단계: WebDriverManager 시도
-                wdm_path = ChromeDriverManager().install()
-                
-                # 2단계: 결과 검증
-                if os.path.exists(wdm_path) and os.access(wdm_path, os.X_OK):
-                    # 올바른 파일인지 확인 (크기 체크)
-                    if os.path.getsize(wdm_path) > 1000000:  # 1MB 이상이면 정상적인 chromedriver
-                        return wdm_path
-                
-                # 3단계: 같은 디렉토리에서 실제 chromedriver 찾기
-                wdm_dir = os.path.dirname(wdm_path)
-                potential_drivers = glob.glob(os.path.join(wdm_dir, '**/chromedriver*'), recursive=True)
-                
-                for driver_path in potential_drivers:
-                    if (os.path.isfile(driver_path) and 
-                        os.access(driver_path, os.X_OK) and 
-                        'chromedriver' in os.path.basename(driver_path) and
-                        not driver_path.endswith('.chromedriver') and
-                        os.path.getsize(driver_path) > 1000000):  # 실제 실행파일인지 확인
-                        return driver_path
-                
-                # 4단계: 전체 .wdm 디렉토리에서 찾기 (마지막 수단)
-                home_dir = os.path.expanduser("~")
-                wdm_base = os.path.join(home_dir, ".wdm", "drivers", "chromedriver")
-                if os.path.exists(wdm_base):
-                    all_drivers = glob.glob(os.path.join(wdm_base, "**/chromedriver"), recursive=True)
-                    for driver_path in all_drivers:
-                        if (os.path.isfile(driver_path) and 
-                            os.access(driver_path, os.X_OK) and
-                            os.path.getsize(driver_path) > 1000000):
-                            return driver_path
-                
-                raise Exception("올바른 chromedriver를 찾을 수 없습니다")
-                
-            except Exception as e:
-                raise Exception(f"ChromeDriver 경로 탐색 실패: {e}")
-        
-        try:
-            driver_path = find_chromedriver_path()
-            service = Service(driver_path)
-            print(f"ChromeDriver 경로: {driver_path}")
-        except Exception as e:
-            print(f"ChromeDriver 초기화 실패: {e}")
-            raise
-        
-        try:
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.wait = WebDriverWait(self.driver, 30)
-            print("Chromium WebDriver initialized successfully")
-        except Exception as e:
-            print(f"Error initializing Chromium WebDriver: {str(e)}")
-            # Selenium 초기화 실패 시 requests 사용으로 폴백 (선택 사항)
-            print("Falling back to requests for page content.")
-            self.driver = None
+        # Selenium은 requests 결과가 비정상일 때만 공용 풀에서 지연 기동
+        self.driver_pool = get_shared_driver_pool()
+
+        # 디버그 HTML 덤프 (기본 비활성화, 활성화 시 백그라운드 압축 저장)
+        self.debug_writer = get_debug_writer()
+
+        # 본문 추출기 (문단 점수화 + 상용구 제거, HTML 해시 기준 결과 캐시)
+        self.content_extractor = get_shared_content_extractor()
             
         # AI 추천 시스템 초기화
         self.article_recommender = ArticleRecommender(notion_client)
@@ -124,46 +86,29 @@ class ElectimesCrawler(BaseCrawler):
         self.keywords = set()  # 동적 키워드 세트
         self.update_crawling_criteria()  # 초기 크롤링 기준 설정
 
-    def __del__(self):
-        """드라이버 종료"""
-        if hasattr(self, 'driver') and self.driver is not None:
-            try:
-                self.driver.quit()
-            except Exception as e:
-                print(f"Error closing WebDriver: {str(e)}")
-
-    def load_crawled_urls(self) -> set:
-        """이전에 크롤링한 URL 목록을 로드"""
-        if os.path.exists(self.history_file):
-            try:
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    return set(json.load(f))
-            except Exception as e:
-                print(f"Error loading crawled URLs: {str(e)}")
-        return set()
+    def load_crawled_urls(self) -> UrlIndex:
+        """이전에 크롤링한 URL 이력을 로드 (기존 JSON 이력은 최초 1회 SQLite로 이전)"""
+        return UrlIndex(legacy_json=self.history_file)
 
     def save_crawled_url(self, url: str):
-        """크롤링한 URL을 저장"""
+        """크롤링한 URL을 기록 (디스크 반영은 페이지 단위 commit에서)"""
         self.crawled_urls.add(url)
-        try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(list(self.crawled_urls), f)
-        except Exception as e:
-            print(f"Error saving crawled URL: {str(e)}")
+
+    def close(self):
+        """URL 이력 연결 종료 (이력 반영은 finalize_crawl()/호출부 commit에서만, 남은 항목은 버림)"""
+        self.crawled_urls.close(commit=False)
 
     def is_recent_article(self, date: datetime) -> bool:
-        """기사가 한국 시간 기준으로 최근 7일 내의 것인지 확인 (날짜만 비교)"""
+        """기사가 한국 시간 기준으로 최근 window_days일 내의 것인지 확인 (날짜만 비교)"""
         kst = pytz.timezone('Asia/Seoul')
         now_kst = datetime.now(kst) # 한국 시간 현재 시각
         today_kst = now_kst.date() # 한국 시간 오늘 날짜
-        three_days_ago_kst = today_kst - timedelta(days=7) # 한국 시간 3일 전 날짜
+        window_start_kst = today_kst - timedelta(days=self.window_days) # 한국 시간 수집 기간 시작 날짜
 
         # 기사 날짜의 시간 정보 제거 (naive datetime 가정)
         article_date = date.date()
 
-        is_recent = article_date >= three_days_ago_kst
-        # print(f"Date check (KST) - Article date (date only): {article_date}, 3 days ago (KST date only): {three_days_ago_kst}, Is recent: {is_recent})") # Debug log 제거
-        return is_recent
+        return article_date >= window_start_kst
 
     def _parse_date_safely(self, date_str: str) -> Optional[datetime]:
         """
@@ -220,74 +165,30 @@ class ElectimesCrawler(BaseCrawler):
 
     def _smart_retry(self, operation_name: str, operation_func, max_retries: int = 3, base_delay: float = 2.0):
         """
-        🔧 스마트 네트워크 재시도 시스템
+        🔧 스마트 네트워크 재시도 시스템 (호스트별 공용 속도 제한기 기반)
         
         **특징**:
-        - 지수 백오프 (Exponential Backoff): 2초 → 4초 → 8초
+        - 호출마다 따로 지수 백오프 sleep 하지 않음: 재시도 간격은 호스트 토큰 버킷이 결정
+          (429/5xx/타임아웃 발생 시 호스트 전체 속도를 낮춰 동시 요청이 함께 감속)
+        - 연속 실패로 서킷이 차단된 호스트는 즉시 포기 (재시도 폭주 방지)
         - 오류 분류: 일시적 vs 영구적 오류 구분
-        - 지터(Jitter): 랜덤 요소 추가로 서버 부하 분산
         
         Args:
             operation_name (str): 작업 이름 (로그용)
-            operation_func (callable): 실행할 함수
-            max_retries (int): 최대 재시도 횟수
-            base_delay (float): 기본 대기 시간(초)
+            operation_func (callable): 실행할 함수 (요청 구간은 fetcher.host_slot 또는 rate_limiter.slot 사용)
+            max_retries (int): 최대 시도 횟수
+            base_delay (float): 하위 호환용 (대기 시간은 속도 제한기가 결정)
             
         Returns:
             operation_func의 결과 또는 None
         """
-        import random
-        
-        # 🔍 재시도 가능한 오류 타입들
-        retryable_exceptions = (
-            requests.exceptions.ConnectionError,     # 연결 오류
-            requests.exceptions.Timeout,            # 타임아웃
-            requests.exceptions.HTTPError,          # HTTP 5xx 오류
-            TimeoutException,                       # Selenium 타임아웃
+        return self.fetcher.rate_limiter.call_with_retry(
+            operation_name, operation_func, max_retries=max_retries, log_prefix='[Electimes]'
         )
-        
-        for attempt in range(max_retries):
-            try:
-                print(f"[Electimes] {operation_name} 시도 중... (시도 {attempt + 1}/{max_retries})")
-                result = operation_func()
-                print(f"[Electimes] ✅ {operation_name} 성공!")
-                return result
-                
-            except retryable_exceptions as e:
-                if attempt < max_retries - 1:
-                    # 🎯 지수 백오프 + 지터 계산
-                    delay = base_delay * (2 ** attempt)  # 2초 → 4초 → 8초
-                    jitter = random.uniform(0.1, 0.3) * delay  # 10-30% 랜덤 추가
-                    total_delay = delay + jitter
-                    
-                    print(f"[Electimes] ⚠️ {operation_name} 일시적 오류: {type(e).__name__}")
-                    print(f"[Electimes] 🔄 {total_delay:.1f}초 후 재시도... (지수 백오프)")
-                    time.sleep(total_delay)
-                else:
-                    print(f"[Electimes] ❌ {operation_name} 최종 실패: {str(e)}")
-                    break
-                    
-            except (requests.exceptions.HTTPError, ValueError, AttributeError) as e:
-                # 🚫 영구적 오류 - 재시도하지 않음
-                print(f"[Electimes] ❌ {operation_name} 영구적 오류 (재시도 안함): {type(e).__name__} - {str(e)}")
-                break
-                
-            except Exception as e:
-                # 🤔 알 수 없는 오류 - 보수적으로 재시도
-                if attempt < max_retries - 1:
-                    delay = base_delay * (2 ** attempt)
-                    print(f"[Electimes] ❓ {operation_name} 알 수 없는 오류: {type(e).__name__} - {str(e)}")
-                    print(f"[Electimes] 🔄 {delay}초 후 재시도...")
-                    time.sleep(delay)
-                else:
-                    print(f"[Electimes] ❌ {operation_name} 최종 실패 (알 수 없는 오류): {str(e)}")
-                    break
-        
-        return None  # 모든 시도 실패
 
     def contains_keywords_and_extract(self, text: str) -> tuple[bool, list]:
-        """텍스트에 키워드가 포함되어 있는지 확인하고 매칭된 키워드 반환"""
-        found_keywords = [keyword for keyword in self.KEYWORDS if keyword in text]
+        """텍스트에 키워드가 포함되어 있는지 확인하고 매칭된 키워드 반환 (공용 키워드 매처, 단일 패스)"""
+        found_keywords = get_keyword_matcher().matched_keywords(text, 'electimes')
         if found_keywords:
             return True, found_keywords
         return False, []
@@ -297,40 +198,27 @@ class ElectimesCrawler(BaseCrawler):
         contains, _ = self.contains_keywords_and_extract(text)
         return contains
 
-    def get_page_content(self, url: str) -> str:
-        """🔧 개선된 Selenium 페이지 컨텐츠 가져오기 (스마트 재시도 적용)"""
-        if self.driver is None:
-            print("Selenium driver not initialized. Cannot get page content.")
-            return ""
+    @staticmethod
+    def _is_valid_list_page(html_content: Optional[str]) -> bool:
+        """목록 페이지 응답 검사 (기사 목록 영역이 있어야 정상, 빈 마지막 페이지는 정상으로 취급)"""
+        return bool(html_content) and 'section-list' in html_content
+
+    def get_page_content(self, url: str, wait_selector: str = 'section#section-list') -> str:
+        """🔧 Selenium 페이지 컨텐츠 가져오기 (풀 드라이버 재사용 + 명시적 대기, 스마트 재시도 적용)"""
 
         def fetch_with_selenium():
-            """Selenium으로 페이지 가져오기 작업"""
-            self.driver.get(url)
-            
-            # Simple wait for page content to potentially load dynamically
-            time.sleep(5)
-            
-            html_content = self.driver.page_source
-
-            # Save HTML content to file for debugging
-            filename = url.split('/')[-1].split('?')[0]
-            if not filename:
-                filename = 'index.html'
-            if not filename.endswith('.html'):
-                filename = filename + '.html'
-                
-            # Append query parameters to filename for distinction
-            query_string = url.split('?')
-            if len(query_string) > 1:
-                filename = f"{filename}?{'?'.join(query_string[1:])}"
-
-            # Replace invalid characters in filename
-            filename = re.sub(r'[^a-zA-Z0-9_.-?=&]', '_', filename)
-            debug_file = f"debug_{filename}"
-
-            with open(debug_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            print(f"Saved HTML content to {debug_file}")
+            """Selenium으로 페이지 가져오기 작업 (브라우저 로드도 호스트 속도 제한 적용)"""
+            with self.fetcher.rate_limiter.slot(url), self.driver_pool.driver() as driver:
+                driver.get(url)
+
+                # 고정 sleep 대신 목록 영역이 DOM에 나타날 때까지만 대기 (TimeoutException은 재시도)
+                WebDriverWait(driver, SELENIUM_WAIT_TIMEOUT).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector))
+                )
+                html_content = driver.page_source
+
+            # 디버그 모드에서만 백그라운드 저장 (DEBUG_HTML_DUMP=true)
+            self.debug_writer.dump(f"debug_{url.split('/')[-1] or 'index'}", html_content)
             
             return html_content
 
@@ -349,10 +237,6 @@ class ElectimesCrawler(BaseCrawler):
             print(f"Failed to fetch {url} using Selenium after all retries")
             return ""
 
-    def parse_html(self, html_content: str) -> BeautifulSoup:
-        """Parse HTML content using BeautifulSoup"""
-        return BeautifulSoup(html_content, 'html.parser')
-
     def update_crawling_criteria(self):
         """크롤링 기준 업데이트"""
         try:
@@ -377,7 +261,7 @@ class ElectimesCrawler(BaseCrawler):
             # 관심 기사에서 키워드 추출
             # Note: This part assumes ArticleRecommender can load patterns/keywords without a pre-trained model
             # If not, this needs adjustment.
-            if hasattr(self, 'article_recommender') and self.article_recommender:
+            if getattr(self, 'article_recommender', None) and self.article_recommender.notion is not None:
                  interested_articles = self.article_recommender.notion.get_interested_articles()
                  if interested_articles:
                      # Assuming analyze_article_patterns extracts keywords from interested articles
@@ -399,24 +283,23 @@ class ElectimesCrawler(BaseCrawler):
             import traceback
             print(traceback.format_exc())
 
-    def _fetch_articles(self, page: int = 1) -> List[Dict[str, Any]]:
-        """특정 페이지의 기사 목록 원시 데이터를 가져옵니다."""
-        url = f"{self.list_url}&page={page}"
+    def search_url(self, term: str, page: int = 1) -> str:
+        """사이트 검색 결과 목록 URL (일반 목록과 같은 view_type=sm 형식)"""
+        return f"{self.list_url}&sc_word={quote(term)}&page={page}"
+
+    def _fetch_articles(self, page: int = 1, search_term: Optional[str] = None) -> List[Dict[str, Any]]:
+        """특정 페이지의 기사 목록 원시 데이터를 가져옵니다. (search_term이 있으면 사이트 검색 결과 페이지)"""
+        url = self.search_url(search_term, page) if search_term else f"{self.list_url}&page={page}"
         print(f"[Electimes] 기사 목록 가져오는 중 (페이지 {page}): {url}")
         
         try:
-            # Selenium 드라이버가 초기화되었으면 Selenium 사용, 아니면 requests 사용
-            if self.driver:
-                html_content = self.get_page_content(url)
-            else:
-                # 🚀 개선된 requests 호출 (스마트 재시도 적용)
-                def fetch_page_list():
-                    """페이지 목록 가져오기 작업"""
-                    response = requests.get(url, timeout=15)
-                    response.raise_for_status()
-                    return response.text
-
-                print(f"[Electimes] Selenium 드라이버 사용 불가. 스마트 재시도로 기사 목록 가져오는 중: {url}")
+            # 🚀 requests 우선 (스마트 재시도 + HTTP 캐시 경유, 304는 캐시 본문 사용)
+            def fetch_page_list():
+                """페이지 목록 가져오기 작업"""
+                return self.http_cache.get(self.session, url, url_class='search' if search_term else 'list',
+                                           timeout=15, slot=self.fetcher.host_slot)
+
+            with self.stage_timer('list_fetch'):
                 html_content = self._smart_retry(
                     operation_name=f"기사 목록 가져오기 (페이지 {page})",
                     operation_func=fetch_page_list,
@@ -424,56 +307,58 @@ class ElectimesCrawler(BaseCrawler):
                     base_delay=1.5  # 목록 페이지는 좀 더 빠르게
                 )
 
+            # 응답이 비정상(목록 영역 없음)일 때만 Selenium으로 폴백
+            if not self._is_valid_list_page(html_content):
+                print(f"[Electimes] requests 응답에 기사 목록이 없습니다. Selenium으로 재시도: {url}")
+                html_content = self.get_page_content(url)
+                if self._is_valid_list_page(html_content):
+                    # 다음 조회는 캐시된 정상 본문 사용
+                    self.http_cache.store(url, html_content)
+
             if not html_content:
                 print(f"[Electimes] 페이지 콘텐츠를 가져오지 못했습니다: {url}")
                 return []
                 
-            soup = self.parse_html(html_content)
-            # 수정된 CSS 선택자 사용
-            articles = []
-            # section#section-list li.item 아래에서 기사 항목 찾기
-            article_items = soup.select('section#section-list li.item')
+            # 기사 목록 영역(section#section-list)만 파싱 (항목 추출 후 트리 즉시 해제)
+            with self.parsed_html(html_content, parse_only=ARTICLE_LIST_STRAINER) as soup:
+                # 수정된 CSS 선택자 사용
+                articles = []
+                # section#section-list li.item 아래에서 기사 항목 찾기
+                article_items = soup.select('section#section-list li.item')
             
-            if not article_items:
-                 print(f"[Electimes] 페이지 {page}에서 기사 항목을 찾지 못했습니다. (선택자: section#section-list li.item)")
-                 # 빈 목록을 반환하여 페이지네이션 중단 로직이 작동하도록 유도
-                 return []
-
-            print(f"[Electimes] 페이지 {page}에서 {len(article_items)}개의 기사 항목 발견.")
-
-            for item in article_items:
-                # 수정된 CSS 선택자 사용: 제목 링크, 날짜
-                title_link = item.select_one('h4.titles a.linked')
-                date_tag = item.select_one('em.replace-date')
-                source_tag = item.select_one('span.byline a') # 출처(기자 이름/소속) 가져오기 추가
-
-                title = title_link.text.strip() if title_link else None
-                url = self.base_url + title_link['href'] if title_link and title_link.has_attr('href') else None
-                date_str = date_tag.text.strip() if date_tag else None
-                source = source_tag.text.strip() if source_tag else self._source_name # 출처 가져오기
-
-                # 🔧 개선된 날짜 파싱 시도 (다양한 형식 고려)
-                published_date = None
-                if date_str:
-                    published_date = self._parse_date_safely(date_str)
+                if not article_items:
+                     print(f"[Electimes] 페이지 {page}에서 기사 항목을 찾지 못했습니다. (선택자: section#section-list li.item)")
+                     # 빈 목록을 반환하여 페이지네이션 중단 로직이 작동하도록 유도
+                     return []
+
+                print(f"[Electimes] 페이지 {page}에서 {len(article_items)}개의 기사 항목 발견.")
+
+                for item in article_items:
+                    # 수정된 CSS 선택자 사용: 제목 링크, 날짜
+                    title_link = item.select_one('h4.titles a.linked')
+                    date_tag = item.select_one('em.replace-date')
+                    source_tag = item.select_one('span.byline a') # 출처(기자 이름/소속) 가져오기 추가
+
+                    title = title_link.text.strip() if title_link else None
+                    url = self.base_url + title_link['href'] if title_link and title_link.has_attr('href') else None
+                    date_str = date_tag.text.strip() if date_tag else None
+                    source = source_tag.text.strip() if source_tag else self._source_name # 출처 가져오기
+
+                    # 🔧 개선된 날짜 파싱 시도 (다양한 형식 고려)
+                    published_date = None
+                    if date_str:
+                        published_date = self._parse_date_safely(date_str)
                             
-                # ✅ 제목, URL, 날짜가 모두 성공적으로 파싱된 경우만 추가
-                if title and url and published_date:
-                     articles.append({
-                         'title': title,
-                         'url': url,
-                         'published_date': published_date,
-                         'source': source, # 출처 추가
-                         'content': '', # content는 상세 페이지에서 가져옴
-                         'keywords': [], # 키워드는 나중에 추가
-                         'ai_recommend': False # AI 추천 초기값
-                     })
-                     # print(f"[Electimes] 기사 항목 추출: {title} - {date_str}") # Debug log 제거
-                elif date_str and not published_date:
-                    # 📝 날짜 파싱 실패한 기사는 로그로 기록
-                    print(f"[Electimes] ⚠️  날짜 파싱 실패로 기사 제외: '{title}' - 날짜: '{date_str}'")
-                # else:
-                #     print(f"[Electimes] 기사 항목 스킵 (정보 누락): 제목={title}, URL={url}, 날짜={date_str}") # Debug log 제거
+                    # ✅ 제목, URL, 날짜가 모두 성공적으로 파싱된 경우만 추가
+                    if title and url and published_date:
+                         # content는 상세 페이지에서, 키워드는 필터 단계에서 채움 (__slots__ 레코드)
+                         articles.append(CrawledArticle.from_listing(title, url, published_date, source))
+                         # print(f"[Electimes] 기사 항목 추출: {title} - {date_str}") # Debug log 제거
+                    elif date_str and not published_date:
+                        # 📝 날짜 파싱 실패한 기사는 로그로 기록
+                        print(f"[Electimes] ⚠️  날짜 파싱 실패로 기사 제외: '{title}' - 날짜: '{date_str}'")
+                    # else:
+                    #     print(f"[Electimes] 기사 항목 스킵 (정보 누락): 제목={title}, URL={url}, 날짜={date_str}") # Debug log 제거
                 
             return articles
             
@@ -486,6 +371,11 @@ class ElectimesCrawler(BaseCrawler):
             print(traceback.format_exc())
             return []
 
+    def _extract_idxno(self, url: Optional[str]) -> Optional[int]:
+        """기사 URL에서 idxno(기사 번호) 추출"""
+        match_idxno = re.search(r'idxno=(\d+)', url or '')
+        return int(match_idxno.group(1)) if match_idxno else None
+
     def _extract_date(self, article: Dict[str, Any]) -> Optional[datetime]:
          """🔧 기사 딕셔너리에서 날짜 정보를 안전하게 추출합니다."""
          date = article.get('published_date')
@@ -494,22 +384,34 @@ class ElectimesCrawler(BaseCrawler):
              return self._parse_date_safely(date)
          return date
 
-    def crawl(self) -> list:
+    def _ai_model_loaded(self) -> bool:
+        """AI 추천 모델과 벡터라이저가 모두 로드되었는지 확인"""
+        return bool(self.ai_recommender and getattr(self, 'vectorizer', None))
+
+    def iter_list_pages(self):
         """
-        전기신문 기사를 크롤링합니다.
-        한국 날짜 기준으로 최근 7일 이내 기사가 나타날 때까지 페이지를 탐색하며,
-        키워드 및 AI 추천 필터링을 거쳐 상세 내용을 크롤링합니다.
+        기사 목록 페이지를 순서대로 탐색하며 (페이지 번호, 최근 기사 목록)을 생성합니다.
+        한국 날짜 기준으로 최근 window_days일 이내 기사가 나타날 때까지 페이지를 탐색하고,
+        지난 실행 워터마크를 지나면 탐색을 종료합니다.
+        생성한 기사는 처리 대상으로 기록하고, 워터마크 전진은 finalize_crawl()에서
+        처리가 끝난 기사(mark_processed) 구간까지만 반영합니다.
         """
         print("[Electimes] 크롤링 시작...")
         self.update_crawling_criteria() # 최신 기준 업데이트
         
-        crawled_articles_details = []
         page = 1
         recent_article_found_on_page = True # 현재 페이지에서 최근 기사 발견 여부
         consecutive_pages_without_recent = 0 # 최근 기사 없는 연속 페이지 수
         max_consecutive_without_recent = 3 # 최근 기사 없이 탐색할 최대 연속 페이지 수
+
+        # 증분 크롤링: 지난 실행 워터마크를 지나면 탐색 종료
+        watermark = self.watermark.get(self._source_name) if self.use_watermark else None
+        if watermark:
+            print(f"[Electimes] 워터마크: idxno={watermark['idxno']}, {watermark['published_date']} (overlap {self.watermark.overlap})")
+        watermark_crossed = False
+        self.progress = WatermarkProgress()
         
-        while recent_article_found_on_page and page <= 20: # 최대 20페이지까지 탐색 (안전 장치)
+        while recent_article_found_on_page and not watermark_crossed and page <= 20: # 최대 20페이지까지 탐색 (안전 장치)
             print(f"[Electimes] 페이지 {page} 탐색 중...")
             recent_article_found_on_page = False # 다음 페이지를 위해 초기화
 
@@ -523,171 +425,309 @@ class ElectimesCrawler(BaseCrawler):
             recent_articles_on_page = []
             for article in raw_articles_on_page:
                  published_date = self._extract_date(article)
-                 if published_date and self.is_recent_article(published_date):
+                 if not published_date:
+                     continue
+
+                 idxno = self._extract_idxno(article.get('url'))
+
+                 # 워터마크 이전 기사는 지난 실행에서 처리됨 → 건너뛰고 이 페이지에서 탐색 종료
+                 if watermark and self.watermark.is_covered(self._source_name, idxno, published_date):
+                     watermark_crossed = True
+                     continue
+
+                 if self.is_recent_article(published_date):
                      recent_articles_on_page.append(article)
+                     self.progress.listed(self._source_name, article.get('url'), idxno, published_date)
                      recent_article_found_on_page = True # 현재 페이지에서 최근 기사 발견!
 
+            if watermark_crossed:
+                 print(f"[Electimes] 페이지 {page}에서 워터마크 도달. 이 페이지까지만 처리 후 탐색 종료.")
+
             if recent_article_found_on_page:
                  consecutive_pages_without_recent = 0 # 최근 기사를 찾았으므로 카운트 리셋
-                 print(f"[Electimes] 페이지 {page}에서 최근 7일 이내 기사 발견. 탐색 계속.")
+                 print(f"[Electimes] 페이지 {page}에서 최근 {self.window_days}일 이내 기사 발견. 탐색 계속.")
             else:
                  consecutive_pages_without_recent += 1
-                 print(f"[Electimes] 페이지 {page}에서 최근 7일 이내 기사 없음. 연속 {consecutive_pages_without_recent} 페이지.")
+                 print(f"[Electimes] 페이지 {page}에서 최근 {self.window_days}일 이내 기사 없음. 연속 {consecutive_pages_without_recent} 페이지.")
                  if consecutive_pages_without_recent >= max_consecutive_without_recent:
                      print(f"[Electimes] 최근 기사 없는 페이지가 {max_consecutive_without_recent}번 연속되어 탐색 종료.")
                      break # 연속 3페이지 동안 최근 기사가 없으면 탐색 종료
 
             # 날짜 필터링 통과한 기사들에 대해서만 추가 처리
-            articles_to_process = recent_articles_on_page
+            yield page, recent_articles_on_page
+
+            page += 1 # 다음 페이지로 이동
+
+    def _with_urls(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """URL이 있는 기사만 반환 (상세 내용 크롤링 대상)"""
+        articles_to_fetch = []
+        for article_summary in articles:
+            if article_summary.get('url'):
+                articles_to_fetch.append(article_summary)
+            else:
+                print(f"[Electimes] URL 정보가 없어 상세 내용 크롤링 스킵: {article_summary.get('title', '제목 없음')}")
+        return articles_to_fetch
+
+    def iter_recent_articles(self):
+        """
+        📋 목록 단계: 상세 내용 크롤링 대상 기사 요약을 하나씩 생성합니다.
+        (스트리밍 파이프라인의 입력, AI 추천 모델이 로드된 경우에만 대상 선정)
+        """
+        for page, articles_to_process in self.iter_list_pages():
+            if not (self._ai_model_loaded() and articles_to_process):
+                continue
+            for article_summary in self._with_urls(articles_to_process):
+                yield article_summary
+
+    def _merge_details(self, article_summary: Dict[str, Any],
+                       article_details: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """목록 정보와 상세 내용을 합침 (상세 내용이 없으면 None)"""
+        if article_details and article_details.get('content'):
+            # 상세 내용이 있는 경우, 기존 목록 정보에 합침
+            print(f"[Electimes] 상세 내용 크롤링 완료: {article_summary.get('title', '제목 없음')}")
+            # 새 레코드를 만들지 않고 목록 레코드를 제자리 갱신 (본문은 한 곳에만 보관)
+            article_summary.update(article_details)
+            return article_summary
+        print(f"[Electimes] 상세 내용 크롤링 실패 또는 내용 없음: {article_summary.get('title', '제목 없음')}")
+        return None
+
+    def fetch_article_details(self, article_summary: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """📰 상세 단계: 기사 하나의 상세 내용을 가져와 목록 정보와 합침"""
+        return self._merge_details(article_summary, self.get_article_content(article_summary['url']))
+
+    def filter_articles(self, articles_with_details: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        🔍 필터 단계: 상세 내용을 가져온 기사에 AI 추천 예측 후 키워드/AI 추천 기준으로 최종 대상 선정
+        (선정된 기사 URL은 이력에 기록, 디스크 반영은 commit에서)
+        """
+        # 상세 내용을 가져온 기사들에 대해 AI 추천 예측
+        articles_after_ai_predict = []
+        if articles_with_details and self._ai_model_loaded():
+            # 텍스트 데이터 준비 (제목 + 본문)
+            texts = [f"{a.get('title', '')} {a.get('content', '')}" for a in articles_with_details]
+
+            # 벡터화 및 예측
+            try:
+                with self.stage_timer('ai_predict'):
+                    X_vec = self.vectorizer.transform(texts)
+                    # Use the loaded model's predict method directly
+                    preds = self.ai_recommender.predict(X_vec)
+
+                for i, article in enumerate(articles_with_details):
+                    article['ai_recommend'] = bool(preds[i])
+                    articles_after_ai_predict.append(article)
+                print(f"[Electimes] AI 추천 예측 완료 ({len(articles_after_ai_predict)}건)")
+            except Exception as predict_e:
+                print(f"[Electimes] AI 추천 예측 중 오류 발생: {str(predict_e)}")
+                print(traceback.format_exc())
+                # 예측 실패 시 AI 추천은 기본값(False) 유지
+                articles_after_ai_predict = articles_with_details # 오류 발생해도 다음 단계로 넘어가도록
+        else:
+            # AI 모델 없거나 예측 대상 없으면 AI 추천 필터링 건너뛰고 다음 단계로
+            articles_after_ai_predict = articles_with_details
+            if not self._ai_model_loaded():
+                 print("[Electimes] AI 추천 모델이 로드되지 않아 예측을 건너뜠습니다.")
+
+        # 키워드 및 AI 추천 필터링 (최종 대상 선정)
+        final_articles_to_sync = []
+        for article in articles_after_ai_predict:
+            # 키워드 포함 여부 확인 및 매칭된 키워드 추출 (본문 포함)
+            title_and_content = f"{article.get('title', '')} {article.get('content', '')}"
+            with self.stage_timer('keyword_filter'):
+                contains_kw, matched_keywords = self.contains_keywords_and_extract(title_and_content)
             
-            # 2. AI 추천 예측 적용 (모델이 로드된 경우에만)
-            if self.ai_recommender and self.vectorizer and articles_to_process:
-                # predict_ai_recommend는 ArticleRecommender 인스턴스 메서드이므로 self.article_recommender 사용
-                # 하지만 predict_ai_recommend는 내부적으로 vectorizer와 model을 로드함. 중복 로딩 방지 또는 인자 전달 필요.
-                # 현재 ai_recommender 인스턴스는 LogisticRegression 모델 객체이므로 predict 메서드를 사용해야 함.
-                # 그리고 predict에는 벡터화된 텍스트 데이터(X_vec)가 필요하므로 vectorizer를 사용해야 함.
+            # 매칭된 키워드를 기사에 저장
+            if matched_keywords:
+                article['keywords'] = matched_keywords
+                print(f"[Electimes] 키워드 매칭: {article.get('title', '제목 없음')} → {matched_keywords}")
+
+            # 최종 필터링: 키워드 포함 OR AI 추천 True
+            # 키워드가 포함되어 있거나 AI가 추천한 경우 크롤링 대상
+            if contains_kw or (self.ai_recommender and article.get('ai_recommend', False)):
+                final_articles_to_sync.append(article)
+                # 성공적으로 처리된 기사 URL 저장
+                self.save_crawled_url(article.get('url'))
                 
+                # 크롤링 이유 표시
+                reason = []
+                if contains_kw:
+                    reason.append(f"키워드: {matched_keywords}")
+                if article.get('ai_recommend', False):
+                    reason.append("AI추천")
+                print(f"[Electimes] 최종 크롤링 대상: {article.get('title', '제목 없음')} (이유: {', '.join(reason)})")
+
+        return final_articles_to_sync
+
+    def crawl_pages(self, pages: List[int]) -> Dict[str, Any]:
+        """
+        📦 백필 샤드: 지정한 목록 페이지만 탐색 → 상세 병렬 수집 → 필터
+        (워터마크 무시, 목록은 최신순이므로 수집 기간 이전 글이 나온 페이지에서 중단)
+        """
+        selected, listed, exhausted = [], 0, False
+        for page in pages:
+            raw_articles = self._fetch_articles(page)
+            if not raw_articles:
+                exhausted = True
+                break
+
+            recent_articles = []
+            for article in raw_articles:
+                published_date = self._extract_date(article)
+                if published_date and self.is_recent_article(published_date):
+                    recent_articles.append(article)
+            listed += len(recent_articles)
+
+            summaries = self._with_urls(recent_articles)
+            details_list = self.fetcher.map(self.get_article_content, [summary['url'] for summary in summaries])
+            articles = [merged for merged in (self._merge_details(summary, details)
+                                              for summary, details in zip(summaries, details_list)) if merged]
+            selected.extend(self.filter_articles(articles))
+
+            if len(recent_articles) < len(raw_articles):
+                print(f"[Electimes] 페이지 {page}에서 최근 {self.window_days}일 이전 기사 도달. 샤드 탐색 종료.")
+                exhausted = True
+                break
+        return {'articles': selected, 'listed': listed, 'exhausted': exhausted}
+
+    def _search_term(self, term: str, max_pages: int, since: Optional[datetime]) -> List[Dict[str, Any]]:
+        """검색어 하나의 결과 페이지를 차례로 탐색 (빈 페이지 / since 이전 기사에 닿으면 중단)"""
+        results = []
+        for page in range(1, max(1, max_pages) + 1):
+            articles = self._fetch_articles(page, search_term=term)
+            if not articles:
+                break
+            for article in articles:
+                if since is None or article['published_date'] >= since:
+                    article['search_term'] = term
+                    results.append(article)
+            if since is not None and any(article['published_date'] < since for article in articles):
+                break
+        print(f"[Electimes] 🔍 '{term}' 검색 결과 {len(results)}건")
+        return results
+
+    def iter_search_articles(self, terms: List[str], max_pages: int = SEARCH_MAX_PAGES,
+                             since: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        """
+        🔍 검색 목록 단계: 여러 검색어를 동시에 검색해 기사 요약을 하나씩 생성 (URL 기준 중복 제거)
+
+        결과는 iter_recent_articles()와 같은 형식이라 상세 → 요약 → Notion 파이프라인에 그대로 넣을 수 있습니다.
+        워터마크/수집 기간은 적용하지 않으며, since로 오래된 결과만 잘라낼 수 있습니다.
+
+        Args:
+            terms: 검색어 목록
+            max_pages: 검색어별 최대 결과 페이지 수
+            since: 이 시각 이전 기사는 제외 (None이면 날짜 제한 없음)
+        """
+        seen_urls = set()
+        workers = max(1, min(SEARCH_MAX_TERMS_CONCURRENCY, len(terms)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='search') as pool:
+            futures = {pool.submit(self._search_term, term, max_pages, since): term for term in terms}
+            for future in as_completed(futures):
                 try:
-                     # 텍스트 준비 (제목 + 본문. 본문은 get_article_content 후 알 수 있지만, 여기서는 목록 정보만 사용)
-                     # AI 예측은 상세 내용을 가져온 후 해야 더 정확하지만, 현재 구조상 목록 단계에서 일부 예측 시도.
-                     # 상세 내용을 가져온 후 AI 예측 및 필터링하는 방식으로 변경하는 것이 합리적입니다.
-                     # 계획을 수정하여, 페이지 목록 가져오기 -> 날짜 필터링 -> 상세 내용 크롤링 (조건부) -> 상세 내용에 대해 AI 예측 -> 최종 필터링 순서로 변경합니다.
-
-                     # **수정된 계획 적용:**
-                     # 페이지 목록 가져오기 -> 날짜 필터링 -> 상세 내용 크롤링 (조건부) -> 상세 내용에 대해 AI 예측 -> 최종 필터링
-
-                     # 이 페이지의 최근 기사 목록에 대해 상세 내용 크롤링 시도 (이미 크롤링된 URL은 건너뛰지 않음)
-                    articles_with_details = []
-                    for article_summary in articles_to_process:
-                        url = article_summary.get('url')
-                        # **수정:** 이미 크롤링된 URL도 다시 상세 내용을 가져오도록 변경 (항상 최신 본문 확보)
-                        # if url and url not in self.crawled_urls:
-                        if url:
-                            print(f"[Electimes] 상세 내용 가져오는 중: {article_summary.get('title', '제목 없음')}")
-                            article_details = self.get_article_content(url) # 상세 내용 크롤링
-                            if article_details and article_details.get('content'):
-                                # 상세 내용이 있는 경우, 기존 목록 정보에 합침
-                                full_article = {**article_summary, **article_details}
-                                articles_with_details.append(full_article)
-                                print(f"[Electimes] 상세 내용 크롤링 완료: {article_summary.get('title', '제목 없음')}")
-                            else:
-                                print(f"[Electimes] 상세 내용 크롤링 실패 또는 내용 없음: {article_summary.get('title', '제목 없음')}")
-                        else:
-                             print(f"[Electimes] URL 정보가 없어 상세 내용 크롤링 스킵: {article_summary.get('title', '제목 없음')}") # Debug log 제거
-
-                    # 상세 내용을 가져온 기사들에 대해 AI 추천 예측
-                    articles_after_ai_predict = []
-                    if articles_with_details and self.ai_recommender and self.vectorizer:
-                        # 텍스트 데이터 준비 (제목 + 본문)
-                        texts = [f"{a.get('title', '')} {a.get('content', '')}" for a in articles_with_details]
-
-                        # 벡터화 및 예측
-                        try:
-                            X_vec = self.vectorizer.transform(texts)
-                            # Use the loaded model's predict method directly
-                            preds = self.ai_recommender.predict(X_vec)
-
-                            for i, article in enumerate(articles_with_details):
-                                article['ai_recommend'] = bool(preds[i])
-                                articles_after_ai_predict.append(article)
-                            print(f"[Electimes] AI 추천 예측 완료 ({len(articles_after_ai_predict)}건)")
-                        except Exception as predict_e:
-                            print(f"[Electimes] AI 추천 예측 중 오류 발생: {str(predict_e)}")
-                            print(traceback.format_exc())
-                            # 예측 실패 시 AI 추천은 기본값(False) 유지
-                            articles_after_ai_predict = articles_with_details # 오류 발생해도 다음 단계로 넘어가도록
-                    else:
-                        # AI 모델 없거나 예측 대상 없으면 AI 추천 필터링 건너뛰고 다음 단계로
-                        articles_after_ai_predict = articles_with_details
-                        if not (self.ai_recommender and self.vectorizer):
-                             print("[Electimes] AI 추천 모델이 로드되지 않아 예측을 건너뜠습니다.")
-
-                    # 3. 키워드 및 AI 추천 필터링 (최종 대상 선정)
-                    final_articles_to_sync = []
-                    for article in articles_after_ai_predict:
-                        # 키워드 포함 여부 확인 및 매칭된 키워드 추출 (본문 포함)
-                        title_and_content = f"{article.get('title', '')} {article.get('content', '')}"
-                        contains_kw, matched_keywords = self.contains_keywords_and_extract(title_and_content)
-                        
-                        # 매칭된 키워드를 기사에 저장
-                        if matched_keywords:
-                            article['keywords'] = matched_keywords
-                            print(f"[Electimes] 키워드 매칭: {article.get('title', '제목 없음')} → {matched_keywords}")
-
-                        # AI 추천 결과 확인 (AI 모델 로드된 경우에만 필터링 적용)
-                        passes_ai_filter = True # 기본적으로 통과 (AI 모델 없는 경우)
-                        if self.ai_recommender and self.vectorizer:
-                             # AI 추천 결과가 True인 기사만 통과
-                             passes_ai_filter = article.get('ai_recommend', False)
-                             # print(f"[Electimes] 기사 '{article.get('title', '')}': 키워드={contains_kw}, AI추천={article.get('ai_recommend', False)}, 통과={contains_kw and passes_ai_filter}") # Debug log 제거
-
-                        # 최종 필터링: 키워드 포함 OR AI 추천 True
-                        # 키워드가 포함되어 있거나 AI가 추천한 경우 크롤링 대상
-                        if contains_kw or (self.ai_recommender and article.get('ai_recommend', False)):
-                            final_articles_to_sync.append(article)
-                            # 성공적으로 처리된 기사 URL 저장
-                            self.save_crawled_url(article.get('url'))
-                            
-                            # 크롤링 이유 표시
-                            reason = []
-                            if contains_kw:
-                                reason.append(f"키워드: {matched_keywords}")
-                            if article.get('ai_recommend', False):
-                                reason.append("AI추천")
-                            print(f"[Electimes] 최종 크롤링 대상: {article.get('title', '제목 없음')} (이유: {', '.join(reason)})")
-                        # else:
-                        #      print(f"[Electimes] 최종 제외: {article.get('title', '제목 없음')} (키워드: {contains_kw}, AI추천 통과: {passes_ai_filter}))") # Debug log 제거
-
-                    crawled_articles_details.extend(final_articles_to_sync)
-
-                except Exception as process_e:
-                    print(f"[Electimes] 페이지 {page} 기사 처리 중 오류 발생: {str(process_e)}")
-                    print(traceback.format_exc())
-                    # 오류 발생 시 해당 페이지의 나머지 기사는 건너뛸 수 있음 (구현에 따라 다름)
+                    articles = future.result()
+                except Exception as e:
+                    print(f"[Electimes] ❌ '{futures[future]}' 검색 실패: {type(e).__name__} - {e}")
+                    continue
+                for article in self._with_urls(articles):
+                    if article['url'] in seen_urls:
+                        continue
+                    seen_urls.add(article['url'])
+                    yield article
+
+    def select_search_result(self, article: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        🔍 검색 결과용 필터 단계: 직접 찾은 기사이므로 제외하지 않고 키워드만 표시
+        (관심 키워드가 없으면 검색어를 키워드로 사용, URL 이력은 Notion 기록 성공 후 호출부에서 기록)
+        """
+        title_and_content = f"{article.get('title', '')} {article.get('content', '')}"
+        with self.stage_timer('keyword_filter'):
+            _, matched_keywords = self.contains_keywords_and_extract(title_and_content)
+        if not matched_keywords and article.get('search_term'):
+            matched_keywords = [article['search_term']]
+        article['keywords'] = matched_keywords
+        return article
+
+    def select_article(self, article: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """🔍 필터 단계 (기사 단위): 최종 대상이면 기사, 아니면 None"""
+        selected = self.filter_articles([article])
+        return selected[0] if selected else None
+
+    def mark_processed(self, article: Dict[str, Any]):
+        """후속 처리가 끝난 기사 기록 (워터마크는 처리가 끝난 구간까지만 전진)"""
+        self.progress.processed(article.get('url'))
+
+    def finalize_crawl(self):
+        """
+        크롤링 마무리: URL 이력 커밋 후 워터마크 전진
+        목록 탐색과 후속 처리가 끝까지 완료된 경우에만 호출합니다 (중간 실패 시 다음 실행에서 다시 탐색).
+        처리되지 않은 기사(상세 실패, 단계 오류, AI 모델 미로드 등)가 있으면 그 기사 이전까지만 전진합니다.
+        """
+        self.crawled_urls.commit()
+        if not self.use_watermark:
+            return
+
+        pending = self.progress.pending(self._source_name)
+        if pending:
+            print(f"[Electimes] 처리되지 않은 기사 {pending}건 - 워터마크는 그 이전까지만 전진 (다음 실행에서 재탐색)")
+        mark = self.progress.safe_mark(self._source_name)
+        if mark:
+            newest_idxno, newest_date = mark
+            self.watermark.advance(self._source_name, newest_idxno, newest_date)
+            self.watermark.save()
+            print(f"[Electimes] 워터마크 갱신: idxno={newest_idxno}, {newest_date}")
 
-            page += 1 # 다음 페이지로 이동
+    def crawl(self) -> list:
+        """
+        전기신문 기사를 크롤링합니다.
+        한국 날짜 기준으로 최근 window_days일 이내 기사가 나타날 때까지 페이지를 탐색하며,
+        키워드 및 AI 추천 필터링을 거쳐 상세 내용을 크롤링합니다.
+        (전체 결과를 리스트로 반환, 스트리밍 처리는 processors.streaming_pipeline 참고)
+        """
+        crawled_articles_details = []
 
-        print(f"[Electimes] 크롤링 종료. 총 {len(crawled_articles_details)}건의 기사 크롤링 완료.")
-        return crawled_articles_details
+        for page, articles_to_process in self.iter_list_pages():
+            # AI 추천 예측 적용 (모델이 로드된 경우에만)
+            if not (self._ai_model_loaded() and articles_to_process):
+                continue
 
-    def get_article_content(self, url: str) -> Dict[str, Any]:
-        """🔧 개선된 기사 상세 내용 가져오기 (스마트 재시도 적용)"""
-        
-        # Extract idxno from URL for debug filename
-        match_idxno = re.search(r'idxno=(\d+)', url)
-        idxno = match_idxno.group(1) if match_idxno else 'unknown'
-        debug_file = f"debug_article_{idxno}.html"
+            try:
+                # 페이지 목록 가져오기 -> 날짜 필터링 -> 상세 내용 크롤링 -> 상세 내용에 대해 AI 예측 -> 최종 필터링
+                # (이미 크롤링된 URL도 다시 상세 내용을 가져옴, HTTP 캐시가 ETag/Last-Modified로 재검증)
+                articles_to_fetch = self._with_urls(articles_to_process)
+
+                # 🚀 페이지 내 상세 내용을 병렬로 가져오기 (결과는 목록 순서 유지)
+                print(f"[Electimes] 상세 내용 병렬 수집 시작: {len(articles_to_fetch)}건")
+                details_list = self.fetcher.map(
+                    self.get_article_content,
+                    [article_summary['url'] for article_summary in articles_to_fetch]
+                )
 
-        def fetch_article():
-            """실제 기사 가져오기 작업"""
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/113.0.0.0 Safari/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
+                articles_with_details = []
+                for article_summary, article_details in zip(articles_to_fetch, details_list):
+                    full_article = self._merge_details(article_summary, article_details)
+                    if full_article:
+                        articles_with_details.append(full_article)
 
-            # Save HTML content to file for debugging
-            with open(debug_file, 'w', encoding='utf-8') as f:
-                f.write(response.text)
-            print(f"Saved HTML content to {debug_file}")
+                crawled_articles_details.extend(self.filter_articles(articles_with_details))
 
-            return response.text
+                # 페이지 단위로 URL 이력 일괄 기록
+                self.crawled_urls.commit()
+                for article in articles_with_details:  # 상세 실패 기사는 처리 완료로 기록하지 않음
+                    self.mark_processed(article)
 
-        # 🚀 스마트 재시도 시스템 사용
-        html_content = self._smart_retry(
-            operation_name=f"기사 내용 가져오기 ({url})",
-            operation_func=fetch_article,
-            max_retries=3,
-            base_delay=2.0
-        )
+            except Exception as process_e:
+                print(f"[Electimes] 페이지 {page} 기사 처리 중 오류 발생: {str(process_e)}")
+                print(traceback.format_exc())
+                # 오류 발생 시 해당 페이지의 나머지 기사는 건너뛸 수 있음 (구현에 따라 다름)
 
-        if not html_content:
-            print(f"[Electimes] ❌ 기사 내용 가져오기 최종 실패: {url}")
-            return {'content': '', 'attachments': [], 'published_date': None}
+        self.finalize_crawl()
 
-        # Parse HTML content
-        soup = BeautifulSoup(html_content, 'html.parser')
+        print(f"[Electimes] 크롤링 종료. 총 {len(crawled_articles_details)}건의 기사 크롤링 완료.")
+        return crawled_articles_details
+
+    def _extract_article_fields(self, soup: BeautifulSoup, html_content: str,
+                                parse_mode: str = 'full') -> tuple[Optional[datetime], str]:
+        """파싱된 기사 페이지에서 게시일과 본문 추출 (못 찾으면 None / 빈 문자열, 본문 추출 시 트리가 수정됨)"""
         published_date = None
 
         # 1. Try to find date in article header
@@ -740,14 +780,55 @@ class ElectimesCrawler(BaseCrawler):
         if not published_date:
             print("Date not found in any source.")
 
-        # Extract content
-        content = ''
-        content_selectors = ['.view-cont', '.article-content', '.article-body', '#article-view-content-div', '.content']
-        for selector in content_selectors:
-            content_element = soup.select_one(selector)
-            if content_element and content_element.text.strip():
-                content = content_element.text.strip()
-                break
+        # Extract content: 본문 블록 점수화 + 캡션/바이라인/광고 등 상용구 제거 (알려진 본문 컨테이너는 가산점)
+        content = self.content_extractor.extract(html_content, soup, selectors=self.CONTENT_SELECTORS,
+                                                 parse_mode=parse_mode)
+        return published_date, content
+
+    def get_article_content(self, url: str) -> Dict[str, Any]:
+        """🔧 개선된 기사 상세 내용 가져오기 (스마트 재시도 적용)"""
+        
+        # Extract idxno from URL for debug filename
+        match_idxno = re.search(r'idxno=(\d+)', url)
+        idxno = match_idxno.group(1) if match_idxno else 'unknown'
+
+        def fetch_article():
+            """실제 기사 가져오기 작업"""
+            # 공용 커넥션 풀 Session + HTTP 캐시 경유 (변경 없으면 304로 캐시 본문 사용)
+            html_text = self.http_cache.get(
+                self.session, url,
+                url_class='article',
+                timeout=30,
+                encoding='utf-8',
+                slot=self.fetcher.host_slot
+            )
+
+            # 디버그 모드에서만 백그라운드 저장 (DEBUG_HTML_DUMP=true)
+            self.debug_writer.dump(f"debug_article_{idxno}", html_text)
+
+            return html_text
+
+        # 🚀 스마트 재시도 시스템 사용
+        with self.stage_timer('detail_fetch'):
+            html_content = self._smart_retry(
+                operation_name=f"기사 내용 가져오기 ({url})",
+                operation_func=fetch_article,
+                max_retries=3,
+                base_delay=2.0
+            )
+
+        if not html_content:
+            print(f"[Electimes] ❌ 기사 내용 가져오기 최종 실패: {url}")
+            return {'content': '', 'attachments': [], 'published_date': None}
+
+        # Parse HTML content: 날짜/본문 영역만 먼저 파싱하고, 부족하면 전체 트리로 재시도 (추출 후 트리 즉시 해제)
+        with self.parsed_html(html_content, parse_only=ARTICLE_BODY_STRAINER) as soup:
+            published_date, content = self._extract_article_fields(soup, html_content, parse_mode='strained')
+        if not published_date or not content:
+            print("Selective parse incomplete, falling back to full parse.")
+            with self.parsed_html(html_content) as soup:
+                published_date, content = self._extract_article_fields(soup, html_content)
+
         if not content or len(content.strip()) < 10:
             content = '본문 추출 실패'
         print(f"Extracted content length: {len(content)}")
@@ -759,4 +840,8 @@ class ElectimesCrawler(BaseCrawler):
             'content': content,
             'attachments': [],
             'published_date': published_date
-        } 
\ No newline at end of file
+        } 
+
+
+# 공용 키워드 매처에 전기신문 크롤러 키워드 등록
+register_keyword_group('electimes', ElectimesCrawler.KEYWORDS)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔧 크롤러 공용 HTML 파서 계층
+- lxml 백엔드 우선 사용 (미설치 시 html.parser 폴백)
+- SoupStrainer로 필요한 영역(기사 목록 / 본문 컨테이너)만 트리 생성
+- BeautifulSoup API(select, select_one, find)는 그대로 유지
+"""
+
+from typing import Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4 import FeatureNotFound
+
+from config.config import HTML_PARSER
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+
+DEFAULT_PARSER = HTML_PARSER or ('lxml' if LXML_AVAILABLE else 'html.parser')
+FALLBACK_PARSER = 'html.parser'
+
+# 📋 기사 목록 페이지: section#section-list 하위만 파싱
+ARTICLE_LIST_STRAINER = SoupStrainer('section', id='section-list')
+
+# 📰 기사 상세 페이지: 날짜(meta / header)와 본문 컨테이너(article)만 파싱
+ARTICLE_BODY_STRAINER = SoupStrainer(['meta', 'header', 'article'])
+
+
+def parse_html(html_content: str, parse_only: Optional[SoupStrainer] = None,
+               parser: Optional[str] = None) -> BeautifulSoup:
+    """
+    HTML 파싱
+
+    Args:
+        html_content: 파싱할 HTML
+        parse_only: 파싱 범위를 제한할 SoupStrainer (None이면 전체 트리)
+        parser: 강제할 파서 이름 (None이면 DEFAULT_PARSER)
+
+    Returns:
+        BeautifulSoup: 파싱 결과
+    """
+    parser = parser or DEFAULT_PARSER
+    try:
+        return BeautifulSoup(html_content, parser, parse_only=parse_only)
+    except FeatureNotFound:
+        # 설정된 파서가 설치되지 않은 경우 내장 파서로 폴백
+        return BeautifulSoup(html_content, FALLBACK_PARSER, parse_only=parse_only)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔧 Conditional GET 기반 디스크 HTTP 캐시
+- URL 단위로 본문 + ETag/Last-Modified 저장
+- URL 종류별 TTL 정책 (목록 짧게, 기사 길게)
+- TTL 만료 시 If-None-Match / If-Modified-Since 로 재검증
+- 304 응답은 캐시 본문으로 응답
+"""
+
+import os
+import json
+import gzip
+import time
+import hashlib
+import tempfile
+import threading
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from config.config import HTTP_CACHE_DIR, HTTP_CACHE_TTL
+from crawlers.telemetry import get_metrics
+
+
+class HttpCache:
+    """
+    🔧 URL 키 기반 디스크 HTTP 캐시
+
+    **동작 순서**:
+    1. 캐시가 TTL 이내 → 네트워크 요청 없이 캐시 본문 반환
+    2. TTL 만료 → 저장된 검증자로 조건부 요청
+    3. 304 Not Modified → 캐시 본문 반환 (fetched_at 갱신)
+    4. 200 OK → 본문/검증자 저장 후 반환
+    5. 그 외 HTTP 오류 → raise_for_status()로 예외 전파 (호출부 재시도가 처리)
+    """
+
+    def __init__(self, cache_dir: str = HTTP_CACHE_DIR,
+                 ttl_policy: Optional[Dict[str, int]] = None):
+        self.cache_dir = cache_dir
+        self.ttl_policy = dict(HTTP_CACHE_TTL if ttl_policy is None else ttl_policy)
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0}
+        self._stats_lock = threading.Lock()
+        self.metrics = get_metrics()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def _paths(self, url: str):
+        key = self._key(url)
+        subdir = os.path.join(self.cache_dir, key[:2])
+        return os.path.join(subdir, f"{key}.json"), os.path.join(subdir, f"{key}.html.gz")
+
+    def _count(self, name: str, url_class: str = ''):
+        with self._stats_lock:
+            self.stats[name] += 1
+        self.metrics.incr('http_cache_requests_total', result=name, url_class=url_class or None)
+
+    @staticmethod
+    def _atomic_write(path: str, data: bytes):
+        """임시 파일에 쓴 뒤 교체하여 중간에 죽어도 깨진 캐시를 남기지 않음"""
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        """캐시 항목 로드 (메타데이터 + 본문), 없거나 손상 시 None"""
+        meta_path, body_path = self._paths(url)
+        if not (os.path.exists(meta_path) and os.path.exists(body_path)):
+            return None
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            with gzip.open(body_path, 'rt', encoding='utf-8') as f:
+                entry['body'] = f.read()
+            return entry
+        except Exception as e:
+            print(f"[HttpCache] ⚠️ 캐시 로드 실패, 무시함 ({url}): {e}")
+            return None
+
+    def store(self, url: str, body: str, etag: Optional[str] = None,
+              last_modified: Optional[str] = None, fetched_at: Optional[float] = None):
+        """본문과 검증자 저장"""
+        meta_path, body_path = self._paths(url)
+        meta = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': fetched_at if fetched_at is not None else time.time(),
+        }
+        try:
+            self._atomic_write(body_path, gzip.compress(body.encode('utf-8')))
+            self._atomic_write(meta_path, json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+        except Exception as e:
+            print(f"[HttpCache] ⚠️ 캐시 저장 실패 ({url}): {e}")
+
+    def _touch(self, url: str, entry: Dict[str, Any]):
+        """304 재검증 성공 시 fetched_at만 갱신"""
+        meta_path, _ = self._paths(url)
+        meta = {k: v for k, v in entry.items() if k != 'body'}
+        meta['fetched_at'] = time.time()
+        try:
+            self._atomic_write(meta_path, json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+        except Exception as e:
+            print(f"[HttpCache] ⚠️ 캐시 메타데이터 갱신 실패 ({url}): {e}")
+
+    def get(self, session: requests.Session, url: str, url_class: str = 'article',
+            timeout: float = 30, encoding: Optional[str] = None,
+            slot: Optional[Callable[[str], ContextManager]] = None) -> str:
+        """
+        캐시를 거쳐 URL 본문 반환
+
+        Args:
+            session: 요청에 사용할 requests Session
+            url: 요청 URL
+            url_class: TTL 정책 키 ('list', 'article' 등)
+            timeout: 요청 타임아웃(초)
+            encoding: 응답 인코딩 강제 지정 (예: 'utf-8')
+            slot: 실제 네트워크 요청 구간만 감쌀 Context Manager 팩토리
+                  (예: ConcurrentFetcher.host_slot - 호스트 동시성 + 속도 제한)
+
+        Returns:
+            str: 응답 본문
+        """
+        entry = self.load(url)
+        ttl = self.ttl_policy.get(url_class, 0)
+
+        if entry and time.time() - entry.get('fetched_at', 0) < ttl:
+            self._count('hits', url_class)
+            return entry['body']
+
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        with (slot(url) if slot else nullcontext()):
+            response = session.get(url, headers=headers, timeout=timeout)
+            # 4xx/5xx는 슬롯 안에서 예외로 전파 (속도 제한기가 상태 코드를 관찰)
+            response.raise_for_status()
+        self.metrics.incr('crawl_bytes_downloaded_total', len(response.content), host=urlparse(url).netloc)
+
+        if response.status_code == 304 and entry:
+            self._count('revalidated', url_class)
+            self._touch(url, entry)
+            return entry['body']
+
+        if encoding:
+            response.encoding = encoding
+
+        self._count('misses', url_class)
+        body = response.text
+        self.store(
+            url,
+            body,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+        )
+        return body
@@ -1,149 +1,371 @@
-from datetime import datetime
-from typing import List, Dict, Any, Optional
-from bs4 import BeautifulSoup
+import re
+import asyncio
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+from urllib.parse import urljoin
+
+import httpx
 from crawlers.base_crawler import BaseCrawler
+from crawlers.registry import register_crawler
+from crawlers.crawl_watermark import WatermarkProgress, get_shared_watermark
+from crawlers.rate_limiter import get_shared_rate_limiter
+from crawlers.resource_managers import build_default_headers
+from crawlers.content_extractor import get_shared_content_extractor
+from card_news.types import CrawledArticle
 from notion.notion_client import NotionClient
+from processors.keyword_matcher import get_keyword_matcher
+from config.config import (
+    KPX_MAX_PAGES, KPX_PAGE_WINDOW, KPX_DETAIL_CONCURRENCY,
+    KPX_FETCH_ATTACHMENT_INFO, KPX_REQUEST_TIMEOUT
+)
 
+@register_crawler('한국전력거래소')
 class KPXCrawler(BaseCrawler):
-    def __init__(self, notion_client: NotionClient, recommender: Optional[Any] = None):
+    """
+    🔧 한국전력거래소 공지/보도자료 비동기 크롤러
+
+    **특징**:
+    - 공지사항 / 보도자료 게시판과 각 게시판의 목록 페이지를 asyncio로 동시 수집
+    - 상세 페이지와 첨부파일 정보는 KPX_DETAIL_CONCURRENCY개까지만 동시 요청
+    - 게시판별 워터마크(지난 실행의 최신 글)에 닿으면 다음 페이지 탐색 중단
+    - 날짜를 해석할 수 없는 글은 현재 시각으로 대체하지 않고 제외
+    - ElectimesCrawler와 같은 기사 dict 형식으로 반환 (Notion 동기화 그대로 사용)
+    """
+
+    BOARDS = {  # 게시판 종류 → 목록 경로
+        'notice': '/www/notice/notice_list.do',
+        'press': '/www/notice/press_list.do',
+    }
+    PAGE_PARAM = 'pageIndex'  # 목록 페이지 번호 파라미터
+    DATE_FORMATS = ('%Y-%m-%d', '%Y.%m.%d', '%Y/%m/%d', '%Y-%m-%d %H:%M')
+    CONTENT_SELECTOR = '.board-view-content'  # 상세 페이지 본문 영역
+    supports_backfill = True  # crawl_pages로 페이지 단위 백필
+
+    def __init__(self, notion_client: NotionClient, recommender: Optional[Any] = None,
+                 use_watermark: bool = True):
         super().__init__('한국전력거래소', 'https://www.kpx.or.kr')
         self.notion_client = notion_client
         self.recommender = recommender
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        self.notice_url = f"{self.base_url}/www/notice/notice_list.do"
-        self.press_url = f"{self.base_url}/www/notice/press_list.do"
+        self.headers = build_default_headers()
+        self.rate_limiter = get_shared_rate_limiter()
+        self.content_extractor = get_shared_content_extractor()
+        if self.fetcher.politeness_delay:
+            # 비동기 요청도 소스별 요청 간격(SOURCE_POLITENESS_DELAYS)을 상한 속도로 지킴
+            self.rate_limiter.configure_host(self.base_url, max_rps=1.0 / self.fetcher.politeness_delay)
+        self.use_watermark = use_watermark
+        self.watermark = get_shared_watermark()  # 소스 간 공유 (저장 시 서로 덮어쓰지 않도록)
+        self.progress = WatermarkProgress()  # 게시판별 이번 실행에서 처리가 끝난 글 (워터마크 전진 범위)
 
-    def get_news_list(self) -> List[Dict[str, Any]]:
-        """Get list of news articles from KPX"""
-        articles = []
-        
-        # Get notices
-        notice_articles = self._get_notice_list()
-        articles.extend(notice_articles)
-        
-        # Get press releases
-        press_articles = self._get_press_list()
-        articles.extend(press_articles)
-        
-        return articles
+    # 하위 호환: 기존 게시판 URL 속성
+    @property
+    def notice_url(self) -> str:
+        return self.base_url + self.BOARDS['notice']
+
+    @property
+    def press_url(self) -> str:
+        return self.base_url + self.BOARDS['press']
+
+    def _watermark_key(self, board: str) -> str:
+        return f"{self.source_name}:{board}"
+
+    @staticmethod
+    def _extract_item_id(url: str) -> Optional[int]:
+        """게시글 URL에서 글 번호 추출 (seq / no / idx 계열 파라미터)"""
+        match = re.search(r'(?:seq|no|idx|id)\w*=(\d+)', url or '', re.IGNORECASE)
+        return int(match.group(1)) if match else None
 
-    def _get_notice_list(self) -> List[Dict[str, Any]]:
-        """Get list of notices"""
+    def _parse_date(self, date_str: str) -> Optional[datetime]:
+        """게시일 문자열 해석 (실패 시 None)"""
+        for date_format in self.DATE_FORMATS:
+            try:
+                return datetime.strptime(date_str.strip(), date_format)
+            except ValueError:
+                continue
+        return None
+
+    def _parse_board_page(self, html_content: str, board: str) -> List[Dict[str, Any]]:
+        """목록 페이지 HTML → 기사 요약 목록 (ElectimesCrawler 목록 항목과 같은 형식)"""
         articles = []
-        try:
-            html_content = self.get_page_content(self.notice_url)
-            soup = self.parse_html(html_content)
-            
-            # Find all notice items
-            notice_items = soup.select('table.board-list tbody tr')
-            
-            for item in notice_items:
-                try:
-                    # Extract notice information
-                    title_element = item.select_one('td.title a')
-                    if not title_element:
-                        continue
-                        
-                    title = title_element.text.strip()
-                    url = title_element.get('href', '')
-                    if url and not url.startswith('http'):
-                        url = self.base_url + url
-                        
-                    date_element = item.select_one('td.date')
-                    date_str = date_element.text.strip() if date_element else ''
-                    
-                    # Parse date
-                    try:
-                        published_date = datetime.strptime(date_str, '%Y-%m-%d')
-                    except ValueError:
-                        published_date = datetime.now()
-                    
-                    articles.append({
-                        'title': title,
-                        'url': url,
-                        'published_date': published_date,
-                        'type': 'notice'
-                    })
-                except Exception as e:
-                    print(f"Error processing notice: {str(e)}")
+        with self.parsed_html(html_content) as soup:
+            for item in soup.select('table.board-list tbody tr'):
+                title_element = item.select_one('td.title a')
+                if not title_element:
                     continue
-                    
-        except Exception as e:
-            print(f"Error getting notice list: {str(e)}")
-            
+
+                title = title_element.text.strip()
+                url = urljoin(self.base_url, title_element.get('href', ''))
+                date_element = item.select_one('td.date')
+                date_str = date_element.text.strip() if date_element else ''
+                published_date = self._parse_date(date_str)
+                if not published_date:
+                    print(f"[KPX] ⚠️ 날짜 파싱 실패로 글 제외: '{title}' - 날짜: '{date_str}'")
+                    continue
+
+                articles.append(CrawledArticle.from_listing(title, url, published_date, self.source_name, type=board))
         return articles
 
-    def _get_press_list(self) -> List[Dict[str, Any]]:
-        """Get list of press releases"""
-        articles = []
-        try:
-            html_content = self.get_page_content(self.press_url)
-            soup = self.parse_html(html_content)
-            
-            # Find all press items
-            press_items = soup.select('table.board-list tbody tr')
-            
-            for item in press_items:
-                try:
-                    # Extract press information
-                    title_element = item.select_one('td.title a')
-                    if not title_element:
+    async def _get_text(self, client: httpx.AsyncClient, url: str, params: Optional[Dict[str, Any]] = None,
+                        stage: str = 'detail_fetch') -> str:
+        """호스트 속도 제한기를 거쳐 GET (일시적 오류는 재시도, 실패 시 빈 문자열)"""
+        async def fetch():
+            async with self.rate_limiter.slot_async(url):
+                response = await client.get(url, params=params)
+                response.raise_for_status()
+            self.metrics.incr('crawl_bytes_downloaded_total', len(response.content), host=response.url.host)
+            return response.text
+
+        with self.stage_timer(stage):
+            text = await self.rate_limiter.call_with_retry_async(f"KPX 요청 ({url})", fetch, log_prefix='[KPX]')
+        return text or ''
+
+    def _page_stop_reason(self, board: str, articles: List[Dict[str, Any]], cutoff: datetime) -> Optional[str]:
+        """이 페이지 이후를 더 볼 필요가 없는 이유 (계속 탐색이면 None)"""
+        if not articles:
+            return '빈 페이지'
+        if any(article['published_date'] < cutoff for article in articles):
+            return f'최근 {self.window_days}일 이전 글 도달'
+        if self.use_watermark and any(
+            self.watermark.is_covered(self._watermark_key(board), self._extract_item_id(article['url']),
+                                      article['published_date'])
+            for article in articles
+        ):
+            return '워터마크 도달'
+        return None
+
+    async def _crawl_board(self, client: httpx.AsyncClient, board: str, cutoff: datetime) -> List[Dict[str, Any]]:
+        """게시판 하나의 목록 페이지를 KPX_PAGE_WINDOW개씩 동시에 가져오며 중단 조건까지 탐색"""
+        board_url = self.base_url + self.BOARDS[board]
+        key = self._watermark_key(board)
+        collected = []
+        page = 1
+        while page <= KPX_MAX_PAGES:
+            window = range(page, min(page + max(1, KPX_PAGE_WINDOW), KPX_MAX_PAGES + 1))
+            pages = await asyncio.gather(*(
+                self._get_text(client, board_url, params={self.PAGE_PARAM: number}, stage='list_fetch')
+                for number in window
+            ))
+
+            stop_reason = None
+            for number, html_content in zip(window, pages):
+                articles = self._parse_board_page(html_content, board) if html_content else []
+                for article in articles:
+                    if article['published_date'] < cutoff:
                         continue
-                        
-                    title = title_element.text.strip()
-                    url = title_element.get('href', '')
-                    if url and not url.startswith('http'):
-                        url = self.base_url + url
-                        
-                    date_element = item.select_one('td.date')
-                    date_str = date_element.text.strip() if date_element else ''
-                    
-                    # Parse date
-                    try:
-                        published_date = datetime.strptime(date_str, '%Y-%m-%d')
-                    except ValueError:
-                        published_date = datetime.now()
-                    
-                    articles.append({
-                        'title': title,
-                        'url': url,
-                        'published_date': published_date,
-                        'type': 'press'
-                    })
-                except Exception as e:
-                    print(f"Error processing press release: {str(e)}")
-                    continue
-                    
+                    if self.use_watermark and self.watermark.is_covered(
+                            key, self._extract_item_id(article['url']), article['published_date']):
+                        continue
+                    collected.append(article)
+                stop_reason = self._page_stop_reason(board, articles, cutoff)
+                if stop_reason:
+                    print(f"[KPX] {board} {number}페이지에서 탐색 종료 ({stop_reason})")
+                    break
+            if stop_reason:
+                break
+            page += len(window)
+
+        for article in collected:
+            self.progress.listed(key, article['url'], self._extract_item_id(article['url']), article['published_date'])
+        print(f"[KPX] {board} 게시판 최근 글 {len(collected)}건")
+        return collected
+
+    async def _fetch_attachment_info(self, client: httpx.AsyncClient, attachment: Dict[str, Any]):
+        """첨부파일 HEAD 요청으로 크기/형식 확인 (본문 다운로드 없음)"""
+        url = attachment['url']
+        try:
+            async with self.rate_limiter.slot_async(url):
+                response = await client.head(url)
+                response.raise_for_status()
+            attachment['content_type'] = response.headers.get('Content-Type', '')
+            attachment['size'] = int(response.headers.get('Content-Length') or 0) or None
         except Exception as e:
-            print(f"Error getting press list: {str(e)}")
-            
+            print(f"[KPX] ⚠️ 첨부파일 정보 확인 실패 ({attachment.get('name')}): {type(e).__name__} - {e}")
+
+    def _parse_detail(self, html_content: str) -> Dict[str, Any]:
+        """상세 페이지 HTML → 본문/첨부파일"""
+        with self.parsed_html(html_content) as soup:
+            attachments = [
+                {'name': element.text.strip(), 'url': urljoin(self.base_url, element.get('href', ''))}
+                for element in soup.select('.board-view-file a')
+                if element.get('href')
+            ]
+            # 첨부파일 목록을 먼저 읽은 뒤 본문 추출 (상용구 제거로 트리가 수정됨, 본문 영역이 없는 페이지는 제외)
+            content = ''
+            if soup.select_one(self.CONTENT_SELECTOR):
+                content = self.content_extractor.extract(html_content, soup, selectors=[self.CONTENT_SELECTOR])
+        return {'content': content, 'attachments': attachments}
+
+    async def _fetch_detail(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                            url: str) -> Dict[str, Any]:
+        """상세 페이지 + 첨부파일 정보 (semaphore로 동시 요청 수 제한)"""
+        async with semaphore:
+            html_content = await self._get_text(client, url)
+        if not html_content:
+            return {'content': '', 'attachments': []}
+        details = self._parse_detail(html_content)
+        if KPX_FETCH_ATTACHMENT_INFO and details['attachments']:
+            async def bounded(attachment):
+                async with semaphore:
+                    await self._fetch_attachment_info(client, attachment)
+            await asyncio.gather(*(bounded(attachment) for attachment in details['attachments']))
+        return details
+
+    def _new_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            headers=self.headers,
+            timeout=KPX_REQUEST_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=KPX_DETAIL_CONCURRENCY + len(self.BOARDS) * KPX_PAGE_WINDOW),
+        )
+
+    async def crawl_async(self, with_details: bool = True) -> List[Dict[str, Any]]:
+        """
+        🚀 비동기 크롤링: 게시판 목록 동시 탐색 → 상세/첨부 제한된 동시 수집
+
+        Args:
+            with_details: False면 목록 요약만 반환
+
+        Returns:
+            List[Dict]: 기사 목록 (상세 실패 글 제외)
+        """
+        cutoff = datetime.now() - timedelta(days=self.window_days)
+        self.progress = WatermarkProgress()
+        async with self._new_client() as client:
+            boards = await asyncio.gather(*(self._crawl_board(client, board, cutoff) for board in self.BOARDS))
+            summaries = self._unique(article for board_articles in boards for article in board_articles)
+            if not with_details:
+                return summaries
+            return await self._with_details(client, summaries)
+
+    @staticmethod
+    def _unique(articles: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """URL 기준 중복 제거 (먼저 나온 글 우선)"""
+        seen_urls = set()
+        unique = []
+        for article in articles:
+            if article['url'] not in seen_urls:
+                seen_urls.add(article['url'])
+                unique.append(article)
+        return unique
+
+    async def _with_details(self, client: httpx.AsyncClient, summaries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """목록 요약에 상세/첨부 정보를 제한된 동시 요청으로 합침 (상세 실패 글 제외)"""
+        semaphore = asyncio.Semaphore(max(1, KPX_DETAIL_CONCURRENCY))
+        details_list = await asyncio.gather(*(
+            self._fetch_detail(client, semaphore, summary['url']) for summary in summaries
+        ))
+
+        articles = []
+        for summary, details in zip(summaries, details_list):
+            if not details.get('content'):
+                print(f"[KPX] 상세 내용 없음: {summary.get('title', '제목 없음')}")
+                continue
+            summary.update(details)  # 목록 레코드를 제자리 갱신
+            articles.append(summary)
         return articles
 
+    async def _crawl_pages_async(self, pages: List[int]) -> Dict[str, Any]:
+        """백필 샤드: 두 게시판의 지정 페이지를 동시에 가져와 수집 기간 안의 글만 상세 수집"""
+        cutoff = datetime.now() - timedelta(days=self.window_days)
+        jobs = [(board, number) for board in self.BOARDS for number in pages]
+        async with self._new_client() as client:
+            pages_html = await asyncio.gather(*(
+                self._get_text(client, self.base_url + self.BOARDS[board], params={self.PAGE_PARAM: number},
+                               stage='list_fetch')
+                for board, number in jobs
+            ))
+
+            recent, exhausted_boards = [], set()
+            for (board, number), html_content in zip(jobs, pages_html):
+                if board in exhausted_boards:
+                    continue
+                articles = self._parse_board_page(html_content, board) if html_content else []
+                recent.extend(article for article in articles if article['published_date'] >= cutoff)
+                if not articles or any(article['published_date'] < cutoff for article in articles):
+                    exhausted_boards.add(board)
+            summaries = self._unique(recent)
+            articles = await self._with_details(client, summaries)
+
+        return {
+            'articles': [selected for selected in map(self.select_article, articles) if selected],
+            'listed': len(summaries),
+            'exhausted': len(exhausted_boards) == len(self.BOARDS),
+        }
+
+    def get_news_list(self) -> List[Dict[str, Any]]:
+        """Get list of news articles from KPX (공지/보도자료 목록 동시 수집)"""
+        return asyncio.run(self.crawl_async(with_details=False))
+
     def get_article_content(self, url: str) -> Dict[str, Any]:
-        """Get article content from KPX"""
+        """Get article content from KPX (단건 상세 + 첨부파일 정보)"""
+        async def fetch_one():
+            async with self._new_client() as client:
+                return await self._fetch_detail(client, asyncio.Semaphore(max(1, KPX_DETAIL_CONCURRENCY)), url)
+
         try:
-            html_content = self.get_page_content(url)
-            soup = self.parse_html(html_content)
-            
-            # Extract article content
-            content_element = soup.select_one('.board-view-content')
-            content = content_element.text.strip() if content_element else ''
-            
-            # Extract attachments if any
-            attachments = []
-            attachment_elements = soup.select('.board-view-file a')
-            for element in attachment_elements:
-                attachments.append({
-                    'name': element.text.strip(),
-                    'url': element.get('href', '')
-                })
-            
-            return {
-                'content': content,
-                'attachments': attachments
-            }
+            return asyncio.run(fetch_one())
         except Exception as e:
             print(f"Error getting article content: {str(e)}")
-            return {'content': '', 'attachments': []} 
\ No newline at end of file
+            return {'content': '', 'attachments': []}
+
+    def iter_recent_articles(self) -> Iterator[Dict[str, Any]]:
+        """목록 단계: 상세/첨부까지 비동기로 모두 수집한 최근 글 (파이프라인 상세 단계는 그대로 통과)"""
+        yield from asyncio.run(self.crawl_async())
+
+    def fetch_article_details(self, article_summary: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """상세 단계: 이미 본문이 있으면 그대로, 없으면 단건 수집 후 목록 정보와 합침"""
+        if article_summary.get('content'):
+            return article_summary
+        details = self.get_article_content(article_summary['url'])
+        if not details.get('content'):
+            print(f"[KPX] 상세 내용 없음: {article_summary.get('title', '제목 없음')}")
+            return None
+        article_summary.update(details)
+        return article_summary
+
+    def crawl_pages(self, pages: List[int]) -> Dict[str, Any]:
+        """백필 샤드: 지정한 목록 페이지(두 게시판 모두)만 탐색 → 상세 → 키워드 필터"""
+        return asyncio.run(self._crawl_pages_async(pages))
+
+    def select_article(self, article: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """필터 단계: 제목/본문에 관심 키워드가 있는 기사만 선택"""
+        text = f"{article.get('title', '')} {article.get('content', '')}"
+        matched_keywords = get_keyword_matcher().matched_keywords(text, 'config')
+        if not matched_keywords:
+            return None
+        article['keywords'] = matched_keywords
+        article.setdefault('ai_recommend', False)
+        return article
+
+    def mark_processed(self, article: Dict[str, Any]):
+        """후속 처리가 끝난 글 기록 (워터마크는 처리가 끝난 구간까지만 전진)"""
+        self.progress.processed(article.get('url'))
+
+    def finalize_crawl(self):
+        """크롤링 마무리: 게시판별로 처리가 끝난 글 구간까지 워터마크 전진 (상세 실패 등 미처리 글 이전까지)"""
+        if not self.use_watermark:
+            return
+        advanced = False
+        for board in self.BOARDS:
+            key = self._watermark_key(board)
+            pending = self.progress.pending(key)
+            if pending:
+                print(f"[KPX] {board} 처리되지 않은 글 {pending}건 - 워터마크는 그 이전까지만 전진")
+            mark = self.progress.safe_mark(key)
+            if mark:
+                item_id, published_date = mark
+                self.watermark.advance(key, item_id, published_date)
+                advanced = True
+                print(f"[KPX] {board} 워터마크 갱신: id={item_id}, {published_date}")
+        if advanced:
+            self.watermark.save()
+
+    def crawl(self) -> List[Dict[str, Any]]:
+        """한국전력거래소 공지/보도자료 크롤링 (비동기 목록/상세 수집 → 키워드 필터 → 워터마크 갱신)"""
+        print(f"[KPX] 크롤링 시작...")
+        crawled = asyncio.run(self.crawl_async())
+        articles = [selected for selected in map(self.select_article, crawled) if selected]
+        for article in crawled:  # 상세 실패로 빠진 글은 처리 완료로 기록하지 않음
+            self.mark_processed(article)
+        self.finalize_crawl()
+        print(f"[KPX] 크롤링 종료. 총 {len(articles)}건의 기사 크롤링 완료.")
+        return articles
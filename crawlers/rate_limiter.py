@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔧 호스트별 적응형 속도 제한기 + 서킷 브레이커
+- 호스트마다 토큰 버킷 하나 (크롤러 / Notion / Ollama 호출이 모두 공유)
+- AIMD: 빠른 성공 응답이면 속도를 조금씩 올리고, 429/5xx/느린 응답이면 절반으로 낮춤
+- 429/503의 Retry-After 헤더는 해당 호스트 전체에 적용
+- 연속 실패가 임계값에 도달하면 서킷 차단 → 대기 후 시험 요청 1건으로 복구 확인
+- state()로 호스트별 현재 속도/토큰/서킷 상태 조회
+"""
+
+import time
+import random
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from config.config import (
+    RATE_LIMIT_INITIAL_RPS, RATE_LIMIT_MIN_RPS, RATE_LIMIT_MAX_RPS, RATE_LIMIT_BURST,
+    RATE_LIMIT_TARGET_LATENCY, RATE_LIMIT_INCREASE_STEP, RATE_LIMIT_DECREASE_FACTOR,
+    RATE_LIMIT_HOST_OVERRIDES, CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_COOLDOWN
+)
+from crawlers.telemetry import get_metrics
+
+CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """서킷이 차단된 호스트로의 요청 (재시도하지 않고 즉시 실패)"""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"{host} 서킷 차단 중 ({retry_in:.0f}초 후 재시도 가능)")
+        self.host = host
+        self.retry_in = retry_in
+
+
+def host_of(url_or_host: str) -> str:
+    """URL이면 호스트(netloc)만, 이미 호스트면 그대로"""
+    if '://' in url_or_host:
+        return urlparse(url_or_host).netloc or url_or_host
+    return url_or_host
+
+
+def _status_of(error: BaseException) -> Optional[int]:
+    """requests/httpx HTTP 오류의 상태 코드"""
+    return getattr(getattr(error, 'response', None), 'status_code', None) or getattr(error, 'status', None)
+
+
+def _retry_after_of(response: Any) -> Optional[float]:
+    """Retry-After 헤더(초 단위)만 해석, 없거나 날짜 형식이면 None"""
+    headers = getattr(response, 'headers', None) or {}
+    try:
+        value = headers.get('Retry-After')
+        return max(0.0, float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """호스트 상태를 나타내는 일시적 오류인지 (연결/타임아웃/429/5xx)"""
+    status = _status_of(error)
+    if isinstance(status, int):
+        return status == 429 or status >= 500
+    name = type(error).__name__
+    return 'Timeout' in name or 'Connect' in name or isinstance(error, (ConnectionError, TimeoutError))
+
+
+class HostLimiter:
+    """
+    🔧 호스트 하나의 토큰 버킷 + 서킷 상태
+
+    **특징**:
+    - 토큰은 예약 방식 (부족하면 음수로 빌려 쓰고 그만큼 대기) → 동시 호출자 간 공정한 간격
+    - 실패 시 남은 토큰 회수 → 재시도가 한꺼번에 몰리지 않음
+    - 감속은 DECREASE_COOLDOWN 간격 내 1회 (동시 실패 여러 건이 속도를 한 번에 바닥까지 내리지 않음)
+    """
+
+    DECREASE_COOLDOWN = 1.0  # 연속 감속 최소 간격(초)
+    LATENCY_SMOOTHING = 0.2  # 지연시간 EWMA 가중치
+
+    def __init__(self, host: str, initial_rps: float = RATE_LIMIT_INITIAL_RPS,
+                 min_rps: float = RATE_LIMIT_MIN_RPS, max_rps: float = RATE_LIMIT_MAX_RPS,
+                 burst: float = RATE_LIMIT_BURST, target_latency: float = RATE_LIMIT_TARGET_LATENCY,
+                 failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD, cooldown: float = CIRCUIT_COOLDOWN):
+        self.host = host
+        self.min_rps = max(0.01, min_rps)
+        self.max_rps = max(self.min_rps, max_rps)
+        self.rate = min(self.max_rps, max(self.min_rps, initial_rps))
+        self.burst = max(1.0, burst)
+        self.target_latency = target_latency
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+
+        self.tokens = self.burst
+        self.latency: Optional[float] = None
+        self.circuit = CLOSED
+        self.consecutive_failures = 0
+        self.stats = {'requests': 0, 'failures': 0, 'throttled': 0, 'rejected': 0}
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._opened_at = 0.0
+        self._last_decrease = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """토큰 하나 예약 후 대기해야 할 시간(초) 반환 (서킷 차단 시 CircuitOpenError)"""
+        with self._lock:
+            now = time.monotonic()
+            if self.circuit == OPEN:
+                retry_in = self._opened_at + self.cooldown - now
+                if retry_in > 0:
+                    self.stats['rejected'] += 1
+                    raise CircuitOpenError(self.host, retry_in)
+                self.circuit = HALF_OPEN
+                print(f"[RateLimit] {self.host} 서킷 반개방 - 시험 요청 1건 허용")
+            if self.circuit == HALF_OPEN:
+                if self._probe_in_flight:
+                    self.stats['rejected'] += 1
+                    raise CircuitOpenError(self.host, self.cooldown)
+                self._probe_in_flight = True
+
+            self._refill(now)
+            self.tokens -= 1
+            self.stats['requests'] += 1
+            delay = max(-self.tokens / self.rate if self.tokens < 0 else 0.0, self._blocked_until - now)
+            if delay > 0:
+                self.stats['throttled'] += 1
+            return delay
+
+    def acquire(self):
+        """토큰 하나 예약 후 차례가 올 때까지 대기 (스레드용)"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        """토큰 하나 예약 후 차례가 올 때까지 대기 (asyncio용, 이벤트 루프를 막지 않음)"""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _decrease(self, now: float):
+        if now - self._last_decrease >= self.DECREASE_COOLDOWN:
+            self.rate = max(self.min_rps, self.rate * RATE_LIMIT_DECREASE_FACTOR)
+            self._last_decrease = now
+
+    def record_success(self, latency: float):
+        """성공 응답 반영: 지연시간이 목표 이내면 가산 증가, 넘으면 감속"""
+        with self._lock:
+            now = time.monotonic()
+            self.latency = latency if self.latency is None else (
+                self.LATENCY_SMOOTHING * latency + (1 - self.LATENCY_SMOOTHING) * self.latency
+            )
+            if self.circuit == HALF_OPEN:
+                print(f"[RateLimit] {self.host} 서킷 복구 (시험 요청 성공)")
+            self.circuit = CLOSED
+            self._probe_in_flight = False
+            self.consecutive_failures = 0
+            if self.latency > self.target_latency:
+                self._decrease(now)
+            else:
+                self.rate = min(self.max_rps, self.rate + RATE_LIMIT_INCREASE_STEP / max(self.rate, 1.0))
+
+    def record_failure(self, retry_after: Optional[float] = None):
+        """실패(연결 오류/타임아웃/429/5xx) 반영: 감속 + 토큰 회수, 연속 실패 시 서킷 차단"""
+        with self._lock:
+            now = time.monotonic()
+            self.stats['failures'] += 1
+            self.consecutive_failures += 1
+            self._probe_in_flight = False
+            self._decrease(now)
+            self._refill(now)
+            self.tokens = min(self.tokens, 0.0)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+            if self.circuit == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.circuit != OPEN:
+                    print(f"[RateLimit] ⛔ {self.host} 서킷 차단 (연속 실패 {self.consecutive_failures}회, "
+                          f"{self.cooldown:.0f}초 후 시험 요청)")
+                self.circuit = OPEN
+                self._opened_at = now
+
+    def release(self):
+        """호스트 상태와 무관한 결과(4xx 등): 속도/서킷은 그대로, 시험 요청 자리만 반납"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                'circuit': self.circuit,
+                'rate': round(self.rate, 3),
+                'tokens': round(self.tokens, 2),
+                'latency': round(self.latency, 3) if self.latency is not None else None,
+                'consecutive_failures': self.consecutive_failures,
+                'blocked_for': round(max(0.0, self._blocked_until - time.monotonic()), 1),
+                **self.stats,
+            }
+
+
+class AdaptiveRateLimiter:
+    """
+    🔧 호스트별 HostLimiter 모음
+
+    **사용 예**:
+        limiter = get_shared_rate_limiter()
+        with limiter.slot(url) as slot:
+            response = session.get(url)
+            slot.observe(response)   # raise_for_status()를 블록 안에서 호출하면 생략 가능
+    """
+
+    def __init__(self, host_overrides: Optional[Dict[str, Dict[str, float]]] = None):
+        self.host_overrides = dict(RATE_LIMIT_HOST_OVERRIDES if host_overrides is None else host_overrides)
+        self._hosts: Dict[str, HostLimiter] = {}
+        self._lock = threading.Lock()
+
+    def configure_host(self, url_or_host: str, **settings):
+        """호스트별 설정 지정 (예: LLM 서버는 target_latency를 길게), 이미 만든 리미터는 교체"""
+        host = host_of(url_or_host)
+        with self._lock:
+            self.host_overrides[host] = {**self.host_overrides.get(host, {}), **settings}
+            self._hosts.pop(host, None)
+
+    def for_host(self, url_or_host: str) -> HostLimiter:
+        host = host_of(url_or_host)
+        with self._lock:
+            limiter = self._hosts.get(host)
+            if limiter is None:
+                limiter = HostLimiter(host, **self.host_overrides.get(host, {}))
+                self._hosts[host] = limiter
+            return limiter
+
+    def acquire(self, url_or_host: str) -> HostLimiter:
+        """요청 직전 호출: 토큰 대기 (서킷 차단 시 CircuitOpenError)"""
+        limiter = self.for_host(url_or_host)
+        limiter.acquire()
+        return limiter
+
+    def record(self, url_or_host: str, latency: float, status: Optional[int] = None,
+               error: Optional[BaseException] = None, retry_after: Optional[float] = None):
+        """요청 결과 반영 (status 또는 error 중 하나, 둘 다 없으면 성공)"""
+        limiter = self.for_host(url_or_host)
+        if error is not None:
+            if is_transient_error(error):
+                limiter.record_failure(retry_after or _retry_after_of(getattr(error, 'response', None)))
+            else:
+                limiter.release()
+        elif status is not None and (status == 429 or status >= 500):
+            limiter.record_failure(retry_after)
+        elif status is not None and status >= 400:
+            limiter.release()
+        else:
+            limiter.record_success(latency)
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator['_SlotObservation']:
+        """요청 하나를 감싸는 Context Manager (토큰 대기 → 실행 → 지연시간/결과 반영)"""
+        limiter = self.acquire(url)
+        observation = _SlotObservation()
+        started = time.monotonic()
+        try:
+            yield observation
+        except BaseException as e:
+            self.record(limiter.host, time.monotonic() - started, error=e)
+            raise
+        self.record(limiter.host, time.monotonic() - started,
+                    status=observation.status, retry_after=observation.retry_after)
+
+    @asynccontextmanager
+    async def slot_async(self, url: str) -> AsyncIterator['_SlotObservation']:
+        """slot()의 asyncio 버전"""
+        limiter = self.for_host(url)
+        await limiter.acquire_async()
+        observation = _SlotObservation()
+        started = time.monotonic()
+        try:
+            yield observation
+        except BaseException as e:
+            self.record(limiter.host, time.monotonic() - started, error=e)
+            raise
+        self.record(limiter.host, time.monotonic() - started,
+                    status=observation.status, retry_after=observation.retry_after)
+
+    def call_with_retry(self, operation_name: str, operation_func: Callable[[], Any],
+                        max_retries: int = 3, log_prefix: str = '[RateLimit]') -> Optional[Any]:
+        """
+        🔧 공용 재시도 (기존 _smart_retry 대체)
+
+        **특징**:
+        - 재시도 간격은 호출부가 각자 sleep하지 않고 호스트 버킷이 정함
+          (실패 시 속도 감소 + 토큰 회수 → 동시 재시도가 자연스럽게 분산)
+        - 서킷 차단(CircuitOpenError)은 즉시 포기
+        - 영구적 오류(ValueError/AttributeError, 429 외 4xx)는 재시도하지 않음
+
+        operation_func 내부의 실제 요청은 slot()(또는 ConcurrentFetcher.host_slot)으로 감싸져 있어야 합니다.
+
+        Returns:
+            operation_func의 결과 또는 None
+        """
+        for attempt in range(max_retries):
+            try:
+                return operation_func()
+            except Exception as e:
+                if not self._should_retry(e, operation_name, attempt, max_retries, log_prefix):
+                    return None
+                # 서킷/버킷을 거치지 않는 작업을 위한 최소 지터 (동시 재시도 동기화 방지)
+                time.sleep(random.uniform(0.05, 0.25))
+        return None
+
+    async def call_with_retry_async(self, operation_name: str, operation_func: Callable[[], Awaitable[Any]],
+                                    max_retries: int = 3, log_prefix: str = '[RateLimit]') -> Optional[Any]:
+        """call_with_retry()의 asyncio 버전 (operation_func는 코루틴 함수, 요청은 slot_async()로 감쌈)"""
+        for attempt in range(max_retries):
+            try:
+                return await operation_func()
+            except Exception as e:
+                if not self._should_retry(e, operation_name, attempt, max_retries, log_prefix):
+                    return None
+                await asyncio.sleep(random.uniform(0.05, 0.25))
+        return None
+
+    @staticmethod
+    def _should_retry(error: Exception, operation_name: str, attempt: int, max_retries: int,
+                      log_prefix: str) -> bool:
+        """재시도 여부 판단 + 로그 (서킷 차단/영구적 오류/마지막 시도면 False)"""
+        metrics, source = get_metrics(), log_prefix.strip('[]')
+        if isinstance(error, CircuitOpenError):
+            print(f"{log_prefix} ⛔ {operation_name} 건너뜀: {error}")
+            metrics.incr('crawl_give_ups_total', source=source, reason='circuit_open')
+            return False
+        status = _status_of(error)
+        permanent = isinstance(error, (ValueError, AttributeError)) or (
+            isinstance(status, int) and 400 <= status < 500 and status != 429
+        )
+        if permanent:
+            print(f"{log_prefix} ❌ {operation_name} 영구적 오류 (재시도 안함): {type(error).__name__} - {error}")
+            metrics.incr('crawl_give_ups_total', source=source, reason='permanent')
+            return False
+        if attempt == max_retries - 1:
+            print(f"{log_prefix} ❌ {operation_name} 최종 실패: {type(error).__name__} - {error}")
+            metrics.incr('crawl_give_ups_total', source=source, reason='exhausted')
+            return False
+        print(f"{log_prefix} ⚠️ {operation_name} 오류: {type(error).__name__} - 호스트 속도 제한에 맞춰 재시도 "
+              f"({attempt + 2}/{max_retries})")
+        metrics.incr('crawl_retries_total', source=source)
+        return True
+
+    def state(self) -> Dict[str, Dict[str, Any]]:
+        """호스트별 현재 상태 {호스트: {circuit, rate, tokens, latency, ...}}"""
+        with self._lock:
+            limiters = list(self._hosts.values())
+        return {limiter.host: limiter.snapshot() for limiter in limiters}
+
+    def summary(self) -> str:
+        """로그용 한 줄 요약"""
+        return ', '.join(
+            f"{host}: {info['circuit']} {info['rate']}rps (실패 {info['failures']}/{info['requests']})"
+            for host, info in self.state().items()
+        ) or '요청 없음'
+
+
+class _SlotObservation:
+    """slot() 블록 안에서 응답 상태 전달용 (예외로 표현되지 않는 5xx/429 응답)"""
+
+    def __init__(self):
+        self.status: Optional[int] = None
+        self.retry_after: Optional[float] = None
+
+    def observe(self, response: Any):
+        self.status = getattr(response, 'status_code', None)
+        self.retry_after = _retry_after_of(response)
+
+
+# 크롤러 / Notion / Ollama 공용 속도 제한기 (싱글톤 패턴)
+_shared_limiter: Optional[AdaptiveRateLimiter] = None
+_shared_limiter_lock = threading.Lock()
+
+
+def get_shared_rate_limiter() -> AdaptiveRateLimiter:
+    """모든 외부 호출이 공유하는 호스트별 속도 제한기 반환"""
+    global _shared_limiter
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            _shared_limiter = AdaptiveRateLimiter()
+        return _shared_limiter
+
+
+class RateLimitedTransport(httpx.BaseTransport):
+    """
+    httpx.Client(transport=...)용 전송 계층 (notion-client처럼 httpx를 쓰는 SDK에 속도 제한기 연결)
+
+    요청 하나를 slot()으로 감싸므로 응답 상태 코드/지연시간뿐 아니라 연결 오류/타임아웃도 반영됩니다
+    (반개방 시험 요청이 전송 오류로 끝나도 서킷이 다시 차단 → 쿨다운 후 새 시험 요청).
+    """
+
+    def __init__(self, limiter: Optional[AdaptiveRateLimiter] = None,
+                 transport: Optional[httpx.BaseTransport] = None):
+        self.limiter = limiter or get_shared_rate_limiter()
+        self.transport = transport or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self.limiter.slot(str(request.url)) as slot:
+            response = self.transport.handle_request(request)
+            slot.observe(response)
+        return response
+
+    def close(self):
+        self.transport.close()
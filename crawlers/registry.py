@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔧 멀티 소스 크롤러 레지스트리
+- @register_crawler('소스명')으로 BaseCrawler 구현체 등록
+- ENABLED_SOURCES에 있는 소스만 생성 (미구현 소스는 건너뜀)
+- 소스별 목록 탐색을 동시에 실행하고 하나의 중복 제거된 스트림으로 병합
+- 소스 하나의 실패(생성/탐색 오류)는 다른 소스에 영향 없음
+"""
+
+import queue
+import threading
+import traceback
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+from crawlers.base_crawler import BaseCrawler
+from config.config import NEWS_SOURCES, ENABLED_SOURCES, SOURCE_QUEUE_SIZE
+
+
+# 소스명 → 크롤러 클래스
+CRAWLER_REGISTRY: Dict[str, Type[BaseCrawler]] = {}
+
+# 기본 제공 크롤러 모듈 (import 시 @register_crawler로 등록됨)
+BUILTIN_CRAWLER_MODULES = [
+    'crawlers.electimes_crawler',
+    'crawlers.kpx_crawler',
+]
+
+_END = object()  # 소스 탐색 종료 신호
+
+
+def register_crawler(source_name: str) -> Callable[[Type[BaseCrawler]], Type[BaseCrawler]]:
+    """크롤러 클래스 등록 데코레이터"""
+    def decorator(cls: Type[BaseCrawler]) -> Type[BaseCrawler]:
+        CRAWLER_REGISTRY[source_name] = cls
+        return cls
+    return decorator
+
+
+def load_builtin_crawlers():
+    """기본 제공 크롤러 모듈 로드 (모듈 하나의 import 실패는 해당 소스만 제외)"""
+    import importlib
+
+    for module_name in BUILTIN_CRAWLER_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except Exception as e:
+            print(f"[Registry] ⚠️ 크롤러 모듈 로드 실패 ({module_name}): {type(e).__name__} - {e}")
+
+
+def build_crawlers(notion_client: Any, sources: Optional[List[str]] = None,
+                   recommender: Optional[Any] = None, window_days: Optional[int] = None,
+                   **crawler_options) -> List[BaseCrawler]:
+    """
+    활성화된 소스의 크롤러 생성
+
+    Args:
+        notion_client: 크롤러에 전달할 NotionClient
+        sources: 실행할 소스명 목록 (None이면 ENABLED_SOURCES)
+        recommender: 크롤러에 전달할 추천 모델 (선택)
+        window_days: 최근 N일 이내 기사만 수집 (None이면 CRAWL_WINDOW_DAYS)
+        crawler_options: 크롤러 생성자에 그대로 전달할 옵션 (예: use_watermark=False)
+
+    Returns:
+        List[BaseCrawler]: 생성에 성공한 크롤러 목록
+    """
+    load_builtin_crawlers()
+
+    crawlers = []
+    for source_name in (sources if sources is not None else ENABLED_SOURCES):
+        if source_name not in NEWS_SOURCES:
+            print(f"[Registry] ⚠️ NEWS_SOURCES에 없는 소스 건너뜀: {source_name}")
+            continue
+        crawler_cls = CRAWLER_REGISTRY.get(source_name)
+        if crawler_cls is None:
+            print(f"[Registry] ⚠️ 등록된 크롤러가 없는 소스 건너뜀: {source_name}")
+            continue
+        try:
+            crawler = crawler_cls(notion_client, recommender=recommender, **crawler_options)
+            if window_days is not None:
+                crawler.window_days = window_days
+            crawlers.append(crawler)
+            print(f"[Registry] ✅ {source_name} 크롤러 준비 완료 ({crawler_cls.__name__})")
+        except Exception as e:
+            print(f"[Registry] ❌ {source_name} 크롤러 생성 실패 - 이 소스는 제외: {type(e).__name__} - {e}")
+    return crawlers
+
+
+def backfill_sources(sources: List[str]) -> List[str]:
+    """페이지 단위 백필(supports_backfill)을 지원하는 소스만 남김 (나머지는 이유를 출력하고 제외)"""
+    load_builtin_crawlers()
+
+    supported = []
+    for source_name in sources:
+        crawler_cls = CRAWLER_REGISTRY.get(source_name)
+        if crawler_cls is None:
+            print(f"[Backfill] ⚠️ 등록된 크롤러가 없는 소스 제외: {source_name}")
+        elif not crawler_cls.supports_backfill:
+            print(f"[Backfill] ⚠️ 페이지 단위 백필을 지원하지 않는 소스 제외: {source_name} ({crawler_cls.__name__})")
+        else:
+            supported.append(source_name)
+    return supported
+
+
+class MultiSourceCrawl:
+    """
+    🔧 여러 소스의 목록 탐색을 동시에 실행하는 스트림
+
+    **특징**:
+    - 소스마다 전용 스레드에서 iter_recent_articles() 실행 → 전체 시간은 가장 느린 소스 기준
+    - 결과는 (크롤러, 기사) 쌍으로 완료 순서대로 생성
+    - URL 기준 중복 제거 (먼저 도착한 소스 우선)
+    - 탐색 중 오류가 난 소스는 failed_sources에 기록, finalize()에서 제외
+    """
+
+    def __init__(self, crawlers: List[BaseCrawler], queue_size: int = SOURCE_QUEUE_SIZE):
+        self.crawlers = crawlers
+        self.queue_size = max(1, queue_size)
+        self.failed_sources: List[str] = []
+        self.duplicates = 0
+        self._lock = threading.Lock()
+
+    def _list_source(self, crawler: BaseCrawler, out_queue: queue.Queue):
+        try:
+            for article in crawler.iter_recent_articles():
+                out_queue.put((crawler, article))
+        except Exception as e:
+            with self._lock:
+                self.failed_sources.append(crawler.source_name)
+            print(f"[Registry] ❌ {crawler.source_name} 목록 탐색 실패 - 다른 소스는 계속 진행: {type(e).__name__} - {e}")
+            print(traceback.format_exc())
+        finally:
+            out_queue.put(_END)
+
+    def __iter__(self) -> Iterator[Tuple[BaseCrawler, Dict[str, Any]]]:
+        out_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        threads = [
+            threading.Thread(target=self._list_source, args=(crawler, out_queue),
+                             name=f'source-{crawler.source_name}', daemon=True)
+            for crawler in self.crawlers
+        ]
+        for thread in threads:
+            thread.start()
+
+        seen_urls = set()
+        remaining = len(threads)
+        while remaining:
+            item = out_queue.get()
+            if item is _END:
+                remaining -= 1
+                continue
+            url = item[1].get('url')
+            if url and url in seen_urls:
+                self.duplicates += 1
+                item[0].mark_processed(item[1])  # 먼저 도착한 소스가 처리
+                continue
+            if url:
+                seen_urls.add(url)
+            yield item
+
+        for thread in threads:
+            thread.join()
+        print(f"[Registry] 전체 소스 목록 탐색 완료 (중복 제외 {self.duplicates}건, 실패 소스: {self.failed_sources or '없음'})")
+
+    def finalize(self):
+        """탐색에 성공한 소스만 마무리 (URL 이력/워터마크 반영)"""
+        for crawler in self.crawlers:
+            if crawler.source_name in self.failed_sources:
+                print(f"[Registry] ⚠️ {crawler.source_name} 탐색 실패로 마무리 생략 (다음 실행에서 재탐색)")
+                continue
+            try:
+                crawler.finalize_crawl()
+            except Exception as e:
+                print(f"[Registry] ❌ {crawler.source_name} 마무리 실패: {type(e).__name__} - {e}")
+
+    def close(self):
+        """모든 소스 크롤러의 로컬 저장소 정리 (finalize() 여부와 관계없이 호출)"""
+        for crawler in self.crawlers:
+            try:
+                crawler.close()
+            except Exception as e:
+                print(f"[Registry] ⚠️ {crawler.source_name} 정리 실패: {type(e).__name__} - {e}")
+
+
+def per_source(func: Callable[[BaseCrawler, Dict[str, Any]], Optional[Any]]
+               ) -> Callable[[Tuple[BaseCrawler, Dict[str, Any]]], Optional[Tuple[BaseCrawler, Any]]]:
+    """
+    (크롤러, 기사) 쌍을 다루는 파이프라인 단계 함수로 변환
+
+    func가 None을 반환하면 해당 항목은 단계에서 제외됩니다.
+    """
+    def stage(item: Tuple[BaseCrawler, Dict[str, Any]]) -> Optional[Tuple[BaseCrawler, Any]]:
+        crawler, article = item
+        result = func(crawler, article)
+        return (crawler, result) if result is not None else None
+    return stage
+
+
+def processed_if_dropped(func: Callable[[BaseCrawler, Dict[str, Any]], Optional[Any]]
+                         ) -> Callable[[BaseCrawler, Dict[str, Any]], Optional[Any]]:
+    """필터/중복 제거 단계 래퍼: 제외된(None) 기사는 크롤러에 처리 완료로 알림 (워터마크 전진 범위)"""
+    def run(crawler: BaseCrawler, article: Dict[str, Any]) -> Optional[Any]:
+        result = func(crawler, article)
+        if result is None:
+            crawler.mark_processed(article)
+        return result
+    return run
+
+
+def processed_if_done(func: Callable[[BaseCrawler, Dict[str, Any]], Optional[Any]]
+                      ) -> Callable[[BaseCrawler, Dict[str, Any]], Optional[Any]]:
+    """마지막 단계 래퍼: 결과가 있는(기록에 성공한) 기사는 크롤러에 처리 완료로 알림"""
+    def run(crawler: BaseCrawler, article: Dict[str, Any]) -> Optional[Any]:
+        result = func(crawler, article)
+        if result is not None:
+            crawler.mark_processed(article)
+        return result
+    return run
@@ -3,7 +3,7 @@
 """
 🔧 Phase 2: 리소스 관리 Context Manager 클래스들
 - WebDriver 안전 관리
-- Session 재사용 관리  
+- Session 재사용 관리 (크롤러 공용 커넥션 풀)
 - 메모리 모니터링
 - 배치 처리 시스템
 """
@@ -12,11 +12,15 @@ import os
 import gc
 import time
 import random
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, Iterator, List, Dict, Any
 from contextlib import contextmanager
 from datetime import datetime
 
+from config.config import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, SELENIUM_POOL_SIZE
+
 try:
     import psutil
     PSUTIL_AVAILABLE = True
@@ -36,6 +40,31 @@ except ImportError:
     SELENIUM_AVAILABLE = False
     print("⚠️ Selenium 없음 - WebDriver 관리 불가")
 
+try:
+    import brotli  # noqa: F401 - urllib3가 br 응답 디코딩에 사용
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+
+# 모든 크롤러가 공유하는 기본 헤더
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/113.0.0.0 Safari/537.36'
+
+
+def build_default_headers() -> Dict[str, str]:
+    """공용 기본 헤더 생성 (brotli 디코더가 있을 때만 br 협상)"""
+    return {
+        'User-Agent': DEFAULT_USER_AGENT,
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+        'Accept-Encoding': 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate',
+        'Connection': 'keep-alive',
+    }
+
 
 class ResourceMonitor:
     """
@@ -96,24 +125,45 @@ class ResourceMonitor:
 class SessionManager:
     """
     🔧 HTTP Session 재사용 관리 Context Manager
+
+    **특징**:
+    - keep-alive 커넥션 풀 (호스트당 pool_maxsize개)
+    - 공용 기본 헤더 + gzip/brotli 협상
+    - 재시도는 호출부의 _smart_retry가 담당 (어댑터 자동 재시도 없음)
     """
     
-    def __init__(self, timeout: int = 30, max_retries: int = 3):
+    def __init__(self, timeout: int = 30, max_retries: int = 3,
+                 pool_connections: int = HTTP_POOL_CONNECTIONS,
+                 pool_maxsize: int = HTTP_POOL_MAXSIZE):
         self.timeout = timeout
         self.max_retries = max_retries
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
         self.session: Optional[requests.Session] = None
+
+    def create_session(self) -> requests.Session:
+        """커넥션 풀이 설정된 새 Session 생성"""
+        session = requests.Session()
+        
+        # 기본 헤더 설정
+        session.headers.update(build_default_headers())
+
+        # 호스트별 커넥션 풀 설정 (http/https 모두)
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=0
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
     
     def __enter__(self):
         print("🌐 HTTP Session 초기화 중...")
         
-        self.session = requests.Session()
+        self.session = self.create_session()
         
-        # 기본 헤더 설정
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/113.0.0.0 Safari/537.36',
-        })
-        
-        print("✅ HTTP Session 초기화 완료")
+        print(f"✅ HTTP Session 초기화 완료 (커넥션 풀: 호스트당 {self.pool_maxsize}개)")
         return self.session
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -126,3 +176,191 @@ class SessionManager:
                 print(f"⚠️ HTTP Session 종료 중 오류: {e}")
             finally:
                 self.session = None
+
+
+# 크롤러 공용 Session (싱글톤 패턴)
+_shared_session_manager: Optional[SessionManager] = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    """
+    모든 크롤러가 공유하는 커넥션 풀 Session 반환
+
+    같은 호스트에 대한 목록/상세 요청이 keep-alive 커넥션을 재사용하므로
+    요청마다 TCP+TLS 핸드셰이크를 반복하지 않습니다.
+    """
+    global _shared_session_manager
+    with _shared_session_lock:
+        if _shared_session_manager is None or _shared_session_manager.session is None:
+            _shared_session_manager = SessionManager()
+            _shared_session_manager.__enter__()
+        return _shared_session_manager.session
+
+
+def close_shared_session():
+    """공용 Session 종료 (프로세스 종료 전 호출)"""
+    global _shared_session_manager
+    with _shared_session_lock:
+        if _shared_session_manager is not None:
+            _shared_session_manager.__exit__(None, None, None)
+            _shared_session_manager = None
+
+
+def find_chromedriver_path() -> str:
+    """WebDriverManager 결과를 검증하고 실제 chromedriver 실행 파일 경로 반환"""
+    import glob
+
+    # 1단계: WebDriverManager 시도 + 결과 검증 (1MB 이상이면 정상적인 chromedriver)
+    wdm_path = ChromeDriverManager().install()
+    if os.path.exists(wdm_path) and os.access(wdm_path, os.X_OK) and os.path.getsize(wdm_path) > 1000000:
+        return wdm_path
+
+    # 2단계: 같은 디렉토리 → 전체 .wdm 디렉토리 순으로 실제 실행 파일 탐색
+    search_patterns = [
+        os.path.join(os.path.dirname(wdm_path), '**/chromedriver*'),
+        os.path.join(os.path.expanduser("~"), ".wdm", "drivers", "chromedriver", "**/chromedriver"),
+    ]
+    for pattern in search_patterns:
+        for driver_path in glob.glob(pattern, recursive=True):
+            if (os.path.isfile(driver_path) and
+                os.access(driver_path, os.X_OK) and
+                'chromedriver' in os.path.basename(driver_path) and
+                not driver_path.endswith('.chromedriver') and
+                os.path.getsize(driver_path) > 1000000):
+                return driver_path
+
+    raise Exception("올바른 chromedriver를 찾을 수 없습니다")
+
+
+class WebDriverPool:
+    """
+    🔧 지연 생성 WebDriver 풀
+
+    **특징**:
+    - 생성 시점에는 브라우저를 띄우지 않음 (requests 경로가 실패할 때만 기동)
+    - 최대 size개의 드라이버를 만들어 페이지 간 재사용
+    - close_all()에서 대기 중인 드라이버는 바로 종료, 대여 중인 드라이버는 반납될 때 종료
+    """
+
+    def __init__(self, size: int = SELENIUM_POOL_SIZE):
+        self.size = max(1, size)
+        self._idle: List[Any] = []
+        self._all: List[Any] = []
+        self._count = 0
+        self._cond = threading.Condition()
+        self._closed = False
+        self._driver_path: Optional[str] = None
+
+    def _create_driver(self):
+        """헤드리스 Chrome 드라이버 생성"""
+        if not SELENIUM_AVAILABLE:
+            raise RuntimeError("Selenium이 설치되지 않아 WebDriver를 생성할 수 없습니다")
+
+        chrome_options = Options()
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--window-size=1920,1080')
+        chrome_options.add_argument(f'--user-agent={DEFAULT_USER_AGENT}')
+
+        if self._driver_path is None:
+            self._driver_path = find_chromedriver_path()
+            print(f"ChromeDriver 경로: {self._driver_path}")
+
+        driver = webdriver.Chrome(service=Service(self._driver_path), options=chrome_options)
+        print(f"✅ WebDriver 기동 완료 (풀 최대 {self.size}개)")
+        return driver
+
+    @contextmanager
+    def driver(self) -> Iterator[Any]:
+        """
+        풀에서 드라이버 대여 (없고 여유가 있으면 새로 생성, 가득 차면 반납 대기)
+
+        사용 중 예외가 발생한 드라이버는 상태를 신뢰할 수 없으므로 폐기합니다.
+        close_all() 이후에는 대여할 수 없고, 대여 중이던 드라이버는 반납 시 종료합니다.
+        """
+        with self._cond:
+            while not self._closed and not self._idle and self._count >= self.size:
+                self._cond.wait()
+            if self._closed:
+                raise RuntimeError("WebDriver 풀이 이미 종료되었습니다")
+            driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                self._count += 1  # 생성 중인 드라이버 자리 예약
+
+        if driver is None:
+            try:
+                driver = self._create_driver()
+            except Exception:
+                with self._cond:
+                    self._count -= 1
+                    self._cond.notify()
+                raise
+            with self._cond:
+                self._all.append(driver)
+
+        healthy = True
+        try:
+            yield driver
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            with self._cond:
+                keep = healthy and not self._closed
+                if keep:
+                    self._idle.append(driver)
+                else:
+                    self._all.remove(driver)
+                    self._count -= 1
+                self._cond.notify()
+            if not keep:
+                self._quit(driver)
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"⚠️ WebDriver 종료 중 오류: {e}")
+
+    def close_all(self):
+        """풀 종료: 대기 중인 드라이버는 바로 종료, 대여 중인 드라이버는 반납될 때 종료"""
+        with self._cond:
+            self._closed = True
+            drivers, self._idle = self._idle, []
+            for driver in drivers:
+                self._all.remove(driver)
+            self._count -= len(drivers)
+            borrowed = len(self._all)
+            self._cond.notify_all()  # 대여 대기 중인 스레드 깨우기 (종료 예외)
+        for driver in drivers:
+            self._quit(driver)
+        if drivers:
+            print(f"✅ WebDriver {len(drivers)}개 정상 종료")
+        if borrowed:
+            print(f"⚠️ 대여 중인 WebDriver {borrowed}개는 반납 시 종료")
+
+
+# 크롤러 공용 WebDriver 풀 (싱글톤 패턴)
+_shared_driver_pool: Optional[WebDriverPool] = None
+
+
+def get_shared_driver_pool() -> WebDriverPool:
+    """모든 크롤러가 공유하는 지연 생성 WebDriver 풀 반환 (드라이버는 첫 대여 시 기동)"""
+    global _shared_driver_pool
+    with _shared_session_lock:
+        if _shared_driver_pool is None:
+            _shared_driver_pool = WebDriverPool()
+        return _shared_driver_pool
+
+
+def close_shared_driver_pool():
+    """공용 WebDriver 풀 종료 (프로세스 종료 전 호출)"""
+    global _shared_driver_pool
+    with _shared_session_lock:
+        pool, _shared_driver_pool = _shared_driver_pool, None
+    if pool is not None:
+        pool.close_all()
@@ -25,11 +25,34 @@ from contextlib import contextmanager
 
 # Phase 1 개선사항 임포트
 try:
-    from crawlers.resource_managers import ResourceMonitor, SessionManager
+    from crawlers.resource_managers import ResourceMonitor, SessionManager, get_shared_session
 except ImportError:
     print("⚠️ resource_managers 임포트 실패 - 기본 리소스 관리 사용")
     ResourceMonitor = None
     SessionManager = None
+    get_shared_session = None
+
+try:
+    from crawlers.url_index import UrlIndex
+except ImportError:
+    UrlIndex = None
+
+try:
+    from crawlers.html_parser import parse_html, ARTICLE_LIST_STRAINER
+except ImportError:
+    parse_html = None
+    ARTICLE_LIST_STRAINER = None
+
+try:
+    from crawlers.rate_limiter import get_shared_rate_limiter
+except ImportError:
+    get_shared_rate_limiter = None
+
+try:
+    from processors.keyword_matcher import get_keyword_matcher, register_keyword_group
+except ImportError:
+    get_keyword_matcher = None
+    register_keyword_group = None
 
 # 기존 imports
 try:
@@ -95,6 +118,7 @@ class SafeElectimesCrawler(BaseCrawler if FULL_DEPENDENCIES else object):
         
         # 리소스들 (Context Manager에서 관리)
         self.session = None
+        self._owns_session = False
         self.driver = None
         self.resource_monitor = None
         
@@ -115,16 +139,17 @@ class SafeElectimesCrawler(BaseCrawler if FULL_DEPENDENCIES else object):
                 self.resource_monitor = ResourceMonitor(warning_threshold_mb=self.memory_limit_mb)
                 self.resource_monitor.__enter__()
             
-            # 2. HTTP Session 초기화
-            if SessionManager:
-                self.session_manager = SessionManager()
-                self.session = self.session_manager.__enter__()
+            # 2. HTTP Session 초기화 (크롤러 공용 커넥션 풀 재사용)
+            if get_shared_session:
+                self.session = get_shared_session()
+                self._owns_session = False
             else:
                 # Fallback: 기본 requests 사용
                 self.session = requests.Session()
                 self.session.headers.update({
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 })
+                self._owns_session = True
             
             # 3. 크롤링 이력 로드
             self.crawled_urls = self.load_crawled_urls()
@@ -153,18 +178,21 @@ class SafeElectimesCrawler(BaseCrawler if FULL_DEPENDENCIES else object):
     
     def _cleanup_all(self):
         """모든 리소스 정리"""
-        
-        # Session 정리
-        if hasattr(self, 'session_manager') and self.session_manager:
+
+        # URL 이력 마무리 (미커밋 항목 기록 후 연결 종료)
+        if hasattr(self.crawled_urls, 'close'):
             try:
-                self.session_manager.__exit__(None, None, None)
+                self.crawled_urls.close()
             except Exception as e:
-                print(f"⚠️ Session 정리 중 오류: {e}")
-        elif self.session:
+                print(f"⚠️ URL 이력 정리 중 오류: {e}")
+        
+        # Session 정리 (공용 커넥션 풀은 다른 크롤러가 계속 사용하므로 닫지 않음)
+        if self.session and self._owns_session:
             try:
                 self.session.close()
             except Exception as e:
                 print(f"⚠️ Session 정리 중 오류: {e}")
+        self.session = None
         
         # 리소스 모니터링 종료
         if self.resource_monitor:
@@ -194,9 +222,14 @@ class SafeElectimesCrawler(BaseCrawler if FULL_DEPENDENCIES else object):
         except Exception as e:
             print(f"⚠️ AI 모델 로드 중 오류: {e}")
 
-    def load_crawled_urls(self) -> set:
-        """이전에 크롤링한 URL 목록을 로드"""
-        if os.path.exists(self.history_file):
+    def load_crawled_urls(self):
+        """이전에 크롤링한 URL 이력을 로드 (SQLite URL 인덱스, 기존 JSON은 최초 1회 이전)"""
+        if UrlIndex:
+            try:
+                return UrlIndex(legacy_json=self.history_file)
+            except Exception as e:
+                print(f"⚠️ URL 인덱스 열기 오류 - 메모리 이력 사용: {str(e)}")
+        elif os.path.exists(self.history_file):
             try:
                 with open(self.history_file, 'r', encoding='utf-8') as f:
                     return set(json.load(f))
@@ -205,13 +238,16 @@ class SafeElectimesCrawler(BaseCrawler if FULL_DEPENDENCIES else object):
         return set()
 
     def save_crawled_url(self, url: str):
-        """크롤링한 URL을 안전하게 저장"""
+        """크롤링한 URL을 기록 (디스크 반영은 페이지 단위 commit에서)"""
         self.crawled_urls.add(url)
-        try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(list(self.crawled_urls), f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"⚠️ 크롤링 이력 저장 오류: {str(e)}")
+
+    def _commit_crawled_urls(self):
+        """URL 이력 일괄 커밋 (URL 인덱스 사용 시)"""
+        if hasattr(self.crawled_urls, 'commit'):
+            try:
+                self.crawled_urls.commit()
+            except Exception as e:
+                print(f"⚠️ 크롤링 이력 저장 오류: {str(e)}")
 
     def _parse_date_safely(self, date_str: str) -> Optional[datetime]:
         """🔧 Phase 1: 안전한 날짜 파싱 메서드"""
@@ -249,7 +285,12 @@ class SafeElectimesCrawler(BaseCrawler if FULL_DEPENDENCIES else object):
         return None
 
     def _smart_retry(self, operation_name: str, operation_func, max_retries: int = 3, base_delay: float = 2.0):
-        """🔧 Phase 1: 스마트 네트워크 재시도 시스템"""
+        """🔧 Phase 1: 스마트 네트워크 재시도 시스템 (공용 속도 제한기가 있으면 호스트 단위로 재시도 간격 조절)"""
+        if get_shared_rate_limiter:
+            return get_shared_rate_limiter().call_with_retry(
+                operation_name, operation_func, max_retries=max_retries, log_prefix='  '
+            )
+
         retryable_exceptions = (
             requests.exceptions.ConnectionError,
             requests.exceptions.Timeout,
@@ -292,6 +333,9 @@ class SafeElectimesCrawler(BaseCrawler if FULL_DEPENDENCIES else object):
 
     def contains_keywords(self, text: str) -> bool:
         """텍스트에 키워드가 포함되어 있는지 확인"""
+        if get_keyword_matcher:
+            # 공용 키워드 매처 (단일 패스)
+            return get_keyword_matcher().contains_any(text, 'safe_electimes')
         found_keywords = [keyword for keyword in self.KEYWORDS if keyword in text]
         return len(found_keywords) > 0
 
@@ -338,25 +382,6 @@ class SafeElectimesCrawler(BaseCrawler if FULL_DEPENDENCIES else object):
         recent_articles = 0
         keyword_matched = 0
         
-        for page in range(1, max_pages + 1):
-            print(f"📄 페이지 {page} 처리 중...")
-            
-            # 페이지별 기사 목록 가져오기
-            page_articles = self._fetch_articles_safely(page)
-            
-            if not page_articles:
-                print(f"   페이지 {page}에서 기사 없음 - 크롤링 종료")
-                break
-    def crawl_safely(self, max_pages: int = 5) -> Iterator[Dict[str, Any]]:
-        """
-        🔧 Phase 2: 메모리 효율적 안전 크롤링
-        """
-        print(f"🚀 안전 크롤링 시작 (최대 {max_pages}페이지)")
-        
-        total_articles = 0
-        recent_articles = 0
-        keyword_matched = 0
-        
         for page in range(1, max_pages + 1):
             print(f"📄 페이지 {page} 처리 중...")
             
@@ -391,15 +416,8 @@ class SafeElectimesCrawler(BaseCrawler if FULL_DEPENDENCIES else object):
                 # 메모리 효율적으로 하나씩 yield
                 yield article
             
-            # 페이지 처리 후 가비지 컬렉션
-            gc.collect()
-                        if article.get('url'):
-                            self.save_crawled_url(article['url'])
-                        
-                        # 메모리 효율적으로 하나씩 yield
-                        yield article
-            
-            # 페이지 처리 후 가비지 컬렉션
+            # 페이지 단위로 URL 이력 일괄 기록 후 가비지 컬렉션
+            self._commit_crawled_urls()
             gc.collect()
         
         print(f"📊 크롤링 완료 통계:")
@@ -415,8 +433,13 @@ class SafeElectimesCrawler(BaseCrawler if FULL_DEPENDENCIES else object):
             if not self.session:
                 raise RuntimeError("Session이 초기화되지 않았습니다.")
             
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
+            if get_shared_rate_limiter:
+                with get_shared_rate_limiter().slot(url):
+                    response = self.session.get(url, timeout=15)
+                    response.raise_for_status()
+            else:
+                response = self.session.get(url, timeout=15)
+                response.raise_for_status()
             return response.text
 
         html_content = self._smart_retry(
@@ -433,7 +456,11 @@ class SafeElectimesCrawler(BaseCrawler if FULL_DEPENDENCIES else object):
 
     def _parse_articles_from_html(self, html_content: str) -> List[Dict[str, Any]]:
         """HTML에서 기사 정보 추출"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        if parse_html:
+            # 기사 목록 영역만 파싱 (lxml 우선)
+            soup = parse_html(html_content, parse_only=ARTICLE_LIST_STRAINER)
+        else:
+            soup = BeautifulSoup(html_content, 'html.parser')
         articles = []
         article_items = soup.select('section#section-list li.item')
         
@@ -466,6 +493,11 @@ class SafeElectimesCrawler(BaseCrawler if FULL_DEPENDENCIES else object):
         return articles
 
 
+# 공용 키워드 매처에 크롤러 키워드 등록
+if register_keyword_group:
+    register_keyword_group('safe_electimes', SafeElectimesCrawler.KEYWORDS)
+
+
 # 편의 함수: 기존 호환성 유지
 def create_safe_crawler(*args, **kwargs):
     """안전한 크롤러 생성 함수"""
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔧 크롤링 텔레메트리 (카운터 / 게이지 / 지연시간 히스토그램)
+- 단계별 소요 시간: 목록 / 상세 / 파싱 / 키워드 필터 / AI 예측 / LLM 요약 / Notion 기록
+- 다운로드 바이트, 재시도, HTTP 캐시 적중, 파이프라인 단계별 처리 건수
+- 실행 종료 시 JSON-lines(실행 이력 누적) + Prometheus textfile(최신 값) 내보내기
+"""
+
+import os
+import json
+import time
+import tempfile
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from config.config import (
+    TELEMETRY_ENABLED, TELEMETRY_DIR, TELEMETRY_JSONL_FILE, TELEMETRY_PROM_FILE, TELEMETRY_BUCKETS
+)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# 지표 설명 (Prometheus HELP)
+METRIC_HELP = {
+    'crawl_stage_seconds': '크롤링 단계별 소요 시간(초)',
+    'crawl_stage_errors_total': '크롤링 단계별 예외 발생 수',
+    'crawl_bytes_downloaded_total': '다운로드한 응답 본문 바이트 수',
+    'crawl_retries_total': '재시도 횟수',
+    'crawl_give_ups_total': '재시도를 포기한 작업 수 (사유별)',
+    'http_cache_requests_total': 'HTTP 캐시 조회 결과별 요청 수',
+    'content_extract_total': '본문 추출 결과별 건수 (hit=추출 캐시 적중, miss=새로 추출, empty=본문 없음)',
+    'pipeline_stage_seconds': '스트리밍 파이프라인 단계 함수 처리 시간(초)',
+    'pipeline_items_total': '스트리밍 파이프라인 단계별 처리 결과 수',
+    'notion_api_calls_total': 'Notion API 호출 수 (작업별, 재시도 포함)',
+    'notion_request_seconds': 'Notion 요청 소요 시간(초, 속도 제한 대기/재시도 포함)',
+    'notion_queue_wait_seconds': 'Notion 요청 실행기 대기열 대기 시간(초)',
+    'notion_queue_depth': 'Notion 요청 실행기 대기열 깊이',
+    'notion_requests_in_flight': 'Notion 요청 실행기 실행 중인 작업 수',
+    'llm_enrich_total': 'LLM 요약 보강 결과별 건수 (cached=저장된 요약 사용, enriched=보강 완료, failed=실패)',
+    'llm_enrich_queue_depth': 'LLM 요약 보강 대기 작업 수',
+    'rate_limit_rps': '호스트별 현재 허용 속도(초당 요청)',
+    'rate_limit_circuit_open': '호스트 서킷 차단 여부 (1=차단)',
+    'crawl_run_seconds': '전체 실행 시간(초)',
+}
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((key, str(value)) for key, value in labels.items() if value is not None))
+
+
+class _Histogram:
+    """누적 버킷 히스토그램 (Prometheus histogram과 같은 le 버킷)"""
+
+    __slots__ = ('bounds', 'counts', 'sum', 'count', 'max')
+
+    def __init__(self, bounds: List[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+        self.max = max(self.max, value)
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        total, result = 0, []
+        for bound, count in zip(self.bounds + [float('inf')], self.counts):
+            total += count
+            result.append(('+Inf' if bound == float('inf') else repr(bound), total))
+        return result
+
+
+class CrawlMetrics:
+    """
+    🔧 스레드 안전 지표 저장소
+
+    **사용 예**:
+        metrics = get_metrics()
+        with metrics.timer('detail_fetch', source='전기신문'):
+            html = fetch(url)
+        metrics.incr('crawl_bytes_downloaded_total', len(html), host='www.electimes.com')
+
+    비활성화(TELEMETRY_ENABLED=false) 시 모든 기록 호출은 즉시 반환합니다.
+    """
+
+    def __init__(self, enabled: bool = TELEMETRY_ENABLED, buckets: Optional[List[float]] = None):
+        self.enabled = enabled
+        self.buckets = sorted(buckets or TELEMETRY_BUCKETS)
+        self.started_at = datetime.now()
+        self.run_id = self.started_at.strftime('%Y%m%d-%H%M%S')
+        self._started = time.monotonic()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def incr(self, name: str, value: float = 1, **labels):
+        """카운터 증가"""
+        if not self.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels):
+        """게이지 값 설정"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    def observe(self, name: str, value: float, **labels):
+        """히스토그램에 관측값 추가"""
+        if not self.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(self.buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, stage: str, **labels) -> Iterator[None]:
+        """단계 소요 시간 기록 (crawl_stage_seconds{stage=...}), 예외는 crawl_stage_errors_total에도 집계"""
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.incr('crawl_stage_errors_total', stage=stage, **labels)
+            raise
+        finally:
+            self.observe('crawl_stage_seconds', time.perf_counter() - started, stage=stage, **labels)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 지표 전체 (내보내기/테스트용)"""
+        with self._lock:
+            return {
+                'counters': {name: dict(series) for name, series in self._counters.items()},
+                'gauges': {name: dict(series) for name, series in self._gauges.items()},
+                'histograms': {
+                    name: {key: {'count': h.count, 'sum': h.sum, 'max': h.max, 'buckets': h.cumulative()}
+                           for key, h in series.items()}
+                    for name, series in self._histograms.items()
+                },
+            }
+
+    def _records(self) -> Iterator[Dict[str, Any]]:
+        """JSON-lines용 시계열 레코드"""
+        snapshot = self.snapshot()
+        base = {'run_id': self.run_id, 'timestamp': datetime.now().isoformat(timespec='seconds')}
+        for kind in ('counters', 'gauges'):
+            for name, series in snapshot[kind].items():
+                for key, value in series.items():
+                    yield {**base, 'type': kind[:-1], 'name': name, 'labels': dict(key), 'value': value}
+        for name, series in snapshot['histograms'].items():
+            for key, info in series.items():
+                yield {
+                    **base, 'type': 'histogram', 'name': name, 'labels': dict(key),
+                    'count': info['count'], 'sum': round(info['sum'], 6), 'max': round(info['max'], 6),
+                    'avg': round(info['sum'] / info['count'], 6) if info['count'] else 0.0,
+                    'buckets': dict(info['buckets']),
+                }
+
+    @staticmethod
+    def _prom_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+        pairs = list(key) + ([extra] if extra else [])
+        if not pairs:
+            return ''
+        escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+        return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+    def to_prometheus(self) -> str:
+        """Prometheus textfile 형식 문자열"""
+        snapshot = self.snapshot()
+        lines = []
+        for kind, prom_type in (('counters', 'counter'), ('gauges', 'gauge')):
+            for name, series in sorted(snapshot[kind].items()):
+                lines.append(f"# HELP {name} {METRIC_HELP.get(name, name)}")
+                lines.append(f"# TYPE {name} {prom_type}")
+                for key, value in series.items():
+                    lines.append(f"{name}{self._prom_labels(key)} {value}")
+        for name, series in sorted(snapshot['histograms'].items()):
+            lines.append(f"# HELP {name} {METRIC_HELP.get(name, name)}")
+            lines.append(f"# TYPE {name} histogram")
+            for key, info in series.items():
+                for bound, count in info['buckets']:
+                    lines.append(f"{name}_bucket{self._prom_labels(key, ('le', bound))} {count}")
+                lines.append(f"{name}_sum{self._prom_labels(key)} {info['sum']:.6f}")
+                lines.append(f"{name}_count{self._prom_labels(key)} {info['count']}")
+        return '\n'.join(lines) + '\n'
+
+    def summary(self) -> str:
+        """로그용 단계별 요약 (건수 / 평균 / 최대)"""
+        histograms = self.snapshot()['histograms'].get('crawl_stage_seconds', {})
+        totals: Dict[str, List[float]] = {}
+        for key, info in histograms.items():
+            stage = dict(key).get('stage', '?')
+            total = totals.setdefault(stage, [0, 0.0, 0.0])
+            total[0] += info['count']
+            total[1] += info['sum']
+            total[2] = max(total[2], info['max'])
+        return ', '.join(
+            f"{stage} {count}건 평균 {total / count:.2f}s 최대 {peak:.2f}s"
+            for stage, (count, total, peak) in totals.items() if count
+        ) or '기록 없음'
+
+    def export(self, directory: str = TELEMETRY_DIR, jsonl_file: str = TELEMETRY_JSONL_FILE,
+               prom_file: str = TELEMETRY_PROM_FILE) -> Optional[Tuple[str, str]]:
+        """
+        실행 지표 내보내기
+
+        Returns:
+            (JSON-lines 경로, Prometheus textfile 경로), 비활성화 시 None
+        """
+        if not self.enabled:
+            return None
+        self.set_gauge('crawl_run_seconds', round(time.monotonic() - self._started, 3))
+        os.makedirs(directory, exist_ok=True)
+
+        jsonl_path = os.path.join(directory, jsonl_file)
+        with open(jsonl_path, 'a', encoding='utf-8') as f:
+            for record in self._records():
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+        # textfile collector가 쓰다 만 파일을 읽지 않도록 임시 파일 작성 후 교체
+        prom_path = os.path.join(directory, prom_file)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, prom_path)
+        return jsonl_path, prom_path
+
+
+# 크롤러 / 파이프라인 / Notion 공용 지표 저장소 (싱글톤 패턴)
+_shared_metrics: Optional[CrawlMetrics] = None
+_shared_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> CrawlMetrics:
+    """실행 전체가 공유하는 지표 저장소 반환"""
+    global _shared_metrics
+    with _shared_metrics_lock:
+        if _shared_metrics is None:
+            _shared_metrics = CrawlMetrics()
+        return _shared_metrics
+
+
+def export_metrics() -> Optional[Tuple[str, str]]:
+    """공용 지표 내보내기 (속도 제한기 호스트 상태를 게이지로 함께 기록)"""
+    metrics = get_metrics()
+    try:
+        from crawlers.rate_limiter import get_shared_rate_limiter
+
+        for host, info in get_shared_rate_limiter().state().items():
+            metrics.set_gauge('rate_limit_rps', info['rate'], host=host)
+            metrics.set_gauge('rate_limit_circuit_open', 1 if info['circuit'] == 'open' else 0, host=host)
+    except Exception as e:
+        print(f"[Telemetry] ⚠️ 속도 제한기 상태 수집 실패: {e}")
+    try:
+        return metrics.export()
+    except Exception as e:
+        print(f"[Telemetry] ⚠️ 지표 내보내기 실패: {e}")
+        return None
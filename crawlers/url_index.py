@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔧 SQLite 기반 크롤링 URL 이력
+- crawled_articles.json 전체 재작성(기사마다 O(n)) 대체
+- 메모리 set으로 O(1) 포함 여부 확인
+- 페이지 단위 배치 커밋 (SQLite 트랜잭션 → 원자적 기록)
+- URL별 first_seen / last_fetched 시각 기록
+"""
+
+import os
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+
+from config.config import URL_INDEX_PATH
+
+
+class UrlIndex:
+    """
+    🔧 크롤링 URL 이력 저장소
+
+    기존 set 기반 crawled_urls와 같은 방식(`url in index`, `index.add(url)`)으로 사용하되,
+    디스크 반영은 commit() 시점에 한 번의 트랜잭션으로 처리합니다.
+    """
+
+    def __init__(self, path: str = URL_INDEX_PATH, legacy_json: Optional[str] = 'crawled_articles.json'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Dict[str, Optional[str]]] = {}
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS crawled_urls (
+                url TEXT PRIMARY KEY,
+                first_seen TEXT NOT NULL,
+                last_fetched TEXT
+            )
+        ''')
+        self._conn.commit()
+
+        self._urls = {row[0] for row in self._conn.execute('SELECT url FROM crawled_urls')}
+
+        if not self._urls and legacy_json:
+            self._migrate_legacy_json(legacy_json)
+
+    def _migrate_legacy_json(self, legacy_json: str):
+        """기존 crawled_articles.json 이력을 1회 가져오기 (원본 파일은 유지)"""
+        if not os.path.exists(legacy_json):
+            return
+        try:
+            with open(legacy_json, 'r', encoding='utf-8') as f:
+                legacy_urls = [url for url in json.load(f) if url]
+        except Exception as e:
+            print(f"[UrlIndex] ⚠️ 기존 이력 파일 로드 실패 ({legacy_json}): {e}")
+            return
+
+        for url in legacy_urls:
+            self.add(url, fetched=False)
+        self.commit()
+        print(f"[UrlIndex] 기존 이력 {len(legacy_urls)}건을 {self.path}로 이전했습니다.")
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._urls
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._urls))
+
+    def add(self, url: str, fetched: bool = True):
+        """
+        URL 기록 (디스크 반영은 commit()에서)
+
+        Args:
+            url: 기사 URL
+            fetched: True면 last_fetched를 현재 시각으로 갱신
+        """
+        if not url:
+            return
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock:
+            self._urls.add(url)
+            entry = self._pending.setdefault(url, {'first_seen': now, 'last_fetched': None})
+            if fetched:
+                entry['last_fetched'] = now
+
+    def commit(self) -> int:
+        """
+        대기 중인 URL을 한 트랜잭션으로 기록
+
+        Returns:
+            int: 기록한 URL 수
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+            rows = [(url, entry['first_seen'], entry['last_fetched']) for url, entry in self._pending.items()]
+            try:
+                with self._conn:
+                    self._conn.executemany('''
+                        INSERT INTO crawled_urls (url, first_seen, last_fetched)
+                        VALUES (?, ?, ?)
+                        ON CONFLICT(url) DO UPDATE SET
+                            last_fetched = COALESCE(excluded.last_fetched, crawled_urls.last_fetched)
+                    ''', rows)
+            except sqlite3.Error as e:
+                print(f"[UrlIndex] ⚠️ URL 이력 커밋 실패 (다음 커밋에서 재시도): {e}")
+                return 0
+            self._pending.clear()
+            return len(rows)
+
+    def get_record(self, url: str) -> Optional[Dict[str, Optional[str]]]:
+        """URL의 first_seen / last_fetched 조회 (미커밋 항목 포함)"""
+        with self._lock:
+            if url in self._pending:
+                return dict(self._pending[url])
+            row = self._conn.execute(
+                'SELECT first_seen, last_fetched FROM crawled_urls WHERE url = ?', (url,)
+            ).fetchone()
+        if not row:
+            return None
+        return {'first_seen': row[0], 'last_fetched': row[1]}
+
+    def close(self, commit: bool = True):
+        """남은 항목 커밋 후 연결 종료 (commit=False면 커밋하지 않은 항목은 버림)"""
+        if commit:
+            self.commit()
+        with self._lock:
+            self._conn.close()
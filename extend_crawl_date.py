@@ -1,15 +1,8 @@
-# 크롤링 날짜 제한을 3일에서 7일로 확장
-import fileinput
-
-# electimes_crawler.py 파일 수정
-with open('crawlers/electimes_crawler.py', 'r', encoding='utf-8') as f:
-    content = f.read()
-
-# 3일을 7일로 변경
-content = content.replace('timedelta(days=3)', 'timedelta(days=7)')
-content = content.replace('최근 3일', '최근 7일')
-
-with open('crawlers/electimes_crawler.py', 'w', encoding='utf-8') as f:
-    f.write(content)
-
-print("✅ 크롤링 날짜 제한을 3일에서 7일로 확장했습니다!")
+# 크롤링 수집 기간 변경 안내
+# 수집 기간은 더 이상 소스 코드를 수정하지 않고 실행 옵션/환경변수로 지정합니다.
+#   - 한 번만:  python main.py --days 7
+#   - 기본값:   CRAWL_WINDOW_DAYS=7 (.env)
+#   - 긴 기간 백필: python backfill.py --days 90 --pages 1-60
+
+print("ℹ️ 수집 기간은 'python main.py --days N' 또는 CRAWL_WINDOW_DAYS 환경변수로 지정합니다.")
+print("   긴 기간 백필은 'python backfill.py --days N'을 사용하세요.")
@@ -2,20 +2,33 @@
 # -*- coding: utf-8 -*-
 """
 🤖 전력산업 뉴스 크롤러 - 메인 실행 스크립트
-- 전기신문 뉴스 자동 수집
-- Notion 자동 동기화  
+- 전기신문 / 한국전력거래소 등 활성화된 소스 동시 수집 (crawlers.registry)
+- Notion 자동 동기화 (목록 → 상세 → 필터 → 유사 중복 제거 → 요약 → Notion 스트리밍 파이프라인)
+- 중간에 중단된 실행은 --resume으로 이어서 진행 (끝난 상세/요약/Notion 기록은 재실행하지 않음)
 - AI 추천 시스템 학습/업데이트
 """
 
 import os
 import sys
 import logging
+import argparse
 from datetime import datetime
 from dotenv import load_dotenv
 
 # 프로젝트 모듈 import (실제 사용되는 것만)
 from notion.notion_client import NotionClient
-from crawlers.electimes_crawler import ElectimesCrawler
+from crawlers.registry import build_crawlers, MultiSourceCrawl, per_source, processed_if_dropped, processed_if_done
+from crawlers.resource_managers import close_shared_driver_pool
+from crawlers.debug_dump import close_debug_writer
+from crawlers.rate_limiter import get_shared_rate_limiter
+from crawlers.telemetry import get_metrics, export_metrics
+from crawlers.crawl_checkpoint import CrawlCheckpoint
+from processors.streaming_pipeline import Stage, StreamingPipeline
+from processors.near_duplicate import NearDuplicateIndex
+from config.config import (
+    PIPELINE_DETAIL_WORKERS, PIPELINE_FILTER_WORKERS,
+    PIPELINE_SUMMARY_WORKERS, PIPELINE_NOTION_WORKERS, NEAR_DUP_ENABLED
+)
 from ai_recommender import fit_and_save_model, update_notion_ai_recommend_all
 
 def setup_logging():
@@ -35,9 +48,21 @@ def setup_logging():
     )
     return logging.getLogger(__name__)
 
-def main():
+def parse_args(argv=None):
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description='전력산업 뉴스 크롤러 → Notion 동기화')
+    parser.add_argument('--resume', action='store_true',
+                        help='중단된 지난 실행의 체크포인트에서 이어서 진행')
+    parser.add_argument('--days', type=int, default=None,
+                        help='최근 N일 이내 기사만 수집 (기본: CRAWL_WINDOW_DAYS, 긴 기간 백필은 backfill.py)')
+    return parser.parse_args(argv)
+
+def main(resume: bool = False, window_days: int | None = None):
     """메인 실행 함수"""
     logger = setup_logging()
+    near_duplicates = None
+    checkpoint = None
+    sources = None
     
     try:
         logger.info("🚀 전력산업 뉴스 크롤러 시작")
@@ -50,18 +75,7 @@ def main():
         notion = NotionClient()
         logger.info("✅ NotionClient 초기화 완료")
         
-        # 2️⃣ 크롤러 초기화 및 실행
-        crawler = ElectimesCrawler(notion)
-        logger.info("✅ ElectimesCrawler 초기화 완료")
-        
-        articles = crawler.crawl()
-        logger.info(f"📰 크롤링 완료: {len(articles)}개 기사")
-        
-        if not articles:
-            logger.warning("⚠️ 크롤링된 기사가 없습니다")
-            return
-        
-        # 3️⃣ Notion 데이터베이스 연결
+        # 2️⃣ Notion 데이터베이스 연결 (기사가 도착하는 즉시 업서트하기 위해 먼저 확보)
         database_id = notion.get_weekly_database_id()
         if not database_id:
             logger.error("❌ Notion 데이터베이스 ID를 가져올 수 없습니다")
@@ -69,9 +83,70 @@ def main():
         
         logger.info(f"✅ 데이터베이스 연결 완료: {database_id}")
         
-        # 4️⃣ Notion 동기화
-        notion.sync_articles(articles, database_id)
-        logger.info(f"💾 Notion 동기화 완료: {len(articles)}개 기사")
+        # 3️⃣ 활성화된 소스의 크롤러 초기화 (ENABLED_SOURCES)
+        crawlers = build_crawlers(notion, window_days=window_days)
+        if not crawlers:
+            logger.error("❌ 실행할 수 있는 크롤러가 없습니다")
+            return
+        logger.info(f"✅ 크롤러 초기화 완료: {', '.join(c.source_name for c in crawlers)}")
+        sources = MultiSourceCrawl(crawlers)  # 종료 시 finally에서 크롤러 저장소 정리
+        
+        # 4️⃣ 크롤링 → Notion 동기화 스트리밍 파이프라인
+        #    소스별 목록 탐색은 동시에 실행하고 (크롤러, 기사) 쌍으로 병합
+        #    단계별 워커 수 + 크기 제한 큐로 첫 기사부터 바로 Notion에 기록
+        #    같은 기사의 재게시(다른 URL)는 LLM 요약/Notion 기록 전에 SimHash로 걸러냄
+        #    LLM 요약은 기다리지 않음: 자리표시(또는 같은 본문의 저장된 요약)로 먼저 기록하고 백그라운드에서 보강
+        #    단계가 끝날 때마다 체크포인트에 기록 (--resume 시 끝난 상세/요약/Notion 단계는 저장된 결과 사용)
+        #    필터/중복으로 제외되거나 Notion 기록에 성공한 기사만 처리 완료 → 워터마크는 그 구간까지만 전진
+        checkpoint = CrawlCheckpoint()
+        checkpoint.start(resume=resume)
+        stages = [
+            Stage('detail', per_source(checkpoint.checkpointed(
+                'detail', lambda crawler, article: crawler.fetch_article_details(article))),
+                  workers=PIPELINE_DETAIL_WORKERS),
+            Stage('filter', per_source(processed_if_dropped(lambda crawler, article: crawler.select_article(article))),
+                  workers=PIPELINE_FILTER_WORKERS),
+        ]
+        if NEAR_DUP_ENABLED:
+            near_duplicates = NearDuplicateIndex()
+            logger.info(f"✅ 유사 중복 색인 로드 완료: {len(near_duplicates)}건")
+            stages.append(Stage('dedup', per_source(processed_if_dropped(
+                lambda crawler, article: near_duplicates.filter_article(article)))))
+        stages += [
+            Stage('summary', per_source(checkpoint.checkpointed(
+                'summary', lambda crawler, article: notion.prepare_article(article))),
+                  workers=PIPELINE_SUMMARY_WORKERS),
+            Stage('notion', per_source(processed_if_done(checkpoint.checkpointed(
+                'notion', lambda crawler, article: notion.sync_article(article, database_id)))),
+                  workers=PIPELINE_NOTION_WORKERS),
+        ]
+        pipeline = StreamingPipeline(stages, name='Crawl→Notion')
+        
+        synced_count = 0
+        for crawler, synced in pipeline.run(checkpoint.track_listing(sources)):
+            synced_count += 1
+            logger.info(f"💾 [{crawler.source_name}] Notion 동기화: {synced.get('id')} (누적 {synced_count}건)")
+        
+        # AI 추천이 LLM 요약을 쓰도록 남은 보강 작업 대기
+        notion.drain_enrichment()
+        
+        # 파이프라인이 끝까지 완료된 경우에만 URL 이력/워터마크 반영 (탐색 실패 소스 제외)
+        sources.finalize()
+        if near_duplicates is not None:
+            near_duplicates.commit()
+            logger.info(f"🔁 유사 중복 기사 {near_duplicates.stats['duplicates']}건 건너뜀")
+        if resume:
+            logger.info(f"♻️ 체크포인트 재사용 {checkpoint.stats['resumed']}건, "
+                        f"이미 Notion 기록된 기사 {checkpoint.stats['skipped_synced']}건 건너뜀")
+        # 실행이 끝까지 완료되었으므로 체크포인트 비움 (다음 실행은 처음부터)
+        checkpoint.clear()
+        logger.info(f"📰 크롤링 및 Notion 동기화 완료: {synced_count}개 기사")
+        logger.info(f"🚦 호스트별 속도 제한 상태: {get_shared_rate_limiter().summary()}")
+        logger.info(f"⏱️ 단계별 소요 시간: {get_metrics().summary()}")
+        
+        if not synced_count:
+            logger.warning("⚠️ 크롤링된 기사가 없습니다")
+            return
         
         # 5️⃣ AI 추천 모델 학습
         try:
@@ -82,7 +157,7 @@ def main():
         
         # 6️⃣ AI 추천 업데이트
         try:
-            update_notion_ai_recommend_all()
+            update_notion_ai_recommend_all(notion)
             logger.info("🔄 AI 추천 업데이트 완료")
         except Exception as update_error:
             logger.warning(f"⚠️ AI 추천 업데이트 실패: {str(update_error)}")
@@ -95,10 +170,26 @@ def main():
         import traceback
         logger.error(f"📝 스택 트레이스:\n{traceback.format_exc()}")
         raise
+    finally:
+        # Selenium 폴백이 사용된 경우에만 실제 브라우저가 떠 있음
+        close_shared_driver_pool()
+        # 디버그 모드에서 대기 중인 HTML 덤프 마무리
+        close_debug_writer()
+        if sources is not None:
+            sources.close()
+        if near_duplicates is not None:
+            near_duplicates.close()
+        if checkpoint is not None:
+            checkpoint.close()
+        # 실패한 실행도 어느 단계에서 멈췄는지 남도록 항상 지표 내보내기
+        exported = export_metrics()
+        if exported:
+            logger.info(f"📊 실행 지표 저장: {', '.join(exported)}")
 
 if __name__ == "__main__":
     print("=" * 60)
     print("🤖 전력산업 뉴스 크롤러")
     print("🔗 전기신문 → Notion 자동 동기화")
     print("=" * 60)
-    main()
+    args = parse_args()
+    main(resume=args.resume, window_days=args.days)
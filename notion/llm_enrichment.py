@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔧 LLM 요약 백그라운드 보강 (Notion 동기화와 분리)
+- 동기화 전: 규칙 기반 한줄요약/핵심 내용(자리표시)으로 바로 페이지 생성/업데이트
+  같은 본문(내용 해시)을 이미 LLM으로 요약했으면 저장된 결과를 그대로 사용 (LLM 호출 없음)
+- 동기화 후: 보강 대기열(SQLite)에 넣고 워커 풀이 LLM 요약 → 한줄요약/핵심 내용 속성만 패치
+- 대기열은 SQLite에 남으므로 중단된 실행의 보강 작업은 다음 실행에서 이어서 처리
+- 이미 요약이 있는 페이지는 본문이 바뀌었을 때만 보강 (자리표시로 기존 요약을 덮어쓰지 않음)
+"""
+
+import os
+import time
+import hashlib
+import sqlite3
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.config import LLM_ENRICH_STATE_PATH, LLM_ENRICH_WORKERS
+from crawlers.telemetry import get_metrics
+from ai_update_content import (
+    clean_article_content, generate_one_line_summary_with_llm, generate_key_content,
+    generate_one_line_summary_rule_based, generate_key_content_rule_based
+)
+
+PENDING_KEY = 'llm_pending'  # 기사 딕셔너리 키: 자리표시 요약으로 동기화되어 보강이 필요한지
+
+
+def content_hash(content: str) -> str:
+    """본문 내용 해시 (공백 차이는 무시)"""
+    return hashlib.sha1(' '.join((content or '').split()).encode('utf-8')).hexdigest()
+
+
+class LLMEnrichmentQueue:
+    """
+    🔧 LLM 요약 보강 대기열 + 워커 풀
+
+    **사용 예**:
+        enrichment = LLMEnrichmentQueue(notion)
+        enrichment.prepare(article)                        # 자리표시 또는 저장된 LLM 요약
+        page = notion.sync_article(article, database_id)   # LLM을 기다리지 않고 바로 기록
+        enrichment.submit(article, database_id, page['id'])
+        enrichment.drain()                                 # 실행 종료 전 남은 보강 대기
+
+    **특징**:
+    - 본문 해시별 LLM 결과를 저장해 같은 본문은 다시 요약하지 않음 (재동기화 / 다른 URL 재게시)
+    - 같은 본문이 동시에 여러 번 들어와도 LLM 호출은 한 번 (나머지는 결과 저장 후 패치만)
+    - LLM 실패(빈 결과) 시 자리표시를 그대로 두고 작업을 남겨 다음 실행에서 재시도 (MAX_ATTEMPTS회까지)
+    - 페이지별 마지막 본문 해시를 기록해 본문이 그대로인 기존 페이지는 다시 보강하지 않음
+    """
+
+    MAX_ATTEMPTS = 3  # 작업당 보강 시도 횟수 (넘으면 자리표시를 유지하고 작업 삭제)
+
+    def __init__(self, notion: Any, path: str = LLM_ENRICH_STATE_PATH, workers: int = LLM_ENRICH_WORKERS):
+        self.notion = notion
+        self.workers = max(1, workers)
+        self.metrics = get_metrics()
+        self.stats = {'placeholder': 0, 'cached': 0, 'queued': 0, 'enriched': 0, 'failed': 0}
+        self._lock = threading.Lock()  # SQLite 연결 + 진행 중 작업
+        self._hash_locks: Dict[str, threading.Lock] = {}  # 본문 해시별 LLM 호출 1회
+        self._futures: List[Future] = []
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS enrichments (
+                content_hash TEXT PRIMARY KEY,
+                summary TEXT NOT NULL,
+                key_points TEXT NOT NULL,
+                enriched_at REAL NOT NULL
+            )
+        ''')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS enrichment_jobs (
+                page_id TEXT PRIMARY KEY,
+                database_id TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                url TEXT, title TEXT, content TEXT,
+                queued_at REAL NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        columns = [row[1] for row in self._conn.execute('PRAGMA table_info(enrichment_jobs)')]
+        if 'attempts' not in columns:  # 이전 버전에서 만든 대기열
+            self._conn.execute('ALTER TABLE enrichment_jobs ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS page_contents (
+                page_id TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                recorded_at REAL NOT NULL
+            )
+        ''')
+        self._conn.commit()
+
+    def _lookup(self, digest: str) -> Optional[Tuple[str, str]]:
+        with self._lock:
+            return self._conn.execute(
+                'SELECT summary, key_points FROM enrichments WHERE content_hash = ?', (digest,)
+            ).fetchone()
+
+    def prepare(self, article: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        동기화 전 요약 채우기 (LLM 호출 없음)
+
+        같은 본문의 LLM 요약이 저장되어 있으면 그 결과를, 없으면 규칙 기반 자리표시를
+        article['summary'] / article['key_points']에 넣고 article['llm_pending']에 보강 필요 여부를 기록합니다.
+        """
+        cached = self._lookup(content_hash(article.get('content', '')))
+        if cached is not None:
+            article['summary'], article['key_points'] = cached
+            article[PENDING_KEY] = False
+            self.stats['cached'] += 1
+            self.metrics.incr('llm_enrich_total', result='cached')
+            return article
+
+        cleaned_content = clean_article_content(article.get('content', ''))
+        article['summary'] = generate_one_line_summary_rule_based(cleaned_content)[:2000]
+        article['key_points'] = generate_key_content_rule_based(cleaned_content)[:2000]
+        article[PENDING_KEY] = bool(cleaned_content)
+        self.stats['placeholder'] += 1
+        return article
+
+    def content_changed(self, page_id: str, article: Dict[str, Any]) -> bool:
+        """
+        요약이 이미 있는 기존 페이지의 본문이 마지막 기록 이후 바뀌었는지
+
+        기록이 없는 페이지(이 대기열 도입 전 동기화)는 기존 요약을 믿고 현재 본문 해시를 기록한 뒤 False.
+        """
+        digest = content_hash(article.get('content', ''))
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                'SELECT content_hash FROM page_contents WHERE page_id = ?', (page_id,)
+            ).fetchone()
+            if row is None:
+                self._conn.execute('INSERT INTO page_contents VALUES (?, ?, ?)', (page_id, digest, time.time()))
+                return False
+        return row[0] != digest
+
+    def submit(self, article: Dict[str, Any], database_id: str, page_id: str) -> bool:
+        """동기화된 페이지의 LLM 보강 예약 (자리표시로 기록된 기사만, 예약했으면 True)"""
+        if not article.get(PENDING_KEY) or not page_id:
+            return False
+        job = (page_id, database_id, content_hash(article.get('content', '')),
+               article.get('url', ''), article.get('title', ''), article.get('content', ''))
+        with self._lock, self._conn:
+            self._conn.execute('INSERT OR REPLACE INTO enrichment_jobs VALUES (?, ?, ?, ?, ?, ?, ?, 0)',
+                               job + (time.time(),))
+        self._schedule(job)
+        return True
+
+    def resume_pending(self) -> int:
+        """이전 실행에서 끝나지 않은 보강 작업 다시 예약 (MAX_ATTEMPTS회 실패한 작업은 삭제)"""
+        with self._lock, self._conn:
+            expired = self._conn.execute('DELETE FROM enrichment_jobs WHERE attempts >= ?',
+                                         (self.MAX_ATTEMPTS,)).rowcount
+            jobs = self._conn.execute(
+                'SELECT page_id, database_id, content_hash, url, title, content FROM enrichment_jobs ORDER BY queued_at'
+            ).fetchall()
+        if expired:
+            print(f"[LLM:Enrich] {self.MAX_ATTEMPTS}회 실패한 보강 작업 {expired}건 삭제 (자리표시 유지)")
+        for job in jobs:
+            self._schedule(tuple(job))
+        if jobs:
+            print(f"[LLM:Enrich] 이전 실행의 보강 작업 {len(jobs)}건 재예약")
+        return len(jobs)
+
+    def _schedule(self, job: tuple):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='llm-enrich')
+            self.stats['queued'] += 1
+            self._futures = [future for future in self._futures if not future.done()]
+            self._futures.append(self._pool.submit(self._enrich, job))
+            self.metrics.set_gauge('llm_enrich_queue_depth', len(self._futures))
+
+    def _enrich(self, job: tuple):
+        page_id, database_id, digest, url, title, content = job
+        try:
+            with self._lock:
+                hash_lock = self._hash_locks.setdefault(digest, threading.Lock())
+            with hash_lock:
+                enriched = self._lookup(digest) or self._summarize(digest, content)
+            if enriched is None:
+                self._record_failure(page_id, digest)
+                return  # 작업은 남겨 두고 다음 실행에서 재시도
+
+            summary, key_points = enriched
+            self.notion._update_page({'url': url, 'title': title}, database_id, page_id, {
+                "한줄요약": {"rich_text": [{"text": {"content": summary}}]},
+                "핵심 내용": {"rich_text": [{"text": {"content": key_points}}]},
+            }, raise_errors=True)
+            with self._lock, self._conn:
+                self._conn.execute('DELETE FROM enrichment_jobs WHERE page_id = ? AND content_hash = ?',
+                                   (page_id, digest))
+                self._conn.execute('INSERT OR REPLACE INTO page_contents VALUES (?, ?, ?)',
+                                   (page_id, digest, time.time()))
+            self.stats['enriched'] += 1
+            self.metrics.incr('llm_enrich_total', result='enriched')
+        except Exception as e:
+            # LLM 결과는 저장되어 있으므로 다음 동기화/재예약 때 LLM 없이 반영
+            print(f"[LLM:Enrich] !!! 보강 실패 '{title}' (Page ID: {page_id}): {e}")
+            self._record_failure(page_id, digest)
+
+    def _record_failure(self, page_id: str, digest: str):
+        """실패 횟수 기록 (resume_pending이 MAX_ATTEMPTS회 넘은 작업을 정리)"""
+        with self._lock:
+            self.stats['failed'] += 1
+            self._conn.execute('UPDATE enrichment_jobs SET attempts = attempts + 1 WHERE page_id = ? AND content_hash = ?',
+                               (page_id, digest))
+            self._conn.commit()
+        self.metrics.incr('llm_enrich_total', result='failed')
+
+    def _summarize(self, digest: str, content: str) -> Optional[Tuple[str, str]]:
+        """LLM 요약 후 본문 해시별 저장 (둘 중 하나라도 실패하면 None)"""
+        cleaned_content = clean_article_content(content)
+        with self.metrics.timer('llm_summary'):
+            summary = generate_one_line_summary_with_llm(cleaned_content, use_llm=True)
+            key_points = generate_key_content(cleaned_content, use_llm=True)
+        if not summary or not key_points:
+            return None
+        enriched = (summary[:2000], key_points[:2000])
+        with self._lock, self._conn:
+            self._conn.execute('INSERT OR REPLACE INTO enrichments VALUES (?, ?, ?, ?)',
+                               (digest, *enriched, time.time()))
+        return enriched
+
+    def drain(self, timeout: Optional[float] = None) -> Dict[str, int]:
+        """예약된 보강이 끝날 때까지 대기 (timeout초가 지나면 남은 작업은 다음 실행으로)"""
+        with self._lock:
+            futures = list(self._futures)
+        if futures:
+            print(f"[LLM:Enrich] 남은 보강 작업 {sum(not future.done() for future in futures)}건 대기 중...")
+            wait(futures, timeout=timeout)
+        with self._lock:
+            self._futures = [future for future in self._futures if not future.done()]
+            self.metrics.set_gauge('llm_enrich_queue_depth', len(self._futures))
+        print(f"[LLM:Enrich] 자리표시 {self.stats['placeholder']}, 저장된 요약 사용 {self.stats['cached']}, "
+              f"보강 {self.stats['enriched']}, 실패 {self.stats['failed']}")
+        return dict(self.stats)
+
+    def close(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+        with self._lock:
+            self._conn.close()
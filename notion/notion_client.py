@@ -1,18 +1,193 @@
-from typing import Dict, Any, List
-from datetime import datetime
+from typing import Dict, Any, Callable, Iterator, List, Tuple
+from datetime import datetime, timedelta
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+import time
+import random
+import threading
+import httpx
 from notion_client import Client
-from config.config import NOTION_API_KEY, NOTION_DATABASE_ID, NOTION_PARENT_PAGE_ID # NOTION_DATABASE_ID는 이제 사용하지 않을 수 있으며, NOTION_PARENT_PAGE_ID를 추가합니다.
+from config.config import NOTION_API_KEY, NOTION_DATABASE_ID, NOTION_PARENT_PAGE_ID, NOTION_WRITE_WORKERS, NOTION_MAX_RETRIES, LLM_ENRICH_ENABLED # NOTION_DATABASE_ID는 이제 사용하지 않을 수 있으며, NOTION_PARENT_PAGE_ID를 추가합니다.
 import pandas as pd
 import re
+from crawlers.rate_limiter import CircuitOpenError, RateLimitedTransport, is_transient_error
+from crawlers.telemetry import get_metrics
+from notion.notion_mirror import NotionMirror
+from notion.llm_enrichment import PENDING_KEY, LLMEnrichmentQueue
+from notion.weekly_registry import get_shared_weekly_registry, iso_week, parse_weekly_title, weekly_database_title
 from ai_update_content import generate_one_line_summary_with_llm, generate_key_content, clean_article_content
 
+class NotionRequestExecutor:
+    """
+    🔧 Notion API 요청 실행기 (속도 제한 / 재시도 / 동시 실행)
+
+    **사용 예**:
+        executor = NotionRequestExecutor()
+        page = executor.run('retrieve', lambda: client.pages.retrieve(page_id=page_id))
+        futures = [executor.submit('update', lambda p=p: client.pages.update(page_id=p, properties=props))
+                   for p in page_ids]
+
+    **특징**:
+    - 속도는 httpx 훅의 공용 속도 제한기가 조절 (api.notion.com 평균 3 req/s, 버스트 3)
+      429/503의 Retry-After는 호스트 버킷 전체에 적용되므로 재시도도 그만큼 기다렸다가 나감
+    - 읽기(query/search/retrieve)와 멱등 쓰기(update)는 일시적 오류(429/5xx/연결/타임아웃)를 재시도
+    - 생성(create)은 서버가 처리하지 않았음이 확실한 429만 재시도 (중복 페이지 방지)
+    - submit()은 workers개 스레드 풀에서 실행, 실패는 Future의 예외로 전달
+    - 대기열 깊이(notion_queue_depth), 요청 지연시간(notion_request_seconds, 재시도 포함), 시도별 호출 수 기록
+    """
+
+    NON_IDEMPOTENT = frozenset({'create', 'create_database'})
+
+    def __init__(self, workers: int = NOTION_WRITE_WORKERS, max_retries: int = NOTION_MAX_RETRIES):
+        self.workers = max(1, workers)
+        self.max_retries = max(1, max_retries)
+        self.metrics = get_metrics()
+        self.stats = {'queued': 0, 'running': 0, 'completed': 0, 'failed': 0, 'retries': 0}
+        self._pool: ThreadPoolExecutor | None = None  # 첫 submit() 때 생성
+        self._lock = threading.Lock()
+
+    def run(self, operation: str, func: Callable[[], Any], idempotent: bool | None = None) -> Any:
+        """
+        요청 하나를 현재 스레드에서 실행 (재시도 포함)
+
+        Args:
+            operation: 지표/로그용 작업 이름 (query, search, retrieve, update, create, ...)
+            func: Notion SDK 호출
+            idempotent: 재시도해도 안전한지 (None이면 create 계열만 False)
+
+        Returns:
+            func의 결과 (최종 실패 시 마지막 예외를 그대로 올림)
+        """
+        if idempotent is None:
+            idempotent = operation not in self.NON_IDEMPOTENT
+        started = time.perf_counter()
+        for attempt in range(self.max_retries):
+            self.metrics.incr('notion_api_calls_total', operation=operation)
+            try:
+                result = func()
+            except Exception as e:
+                if not self._should_retry(e, operation, idempotent, attempt):
+                    self.metrics.observe('notion_request_seconds', time.perf_counter() - started,
+                                         operation=operation, result='error')
+                    raise
+                # 대기는 호스트 버킷(Retry-After 포함)이 정하고, 여기서는 동시 재시도 동기화 방지용 지터만
+                time.sleep(random.uniform(0.05, 0.25))
+                continue
+            self.metrics.observe('notion_request_seconds', time.perf_counter() - started,
+                                 operation=operation, result='ok')
+            return result
+
+    def _should_retry(self, error: Exception, operation: str, idempotent: bool, attempt: int) -> bool:
+        """재시도 여부 판단 + 로그 (서킷 차단/영구적 오류/멱등이 아닌 요청/마지막 시도면 False)"""
+        if isinstance(error, CircuitOpenError) or not is_transient_error(error):
+            return False
+        if not idempotent and getattr(error, 'status', None) != 429:
+            print(f"[Notion] ❌ {operation} 실패 (처리 여부를 알 수 없어 중복 방지를 위해 재시도 안함): "
+                  f"{type(error).__name__} - {error}")
+            return False
+        if attempt == self.max_retries - 1:
+            print(f"[Notion] ❌ {operation} 최종 실패: {type(error).__name__} - {error}")
+            self.metrics.incr('crawl_give_ups_total', source='Notion', reason='exhausted')
+            return False
+        print(f"[Notion] ⚠️ {operation} 일시적 오류: {type(error).__name__} - 속도 제한에 맞춰 재시도 "
+              f"({attempt + 2}/{self.max_retries})")
+        self.metrics.incr('crawl_retries_total', source='Notion')
+        with self._lock:
+            self.stats['retries'] += 1
+        return True
+
+    def submit(self, operation: str, func: Callable[[], Any], idempotent: bool | None = None) -> Future:
+        """스레드 풀에서 run() 실행 (결과/예외는 Future로)"""
+        return self.submit_task(operation, lambda: self.run(operation, func, idempotent))
+
+    def submit_task(self, operation: str, task: Callable[[], Any]) -> Future:
+        """내부에서 run()을 호출하는 작업을 스레드 풀에서 실행 (재시도는 작업 안의 요청 단위)"""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='notion')
+            self.stats['queued'] += 1
+            self._report_queue()
+            return self._pool.submit(self._run_queued, operation, task, time.perf_counter())
+
+    def _run_queued(self, operation: str, task: Callable[[], Any], submitted: float) -> Any:
+        with self._lock:
+            self.stats['queued'] -= 1
+            self.stats['running'] += 1
+            self._report_queue()
+        self.metrics.observe('notion_queue_wait_seconds', time.perf_counter() - submitted, operation=operation)
+        succeeded = False
+        try:
+            result = task()
+            succeeded = True
+            return result
+        finally:
+            with self._lock:
+                self.stats['running'] -= 1
+                self.stats['completed' if succeeded else 'failed'] += 1
+                self._report_queue()
+
+    def _report_queue(self):
+        # self._lock 안에서 호출
+        self.metrics.set_gauge('notion_queue_depth', self.stats['queued'])
+        self.metrics.set_gauge('notion_requests_in_flight', self.stats['running'])
+
+    def summary(self) -> str:
+        """로그용 한 줄 요약"""
+        with self._lock:
+            stats = dict(self.stats)
+        return (f"대기 {stats['queued']}, 실행 중 {stats['running']}, 완료 {stats['completed']}, "
+                f"실패 {stats['failed']}, 재시도 {stats['retries']}")
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+
 class NotionClient:
     def __init__(self):
-        self.client = Client(auth=NOTION_API_KEY)
+        # Notion API 호출도 크롤러와 같은 호스트별 속도 제한기/서킷 브레이커 사용 (429 Retry-After 반영)
+        self.client = Client(auth=NOTION_API_KEY, client=httpx.Client(transport=RateLimitedTransport()))
+        self.executor = NotionRequestExecutor()  # 재시도 / 동시 쓰기 / 대기열 지표
         self.databases = {}  # 데이터베이스 ID 캐시
+        self.weekly_databases = get_shared_weekly_registry()  # (ISO 연도, 주차) → 데이터베이스 ID (프로세스 간 공유)
+        self.metrics = get_metrics()  # LLM 요약 / Notion 기록 소요 시간
+        self._page_indexes: Dict[str, Dict[str, Dict[str, Any]]] = {}  # 데이터베이스 ID → URL → 페이지 (fetch_page_index)
+        self._page_index_lock = threading.Lock()
+        self._mirror: NotionMirror | None = None  # 주간 DB 로컬 미러 (첫 조회 시 생성)
+        self._mirror_lock = threading.Lock()
+        self._enrichment: LLMEnrichmentQueue | None = None  # LLM 요약 보강 대기열 (첫 사용 시 생성)
+        self._enrichment_lock = threading.Lock()
         # self.database_id = NOTION_DATABASE_ID # 환경 변수 대신 동적으로 설정
         # self.database_id = None # 초기에는 데이터베이스 ID를 None으로 설정
 
+    @property
+    def mirror(self) -> NotionMirror:
+        """주간 데이터베이스 로컬 미러 (읽기 전용 조회는 API 대신 미러 사용)"""
+        with self._mirror_lock:
+            if self._mirror is None:
+                self._mirror = NotionMirror(self.client, executor=self.executor)
+            return self._mirror
+
+    @property
+    def enrichment(self) -> LLMEnrichmentQueue:
+        """LLM 요약 보강 대기열 (생성 시 이전 실행에서 남은 보강 작업 재예약)"""
+        with self._enrichment_lock:
+            if self._enrichment is None:
+                self._enrichment = LLMEnrichmentQueue(self)
+                self._enrichment.resume_pending()
+            return self._enrichment
+
+    def drain_enrichment(self, timeout: float | None = None):
+        """실행 종료 전 남은 LLM 보강 대기 (보강 대기열을 쓰지 않았으면 생략)"""
+        if self._enrichment is not None:
+            self._enrichment.drain(timeout=timeout)
+
+    def _mirror_changed(self, database_id: str | None = None):
+        """우리 쪽 쓰기 후 미러를 갱신 대상으로 표시 (미러를 아직 열지 않았으면 생략)"""
+        if self._mirror is not None:
+            self._mirror.mark_stale(database_id)
+
     def _search_database(self, title: str) -> List[Dict]:
         """
         데이터베이스를 제목으로 검색합니다.
@@ -24,13 +199,13 @@ class NotionClient:
             List[Dict]: 검색된 데이터베이스 목록
         """
         try:
-            search_response = self.client.search(
+            search_response = self.executor.run('search', lambda: self.client.search(
                 query=title,
                 filter={
                     "property": "object",
                     "value": "database"
                 }
-            )
+            ))
             
             results = []
             for result in search_response.get('results', []):
@@ -53,16 +228,15 @@ class NotionClient:
     def get_weekly_database_id(self, parent_page_id: str = NOTION_PARENT_PAGE_ID) -> str | None:
         """Get or create the database ID for the current week."""
         try:
-            # 현재 연도와 주차 계산
-            now = datetime.now()
-            current_year = now.year
-            current_week = now.isocalendar()[1]
-            database_title = f"전력 산업 뉴스 {current_year}년 {current_week}주차"
+            # 현재 ISO 연도와 주차 계산 (연말/연초 주는 ISO 연도 기준)
+            current_week = iso_week()
+            database_title = weekly_database_title(*current_week)
             
-            # 데이터베이스 검색
-            results = self._search_database(database_title)
-            if results:
-                found_database_id = results[0]['id']
+            # 주간 데이터베이스 레지스트리 조회 (모르는 주차일 때만 하위 데이터베이스 목록 1회 조회)
+            found_database_id = self.weekly_databases.resolve(
+                [current_week], lambda: self._list_weekly_databases(parent_page_id)
+            ).get(current_week)
+            if found_database_id:
                 self.databases[database_title] = found_database_id
                 return found_database_id
                 
@@ -92,7 +266,7 @@ class NotionClient:
         print(f"[Notion] 데이터베이스 '{database_title}' 생성 중... (부모 페이지: {parent_page_id})")
         
         # Create a new database under the specified parent page
-        new_database = self.client.databases.create(
+        new_database = self.executor.run('create_database', lambda: self.client.databases.create(
             parent={
                 "type": "page_id",
                 "page_id": parent_page_id
@@ -116,11 +290,14 @@ class NotionClient:
                 "관심": {"checkbox": {}},
                 "AI추천": {"checkbox": {}}
             }
-        )
+        ))
         
         created_database_id = new_database['id']
         print(f"[Notion] 데이터베이스 생성 완료 (ID: {created_database_id})")
         self.databases[database_title] = created_database_id
+        week = parse_weekly_title(database_title)
+        if week is not None:
+            self.weekly_databases.register(*week, created_database_id, database_title)
         return created_database_id
 
     def create_news_card(self, article: Dict[str, Any], database_id: str) -> Dict[str, Any]:
@@ -234,191 +411,375 @@ class NotionClient:
             ]
         }
 
-        return self.client.pages.create(**new_page)
+        return self.executor.run('create', lambda: self.client.pages.create(**new_page))
+
+    def summarize_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
+        """본문 정제 후 한줄요약/핵심 내용 생성 (LLM 사용), article['summary'] / article['key_points']에 저장"""
+        # 본문 정제
+        cleaned_content = clean_article_content(article['content'])
+        # 한줄요약 및 핵심 내용 생성 (LLM 사용)
+        with self.metrics.timer('llm_summary'):
+            summary = generate_one_line_summary_with_llm(cleaned_content, use_llm=True)
+            key_points = generate_key_content(cleaned_content, use_llm=True)
+
+        # Ensure content is within Notion's limits (2000 characters)
+        article['summary'] = summary[:2000] if summary else ""
+        article['key_points'] = key_points[:2000] if key_points else ""
+        return article
+
+    def prepare_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        동기화 전 한줄요약/핵심 내용 채우기
+
+        LLM_ENRICH_ENABLED면 LLM을 기다리지 않고 저장된 LLM 요약(같은 본문) 또는 규칙 기반 자리표시를 넣고,
+        동기화 후 보강 대기열이 LLM 요약으로 패치합니다. 비활성화 시 summarize_article()과 같습니다.
+        """
+        if not LLM_ENRICH_ENABLED:
+            return self.summarize_article(article)
+        return self.enrichment.prepare(article)
+
+    def sync_article(self, article: Dict[str, Any], database_id: str) -> Dict[str, Any] | None:
+        """
+        기사 하나를 Notion에 동기화 (URL 기준으로 있으면 업데이트, 없으면 생성)
+        요약이 없는 기사는 prepare_article()로 먼저 채우고, 자리표시로 기록했으면 LLM 보강을 예약합니다.
+
+        Returns:
+            동기화된 페이지 정보 (실패 시 None)
+        """
+        if not article.get('summary') and not article.get('key_points'):
+            self.prepare_article(article)
+        summary = article['summary']
+        key_points = article['key_points']
+
+        with self.metrics.timer('notion_write'):
+            result = self._upsert_article_page(article, database_id, summary, key_points)
+        if result is None:
+            self.metrics.incr('crawl_stage_errors_total', stage='notion_write')
+        elif LLM_ENRICH_ENABLED and article.get(PENDING_KEY):
+            self.enrichment.submit(article, database_id, result.get('id'))
+        return result
+
+    @staticmethod
+    def _plain_text(properties: Dict[str, Any], name: str) -> str:
+        return ''.join(text.get('plain_text', '') for text in properties.get(name, {}).get('rich_text', []))
+
+    def fetch_page_index(self, database_id: str, refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        URL → 페이지 인덱스 생성 (데이터베이스별 캐시, 로컬 미러를 증분 갱신한 뒤 생성)
+
+        Returns:
+            Dict[str, Dict]: {바로가기 URL: {'id': 페이지 ID, 'properties': 현재 속성}}
+        """
+        with self._page_index_lock:
+            index = self._page_indexes.get(database_id)
+            if index is not None and not refresh:
+                return index
+
+            # 미러를 증분 갱신(변경된 페이지만 조회)한 뒤 로컬에서 인덱스 생성
+            # (쓰기 판단용이라 갱신에 실패하면 오래된 미러 대신 예외 → 호출부가 URL 필터 조회로 대체)
+            index = self.mirror.page_index(database_id, max_age=0, allow_stale=False)
+            self._page_indexes[database_id] = index
+            print(f"[Notion:sync] URL 인덱스 생성: 페이지 {len(index)}건")
+            return index
+
+    def _find_existing_page(self, database_id: str, article_url: str) -> Dict[str, Any] | None:
+        """URL로 기존 페이지 찾기 (URL 인덱스 우선, 인덱스 생성에 실패하면 URL 필터 조회)"""
+        try:
+            return self.fetch_page_index(database_id).get(article_url)
+        except Exception as e:
+            print(f"[Notion:sync] ⚠️ URL 인덱스 생성 실패, URL 필터 조회로 대체: {e}")
+
+        print(f"[Notion:sync] Searching for existing page with URL: {article_url}")
+        existing_pages = self.executor.run('query', lambda: self.client.databases.query(
+            database_id=database_id,
+            filter={
+                "property": "바로가기",
+                "url": {"equals": article_url}
+            }
+        ))
+        if not existing_pages.get('results'):
+            return None
+        # 조회 결과에 현재 속성이 포함되어 있으므로 pages.retrieve는 생략
+        page = existing_pages['results'][0]
+        return {'id': page['id'], 'properties': page.get('properties', {})}
+
+    def _remember_page(self, database_id: str, article_url: str, page_id: str, properties: Dict[str, Any]):
+        """생성/업데이트한 페이지를 URL 인덱스에 반영 (같은 URL 재동기화 시 재조회 없이 비교)"""
+        with self._page_index_lock:
+            index = self._page_indexes.get(database_id)
+            if index is None or not article_url:
+                return
+            entry = index.setdefault(article_url, {'id': page_id, 'properties': {}})
+            entry['properties'] = {**entry['properties'], **self._as_page_properties(properties)}
+
+    @staticmethod
+    def _as_page_properties(properties: Dict[str, Any]) -> Dict[str, Any]:
+        """요청 형식 속성({"text": {"content"}})에 조회 형식의 plain_text를 채움 (응답 속성은 그대로)"""
+        converted = {}
+        for name, value in properties.items():
+            value = dict(value)
+            for kind in ('rich_text', 'title'):
+                if kind in value:
+                    value[kind] = [
+                        {**item, 'plain_text': item.get('plain_text', item.get('text', {}).get('content', ''))}
+                        for item in value[kind]
+                    ]
+            converted[name] = value
+        return converted
+
+    def _property_updates(self, article: Dict[str, Any], current_properties: Dict[str, Any],
+                          summary: str, key_points: str) -> Dict[str, Any]:
+        """기존 페이지 속성과 비교해 바뀐 속성만 반환 (비어 있으면 업데이트 불필요)"""
+        properties_to_update = {}
+
+        # 1. 출처 업데이트 (새로운 출처가 있고, 기존 출처와 다른 경우)
+        new_source = article.get('source', '')
+        current_source = self._plain_text(current_properties, '출처')
+        if new_source and new_source != current_source:
+            properties_to_update['출처'] = {"rich_text": [{"text": {"content": new_source}}]}
+            print(f"[Notion:sync] 출처 업데이트: {current_source} -> {new_source}")
+
+        # 2. 한줄요약 업데이트 (새로운 요약이 있고, 기존 요약과 다른 경우)
+        current_summary = self._plain_text(current_properties, '한줄요약')
+        if summary and summary != current_summary:
+            properties_to_update['한줄요약'] = {"rich_text": [{"text": {"content": summary}}]}
+            print(f"[Notion:sync] 한줄요약 업데이트: {current_summary[:50]}... -> {summary[:50]}...")
+
+        # 3. 핵심 내용 업데이트 (새로운 내용이 있고, 기존 내용과 다른 경우)
+        current_key_points = self._plain_text(current_properties, '핵심 내용')
+        if key_points and key_points != current_key_points:
+            properties_to_update['핵심 내용'] = {"rich_text": [{"text": {"content": key_points}}]}
+            print(f"[Notion:sync] 핵심 내용 업데이트: {current_key_points[:50]}... -> {key_points[:50]}...")
+
+        # 4. 키워드 업데이트 (새로운 키워드가 있는 경우)
+        new_keywords = list(article.get('keywords', []))
+        current_keywords = [k['name'] for k in current_properties.get('키워드', {}).get('multi_select', [])]
+        if new_keywords and set(new_keywords) != set(current_keywords):
+            properties_to_update['키워드'] = {"multi_select": [{"name": k} for k in new_keywords]}
+            print(f"[Notion:sync] 키워드 업데이트: {current_keywords} -> {new_keywords}")
+
+        return properties_to_update
+
+    def _keep_existing_summary(self, article: Dict[str, Any], existing: Dict[str, Any],
+                               summary: str, key_points: str) -> Tuple[str, str]:
+        """
+        자리표시 요약으로 기존 페이지의 한줄요약/핵심 내용을 덮어쓰지 않도록 비교할 요약 결정
+
+        자리표시(보강 대기) 기사인데 기존 페이지에 두 값이 모두 있으면 기존 값을 그대로 두고,
+        본문이 마지막 기록 이후 바뀐 경우에만 보강을 예약합니다 (article['llm_pending'] 갱신).
+        """
+        if not article.get(PENDING_KEY):
+            return summary, key_points
+        current_summary = self._plain_text(existing['properties'], '한줄요약')
+        current_key_points = self._plain_text(existing['properties'], '핵심 내용')
+        if not (current_summary and current_key_points):
+            return summary, key_points
+        article[PENDING_KEY] = self.enrichment.content_changed(existing['id'], article)
+        return current_summary, current_key_points
+
+    @staticmethod
+    def _new_page_properties(article: Dict[str, Any], summary: str, key_points: str) -> Dict[str, Any]:
+        """새 기사 페이지 속성"""
+        return {
+            "제목": {
+                "title": [
+                    {"text": {"content": article.get('title', '')}}
+                ]
+            },
+            "출처": {
+                "rich_text": [
+                    {"text": {"content": article.get('source', '')}}
+                ]
+            },
+            "날짜": {
+                "date": {"start": (article.get('published_date') or datetime.now()).isoformat()}
+            },
+            "키워드": {
+                "multi_select": [
+                    {"name": keyword} for keyword in article.get('keywords', [])
+                ]
+            },
+            "한줄요약": {
+                "rich_text": [
+                    {"text": {"content": summary}}
+                ]
+            },
+            "핵심 내용": {
+                "rich_text": [
+                    {"text": {"content": key_points}}
+                ]
+            },
+            "바로가기": {
+                "url": article.get('url', '')
+            },
+            "관심": {
+                "checkbox": False
+            },
+            "AI추천": {
+                "checkbox": article.get('ai_recommend', False)
+            }
+        }
+
+    def _update_page(self, article: Dict[str, Any], database_id: str, page_id: str,
+                     properties_to_update: Dict[str, Any], raise_errors: bool = False) -> Dict[str, Any] | None:
+        """변경된 속성만 업데이트 (raise_errors면 예외를 그대로 올려 호출부가 재시도 판단)"""
+        print(f"[Notion:sync] 기존 기사 업데이트 시도: {article.get('title', '')} (Page ID: {page_id})")
+        try:
+            updated_page = self.executor.run('update', lambda: self.client.pages.update(
+                page_id=page_id,
+                properties=properties_to_update
+            ))
+        except Exception as e:
+            if raise_errors:
+                raise
+            print(f"[Notion:sync] !!! Error updating page {page_id} for article '{article.get('title', '')}': {e}")
+            import traceback
+            print(traceback.format_exc())
+            return None
+        self._remember_page(database_id, article.get('url', ''), page_id,
+                            (updated_page or {}).get('properties') or properties_to_update)
+        self._mirror_changed(database_id)
+        print(f"[Notion:sync] 기존 기사 업데이트 성공: {article.get('title', '')} (Page ID: {page_id})")
+        return {'id': page_id, 'title': article.get('title', '')}
+
+    def _create_page(self, article: Dict[str, Any], database_id: str, summary: str, key_points: str,
+                     raise_errors: bool = False) -> Dict[str, Any] | None:
+        """새 기사 페이지 생성 (raise_errors면 예외를 그대로 올려 호출부가 재시도 판단)"""
+        print(f"[Notion:sync] 새 기사 생성 시도: {article.get('title', '')}")
+        new_page = {
+            "parent": {"database_id": database_id},
+            "properties": self._new_page_properties(article, summary, key_points)
+        }
+        try:
+            notion_page = self.executor.run('create', lambda: self.client.pages.create(**new_page))
+        except Exception as e:
+            if raise_errors:
+                raise
+            print(f"[Notion:sync] !!! Error creating new page for article '{article.get('title', '')}': {e}")
+            import traceback
+            print(traceback.format_exc())
+            return None
+        if not notion_page:
+            print(f"[Notion:sync] 새 기사 생성 실패: {article.get('title', '')} - Notion API에서 응답 없음")
+            return None
+        self._remember_page(database_id, article.get('url', ''), notion_page['id'],
+                            notion_page.get('properties') or new_page['properties'])
+        self._mirror_changed(database_id)
+        print(f"[Notion:sync] 새 기사 생성 성공: {article.get('title', '')} (Page ID: {notion_page['id']})")
+        return notion_page
+
+    def _upsert_article_page(self, article: Dict[str, Any], database_id: str,
+                             summary: str, key_points: str) -> Dict[str, Any] | None:
+        """URL로 기존 페이지를 찾아 변경된 속성만 업데이트하거나 새 페이지 생성 (실패 시 None)"""
+        article_url = article.get('url', '')
+        try:
+            existing = self._find_existing_page(database_id, article_url)
+            if existing is None:
+                return self._create_page(article, database_id, summary, key_points)
+
+            page_id = existing['id']
+            summary, key_points = self._keep_existing_summary(article, existing, summary, key_points)
+            properties_to_update = self._property_updates(article, existing['properties'], summary, key_points)
+            if not properties_to_update:
+                print(f"[Notion:sync] 업데이트할 내용이 없음: {article.get('title', '')}")
+                return {'id': page_id, 'title': article.get('title', '')}
+            return self._update_page(article, database_id, page_id, properties_to_update)
+        except Exception as e:
+            print(f"[Notion:sync] !!! Outer error syncing article '{article.get('title', article.get('url', 'Unknown Article'))}': {e}")
+            import traceback
+            print(traceback.format_exc())
+        return None
 
     def sync_articles(self, articles: List[Dict[str, Any]], database_id: str) -> List[Dict[str, Any]]:
-        """Sync articles to Notion (update if exists, create if not)"""
-        synced_articles = []
-        
+        """
+        📦 일괄 동기화: URL 인덱스 1회 조회 → 로컬에서 속성 비교 → 필요한 생성/업데이트만 동시 실행 → LLM 보강 예약
+
+        **특징**:
+        - 기사마다 조회/retrieve를 하지 않으므로 API 호출은 (쓰기 건수 + 인덱스 조회 페이지 수)
+        - 쓰기는 요청 실행기(NotionRequestExecutor) 스레드 풀로 동시에 보내고, 속도는 공용 속도 제한기가 조절
+        - 429/5xx 같은 일시적 오류는 호스트 버킷에 맞춰 재시도 (생성은 429만), 같은 URL 기사는 한 번만 기록
+        - LLM 요약은 기다리지 않음: 자리표시로 먼저 기록하고 동기화된 페이지를 보강 대기열에 넣음
+
+        Returns:
+            List[Dict]: 동기화된(생성/업데이트/변경 없음) 페이지 정보, 입력 순서 유지
+        """
         # Ensure database_id is set before syncing
         if not database_id:
              print("Database ID is not provided. Cannot sync articles.")
              return []
-             
+
         for article in articles:
+            if article.get('summary') or article.get('key_points'):
+                continue
             try:
-                # 본문 정제
-                cleaned_content = clean_article_content(article['content'])
-                # 한줄요약 및 핵심 내용 생성 (LLM 사용)
-                summary = generate_one_line_summary_with_llm(cleaned_content, use_llm=True)
-                key_points = generate_key_content(cleaned_content, use_llm=True)
-
-                # Ensure content is within Notion's limits (2000 characters)
-                summary = summary[:2000] if summary else ""
-                key_points = key_points[:2000] if key_points else ""
-
-                # 기존 페이지 존재 여부 확인 (URL 기준)
-                article_url = article.get('url', '')
-                print(f"[Notion:sync] Searching for existing page with URL: {article_url}")
+                self.prepare_article(article)
+            except Exception as e:
+                print(f"[Notion] !!! 요약 생성 실패 '{article.get('title', article.get('url', 'Unknown Article'))}': {e}")
+
+        try:
+            index = self.fetch_page_index(database_id)
+        except Exception as e:
+            print(f"[Notion] ⚠️ URL 인덱스 생성 실패, 기사별 동기화로 진행: {e}")
+            return [synced for synced in (self.sync_article(article, database_id) for article in articles) if synced]
+
+        # 로컬 비교로 쓰기 작업 계획 (URL 중복은 첫 기사만)
+        results: List[Dict[str, Any] | None] = [None] * len(articles)
+        writes, seen_urls = [], set()
+        stats = {'create': 0, 'update': 0, 'unchanged': 0, 'duplicate': 0, 'failed': 0}
+        for position, article in enumerate(articles):
+            url = article.get('url', '')
+            if url in seen_urls:
+                stats['duplicate'] += 1
+                continue
+            seen_urls.add(url)
+            summary, key_points = article.get('summary', ''), article.get('key_points', '')
+            existing = index.get(url)
+            if existing is None:
+                writes.append((position, 'create', lambda a=article, s=summary, k=key_points:
+                               self._create_page(a, database_id, s, k, raise_errors=True)))
+                continue
+            summary, key_points = self._keep_existing_summary(article, existing, summary, key_points)
+            properties_to_update = self._property_updates(article, existing['properties'], summary, key_points)
+            if not properties_to_update:
+                stats['unchanged'] += 1
+                results[position] = {'id': existing['id'], 'title': article.get('title', '')}
+                continue
+            writes.append((position, 'update', lambda a=article, p=existing['id'], u=properties_to_update:
+                           self._update_page(a, database_id, p, u, raise_errors=True)))
+
+        with self.metrics.timer('notion_write', mode='bulk'):
+            futures = {self.executor.submit_task(operation, func): (position, operation)
+                       for position, operation, func in writes}
+            for future in as_completed(futures):
+                position, operation = futures[future]
                 try:
-                    existing_pages = self.client.databases.query(
-                        database_id=database_id,
-                        filter={
-                            "property": "바로가기",
-                            "url": {"equals": article_url}
-                        }
-                    )
-                    if existing_pages.get('results'):
-                        page_id = existing_pages['results'][0]['id']
-                        print(f"[Notion:sync] Found existing page for '{article.get('title', '')}' (ID: {page_id})")
-                        
-                        # 기존 페이지의 현재 상태 가져오기
-                        current_page = self.client.pages.retrieve(page_id=page_id)
-                        current_properties = current_page.get('properties', {})
-                        
-                        # 업데이트할 속성 준비
-                        properties_to_update = {}
-                        
-                        # 1. 출처 업데이트 (새로운 출처가 있고, 기존 출처와 다른 경우)
-                        new_source = article.get('source', '')
-                        current_source = ''.join([text.get('plain_text', '') for text in current_properties.get('출처', {}).get('rich_text', [])])
-                        if new_source and new_source != current_source:
-                            properties_to_update['출처'] = {"rich_text": [{"text": {"content": new_source}}]}
-                            print(f"[Notion:sync] 출처 업데이트: {current_source} -> {new_source}")
-                        
-                        # 2. 한줄요약 업데이트 (새로운 요약이 있고, 기존 요약과 다른 경우)
-                        current_summary = ''.join([text.get('plain_text', '') for text in current_properties.get('한줄요약', {}).get('rich_text', [])])
-                        if summary and summary != current_summary:
-                            properties_to_update['한줄요약'] = {"rich_text": [{"text": {"content": summary}}]}
-                            print(f"[Notion:sync] 한줄요약 업데이트: {current_summary[:50]}... -> {summary[:50]}...")
-                        
-                        # 3. 핵심 내용 업데이트 (새로운 내용이 있고, 기존 내용과 다른 경우)
-                        current_key_points = ''.join([text.get('plain_text', '') for text in current_properties.get('핵심 내용', {}).get('rich_text', [])])
-                        if key_points and key_points != current_key_points:
-                            properties_to_update['핵심 내용'] = {"rich_text": [{"text": {"content": key_points}}]}
-                            print(f"[Notion:sync] 핵심 내용 업데이트: {current_key_points[:50]}... -> {key_points[:50]}...")
-                        
-                        # 4. 키워드 업데이트 (새로운 키워드가 있는 경우)
-                        new_keywords = article.get('keywords', [])
-                        current_keywords = [k['name'] for k in current_properties.get('키워드', {}).get('multi_select', [])]
-                        if new_keywords and set(new_keywords) != set(current_keywords):
-                            properties_to_update['키워드'] = {"multi_select": [{"name": k} for k in new_keywords]}
-                            print(f"[Notion:sync] 키워드 업데이트: {current_keywords} -> {new_keywords}")
-                        
-                        # 업데이트할 속성이 있는 경우에만 업데이트 실행
-                        if properties_to_update:
-                            print(f"[Notion:sync] 기존 기사 업데이트 시도: {article.get('title', '')} (Page ID: {page_id})")
-                            try:
-                                self.client.pages.update(
-                                    page_id=page_id,
-                                    properties=properties_to_update
-                                )
-                                print(f"[Notion:sync] 기존 기사 업데이트 성공: {article.get('title', '')} (Page ID: {page_id})")
-                                synced_articles.append({'id': page_id, 'title': article.get('title', '')})
-                            except Exception as e:
-                                print(f"[Notion:sync] !!! Error updating page {page_id} for article '{article.get('title', '')}': {e}")
-                                import traceback
-                                print(traceback.format_exc())
-                        else:
-                            print(f"[Notion:sync] 업데이트할 내용이 없음: {article.get('title', '')}")
-                            synced_articles.append({'id': page_id, 'title': article.get('title', '')})
-                    else:
-                        # 없으면 새로 생성
-                        print(f"[Notion:sync] 새 기사 생성 시도: {article.get('title', '')}")
-                        new_page = {
-                            "parent": {"database_id": database_id},
-                            "properties": {
-                                "제목": {
-                                    "title": [
-                                        {"text": {"content": article.get('title', '')}}
-                                    ]
-                                },
-                                "출처": {
-                                    "rich_text": [
-                                        {"text": {"content": article.get('source', '')}}
-                                    ]
-                                },
-                                "날짜": {
-                                    "date": {"start": article.get('published_date', datetime.now()).isoformat()}
-                                },
-                                "키워드": {
-                                    "multi_select": [
-                                        {"name": keyword} for keyword in article.get('keywords', [])
-                                    ]
-                                },
-                                "한줄요약": {
-                                    "rich_text": [
-                                        {"text": {"content": summary}}
-                                    ]
-                                },
-                                "핵심 내용": {
-                                    "rich_text": [
-                                        {"text": {"content": key_points}}
-                                    ]
-                                },
-                                "바로가기": {
-                                    "url": article.get('url', '')
-                                },
-                                "관심": {
-                                    "checkbox": False
-                                },
-                                "AI추천": {
-                                    "checkbox": article.get('ai_recommend', False)
-                                }
-                            }
-                        }
-                        print(f"[Notion:sync] Attempting to create new page with properties: {new_page}")
-                        try:
-                            notion_page = self.client.pages.create(**new_page)
-                            if notion_page:
-                                print(f"[Notion:sync] 새 기사 생성 성공: {article.get('title', '')} (Page ID: {notion_page['id']})")
-                                synced_articles.append(notion_page)
-                            else:
-                                 print(f"[Notion:sync] 새 기사 생성 실패: {article.get('title', '')} - Notion API에서 응답 없음")
-                        except Exception as e:
-                            print(f"[Notion:sync] !!! Error creating new page for article '{article.get('title', '')}': {e}")
-                            import traceback
-                            print(traceback.format_exc())
+                    results[position] = future.result()
                 except Exception as e:
-                    print(f"[Notion:sync] !!! Outer error syncing article '{article.get('title', article.get('url', 'Unknown Article'))}': {e}")
-                    import traceback
-                    print(traceback.format_exc())
-                
-            except Exception as e:
-                print(f"[Notion] !!! Outer error syncing article '{article.get('title', article.get('url', 'Unknown Article'))}': {e}")
-                import traceback
-                print(traceback.format_exc())
-                
-        return synced_articles
+                    print(f"[Notion:bulk] ❌ 페이지 {operation} 실패: '{articles[position].get('title', '')}' - "
+                          f"{type(e).__name__}: {e}")
+                stats[operation if results[position] else 'failed'] += 1
+
+        if LLM_ENRICH_ENABLED:
+            for article, result in zip(articles, results):
+                if result and article.get(PENDING_KEY):
+                    self.enrichment.submit(article, database_id, result.get('id'))
+
+        print(f"[Notion] 일괄 동기화 완료: 생성 {stats['create']}, 업데이트 {stats['update']}, "
+              f"변경 없음 {stats['unchanged']}, 중복 URL {stats['duplicate']}, 실패 {stats['failed']} "
+              f"(쓰기 요청 {len(writes)}건, {self.executor.summary()})")
+        return [result for result in results if result]
 
     def export_feedback_to_csv(self, database_id: str, csv_path: str = 'feedback/feedback.csv', limit: int = 1000) -> None:
-        """Notion DB에서 기사 정보와 관심 컬럼을 읽어와 CSV로 저장 (핵심 내용 포함)"""
+        """Notion DB에서 기사 정보와 관심 컬럼을 읽어와 CSV로 저장 (핵심 내용 포함, 로컬 미러 조회)"""
         try:
-            results = []
-            query = self.client.databases.query(database_id=database_id, page_size=100)
-            results.extend(query.get('results', []))
-            # 페이징 처리 (최대 limit까지)
-            while query.get('has_more') and len(results) < limit:
-                query = self.client.databases.query(
-                    database_id=database_id,
-                    start_cursor=query['next_cursor'],
-                    page_size=100
-                )
-                results.extend(query.get('results', []))
-            rows = []
-            for page in results:
-                props = page['properties']
-                def safe_get_text(prop, key):
-                    arr = prop.get(key, {}).get('title' if key == '제목' else 'rich_text', [])
-                    return arr[0].get('plain_text', '') if arr and 'plain_text' in arr[0] else ''
-                rows.append({
-                    'title': safe_get_text(props, '제목'),
-                    'url': props.get('바로가기', {}).get('url', ''),
-                    'summary': safe_get_text(props, '한줄요약'),
-                    'content': safe_get_text(props, '핵심 내용'),
-                    'interest': props.get('관심', {}).get('checkbox', False),
-                    'ai_recommend': props.get('AI추천', {}).get('checkbox', False)
-                })
+            rows = [{
+                'title': article['title'],
+                'url': article['url'],
+                'summary': article['summary'],
+                'content': article['key_points'],
+                'interest': article['interest'],
+                'ai_recommend': article['ai_recommend']
+            } for article in self.mirror.articles(database_id, limit=limit)]
             df = pd.DataFrame(rows)
             import os
             os.makedirs(os.path.dirname(csv_path), exist_ok=True)
@@ -428,47 +789,15 @@ class NotionClient:
             print(f"피드백 데이터 저장 실패: {e}")
 
     def export_interested_articles_to_csv(self, database_id: str, csv_path: str = 'feedback/interested_articles.csv', limit: int = 1000) -> None:
-        """Notion DB에서 '관심' 컬럼이 체크된 기사만 필터링하여 CSV로 저장"""
+        """Notion DB에서 '관심' 컬럼이 체크된 기사만 필터링하여 CSV로 저장 (로컬 미러 조회)"""
         try:
-            results = []
-            query = self.client.databases.query(
-                database_id=database_id,
-                filter={
-                    "property": "관심",
-                    "checkbox": {
-                        "equals": True
-                    }
-                },
-                page_size=100
-            )
-            results.extend(query.get('results', []))
-            # 페이징 처리 (최대 limit까지)
-            while query.get('has_more') and len(results) < limit:
-                query = self.client.databases.query(
-                    database_id=database_id,
-                    filter={
-                        "property": "관심",
-                        "checkbox": {
-                            "equals": True
-                        }
-                    },
-                    start_cursor=query['next_cursor'],
-                    page_size=100
-                )
-                results.extend(query.get('results', []))
-            rows = []
-            for page in results:
-                props = page['properties']
-                def safe_get_text(prop, key):
-                    arr = prop.get(key, {}).get('title' if key == '제목' else 'rich_text', [])
-                    return arr[0].get('plain_text', '') if arr and 'plain_text' in arr[0] else ''
-                rows.append({
-                    'title': safe_get_text(props, '제목'),
-                    'url': props.get('바로가기', {}).get('url', ''),
-                    'summary': safe_get_text(props, '한줄요약'),
-                    'interest': props.get('관심', {}).get('checkbox', False),
-                    'ai_recommend': props.get('AI추천', {}).get('checkbox', False)
-                })
+            rows = [{
+                'title': article['title'],
+                'url': article['url'],
+                'summary': article['summary'],
+                'interest': article['interest'],
+                'ai_recommend': article['ai_recommend']
+            } for article in self.mirror.articles(database_id, interest=True, limit=limit)]
             df = pd.DataFrame(rows)
             import os
             os.makedirs(os.path.dirname(csv_path), exist_ok=True)
@@ -485,14 +814,15 @@ class NotionClient:
             ai_recommend (bool): AI 추천 여부 (True/False)
         """
         try:
-            self.client.pages.update(
+            self.executor.run('update', lambda: self.client.pages.update(
                 page_id=page_id,
                 properties={
                     "AI추천": {
                         "checkbox": ai_recommend
                     }
                 }
-            )
+            ))
+            self._mirror_changed()
             print(f"AI 추천 결과 업데이트 완료: {page_id}, 추천 여부: {ai_recommend}")
         except Exception as e:
             print(f"AI 추천 결과 업데이트 실패: {e}") 
@@ -500,7 +830,7 @@ class NotionClient:
     def update_article_content(self, page_id: str, content: str) -> None:
         """Notion DB의 특정 기사에 대해 '핵심 내용' 컬럼을 업데이트합니다."""
         try:
-            self.client.pages.update(
+            self.executor.run('update', lambda: self.client.pages.update(
                 page_id=page_id,
                 properties={
                     "핵심 내용": {
@@ -509,28 +839,64 @@ class NotionClient:
                         ]
                     }
                 }
-            )
+            ))
+            self._mirror_changed()
             print(f"핵심 내용 업데이트 완료: {page_id}")
         except Exception as e:
             print(f"핵심 내용 업데이트 실패: {e}") 
 
+    def update_ai_recommendations(self, recommendations: Dict[str, bool]) -> int:
+        """여러 기사의 AI 추천 결과를 동시에 업데이트합니다. (page_id → 추천 여부, 성공 건수 반환)"""
+        return self._update_pages_concurrently('AI 추천 결과', {
+            page_id: {"AI추천": {"checkbox": bool(ai_recommend)}}
+            for page_id, ai_recommend in recommendations.items()
+        })
+
+    def update_article_contents(self, contents: Dict[str, str]) -> int:
+        """여러 기사의 '핵심 내용' 컬럼을 동시에 업데이트합니다. (page_id → 내용, 성공 건수 반환)"""
+        return self._update_pages_concurrently('핵심 내용', {
+            page_id: {"핵심 내용": {"rich_text": [{"text": {"content": content[:2000]}}]}}  # Notion API 제한 고려
+            for page_id, content in contents.items()
+        })
+
+    def _update_pages_concurrently(self, label: str, updates: Dict[str, Dict[str, Any]]) -> int:
+        """서로 독립적인 페이지 속성 업데이트를 요청 실행기로 동시에 실행 (실패한 페이지는 로그만)"""
+        futures = {
+            self.executor.submit('update', lambda p=page_id, props=properties: self.client.pages.update(
+                page_id=p, properties=props
+            )): page_id
+            for page_id, properties in updates.items()
+        }
+        updated = 0
+        for future in as_completed(futures):
+            try:
+                future.result()
+                updated += 1
+            except Exception as e:
+                print(f"{label} 업데이트 실패: {futures[future]} - {e}")
+        if updated:
+            self._mirror_changed()
+        print(f"{label} 업데이트 완료: {updated}/{len(updates)}건 ({self.executor.summary()})")
+        return updated
+
     def update_article_url(self, page_id: str, url: str) -> None:
         """Update article URL in Notion"""
-        self.client.pages.update(
+        self.executor.run('update', lambda: self.client.pages.update(
             page_id=page_id,
             properties={
                 "바로가기": {"url": url}
             }
-        )
+        ))
 
     def update_article_in_database(self, page_id: str, properties: Dict[str, Any]) -> bool:
         """Update article properties in Notion database"""
         try:
             print(f"Updating page {page_id} with properties: {properties}")
-            self.client.pages.update(
+            self.executor.run('update', lambda: self.client.pages.update(
                 page_id=page_id,
                 properties=properties
-            )
+            ))
+            self._mirror_changed()
             print(f"Successfully updated page {page_id}")
             return True
         except Exception as e:
@@ -544,11 +910,11 @@ class NotionClient:
         blocks = []
         next_cursor = None
         while True:
-            response = self.client.blocks.children.list(
+            response = self.executor.run('blocks', lambda: self.client.blocks.children.list(
                 block_id=page_id,
                 page_size=100,
                 start_cursor=next_cursor
-            )
+            ))
             blocks.extend(response.get('results', []))
             if not response.get('has_more'):
                 break
@@ -585,29 +951,42 @@ class NotionClient:
         print("DEBUG: No potential article link found in blocks.")
         return None 
 
-    def get_all_weekly_databases(self) -> List[str]:
-        """모든 주차의 데이터베이스 ID를 가져옵니다."""
+    def _list_weekly_databases(self, parent_page_id: str = NOTION_PARENT_PAGE_ID) -> Iterator[Tuple[str, str]]:
+        """
+        주간 데이터베이스 후보 (ID, 제목) 목록 (WeeklyDatabaseRegistry 갱신용)
+
+        부모 페이지의 하위 데이터베이스 블록을 페이지 단위로 조회하고,
+        부모 페이지가 설정되지 않았으면 데이터베이스 검색 결과를 페이지 단위로 조회합니다.
+        """
+        if parent_page_id:
+            for block in self.get_page_blocks(parent_page_id):
+                if block.get('type') == 'child_database':
+                    yield block['id'], block.get('child_database', {}).get('title', '')
+            return
+
+        query = {
+            'query': '전력 산업 뉴스',
+            'filter': {"property": "object", "value": "database"},
+            'page_size': 100,
+        }
+        while True:
+            response = self.executor.run('search', lambda: self.client.search(**query))
+            for result in response.get('results', []):
+                yield result['id'], "".join(text_item['plain_text'] for text_item in result.get('title', []))
+            if not response.get('has_more') or not response.get('next_cursor'):
+                return
+            query['start_cursor'] = response['next_cursor']
+
+    def get_all_weekly_databases(self, weeks: int = 4) -> List[str]:
+        """최근 weeks주(이번 주 포함)의 데이터베이스 ID를 가져옵니다. (최신 주차부터)"""
         try:
-            # 현재 연도와 주차 계산
+            # 최근 주차 계산 (ISO 연도/주차, 52주·53주 해 모두 처리)
             now = datetime.now()
-            current_year = now.year
-            current_week = now.isocalendar()[1]
+            week_keys = [iso_week(now - timedelta(weeks=week_offset)) for week_offset in range(weeks)]
             
-            # 최근 4주치 데이터베이스 검색
-            databases = []
-            for week_offset in range(4):
-                target_week = current_week - week_offset
-                if target_week <= 0:
-                    target_week += 52
-                    target_year = current_year - 1
-                else:
-                    target_year = current_year
-                    
-                database_title = f"전력 산업 뉴스 {target_year}년 {target_week}주차"
-                
-                # 데이터베이스 검색
-                results = self._search_database(database_title)
-                databases.extend(result['id'] for result in results)
+            # 레지스트리 조회 (모르는 주차가 있어도 목록 조회는 최대 1회)
+            found = self.weekly_databases.resolve(week_keys, self._list_weekly_databases)
+            databases = [found[key] for key in week_keys if key in found]
             
             return databases
             
@@ -630,51 +1009,18 @@ class NotionClient:
                 databases = self.get_all_weekly_databases()
             
             for db_id in databases:
-                # 관심 표시된 기사만 필터링
-                query = self.client.databases.query(
-                    database_id=db_id,
-                    filter={
-                        "property": "관심",
-                        "checkbox": {
-                            "equals": True
-                        }
-                    },
-                    page_size=100
-                )
-                
-                results = query.get('results', [])
-                while query.get('has_more'):
-                    query = self.client.databases.query(
-                        database_id=db_id,
-                        filter={
-                            "property": "관심",
-                            "checkbox": {
-                                "equals": True
-                            }
-                        },
-                        start_cursor=query['next_cursor'],
-                        page_size=100
-                    )
-                    results.extend(query.get('results', []))
-                
-                # 기사 정보 추출
-                for page in results:
-                    props = page['properties']
-                    def safe_get_text(prop, key):
-                        arr = prop.get(key, {}).get('title' if key == '제목' else 'rich_text', [])
-                        return arr[0].get('plain_text', '') if arr and 'plain_text' in arr[0] else ''
-                    
-                    article = {
-                        'page_id': page['id'],
-                        'title': safe_get_text(props, '제목'),
-                        'url': props.get('바로가기', {}).get('url', ''),
-                        'summary': safe_get_text(props, '한줄요약'),
-                        'content': safe_get_text(props, '핵심 내용'),
-                        'keywords': [opt['name'] for opt in props.get('키워드', {}).get('multi_select', [])],
-                        'interest': props.get('관심', {}).get('checkbox', False),
-                        'ai_recommend': props.get('AI추천', {}).get('checkbox', False)
-                    }
-                    interested_articles.append(article)
+                # 관심 표시된 기사만 로컬 미러에서 조회 (미러가 오래됐으면 변경분만 갱신)
+                for article in self.mirror.articles(db_id, interest=True):
+                    interested_articles.append({
+                        'page_id': article['page_id'],
+                        'title': article['title'],
+                        'url': article['url'],
+                        'summary': article['summary'],
+                        'content': article['key_points'],
+                        'keywords': article['keywords'],
+                        'interest': article['interest'],
+                        'ai_recommend': article['ai_recommend']
+                    })
             
             print(f"[Notion] 총 {len(interested_articles)}개의 관심 기사를 찾았습니다.")
             return interested_articles
@@ -686,47 +1032,19 @@ class NotionClient:
             return [] 
 
     def get_all_articles_from_database(self, database_id: str) -> List[Dict[str, Any]]:
-        """특정 데이터베이스의 모든 기사 (페이지) 정보를 가져옵니다."""
+        """특정 데이터베이스의 모든 기사 (페이지) 정보를 가져옵니다. (로컬 미러 조회)"""
         try:
-            all_articles = []
-            
-            # 데이터베이스의 모든 페이지 조회 (페이징 처리 포함)
-            query = self.client.databases.query(
-                database_id=database_id,
-                page_size=100
-            )
-            
-            results = query.get('results', [])
-            all_articles.extend(results)
-            
-            while query.get('has_more'):
-                query = self.client.databases.query(
-                    database_id=database_id,
-                    start_cursor=query['next_cursor'],
-                    page_size=100
-                )
-                results = query.get('results', [])
-                all_articles.extend(results)
-                
-            # 필요한 기사 정보 추출
-            extracted_articles = []
-            for page in all_articles:
-                props = page['properties']
-                def safe_get_text(prop, key):
-                    arr = prop.get(key, {}).get('title' if key == '제목' else 'rich_text', [])
-                    return arr[0].get('plain_text', '') if arr and 'plain_text' in arr[0] else ''
-                    
-                extracted_articles.append({
-                    'page_id': page['id'],
-                    'title': safe_get_text(props, '제목'),
-                    'url': props.get('바로가기', {}).get('url', ''),
-                    'summary': safe_get_text(props, '한줄요약'),
-                    'source': safe_get_text(props, '출처'),
-                    'key_points': safe_get_text(props, '핵심 내용'),
-                    'keywords': [opt['name'] for opt in props.get('키워드', {}).get('multi_select', [])],
-                    'interest': props.get('관심', {}).get('checkbox', False),
-                    'ai_recommend': props.get('AI추천', {}).get('checkbox', False)
-                })
+            extracted_articles = [{
+                'page_id': article['page_id'],
+                'title': article['title'],
+                'url': article['url'],
+                'summary': article['summary'],
+                'source': article['source'],
+                'key_points': article['key_points'],
+                'keywords': article['keywords'],
+                'interest': article['interest'],
+                'ai_recommend': article['ai_recommend']
+            } for article in self.mirror.articles(database_id)]
             
             return extracted_articles
             
@@ -773,34 +1091,15 @@ class NotionClient:
             List[Dict]: 기사 정보 리스트
         """
         try:
-            articles = []
-            query = self.client.databases.query(database_id=database_id, page_size=100)
-            articles.extend(query.get('results', []))
-            
-            while query.get('has_more'):
-                query = self.client.databases.query(
-                    database_id=database_id,
-                    start_cursor=query['next_cursor'],
-                    page_size=100
-                )
-                articles.extend(query.get('results', []))
-            
-            # 기사 정보 추출
-            processed_articles = []
-            for page in articles:
-                props = page['properties']
-                def safe_get_text(prop, key):
-                    arr = prop.get(key, {}).get('title' if key == '제목' else 'rich_text', [])
-                    return arr[0].get('plain_text', '') if arr and 'plain_text' in arr[0] else ''
-                
-                processed_articles.append({
-                    'page_id': page['id'],
-                    'title': safe_get_text(props, '제목'),
-                    'url': props.get('바로가기', {}).get('url', ''),
-                    'source': safe_get_text(props, '출처'),
-                    'summary': safe_get_text(props, '한줄요약'),
-                    'key_points': safe_get_text(props, '핵심 내용')
-                })
+            # 로컬 미러 조회 (미러가 오래됐으면 변경분만 갱신)
+            processed_articles = [{
+                'page_id': article['page_id'],
+                'title': article['title'],
+                'url': article['url'],
+                'source': article['source'],
+                'summary': article['summary'],
+                'key_points': article['key_points']
+            } for article in self.mirror.articles(database_id)]
             
             return processed_articles
             
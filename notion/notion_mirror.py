@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔧 Notion 주간 데이터베이스 로컬 미러 (SQLite read-through 캐시)
+- 데이터베이스별로 마지막 갱신 시각 / last_edited_time 고수위(high-water)를 기록
+- 갱신은 last_edited_time 필터 + 오름차순 정렬로 변경된 페이지만 조회 (증분)
+- 읽기(관심 기사 / 전체 기사 / 피드백 CSV / AI 추천 대상)는 로컬 쿼리로 처리,
+  미러가 max_age보다 오래됐을 때만 증분 갱신
+- 삭제/보관된 페이지는 증분 조회에 나오지 않으므로 주기적으로 전체 재동기화
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional
+
+from config.config import NOTION_MIRROR_PATH, NOTION_MIRROR_MAX_AGE, NOTION_MIRROR_FULL_SYNC_HOURS
+from crawlers.telemetry import get_metrics
+
+# 미러 행 → 기사 딕셔너리 컬럼
+ARTICLE_COLUMNS = ('page_id', 'title', 'url', 'source', 'summary', 'key_points', 'keywords',
+                   'interest', 'ai_recommend', 'published_date')
+
+
+def _plain_text(properties: Dict[str, Any], name: str) -> str:
+    prop = properties.get(name) or {}
+    return ''.join(text.get('plain_text', '') for text in prop.get('title' if name == '제목' else 'rich_text') or [])
+
+
+def page_to_row(database_id: str, page: Dict[str, Any]) -> tuple:
+    """Notion 페이지 객체 → 미러 행"""
+    props = page.get('properties', {})
+    return (
+        page['id'],
+        database_id,
+        _plain_text(props, '제목'),
+        (props.get('바로가기') or {}).get('url') or '',
+        _plain_text(props, '출처'),
+        _plain_text(props, '한줄요약'),
+        _plain_text(props, '핵심 내용'),
+        json.dumps([opt['name'] for opt in (props.get('키워드') or {}).get('multi_select', [])], ensure_ascii=False),
+        int(bool((props.get('관심') or {}).get('checkbox'))),
+        int(bool((props.get('AI추천') or {}).get('checkbox'))),
+        ((props.get('날짜') or {}).get('date') or {}).get('start') or '',
+        page.get('created_time', ''),
+        page.get('last_edited_time', ''),
+        json.dumps(props, ensure_ascii=False),
+    )
+
+
+class NotionMirror:
+    """
+    🔧 주간 데이터베이스 미러
+
+    **사용 예**:
+        mirror = NotionMirror(notion.client)
+        articles = mirror.articles(database_id, interest=True)  # 오래됐으면 증분 갱신 후 로컬 조회
+
+    **특징**:
+    - 같은 데이터베이스 갱신은 한 번에 하나만 (동시 호출은 앞선 갱신 결과를 사용)
+    - 우리 쪽 쓰기(생성/업데이트) 후 mark_stale()로 다음 읽기에서 증분 갱신
+    - 갱신 실패 시 마지막 미러 내용을 그대로 반환 (미러가 비어 있으면 예외 전달)
+    - 쓰기 경로(page_index(allow_stale=False))는 갱신 실패 시 예외 전달 (오래된 미러로 중복 페이지 생성 방지)
+    """
+
+    def __init__(self, client: Any, path: str = NOTION_MIRROR_PATH, max_age: float = NOTION_MIRROR_MAX_AGE,
+                 full_sync_hours: float = NOTION_MIRROR_FULL_SYNC_HOURS, executor: Optional[Any] = None):
+        self.client = client
+        self.executor = executor  # NotionRequestExecutor (있으면 조회 재시도/지표를 맡김)
+        self.path = path
+        self.max_age = max_age
+        self.full_sync_seconds = full_sync_hours * 3600
+        self.metrics = get_metrics()
+        self.stats = {'refreshes': 0, 'full_syncs': 0, 'queries': 0, 'pages': 0}
+        self._lock = threading.Lock()  # SQLite 연결
+        self._refresh_locks: Dict[str, threading.Lock] = {}  # 데이터베이스별 갱신
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS mirror_pages (
+                page_id TEXT PRIMARY KEY,
+                database_id TEXT NOT NULL,
+                title TEXT, url TEXT, source TEXT, summary TEXT, key_points TEXT, keywords TEXT,
+                interest INTEGER NOT NULL DEFAULT 0,
+                ai_recommend INTEGER NOT NULL DEFAULT 0,
+                published_date TEXT, created_time TEXT, last_edited_time TEXT,
+                properties TEXT NOT NULL
+            )
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_mirror_pages_db ON mirror_pages (database_id, interest)')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS mirror_databases (
+                database_id TEXT PRIMARY KEY,
+                synced_at REAL,
+                full_synced_at REAL,
+                high_water TEXT
+            )
+        ''')
+        self._conn.commit()
+
+    def _state(self, database_id: str) -> Dict[str, Any]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT synced_at, full_synced_at, high_water FROM mirror_databases WHERE database_id = ?',
+                (database_id,)
+            ).fetchone()
+        synced_at, full_synced_at, high_water = row or (None, None, None)
+        return {'synced_at': synced_at, 'full_synced_at': full_synced_at, 'high_water': high_water}
+
+    def mark_stale(self, database_id: Optional[str] = None):
+        """다음 읽기에서 갱신하도록 표시 (database_id가 None이면 전체)"""
+        with self._lock, self._conn:
+            if database_id is None:
+                self._conn.execute('UPDATE mirror_databases SET synced_at = NULL')
+            else:
+                self._conn.execute('UPDATE mirror_databases SET synced_at = NULL WHERE database_id = ?',
+                                   (database_id,))
+
+    def _query_pages(self, database_id: str, since: Optional[str]):
+        """last_edited_time 오름차순으로 (since 이후) 페이지 조회"""
+        query: Dict[str, Any] = {
+            'database_id': database_id,
+            'page_size': 100,
+            'sorts': [{'timestamp': 'last_edited_time', 'direction': 'ascending'}],
+        }
+        if since:
+            # Notion last_edited_time은 분 단위라 같은 분의 페이지는 다시 받아 덮어씀
+            query['filter'] = {'timestamp': 'last_edited_time', 'last_edited_time': {'on_or_after': since}}
+        while True:
+            if self.executor is not None:
+                response = self.executor.run('query', lambda: self.client.databases.query(**query))
+            else:
+                response = self.client.databases.query(**query)
+                self.metrics.incr('notion_api_calls_total', operation='query')
+            self.stats['queries'] += 1
+            yield from response.get('results', [])
+            cursor = response.get('next_cursor')
+            if not response.get('has_more') or not cursor:
+                return
+            query['start_cursor'] = cursor
+
+    def refresh(self, database_id: str, max_age: Optional[float] = None, full: bool = False) -> int:
+        """
+        미러 갱신 (max_age초 안에 갱신했으면 생략)
+
+        Args:
+            database_id: Notion 데이터베이스 ID
+            max_age: 허용할 미러 나이(초), None이면 NOTION_MIRROR_MAX_AGE, 0이면 항상 증분 갱신
+            full: 고수위와 관계없이 전체 재동기화 (미러에서 사라진 페이지 정리)
+
+        Returns:
+            int: 이번 갱신에서 받은 페이지 수 (생략 시 0)
+        """
+        max_age = self.max_age if max_age is None else max_age
+        with self._lock:
+            refresh_lock = self._refresh_locks.setdefault(database_id, threading.Lock())
+
+        with refresh_lock:
+            state = self._state(database_id)
+            now = time.time()
+            if not full and state['synced_at'] is not None and now - state['synced_at'] < max_age:
+                return 0
+            full = full or not state['high_water'] or state['full_synced_at'] is None \
+                or now - state['full_synced_at'] >= self.full_sync_seconds
+
+            rows = [page_to_row(database_id, page)
+                    for page in self._query_pages(database_id, None if full else state['high_water'])]
+            high_water = max([row[12] for row in rows if row[12]] + [state['high_water'] or ''])
+
+            with self._lock, self._conn:
+                if full:
+                    self._conn.execute('DELETE FROM mirror_pages WHERE database_id = ?', (database_id,))
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO mirror_pages VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows
+                )
+                self._conn.execute('''
+                    INSERT INTO mirror_databases (database_id, synced_at, full_synced_at, high_water)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(database_id) DO UPDATE SET
+                        synced_at = excluded.synced_at,
+                        full_synced_at = COALESCE(excluded.full_synced_at, full_synced_at),
+                        high_water = excluded.high_water
+                ''', (database_id, now, now if full else None, high_water or None))
+
+        self.stats['refreshes'] += 1
+        self.stats['full_syncs'] += int(full)
+        self.stats['pages'] += len(rows)
+        print(f"[NotionMirror] {'전체' if full else '증분'} 갱신: {database_id[:8]}… 페이지 {len(rows)}건")
+        return len(rows)
+
+    def _ensure_fresh(self, database_id: str, max_age: Optional[float], allow_stale: bool = True):
+        """읽기 전 갱신 (실패 시 allow_stale이고 기존 미러가 있으면 경고 후 그대로 사용)"""
+        try:
+            self.refresh(database_id, max_age=max_age)
+        except Exception as e:
+            if not allow_stale or self._state(database_id)['full_synced_at'] is None:
+                raise
+            print(f"[NotionMirror] ⚠️ 갱신 실패, 마지막 미러 사용 ({database_id[:8]}…): {e}")
+
+    def articles(self, database_id: str, interest: Optional[bool] = None, limit: Optional[int] = None,
+                 max_age: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        데이터베이스의 기사 목록 (최근 생성 순)
+
+        Returns:
+            List[Dict]: {page_id, title, url, source, summary, key_points, keywords, interest, ai_recommend, published_date}
+        """
+        self._ensure_fresh(database_id, max_age)
+        sql = f"SELECT {', '.join(ARTICLE_COLUMNS)} FROM mirror_pages WHERE database_id = ?"
+        params: List[Any] = [database_id]
+        if interest is not None:
+            sql += ' AND interest = ?'
+            params.append(int(interest))
+        sql += ' ORDER BY created_time DESC'
+        if limit:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        articles = []
+        for row in rows:
+            article = dict(zip(ARTICLE_COLUMNS, row))
+            article['keywords'] = json.loads(article['keywords'] or '[]')
+            article['interest'] = bool(article['interest'])
+            article['ai_recommend'] = bool(article['ai_recommend'])
+            articles.append(article)
+        return articles
+
+    def page_index(self, database_id: str, max_age: Optional[float] = None,
+                   allow_stale: bool = True) -> Dict[str, Dict[str, Any]]:
+        """
+        URL → {'id', 'properties'} (NotionClient.fetch_page_index용)
+
+        Args:
+            allow_stale: False면 갱신 실패 시 마지막 미러 대신 예외 전달 (생성/업데이트 판단용)
+        """
+        self._ensure_fresh(database_id, max_age, allow_stale=allow_stale)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url, page_id, properties FROM mirror_pages WHERE database_id = ? AND url != '' "
+                "ORDER BY created_time", (database_id,)
+            ).fetchall()
+        index: Dict[str, Dict[str, Any]] = {}
+        for url, page_id, properties in rows:
+            index.setdefault(url, {'id': page_id, 'properties': json.loads(properties)})
+        return index
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
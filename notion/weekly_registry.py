@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔧 주간 데이터베이스 레지스트리 ((ISO 연도, ISO 주차) → Notion 데이터베이스 ID)
+- 부모 페이지의 하위 데이터베이스 목록을 한 번(페이지 단위) 조회해 제목으로 채움
+- SQLite에 저장해 프로세스 / NotionClient 인스턴스 간 공유
+- 없는 주차를 찾을 때나 목록이 오래됐을 때만 다시 조회 (지연 갱신)
+"""
+
+import os
+import re
+import time
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from config.config import NOTION_WEEKLY_REGISTRY_PATH, NOTION_WEEKLY_REGISTRY_MAX_AGE_HOURS
+
+WeekKey = Tuple[int, int]  # (ISO 연도, ISO 주차)
+
+WEEKLY_DATABASE_TITLE = "전력 산업 뉴스 {year}년 {week}주차"
+_TITLE_PATTERN = re.compile(r'^전력 산업 뉴스 (\d{4})년 (\d{1,2})주차$')
+
+
+def weekly_database_title(year: int, week: int) -> str:
+    """주간 데이터베이스 제목"""
+    return WEEKLY_DATABASE_TITLE.format(year=year, week=week)
+
+
+def parse_weekly_title(title: str) -> Optional[WeekKey]:
+    """주간 데이터베이스 제목 → (연도, 주차), 형식이 다르면 None"""
+    match = _TITLE_PATTERN.match((title or '').strip())
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def iso_week(moment: Optional[datetime] = None) -> WeekKey:
+    """ISO 연도/주차 (12월 말·1월 초처럼 달력 연도와 ISO 연도가 다른 주 포함)"""
+    iso = (moment or datetime.now()).isocalendar()
+    return iso[0], iso[1]
+
+
+def _week_end_timestamp(key: WeekKey) -> float:
+    """ISO 주차가 끝나는 시각 (다음 주 월요일 0시, 로컬 시간)"""
+    return (datetime.fromisocalendar(key[0], key[1], 1) + timedelta(weeks=1)).timestamp()
+
+
+class WeeklyDatabaseRegistry:
+    """
+    🔧 주간 데이터베이스 ID 레지스트리
+
+    **사용 예**:
+        registry = get_shared_weekly_registry()
+        ids = registry.resolve([(2025, 1), (2024, 52)], notion._list_weekly_databases)
+
+    **특징**:
+    - resolve()는 주차 몇 개를 찾든 목록 조회를 최대 1번만 실행 (모두 알고 있으면 0번)
+    - 없는 주차는 다른 프로세스가 기록했을 수 있으므로 SQLite에서 먼저 다시 읽음
+    - 방금 조회한 목록에도 없던 주차는 MISS_REFRESH_INTERVAL 동안 다시 조회하지 않음
+    - 마지막 조회가 해당 주가 끝난 뒤였다면 없는 주차로 확정 (데이터베이스는 그 주에만 생성되므로)
+    - 목록 조회 결과로 전체를 교체하므로 삭제/보관된 데이터베이스는 다음 갱신 때 빠짐
+    """
+
+    MISS_REFRESH_INTERVAL = 60.0  # 없는 주차 때문에 목록을 다시 조회하는 최소 간격(초)
+
+    def __init__(self, path: str = NOTION_WEEKLY_REGISTRY_PATH,
+                 max_age_hours: float = NOTION_WEEKLY_REGISTRY_MAX_AGE_HOURS):
+        self.path = path
+        self.max_age = max_age_hours * 3600
+        self._entries: Dict[WeekKey, str] = {}
+        self._refreshed_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS weekly_databases (
+                year INTEGER NOT NULL,
+                week INTEGER NOT NULL,
+                database_id TEXT NOT NULL,
+                title TEXT,
+                PRIMARY KEY (year, week)
+            )
+        ''')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS registry_state (key TEXT PRIMARY KEY, value REAL)')
+        self._conn.commit()
+        self._load()
+
+    def _load(self):
+        """SQLite → 메모리 (self._lock 안에서 호출하거나 초기화 시)"""
+        rows = self._conn.execute('SELECT year, week, database_id FROM weekly_databases').fetchall()
+        self._entries = {(year, week): database_id for year, week, database_id in rows}
+        state = self._conn.execute("SELECT value FROM registry_state WHERE key = 'refreshed_at'").fetchone()
+        self._refreshed_at = state[0] if state else None
+
+    def _is_stale(self, now: float) -> bool:
+        return self._refreshed_at is None or now - self._refreshed_at >= self.max_age
+
+    def get(self, year: int, week: int) -> Optional[str]:
+        """알고 있는 데이터베이스 ID (API 조회 없음)"""
+        with self._lock:
+            return self._entries.get((year, week))
+
+    def register(self, year: int, week: int, database_id: str, title: Optional[str] = None):
+        """새로 만든 데이터베이스 기록"""
+        with self._lock, self._conn:
+            self._entries[(year, week)] = database_id
+            self._conn.execute('INSERT OR REPLACE INTO weekly_databases VALUES (?, ?, ?, ?)',
+                               (year, week, database_id, title or weekly_database_title(year, week)))
+
+    def refresh(self, list_databases: Callable[[], Iterable[Tuple[str, str]]]) -> int:
+        """
+        데이터베이스 목록으로 레지스트리 전체 교체
+
+        Args:
+            list_databases: (데이터베이스 ID, 제목)을 내놓는 함수 (NotionClient._list_weekly_databases)
+
+        Returns:
+            int: 등록된 주간 데이터베이스 수
+        """
+        entries: Dict[WeekKey, Tuple[str, str]] = {}
+        for database_id, title in list_databases():
+            key = parse_weekly_title(title)
+            if key is not None:
+                entries.setdefault(key, (database_id, title))  # 같은 제목이 여럿이면 먼저 나온 것
+
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM weekly_databases')
+            self._conn.executemany('INSERT INTO weekly_databases VALUES (?, ?, ?, ?)',
+                                   [(year, week, database_id, title)
+                                    for (year, week), (database_id, title) in entries.items()])
+            self._conn.execute("INSERT OR REPLACE INTO registry_state VALUES ('refreshed_at', ?)", (now,))
+            self._entries = {key: database_id for key, (database_id, _) in entries.items()}
+            self._refreshed_at = now
+        print(f"[Notion] 주간 데이터베이스 목록 갱신: {len(entries)}개")
+        return len(entries)
+
+    def resolve(self, keys: List[WeekKey],
+                list_databases: Callable[[], Iterable[Tuple[str, str]]]) -> Dict[WeekKey, str]:
+        """
+        주차들의 데이터베이스 ID 조회 (필요할 때만 목록 1회 조회)
+
+        Returns:
+            Dict[(연도, 주차), 데이터베이스 ID]: 찾은 주차만 포함
+        """
+        with self._lock:
+            now = time.time()
+            missing = [key for key in keys if key not in self._entries]
+            if missing or self._is_stale(now):
+                self._load()  # 다른 프로세스가 먼저 갱신/기록했을 수 있음
+                missing = [key for key in keys if key not in self._entries
+                           and (self._refreshed_at is None or _week_end_timestamp(key) > self._refreshed_at)]
+            needs_refresh = self._is_stale(now) or (
+                bool(missing) and now - self._refreshed_at >= self.MISS_REFRESH_INTERVAL
+            )
+
+        if needs_refresh:
+            self.refresh(list_databases)
+
+        with self._lock:
+            return {key: self._entries[key] for key in keys if key in self._entries}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# 프로세스 공용 레지스트리 (싱글톤 패턴)
+_shared_registry: Optional[WeeklyDatabaseRegistry] = None
+_shared_registry_lock = threading.Lock()
+
+
+def get_shared_weekly_registry() -> WeeklyDatabaseRegistry:
+    """모든 NotionClient가 공유하는 주간 데이터베이스 레지스트리 반환"""
+    global _shared_registry
+    with _shared_registry_lock:
+        if _shared_registry is None:
+            _shared_registry = WeeklyDatabaseRegistry()
+        return _shared_registry
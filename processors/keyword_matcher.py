@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔧 공용 다중 키워드 매처
+- config.KEYWORDS, 크롤러 클래스 KEYWORDS, SectionConfig 트리거 단어를 하나의 패턴으로 컴파일
+- 텍스트를 한 번만 훑어서 모든 키워드 위치(offset)와 필드(title / body / keywords) 반환
+- 키워드 그룹별 대소문자 구분 여부 지정 (크롤러 키워드: 구분, 섹션 트리거: 무시)
+- pyahocorasick 설치 시 C 구현 Aho-Corasick 오토마톤 사용, 없으면 컴파일된 정규식으로 대체
+"""
+
+import re
+import threading
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from config.config import KEYWORDS
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+class KeywordHit(NamedTuple):
+    """키워드 매칭 결과 하나 (긴 본문은 매칭이 수천 개이므로 가벼운 NamedTuple 사용)"""
+    keyword: str   # 그룹에 등록된 원래 표기
+    group: str     # 키워드 그룹 (예: 'config', 'electimes', 'section:policy')
+    field: str     # 'title' | 'body' | 'keywords' | 호출자가 지정한 필드명
+    start: int     # 필드 텍스트 내 시작 위치
+    end: int       # 필드 텍스트 내 끝 위치 (미포함)
+
+
+class KeywordMatcher:
+    """
+    🔧 다중 키워드 매처 (모든 그룹의 키워드를 하나의 패턴 집합으로 컴파일)
+
+    **특징**:
+    - 텍스트 한 번 스캔으로 모든 그룹의 매칭 위치 반환
+    - 겹치는 매칭(예: '재생에너지' / '재생에너지입찰')도 모두 보고
+    - 스캔 엔진: pyahocorasick 오토마톤 (C) → 없으면 긴 키워드 우선 정규식 + 트라이 접두사 출력
+    """
+
+    def __init__(self, groups: Dict[str, Tuple[Iterable[str], bool]], use_automaton: bool = AHOCORASICK_AVAILABLE):
+        """
+        Args:
+            groups: {그룹명: (키워드 목록, 대소문자 구분 여부)}
+            use_automaton: pyahocorasick 오토마톤 사용 여부 (설치된 경우 기본 사용)
+        """
+        self._order: Dict[str, Dict[str, int]] = {}
+        # 소문자 패턴 → [(원래 키워드, 그룹, 대소문자 구분, 길이)] (대소문자 구분 그룹은 매칭 후 원문으로 검증)
+        patterns: Dict[str, List[Tuple[str, str, bool, int]]] = {}
+        for group, (keywords, case_sensitive) in groups.items():
+            self._order[group] = {}
+            for keyword in keywords:
+                if not keyword or keyword in self._order[group]:
+                    continue
+                self._order[group][keyword] = len(self._order[group])
+                patterns.setdefault(keyword.lower(), []).append((keyword, group, case_sensitive, len(keyword)))
+
+        self._automaton = None
+        self._pattern = None
+        if not patterns:
+            return
+        if use_automaton and AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for pattern, outputs in patterns.items():
+                self._automaton.add_word(pattern, tuple(outputs))
+            self._automaton.make_automaton()
+        else:
+            # 같은 시작 위치에서 함께 매칭되는 짧은 키워드(접두사)를 가장 긴 키워드의 출력에 포함
+            self._outputs = {
+                pattern: tuple(
+                    output
+                    for length in range(1, len(pattern) + 1)
+                    for output in patterns.get(pattern[:length], ())
+                )
+                for pattern in patterns
+            }
+            # 긴 키워드 우선 alternation → 각 시작 위치에서 가장 긴 키워드가 매칭됨
+            alternatives = sorted(patterns, key=len, reverse=True)
+            self._pattern = re.compile('|'.join(map(re.escape, alternatives)))
+
+    def find(self, text: str, field: str = 'body') -> List[KeywordHit]:
+        """텍스트 한 번 훑어서 모든 키워드 매칭 반환"""
+        if not text or (self._automaton is None and self._pattern is None):
+            return []
+
+        hits = []
+        append = hits.append
+        new_hit = tuple.__new__  # KeywordHit(...) 생성자보다 빠름 (매칭이 수천 개인 긴 본문 대비)
+        # 한글/영문 키워드 기준 lower()는 길이를 바꾸지 않으므로 offset은 원문 기준과 동일
+        lowered = text.lower()
+        if self._automaton is not None:
+            for last, outputs in self._automaton.iter(lowered):
+                end = last + 1
+                for keyword, group, case_sensitive, length in outputs:
+                    start = end - length
+                    if case_sensitive and text[start:end] != keyword:
+                        continue
+                    append(new_hit(KeywordHit, (keyword, group, field, start, end)))
+            return hits
+
+        search, prefix_outputs = self._pattern.search, self._outputs
+        match = search(lowered)
+        while match is not None:
+            start = match.start()
+            for keyword, group, case_sensitive, length in prefix_outputs[match.group()]:
+                end = start + length
+                if case_sensitive and text[start:end] != keyword:
+                    continue
+                append(new_hit(KeywordHit, (keyword, group, field, start, end)))
+            # 다음 위치부터 다시 검색 (겹치는 매칭 포함)
+            match = search(lowered, start + 1)
+        return hits
+
+    def scan_article(self, article: Dict[str, Any]) -> List[KeywordHit]:
+        """기사의 제목(title) / 본문(body) / 키워드(keywords) 필드를 각각 한 번씩 훑어 매칭 반환"""
+        hits = self.find(article.get('title') or '', field='title')
+        hits.extend(self.find(article.get('content') or '', field='body'))
+        keywords = article.get('keywords') or []
+        if keywords:
+            hits.extend(self.find(' '.join(keywords), field='keywords'))
+        return hits
+
+    def matched_keywords(self, text_or_hits, group: str) -> List[str]:
+        """
+        그룹에서 매칭된 키워드 목록 (중복 제거, 그룹 등록 순서 유지)
+
+        Args:
+            text_or_hits: 검사할 텍스트 또는 find()/scan_article() 결과
+            group: 키워드 그룹명
+        """
+        hits = self.find(text_or_hits) if isinstance(text_or_hits, str) else text_or_hits
+        order = self._order.get(group, {})
+        found = {hit.keyword for hit in hits if hit.group == group}
+        return sorted(found, key=order.__getitem__)
+
+    def keywords_by_group(self, hits: List[KeywordHit]) -> Dict[str, List[str]]:
+        """매칭 결과를 그룹별 키워드 목록으로 정리 (그룹 등록 순서 유지, 여러 호출부가 한 번의 스캔을 공유할 때 사용)"""
+        found: Dict[str, set] = {}
+        for hit in hits:
+            found.setdefault(hit.group, set()).add(hit.keyword)
+        return {
+            group: sorted(keywords, key=self._order[group].__getitem__)
+            for group, keywords in found.items()
+        }
+
+    def contains_any(self, text: str, group: str) -> bool:
+        """그룹 키워드가 하나라도 있는지 확인"""
+        return bool(self.matched_keywords(text, group))
+
+    def groups(self) -> List[str]:
+        """등록된 그룹명 목록"""
+        return list(self._order)
+
+
+# 공용 키워드 그룹: {그룹명: (키워드 목록, 대소문자 구분 여부)}
+KEYWORD_GROUPS: Dict[str, Tuple[List[str], bool]] = {
+    'config': (list(KEYWORDS), True),
+}
+
+_shared_matcher: Optional[KeywordMatcher] = None
+_shared_matcher_lock = threading.Lock()
+
+
+def register_keyword_group(name: str, keywords: Iterable[str], case_sensitive: bool = True):
+    """공용 매처에 키워드 그룹 등록 (다음 get_keyword_matcher() 호출 시 한 번 재컴파일)"""
+    global _shared_matcher
+    with _shared_matcher_lock:
+        KEYWORD_GROUPS[name] = (list(keywords), case_sensitive)
+        _shared_matcher = None
+
+
+def _section_trigger_groups() -> Dict[str, Tuple[List[str], bool]]:
+    """SectionConfig 섹션별 트리거 단어 그룹 (카드뉴스 모듈이 없으면 생략)"""
+    try:
+        from card_news.section_config import SectionConfig
+    except ImportError:
+        return {}
+    return {
+        f"section:{section_id}": (list(section.get('trigger_words', [])), False)
+        for section_id, section in SectionConfig.ALL_SECTIONS.items()
+        if section.get('trigger_words')
+    }
+
+
+def get_keyword_matcher() -> KeywordMatcher:
+    """config / 크롤러 / 섹션 트리거 키워드가 모두 컴파일된 공용 매처 반환"""
+    global _shared_matcher
+    with _shared_matcher_lock:
+        if _shared_matcher is None:
+            groups = dict(_section_trigger_groups())
+            groups.update(KEYWORD_GROUPS)
+            _shared_matcher = KeywordMatcher(groups)
+        return _shared_matcher
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔧 유사 중복 기사 탐지 (SimHash)
+- 정규화한 본문의 문자 n-gram으로 64비트 SimHash 지문 생성
+- 지문을 (최대 거리 + 1)개 구간으로 나눈 버킷 색인 → 후보만 해밍 거리 비교 (비둘기집 원리로 누락 없음)
+- 같은 기사가 다른 URL로 재게시된 경우를 LLM 요약 / Notion 기록 전에 걸러냄
+- SQLite에 지문 보관 (다음 실행에서도 이미 동기화된 기사와 비교)
+"""
+
+import os
+import re
+import sqlite3
+import hashlib
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.config import (
+    NEAR_DUP_INDEX_PATH, NEAR_DUP_MAX_DISTANCE, NEAR_DUP_SHINGLE_SIZE,
+    NEAR_DUP_MIN_LENGTH, NEAR_DUP_RETENTION_DAYS
+)
+
+_FINGERPRINT_BITS = 64
+_NOISE_PATTERN = re.compile(r'https?://\S+|[\w.+-]+@[\w-]+\.[\w.]+')  # URL / 기자 이메일
+_NON_WORD_PATTERN = re.compile(r'[\W_]+')  # 공백 / 문장부호 (띄어쓰기 차이 무시)
+
+
+def normalize_text(text: str) -> str:
+    """비교용 본문 정규화: URL/이메일 제거, 소문자화, 공백·문장부호 제거"""
+    text = _NOISE_PATTERN.sub(' ', text or '')
+    return _NON_WORD_PATTERN.sub('', text.lower())
+
+
+def simhash(text: str, shingle_size: int = NEAR_DUP_SHINGLE_SIZE) -> int:
+    """
+    정규화된 텍스트의 64비트 SimHash (문자 n-gram 빈도 가중)
+
+    Args:
+        text: normalize_text()를 거친 텍스트
+        shingle_size: 문자 n-gram 길이
+    """
+    if len(text) <= shingle_size:
+        shingles = Counter([text]) if text else Counter()
+    else:
+        shingles = Counter(text[i:i + shingle_size] for i in range(len(text) - shingle_size + 1))
+
+    weights = [0] * _FINGERPRINT_BITS
+    for shingle, count in shingles.items():
+        value = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(_FINGERPRINT_BITS):
+            weights[bit] += count if value >> bit & 1 else -count
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 지문의 해밍 거리"""
+    return bin(a ^ b).count('1')
+
+
+def _to_signed(value: int) -> int:
+    """SQLite INTEGER(부호 있는 64비트) 저장용 변환"""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _to_unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+@dataclass(frozen=True)
+class DuplicateMatch:
+    """유사 중복 판정 결과"""
+    url: str        # 먼저 등록된 원본 기사 URL
+    title: str      # 원본 기사 제목
+    distance: int   # 해밍 거리 (0이면 정규화 본문 기준 동일)
+
+
+class NearDuplicateIndex:
+    """
+    🔧 SimHash 기반 유사 중복 기사 색인
+
+    **특징**:
+    - check_and_add()는 판정과 등록을 한 번에 처리 (파이프라인 워커 여러 개가 동시에 호출해도 안전)
+    - 같은 URL 재수집은 중복이 아님 (업데이트 경로는 그대로 유지)
+    - 본문이 NEAR_DUP_MIN_LENGTH보다 짧으면 검사하지 않음 (짧은 공지끼리 오탐 방지)
+    - 디스크 반영은 commit() 시점에 한 번의 트랜잭션으로 처리
+    """
+
+    def __init__(self, path: str = NEAR_DUP_INDEX_PATH,
+                 max_distance: int = NEAR_DUP_MAX_DISTANCE,
+                 min_length: int = NEAR_DUP_MIN_LENGTH,
+                 retention_days: int = NEAR_DUP_RETENTION_DAYS):
+        self.path = path
+        self.max_distance = max(0, min(max_distance, _FINGERPRINT_BITS - 1))
+        self.min_length = min_length
+        self.stats = {'checked': 0, 'duplicates': 0, 'skipped_short': 0}
+
+        # 구간 나누기: 거리 ≤ max_distance인 두 지문은 적어도 한 구간이 완전히 같음
+        band_count = self.max_distance + 1
+        band_width, remainder = divmod(_FINGERPRINT_BITS, band_count)
+        self._bands: List[Tuple[int, int]] = []
+        offset = 0
+        for band in range(band_count):
+            width = band_width + (1 if band < remainder else 0)
+            self._bands.append((offset, (1 << width) - 1))
+            offset += width
+
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[int, int], List[str]] = {}
+        self._fingerprints: Dict[str, Tuple[int, str]] = {}  # 원본 URL → (지문, 제목)
+        self._duplicate_of: Dict[str, str] = {}              # 중복 URL → 원본 URL
+        self._pending: Dict[str, Tuple[int, str, str, Optional[str]]] = {}
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS article_fingerprints (
+                url TEXT PRIMARY KEY,
+                simhash INTEGER NOT NULL,
+                title TEXT,
+                first_seen TEXT NOT NULL,
+                duplicate_of TEXT
+            )
+        ''')
+        self._conn.commit()
+
+        # 보관 기간 내 지문만 메모리 색인에 적재 (오래된 기사의 재게시는 새 기사로 취급)
+        cutoff = (datetime.now() - timedelta(days=retention_days)).isoformat(timespec='seconds')
+        rows = self._conn.execute(
+            'SELECT url, simhash, title, duplicate_of FROM article_fingerprints WHERE first_seen >= ?', (cutoff,)
+        ).fetchall()
+        for url, fingerprint, title, duplicate_of in rows:
+            if duplicate_of:
+                self._duplicate_of[url] = duplicate_of
+            else:
+                self._index(url, _to_unsigned(fingerprint), title or '')
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def _band_keys(self, fingerprint: int):
+        return [(band, fingerprint >> offset & mask) for band, (offset, mask) in enumerate(self._bands)]
+
+    def _index(self, url: str, fingerprint: int, title: str):
+        self._fingerprints[url] = (fingerprint, title)
+        for key in self._band_keys(fingerprint):
+            self._buckets.setdefault(key, []).append(url)
+
+    def _nearest(self, fingerprint: int) -> Optional[Tuple[str, int]]:
+        """같은 구간 값을 가진 후보 중 max_distance 이내 가장 가까운 원본"""
+        best = None
+        seen = set()
+        for key in self._band_keys(fingerprint):
+            for url in self._buckets.get(key, ()):
+                if url in seen:
+                    continue
+                seen.add(url)
+                distance = hamming_distance(fingerprint, self._fingerprints[url][0])
+                if distance <= self.max_distance and (best is None or distance < best[1]):
+                    best = (url, distance)
+        return best
+
+    def check_and_add(self, article: Dict[str, Any]) -> Optional[DuplicateMatch]:
+        """
+        기사가 이미 색인된 기사와 유사 중복인지 확인하고 색인에 등록
+
+        Args:
+            article: 'url', 'title', 'content'를 가진 기사
+
+        Returns:
+            DuplicateMatch: 중복이면 원본 정보, 새 기사(또는 검사 생략)면 None
+        """
+        url = article.get('url') or ''
+        title = article.get('title') or ''
+        text = normalize_text(article.get('content') or '')
+        if len(text) < self.min_length:
+            with self._lock:
+                self.stats['skipped_short'] += 1
+            return None
+
+        fingerprint = simhash(text)
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock:
+            self.stats['checked'] += 1
+
+            # 이전 실행에서 중복으로 판정된 URL
+            original_url = self._duplicate_of.get(url)
+            if original_url and original_url in self._fingerprints:
+                self.stats['duplicates'] += 1
+                original_fingerprint, original_title = self._fingerprints[original_url]
+                return DuplicateMatch(original_url, original_title,
+                                      hamming_distance(fingerprint, original_fingerprint))
+
+            # 같은 URL 재수집 → 원본 자신 (업데이트 허용)
+            if url in self._fingerprints:
+                return None
+
+            nearest = self._nearest(fingerprint)
+            if nearest:
+                original_url, distance = nearest
+                self.stats['duplicates'] += 1
+                if url:
+                    self._duplicate_of[url] = original_url
+                    self._pending[url] = (fingerprint, title, now, original_url)
+                return DuplicateMatch(original_url, self._fingerprints[original_url][1], distance)
+
+            if url:
+                self._index(url, fingerprint, title)
+                self._pending[url] = (fingerprint, title, now, None)
+            return None
+
+    def filter_article(self, article: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """파이프라인 단계용: 유사 중복이면 None (로그 출력), 아니면 기사 그대로 반환"""
+        match = self.check_and_add(article)
+        if match is None:
+            return article
+        print(f"[NearDup] 유사 중복 기사 건너뜀: {article.get('title', '제목 없음')} "
+              f"({article.get('url')}) → 원본: {match.title} ({match.url}, 거리 {match.distance})")
+        return None
+
+    def commit(self) -> int:
+        """
+        대기 중인 지문을 한 트랜잭션으로 기록
+
+        Returns:
+            int: 기록한 지문 수
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+            rows = [
+                (url, _to_signed(fingerprint), title, first_seen, duplicate_of)
+                for url, (fingerprint, title, first_seen, duplicate_of) in self._pending.items()
+            ]
+            try:
+                with self._conn:
+                    self._conn.executemany('''
+                        INSERT OR REPLACE INTO article_fingerprints (url, simhash, title, first_seen, duplicate_of)
+                        VALUES (?, ?, ?, ?, ?)
+                    ''', rows)
+            except sqlite3.Error as e:
+                print(f"[NearDup] ⚠️ 지문 커밋 실패 (다음 커밋에서 재시도): {e}")
+                return 0
+            self._pending.clear()
+            return len(rows)
+
+    def close(self):
+        """연결 종료 (커밋하지 않은 지문은 버림 - 동기화가 끝나지 않은 실행의 지문은 남기지 않음)"""
+        with self._lock:
+            self._pending.clear()
+            self._conn.close()
@@ -2,18 +2,19 @@ from typing import List, Dict, Any
 from datetime import datetime
 import re
 from config.config import KEYWORDS
+from processors.keyword_matcher import get_keyword_matcher
 
 class NewsProcessor:
     def __init__(self):
         self.keywords = KEYWORDS
 
     def contains_keywords(self, text: str) -> bool:
-        """Check if text contains any of the keywords"""
-        return any(keyword in text for keyword in self.keywords)
+        """Check if text contains any of the keywords (shared keyword matcher)"""
+        return get_keyword_matcher().contains_any(text, 'config')
 
     def extract_keywords(self, text: str) -> List[str]:
-        """Extract keywords from text"""
-        return [keyword for keyword in self.keywords if keyword in text]
+        """Extract keywords from text (shared keyword matcher)"""
+        return get_keyword_matcher().matched_keywords(text, 'config')
 
     def clean_text(self, text: str) -> str:
         """Clean text by removing extra whitespace and special characters"""
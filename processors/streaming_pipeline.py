@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔧 단계별 스트리밍 파이프라인
+- 입력 이터러블 → 단계1 → 단계2 → ... 순서로 항목을 하나씩 흘려보냄
+- 단계마다 독립된 워커 수 + 크기 제한 큐 (가득 차면 앞 단계가 대기 → backpressure)
+- 단계 함수가 None을 반환하면 해당 항목은 그 단계에서 제외
+- 항목 하나의 예외는 그 항목만 버리고 파이프라인은 계속 진행
+- 단계별 처리 시간 / 건수는 공용 텔레메트리(crawlers.telemetry)에도 기록
+"""
+
+import time
+import queue
+import threading
+import traceback
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from config.config import PIPELINE_QUEUE_SIZE
+from crawlers.telemetry import get_metrics
+
+
+_END = object()  # 단계 종료 신호
+
+
+@dataclass
+class Stage:
+    """파이프라인 단계 정의"""
+    name: str
+    func: Callable[[Any], Optional[Any]]
+    workers: int = 1
+    queue_size: int = PIPELINE_QUEUE_SIZE
+
+
+class StreamingPipeline:
+    """
+    🔧 스레드 + 크기 제한 큐 기반 단계별 파이프라인
+
+    **사용 예**:
+        pipeline = StreamingPipeline([
+            Stage('detail', crawler.fetch_article_details, workers=8),
+            Stage('notion', lambda a: notion.sync_article(a, database_id), workers=2),
+        ])
+        for result in pipeline.run(crawler.iter_recent_articles()):
+            ...
+
+    결과는 완료되는 순서대로 생성되며 입력 순서는 보장하지 않습니다.
+    """
+
+    def __init__(self, stages: List[Stage], name: str = 'Pipeline'):
+        if not stages:
+            raise ValueError("파이프라인 단계가 하나 이상 필요합니다")
+        self.stages = stages
+        self.name = name
+        self.stats = {stage.name: {'in': 0, 'out': 0, 'dropped': 0, 'errors': 0} for stage in stages}
+        self._stats_lock = threading.Lock()
+        self.metrics = get_metrics()
+
+    def _count(self, stage_name: str, key: str):
+        with self._stats_lock:
+            self.stats[stage_name][key] += 1
+        self.metrics.incr('pipeline_items_total', pipeline=self.name, stage=stage_name, result=key)
+
+    def _feed(self, source: Iterable[Any], out_queue: queue.Queue, stop: threading.Event):
+        """입력 이터러블을 첫 단계 큐로 전달 (큐가 가득 차면 대기)"""
+        try:
+            for item in source:
+                if stop.is_set():
+                    break
+                out_queue.put(item)
+        except Exception as e:
+            print(f"[{self.name}] ❌ 입력 단계 오류 - 이후 입력 중단: {type(e).__name__} - {e}")
+            print(traceback.format_exc())
+        finally:
+            out_queue.put(_END)
+
+    def _work(self, stage: Stage, in_queue: queue.Queue, out_queue: queue.Queue,
+              remaining: List[int], lock: threading.Lock):
+        """단계 워커: 종료 신호를 받을 때까지 항목 처리"""
+        while True:
+            item = in_queue.get()
+            if item is _END:
+                in_queue.put(_END)  # 같은 단계의 다른 워커도 종료하도록 되돌려 놓음
+                break
+
+            self._count(stage.name, 'in')
+            started = time.perf_counter()
+            try:
+                result = stage.func(item)
+            except Exception as e:
+                self._count(stage.name, 'errors')
+                print(f"[{self.name}:{stage.name}] ❌ 항목 처리 실패: {type(e).__name__} - {e}")
+                continue
+            finally:
+                self.metrics.observe('pipeline_stage_seconds', time.perf_counter() - started,
+                                     pipeline=self.name, stage=stage.name)
+
+            if result is None:
+                self._count(stage.name, 'dropped')
+                continue
+            self._count(stage.name, 'out')
+            out_queue.put(result)
+
+        # 단계의 마지막 워커가 다음 단계에 종료 신호 전달
+        with lock:
+            remaining[0] -= 1
+            last_worker = remaining[0] == 0
+        if last_worker:
+            out_queue.put(_END)
+
+    def run(self, source: Iterable[Any]) -> Iterator[Any]:
+        """
+        파이프라인 실행 (마지막 단계 결과를 완료 순서대로 생성)
+
+        Args:
+            source: 첫 단계에 넣을 항목 이터러블 (제너레이터면 별도 스레드에서 소비)
+
+        Yields:
+            마지막 단계 함수의 반환값
+        """
+        queues = [queue.Queue(maxsize=max(1, stage.queue_size)) for stage in self.stages]
+        queues.append(queue.Queue(maxsize=max(1, self.stages[-1].queue_size)))
+        stop = threading.Event()
+
+        threads = [threading.Thread(target=self._feed, args=(source, queues[0], stop),
+                                    name=f'{self.name}-source', daemon=True)]
+        for index, stage in enumerate(self.stages):
+            workers = max(1, stage.workers)
+            remaining, lock = [workers], threading.Lock()
+            for worker_no in range(workers):
+                threads.append(threading.Thread(
+                    target=self._work,
+                    args=(stage, queues[index], queues[index + 1], remaining, lock),
+                    name=f'{self.name}-{stage.name}-{worker_no}',
+                    daemon=True
+                ))
+
+        print(f"[{self.name}] 시작: " + ' → '.join(f"{stage.name}({max(1, stage.workers)})" for stage in self.stages))
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                result = queues[-1].get()
+                if result is _END:
+                    break
+                yield result
+        finally:
+            # 소비자가 중간에 멈춘 경우 입력 중단 (진행 중인 항목은 daemon 스레드에서 마무리)
+            stop.set()
+
+        for thread in threads:
+            thread.join()
+
+        summary = ', '.join(f"{name}: {s['in']}→{s['out']}" for name, s in self.stats.items())
+        print(f"[{self.name}] 완료 ({summary})")
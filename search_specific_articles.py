@@ -1,55 +1,110 @@
 #!/usr/bin/env python3
 """
 특정 기사를 날짜 제한 없이 검색하는 스크립트
+- 전기신문 사이트 검색(sc_word)을 requests로 여러 검색어 동시에 조회 (결과 페이지 HTTP 캐시)
+- 검색 결과는 일반 크롤링과 같은 상세 → 유사 중복 제거 → 요약 → Notion 파이프라인으로 기록
+
+사용 예:
+    python search_specific_articles.py "대구 데이터센터" "출력제어 9TWh"
+    python search_specific_articles.py ESS 하향예비력 --pages 3 --days 30 --dry-run
 """
+import sys
+import argparse
+from datetime import datetime, timedelta
+
+from dotenv import load_dotenv
+
+from config.config import (
+    SEARCH_MAX_PAGES, NEAR_DUP_ENABLED,
+    PIPELINE_DETAIL_WORKERS, PIPELINE_SUMMARY_WORKERS, PIPELINE_NOTION_WORKERS
+)
 from crawlers.electimes_crawler import ElectimesCrawler
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-import time
-
-def search_articles():
-    """특정 키워드로 전기신문 검색"""
-    
-    # Selenium 설정
-    options = webdriver.ChromeOptions()
-    options.add_argument('--headless')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    
-    driver = webdriver.Chrome(options=options)
-    
+from crawlers.telemetry import export_metrics
+from notion.notion_client import NotionClient
+from processors.streaming_pipeline import Stage, StreamingPipeline
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='전기신문 검색어 기반 기사 수집')
+    parser.add_argument('terms', nargs='+', help='검색어 (여러 개 동시 검색)')
+    parser.add_argument('--pages', type=int, default=SEARCH_MAX_PAGES,
+                        help=f'검색어별 최대 결과 페이지 수 (기본: {SEARCH_MAX_PAGES})')
+    parser.add_argument('--days', type=int, default=None,
+                        help='최근 N일 이내 기사만 (기본: 날짜 제한 없음)')
+    parser.add_argument('--resync', action='store_true',
+                        help='이미 수집한 URL도 다시 Notion에 기록')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='검색 결과만 출력하고 상세 수집/Notion 기록은 하지 않음')
+    return parser.parse_args(argv)
+
+
+def search_articles(argv=None) -> int:
+    """검색어로 전기신문 검색 후 Notion 동기화"""
+    args = parse_args(argv)
+    load_dotenv()
+
+    notion = NotionClient()
+    crawler = ElectimesCrawler(notion, use_watermark=False)
+    try:
+        return _sync_search_results(args, notion, crawler)
+    finally:
+        crawler.close()
+
+
+def _sync_search_results(args, notion: NotionClient, crawler: ElectimesCrawler) -> int:
+    """검색 결과 → 상세 → 유사 중복 제거 → 요약 → Notion (성공한 기사만 URL 이력에 기록)"""
+    since = datetime.now() - timedelta(days=args.days) if args.days else None
+
+    results = crawler.iter_search_articles(args.terms, max_pages=args.pages, since=since)
+    if not args.resync:
+        results = (article for article in results if article['url'] not in crawler.crawled_urls)
+
+    if args.dry_run:
+        count = 0
+        for count, article in enumerate(results, 1):
+            print(f"\n{count}. [{article['search_term']}] {article['title']}")
+            print(f"   날짜: {article['published_date']}")
+            print(f"   URL: {article['url']}")
+        print(f"\n검색 결과: {count}개")
+        return 0
+
+    database_id = notion.get_weekly_database_id()
+    if not database_id:
+        print("❌ Notion 데이터베이스 ID를 가져올 수 없습니다")
+        return 1
+
+    stages = [
+        Stage('detail', crawler.fetch_article_details, workers=PIPELINE_DETAIL_WORKERS),
+        Stage('tag', crawler.select_search_result),
+    ]
+    near_duplicates = None
+    if NEAR_DUP_ENABLED:
+        from processors.near_duplicate import NearDuplicateIndex
+        near_duplicates = NearDuplicateIndex()
+        stages.append(Stage('dedup', near_duplicates.filter_article))
+    stages += [
+        Stage('summary', notion.prepare_article, workers=PIPELINE_SUMMARY_WORKERS),
+        Stage('notion', lambda article: (
+            article if notion.sync_article(article, database_id) else None
+        ), workers=PIPELINE_NOTION_WORKERS),
+    ]
+
     try:
-        # 검색할 키워드들
-        search_terms = ["대구 데이터센터", "출력제어 9TWh"]
-        
-        for term in search_terms:
-            print(f"\n🔍 '{term}' 검색 중...")
-            
-            # 전기신문 검색 페이지
-            search_url = f"https://www.electimes.com/news/articleList.html?sc_word={term}"
-            driver.get(search_url)
-            time.sleep(2)
-            
-            # 검색 결과 확인
-            articles = driver.find_elements(By.CSS_SELECTOR, "section.article-list-content")
-            
-            print(f"검색 결과: {len(articles)}개")
-            
-            # 상위 5개 결과 출력
-            for i, article in enumerate(articles[:5]):
-                try:
-                    title_elem = article.find_element(By.CSS_SELECTOR, "h4.titles")
-                    date_elem = article.find_element(By.CSS_SELECTOR, "em.dates")
-                    link_elem = article.find_element(By.CSS_SELECTOR, "a")
-                    
-                    print(f"\n{i+1}. {title_elem.text}")
-                    print(f"   날짜: {date_elem.text}")
-                    print(f"   URL: {link_elem.get_attribute('href')}")
-                except:
-                    continue
-                    
+        synced = 0
+        for article in StreamingPipeline(stages, name='Search→Notion').run(results):
+            crawler.save_crawled_url(article['url'])  # Notion 기록에 성공한 기사만 (실패하면 다음 실행에서 재시도)
+            synced += 1
+        notion.drain_enrichment()
+        crawler.crawled_urls.commit()
+        if near_duplicates is not None:
+            near_duplicates.commit()
     finally:
-        driver.quit()
+        if near_duplicates is not None:
+            near_duplicates.close()
+        export_metrics()
+    print(f"🎉 검색 기사 Notion 기록 완료: {synced}건")
+    return 0
+
 
 if __name__ == "__main__":
-    search_articles()
+    sys.exit(search_articles())
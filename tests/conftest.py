@@ -0,0 +1,6 @@
+"""pytest 공용 설정: 저장소 루트를 import 경로에 추가"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,54 @@
+"""백필 코디네이터: 페이지 단위 백필을 지원하지 않는 소스는 샤드를 만들기 전에 제외"""
+
+import pytest
+
+from crawlers import backfill, registry
+from crawlers.backfill import BackfillCoordinator
+from crawlers.base_crawler import BaseCrawler
+from crawlers.url_index import UrlIndex
+
+
+class PagedCrawler(BaseCrawler):
+    supports_backfill = True
+
+    def crawl_pages(self, pages):
+        return {'articles': [], 'listed': 0, 'exhausted': True}
+
+
+class ListingOnlyCrawler(BaseCrawler):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def fake_registry(monkeypatch):
+    monkeypatch.setattr(registry, 'load_builtin_crawlers', lambda: None)
+    monkeypatch.setattr(registry, 'CRAWLER_REGISTRY', {'페이지': PagedCrawler, '목록': ListingOnlyCrawler})
+
+
+def test_backfill_sources_drops_unsupported_and_unregistered(capsys):
+    assert registry.backfill_sources(['목록', '페이지', '미등록']) == ['페이지']
+    output = capsys.readouterr().out
+    assert '지원하지 않는 소스 제외: 목록' in output
+    assert '등록된 크롤러가 없는 소스 제외: 미등록' in output
+
+
+def test_run_shards_only_supported_sources(tmp_path, monkeypatch):
+    monkeypatch.setattr(backfill, 'NEAR_DUP_ENABLED', False)
+    monkeypatch.setattr(backfill, 'UrlIndex', lambda: UrlIndex(str(tmp_path / 'urls.db'), legacy_json=None))
+    coordinator = BackfillCoordinator(sources=['목록', '페이지'], dry_run=True)
+    sharded = []
+
+    def iter_shard_results(first_page, last_page):
+        sharded.extend(backfill.plan_shards(coordinator.sources, first_page, last_page, shard_size=2))
+        return iter([])
+
+    monkeypatch.setattr(coordinator, '_iter_shard_results', iter_shard_results)
+
+    coordinator.run(1, 4)
+    assert sharded == [('페이지', [1, 2]), ('페이지', [3, 4])]
+
+
+def test_run_without_supported_sources_submits_nothing(monkeypatch):
+    coordinator = BackfillCoordinator(sources=['목록'], dry_run=True)
+    monkeypatch.setattr(coordinator, '_iter_shard_results', lambda first, last: pytest.fail('샤드 제출'))
+    assert coordinator.run(1, 4)['shards'] == 0
@@ -0,0 +1,46 @@
+"""본문 추출기 캐시: 일부 파싱(strained) 결과가 전체 파싱 결과로 재사용되지 않는지"""
+
+import pytest
+
+pytest.importorskip('bs4')
+
+from crawlers.content_extractor import ContentExtractor
+from crawlers.html_parser import ARTICLE_BODY_STRAINER, parse_html
+
+PARAGRAPH = '전력거래소는 올해 여름철 전력 수급 대책을 발표하고 예비력 확보 방안을 설명했다. '
+
+HTML = f"""
+<html><head><meta property="article:published_time" content="2025-06-01"></head>
+<body>
+  <article><p>짧은 요약 문단</p></article>
+  <div id="article-view-content-div">
+    <p>{PARAGRAPH * 3}</p>
+    <p>{PARAGRAPH * 2}</p>
+  </div>
+</body></html>
+"""
+
+
+@pytest.fixture
+def extractor(tmp_path):
+    extractor = ContentExtractor(cache_path=str(tmp_path / 'extract.db'), min_paragraph_chars=5)
+    yield extractor
+    extractor.close()
+
+
+def test_parse_mode_is_part_of_cache_key():
+    assert ContentExtractor.content_hash(HTML, ['#a']) != ContentExtractor.content_hash(HTML, ['#a'], 'strained')
+
+
+def test_strained_result_is_not_reused_for_full_parse(extractor):
+    selectors = ['#article-view-content-div']
+    strained = extractor.extract(HTML, parse_html(HTML, parse_only=ARTICLE_BODY_STRAINER),
+                                 selectors=selectors, parse_mode='strained')
+    full = extractor.extract(HTML, parse_html(HTML), selectors=selectors)
+
+    assert PARAGRAPH.strip() not in strained
+    assert PARAGRAPH.strip() in full
+    assert extractor.stats == {'hits': 0, 'misses': 2, 'empty': 0}
+
+    assert extractor.extract(HTML, selectors=selectors) == full
+    assert extractor.stats['hits'] == 1
@@ -0,0 +1,88 @@
+"""크롤링 체크포인트: --resume 시 끝난 단계 재사용 / Notion 기록까지 끝난 기사 제외"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from crawlers.crawl_checkpoint import CrawlCheckpoint
+
+PUBLISHED = datetime(2025, 6, 1, 9, 30)
+
+
+class FakeSources(list):
+    """MultiSourceCrawl처럼 (크롤러, 기사) 쌍 + crawlers / failed_sources 제공"""
+
+    def __init__(self, crawler, urls):
+        super().__init__((crawler, {'url': url, 'title': url}) for url in urls)
+        self.crawlers = [crawler]
+        self.failed_sources = []
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'checkpoint.db')
+
+
+@pytest.fixture
+def crawler():
+    return SimpleNamespace(source_name='전기신문')
+
+
+def _run(checkpoint, sources, calls, fail_notion_for=()):
+    """목록 → 상세 → Notion 단계를 순서대로 실행 (fail_notion_for URL에서 중단)"""
+    detail = checkpoint.checkpointed('detail', lambda c, a: (
+        calls.append(('detail', a['url'])) or {**a, 'content': '본문', 'published_date': PUBLISHED}))
+    notion = checkpoint.checkpointed('notion', lambda c, a: (
+        calls.append(('notion', a['url'])) or {'id': f"page-{a['url']}"}))
+    for c, article in checkpoint.track_listing(sources):
+        detailed = detail(c, article)
+        if article['url'] in fail_notion_for:
+            raise RuntimeError('중단')
+        notion(c, detailed)
+
+
+def test_resume_reuses_finished_stages(path, crawler):
+    sources = FakeSources(crawler, ['a', 'b'])
+    checkpoint = CrawlCheckpoint(path)
+    checkpoint.start()
+    first_calls = []
+    with pytest.raises(RuntimeError):
+        _run(checkpoint, sources, first_calls, fail_notion_for={'b'})
+    checkpoint.close()
+    assert first_calls == [('detail', 'a'), ('notion', 'a'), ('detail', 'b')]
+
+    checkpoint = CrawlCheckpoint(path)
+    assert checkpoint.start(resume=True) == {'listed': 0, 'detail': 1, 'summary': 0, 'notion': 1}
+    assert checkpoint.completed('b', 'detail')['published_date'] == PUBLISHED  # datetime 복원
+
+    resumed_calls = []
+    _run(checkpoint, sources, resumed_calls)
+    assert resumed_calls == [('notion', 'b')]  # a는 목록에서 제외, b는 상세 재요청 없음
+    assert checkpoint.stats['skipped_synced'] == 1
+    assert checkpoint.stats['resumed'] == 1
+    checkpoint.close()
+
+
+def test_start_without_resume_discards_previous_run(path, crawler):
+    checkpoint = CrawlCheckpoint(path)
+    checkpoint.start()
+    _run(checkpoint, FakeSources(crawler, ['a']), [])
+    checkpoint.close()
+
+    checkpoint = CrawlCheckpoint(path)
+    checkpoint.start(resume=False)
+    assert len(checkpoint) == 0
+    assert checkpoint.completed('a', 'detail') is None
+    checkpoint.close()
+
+
+def test_earlier_stage_does_not_overwrite_later_stage(path, crawler):
+    checkpoint = CrawlCheckpoint(path)
+    checkpoint.start()
+    checkpoint.checkpointed('notion', lambda c, a: {'id': 'page-a'})(crawler, {'url': 'a'})
+    checkpoint.checkpointed('detail', lambda c, a: {'url': 'a', 'content': '다시'})(crawler, {'url': 'a'})
+
+    assert checkpoint.stage_counts()['notion'] == 1
+    assert checkpoint.completed('a', 'detail') == {'id': 'page-a'}
+    checkpoint.close()
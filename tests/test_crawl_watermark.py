@@ -0,0 +1,97 @@
+"""CrawlWatermark 저장/병합 테스트"""
+
+import json
+from datetime import datetime, timedelta
+
+from crawlers.crawl_watermark import CrawlWatermark, WatermarkProgress
+
+
+def test_sequential_saves_from_two_sources_keep_both_marks(tmp_path):
+    path = str(tmp_path / 'watermark.json')
+    # 기존 실행의 워터마크
+    old = datetime(2025, 6, 1, 9, 0)
+    seed = CrawlWatermark(path=path)
+    seed.advance('전기신문', 1000, old)
+    seed.advance('한국전력거래소:notice', 50, old)
+    seed.save()
+
+    # 소스별 크롤러가 각자 인스턴스를 가진 경우 (시작 시점의 파일 내용을 로드)
+    electimes = CrawlWatermark(path=path)
+    kpx = CrawlWatermark(path=path)
+    new = old + timedelta(days=1)
+    electimes.advance('전기신문', 1100, new)
+    kpx.advance('한국전력거래소:notice', 60, new)
+    electimes.save()
+    kpx.save()  # 오래된 전기신문 워터마크로 덮어쓰면 안 됨
+
+    reloaded = CrawlWatermark(path=path)
+    assert reloaded.get('전기신문') == {'idxno': 1100, 'published_date': new}
+    assert reloaded.get('한국전력거래소:notice') == {'idxno': 60, 'published_date': new}
+
+
+def test_save_only_writes_advanced_sources(tmp_path):
+    path = str(tmp_path / 'watermark.json')
+    first = CrawlWatermark(path=path)
+    second = CrawlWatermark(path=path)
+    first.advance('전기신문', 10, datetime(2025, 6, 2))
+    first.save()
+    second.save()  # 아무것도 전진하지 않은 인스턴스의 저장
+
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f)['전기신문']['idxno'] == 10
+    assert second.get('전기신문')['idxno'] == 10  # 저장 후 파일 내용 반영
+
+
+def test_advance_never_moves_backwards(tmp_path):
+    watermark = CrawlWatermark(path=str(tmp_path / 'watermark.json'))
+    watermark.advance('전기신문', 200, datetime(2025, 6, 2))
+    watermark.advance('전기신문', 150, datetime(2025, 6, 1))
+    assert watermark.get('전기신문') == {'idxno': 200, 'published_date': datetime(2025, 6, 2)}
+
+
+def test_is_covered_respects_overlap_and_newer_idxno(tmp_path):
+    watermark = CrawlWatermark(path=str(tmp_path / 'watermark.json'), overlap_hours=6)
+    mark = datetime(2025, 6, 2, 12, 0)
+    watermark.advance('전기신문', 500, mark)
+    assert not watermark.is_covered('전기신문', 400, mark - timedelta(hours=3))  # overlap 구간
+    assert watermark.is_covered('전기신문', 400, mark - timedelta(hours=7))
+    assert not watermark.is_covered('전기신문', 501, mark - timedelta(hours=7))  # 더 큰 idxno
+
+
+def test_progress_stops_before_oldest_unprocessed_article():
+    progress = WatermarkProgress()
+    base = datetime(2025, 6, 2, 9, 0)
+    for idxno, hours in [(103, 30), (102, 20), (101, 10), (100, 0)]:
+        progress.listed('전기신문', f'u{idxno}', idxno, base + timedelta(hours=hours))
+    for url in ('u103', 'u101', 'u100'):
+        progress.processed(url)
+
+    assert progress.pending('전기신문') == 1
+    assert progress.safe_mark('전기신문') == (101, base + timedelta(hours=10))
+
+    progress.processed('u102')
+    assert progress.safe_mark('전기신문') == (103, base + timedelta(hours=30))
+    assert progress.safe_mark('한국전력거래소:notice') is None
+
+
+def test_unprocessed_article_is_listed_again_next_run(tmp_path):
+    path = str(tmp_path / 'watermark.json')
+    base = datetime(2025, 6, 2, 9, 0)
+    listing = [(f'u{idxno}', idxno, base + timedelta(hours=hours))
+               for idxno, hours in [(103, 30), (102, 20), (101, 10), (100, 0)]]
+
+    # 1회차: u102 상세 수집 실패 (처리 완료로 기록되지 않음)
+    watermark = CrawlWatermark(path=path, overlap_hours=6)
+    progress = WatermarkProgress()
+    for url, idxno, published_date in listing:
+        progress.listed('전기신문', url, idxno, published_date)
+        if url != 'u102':
+            progress.processed(url)
+    watermark.advance('전기신문', *progress.safe_mark('전기신문'))
+    watermark.save()
+
+    # 2회차: 워터마크가 u102를 덮지 않으므로 다시 목록 단계에 나옴
+    next_run = CrawlWatermark(path=path, overlap_hours=6)
+    relisted = [url for url, idxno, published_date in listing
+                if not next_run.is_covered('전기신문', idxno, published_date)]
+    assert 'u102' in relisted and 'u103' in relisted
@@ -0,0 +1,69 @@
+"""CrawledArticle: 기사 딕셔너리 API 호환 / pickle 후 키워드·출처 공유 유지"""
+
+import pickle
+from datetime import datetime
+
+import pytest
+
+from card_news.types import CrawledArticle, intern_keywords
+
+PUBLISHED = datetime(2025, 6, 1, 9, 30)
+
+
+@pytest.fixture
+def article():
+    return CrawledArticle.from_listing('전력 수급 대책 발표', 'https://example.com/1', PUBLISHED, '전기신문',
+                                       keywords=['ESS', '전력거래소'], view_count=3)
+
+
+def test_dict_style_access(article):
+    assert article['url'] == article.url == 'https://example.com/1'
+    assert article['published_date'] == article.date == PUBLISHED
+    assert article['view_count'] == 3  # 정해진 필드 외의 키는 metadata
+    assert article.get('missing', '기본값') == '기본값'
+    with pytest.raises(KeyError):
+        article['missing']
+
+    article['content'] = '본문'
+    article['summary'] = '요약'
+    article.update({'key_points': '핵심'}, llm_pending=True)
+    assert (article.content, article.summary, article.key_points) == ('본문', '요약', '핵심')
+    assert article.metadata == {'view_count': 3, 'llm_pending': True}
+    assert article.setdefault('attachments', ['x']) == []
+
+    assert 'published_date' in article and 'llm_pending' in article
+    assert 'date' not in article and 'metadata' not in article and 'missing' not in article
+
+
+def test_unpacks_like_article_dict(article):
+    unpacked = {**article}
+    assert unpacked['published_date'] == PUBLISHED
+    assert unpacked['source'] == '전기신문'
+    assert unpacked['view_count'] == 3
+    assert set(unpacked) == set(article.keys())
+    assert len(article) == len(unpacked)
+
+    exported = article.to_dict()
+    assert exported['keywords'] == ['ESS', '전력거래소']
+    assert exported == {**unpacked, 'keywords': ['ESS', '전력거래소']}
+
+
+def test_keywords_and_source_are_shared(article):
+    other = CrawledArticle.from_listing('다른 기사', 'https://example.com/2', PUBLISHED, '전기신문',
+                                        keywords=['ESS', '전력거래소'])
+    assert article.keywords is other.keywords is intern_keywords(['ESS', '전력거래소'])
+    assert article.source is other.source
+
+    article['keywords'] = ['ESS']
+    assert article.keywords == ('ESS',)
+
+
+def test_pickle_round_trip_keeps_fields_and_sharing(article):
+    article['content'] = '본문'
+    restored = pickle.loads(pickle.dumps(article))
+
+    assert restored == article
+    assert restored.to_dict() == article.to_dict()
+    assert restored.keywords is article.keywords  # 코디네이터 쪽에서도 같은 튜플 공유
+    assert restored.source is article.source
+    assert not hasattr(restored, '__dict__')
@@ -0,0 +1,43 @@
+"""크롤러 종료 정리: URL 이력 연결 종료 / 소스별 close() 호출"""
+
+from crawlers.base_crawler import BaseCrawler
+from crawlers.registry import MultiSourceCrawl
+from crawlers.url_index import UrlIndex
+
+
+class FakeCrawler(BaseCrawler):
+    def __init__(self, source_name: str, fail_on_close: bool = False):
+        self.source_name = source_name
+        self.fail_on_close = fail_on_close
+        self.closed = False
+
+    def crawl(self):
+        return []
+
+    def get_article_content(self, url):
+        return {}
+
+    def close(self):
+        self.closed = True
+        if self.fail_on_close:
+            raise RuntimeError('close failed')
+
+
+def test_url_index_close_without_commit_drops_pending(tmp_path):
+    path = str(tmp_path / 'urls.db')
+    index = UrlIndex(path, legacy_json=None)
+    index.add('https://example.com/committed')
+    index.commit()
+    index.add('https://example.com/pending')
+    index.close(commit=False)
+
+    reopened = UrlIndex(path, legacy_json=None)
+    assert 'https://example.com/committed' in reopened
+    assert 'https://example.com/pending' not in reopened
+    reopened.close()
+
+
+def test_multi_source_close_closes_every_crawler():
+    crawlers = [FakeCrawler('A', fail_on_close=True), FakeCrawler('B')]
+    MultiSourceCrawl(crawlers).close()
+    assert all(crawler.closed for crawler in crawlers)
@@ -0,0 +1,70 @@
+"""ElectimesCrawler 워터마크: 처리되지 않은 기사는 다음 실행에서 다시 목록에 나옴"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip('pandas')
+pytest.importorskip('googletrans')
+pytest.importorskip('konlpy')
+pytest.importorskip('sklearn')
+
+from card_news.types import CrawledArticle
+from crawlers.crawl_watermark import CrawlWatermark, WatermarkProgress
+from crawlers.electimes_crawler import ElectimesCrawler
+from crawlers.url_index import UrlIndex
+
+BASE_URL = 'https://www.electimes.com/news/articleView.html?idxno='
+
+
+@pytest.fixture
+def listing():
+    now = datetime.now()
+    return [CrawledArticle.from_listing(f'기사 {idxno}', f'{BASE_URL}{idxno}', now - timedelta(hours=hours), '전기신문')
+            for idxno, hours in [(303, 1), (302, 20), (301, 30), (300, 40)]]
+
+
+def _crawler(tmp_path, listing, failing_urls):
+    crawler = ElectimesCrawler.__new__(ElectimesCrawler)
+    crawler._source_name = '전기신문'
+    crawler.window_days = 7
+    crawler.use_watermark = True
+    crawler.watermark = CrawlWatermark(path=str(tmp_path / 'watermark.json'), overlap_hours=6)
+    crawler.crawled_urls = UrlIndex(str(tmp_path / 'urls.db'), legacy_json=None)
+    crawler.progress = WatermarkProgress()
+    crawler.ai_recommender = object()
+    crawler.vectorizer = object()
+    crawler.update_crawling_criteria = lambda: None
+    crawler._fetch_articles = lambda page, search_term=None: (
+        [CrawledArticle.from_listing(a.title, a.url, a.date, a.source) for a in listing] if page == 1 else [])
+    crawler.get_article_content = lambda url: (
+        None if url in failing_urls else {'content': '본문', 'attachments': [], 'published_date': None})
+    return crawler
+
+
+def _run(crawler):
+    """main.py 파이프라인처럼 목록 → 상세 → (기록 성공) 처리 완료 → 마무리"""
+    listed = []
+    for summary in crawler.iter_recent_articles():
+        listed.append(summary['url'])
+        detailed = crawler.fetch_article_details(summary)
+        if detailed is not None:
+            crawler.mark_processed(detailed)
+    crawler.finalize_crawl()
+    crawler.close()
+    return listed
+
+
+def test_failed_detail_fetch_is_listed_again_next_run(tmp_path, listing):
+    failed_url = f'{BASE_URL}302'
+    assert len(_run(_crawler(tmp_path, listing, failing_urls={failed_url}))) == 4
+
+    relisted = _run(_crawler(tmp_path, listing, failing_urls=set()))
+    assert failed_url in relisted
+    assert f'{BASE_URL}300' not in relisted  # 처리가 끝난 오래된 구간(overlap 밖)은 건너뜀
+
+
+def test_watermark_not_advanced_when_nothing_processed(tmp_path, listing):
+    crawler = _crawler(tmp_path, listing, failing_urls={a.url for a in listing})
+    _run(crawler)
+    assert crawler.watermark.get('전기신문') is None
@@ -0,0 +1,40 @@
+"""KPXCrawler 워터마크: 상세 수집에 실패한 글 이전까지만 전진"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip('pandas')
+pytest.importorskip('googletrans')
+
+from card_news.types import CrawledArticle
+from crawlers.crawl_watermark import CrawlWatermark, WatermarkProgress
+from crawlers.kpx_crawler import KPXCrawler
+
+NOTICE_URL = 'https://www.kpx.or.kr/www/notice/notice_view.do?seq='
+
+
+def test_crawl_does_not_advance_past_article_without_details(tmp_path, monkeypatch):
+    crawler = KPXCrawler.__new__(KPXCrawler)
+    crawler.source_name = '한국전력거래소'
+    crawler.use_watermark = True
+    crawler.watermark = CrawlWatermark(path=str(tmp_path / 'watermark.json'), overlap_hours=6)
+    crawler.progress = WatermarkProgress()
+    key = crawler._watermark_key('notice')
+
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    listing = [CrawledArticle.from_listing(f'공지 {seq}', f'{NOTICE_URL}{seq}', today - timedelta(days=days),
+                                           crawler.source_name, type='notice')
+               for seq, days in [(12, 0), (11, 1), (10, 2)]]
+
+    async def crawl_async(with_details=True):
+        for article in listing:
+            crawler.progress.listed(key, article.url, crawler._extract_item_id(article.url), article.date)
+        return [article for article in listing if article.url != f'{NOTICE_URL}11']  # 11번 상세 실패
+
+    monkeypatch.setattr(crawler, 'crawl_async', crawl_async)
+    monkeypatch.setattr(crawler, 'select_article', lambda article: article)
+    crawler.crawl()
+
+    assert crawler.watermark.get(key) == {'idxno': 10, 'published_date': today - timedelta(days=2)}
+    assert not crawler.watermark.is_covered(key, 11, today - timedelta(days=1))
@@ -0,0 +1,131 @@
+"""LLM 요약 보강 대기열: 기존 요약 보존 / 본문 변경 감지 / 실패 작업 시도 횟수 제한"""
+
+import threading
+import types
+
+import pytest
+
+pytest.importorskip('pandas')
+pytest.importorskip('googletrans')
+
+import notion.llm_enrichment as llm_enrichment
+import notion.notion_client as notion_client
+from notion.llm_enrichment import PENDING_KEY, LLMEnrichmentQueue
+
+DATABASE_ID = 'db'
+
+
+class FakePages:
+    def __init__(self):
+        self.calls = []
+
+    def create(self, parent, properties):
+        self.calls.append(('create', properties))
+        return {'id': f'created-{len(self.calls)}', 'properties': {}}
+
+    def update(self, page_id, properties):
+        self.calls.append(('update', page_id, properties))
+        return {'id': page_id}
+
+
+def _rich_text(value):
+    return {'rich_text': [{'plain_text': value, 'text': {'content': value}}]}
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    """LLM 호출 대체 (fail=True면 빈 결과)"""
+    state = {'calls': 0, 'fail': False}
+
+    def summary(content, use_llm=True):
+        state['calls'] += 1
+        return '' if state['fail'] else 'LLM 요약'
+
+    monkeypatch.setattr(llm_enrichment, 'generate_one_line_summary_with_llm', summary)
+    monkeypatch.setattr(llm_enrichment, 'generate_key_content',
+                        lambda content, use_llm=True: '' if state['fail'] else 'LLM 핵심 내용')
+    return state
+
+
+@pytest.fixture
+def notion(tmp_path, monkeypatch):
+    """API 호출 없이 URL 인덱스/보강 대기열만 갖춘 NotionClient"""
+    monkeypatch.setattr(notion_client, 'LLM_ENRICH_ENABLED', True)
+    client = notion_client.NotionClient.__new__(notion_client.NotionClient)
+    client.client = types.SimpleNamespace(pages=FakePages())
+    client.executor = notion_client.NotionRequestExecutor()
+    client.metrics = notion_client.get_metrics()
+    client._page_indexes = {DATABASE_ID: {}}
+    client._page_index_lock = threading.Lock()
+    client._mirror = None
+    client._mirror_lock = threading.Lock()
+    client._enrichment = LLMEnrichmentQueue(client, path=str(tmp_path / 'enrichment.db'))
+    client._enrichment_lock = threading.Lock()
+    yield client
+    client._enrichment.close()
+
+
+def _article(url, content):
+    return {'url': url, 'title': url, 'content': content, 'source': '전기신문', 'keywords': ['ESS']}
+
+
+def _existing_page(notion, url, summary, key_points, page_id='page-1'):
+    notion._page_indexes[DATABASE_ID][url] = {
+        'id': page_id,
+        'properties': {'출처': _rich_text('전기신문'), '한줄요약': _rich_text(summary),
+                       '핵심 내용': _rich_text(key_points),
+                       '키워드': {'multi_select': [{'name': 'ESS'}]}},
+    }
+
+
+def test_placeholder_does_not_overwrite_existing_summary(notion, llm):
+    _existing_page(notion, 'u1', '기존 LLM 요약', '기존 핵심 내용')
+
+    article = _article('u1', '전력 계통 안정화 방안을 발표했다. 두 번째 문장.')
+    result = notion.sync_article(article, DATABASE_ID)
+    notion.drain_enrichment()
+
+    assert result == {'id': 'page-1', 'title': 'u1'}
+    assert notion.client.pages.calls == []  # 기록할 변경 없음, 보강도 예약하지 않음
+    assert article[PENDING_KEY] is False
+    assert llm['calls'] == 0
+
+
+def test_changed_content_is_enriched_without_placeholder_write(notion, llm):
+    _existing_page(notion, 'u1', '기존 LLM 요약', '기존 핵심 내용')
+    notion.sync_article(_article('u1', '처음 본문입니다.'), DATABASE_ID)  # 본문 해시 기록
+
+    notion.sync_articles([_article('u1', '본문이 수정되었습니다.')], DATABASE_ID)
+    notion.drain_enrichment()
+
+    calls = notion.client.pages.calls
+    assert len(calls) == 1  # 자리표시 쓰기 없이 보강 패치만
+    _, page_id, properties = calls[0]
+    assert page_id == 'page-1'
+    assert properties['한줄요약']['rich_text'][0]['text']['content'] == 'LLM 요약'
+
+
+def test_empty_existing_summary_gets_placeholder_and_enrichment(notion, llm):
+    _existing_page(notion, 'u1', '', '')
+
+    notion.sync_article(_article('u1', '전력 계통 안정화 방안을 발표했다.'), DATABASE_ID)
+    notion.drain_enrichment()
+
+    calls = notion.client.pages.calls
+    assert len(calls) == 2  # 자리표시 기록 → LLM 보강
+    assert calls[-1][2]['한줄요약']['rich_text'][0]['text']['content'] == 'LLM 요약'
+
+
+def test_failed_jobs_are_dropped_after_max_attempts(notion, llm):
+    llm['fail'] = True
+    queue = notion._enrichment
+    article = queue.prepare(_article('u1', '보강에 계속 실패하는 본문.'))
+    assert queue.submit(article, DATABASE_ID, 'page-1')
+    queue.drain()
+
+    for _ in range(queue.MAX_ATTEMPTS - 1):
+        assert queue.resume_pending() == 1
+        queue.drain()
+
+    assert queue.resume_pending() == 0
+    assert llm['calls'] == queue.MAX_ATTEMPTS
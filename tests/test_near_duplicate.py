@@ -0,0 +1,86 @@
+"""유사 중복 색인: 구간(band) 나누기 / 해밍 거리 판정 / 재실행 간 유지"""
+
+import random
+
+import pytest
+
+from processors.near_duplicate import NearDuplicateIndex, hamming_distance, normalize_text, simhash
+
+ARTICLE = (
+    "한국전력거래소는 여름철 전력 수급 대책을 발표하고 최대 전력 수요가 역대 최고치를 기록할 것으로 전망했다. "
+    "거래소는 예비력 확보를 위해 발전기 정비 일정을 조정하고 수요 반응 자원을 확대 운영하기로 했다. "
+    "또한 태양광 출력 변동에 대비해 ESS 충방전 계획을 실시간으로 조정하는 방안을 마련했다."
+)
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = NearDuplicateIndex(str(tmp_path / 'near_dup.db'), max_distance=3, min_length=20)
+    yield index
+    index.close()
+
+
+def _flip(fingerprint: int, bits):
+    for bit in bits:
+        fingerprint ^= 1 << bit
+    return fingerprint
+
+
+@pytest.mark.parametrize('max_distance', [0, 3, 7, 10])
+def test_bands_cover_every_bit_once(tmp_path, max_distance):
+    index = NearDuplicateIndex(str(tmp_path / 'bands.db'), max_distance=max_distance)
+    covered = 0
+    for offset, mask in index._bands:
+        band_bits = mask << offset
+        assert covered & band_bits == 0
+        covered |= band_bits
+    assert covered == (1 << 64) - 1
+    assert len(index._bands) == max_distance + 1
+    index.close()
+
+
+def test_banding_finds_every_fingerprint_within_max_distance(index):
+    rng = random.Random(42)
+    for trial in range(200):
+        original = rng.getrandbits(64)
+        url = f'https://example.com/{trial}'
+        index._index(url, original, '원본')
+        near = _flip(original, rng.sample(range(64), rng.randint(0, index.max_distance)))
+        far = _flip(original, rng.sample(range(64), index.max_distance + 1))
+
+        assert index._nearest(near) == (url, hamming_distance(original, near))
+        nearest = index._nearest(far)
+        assert nearest is None or nearest[0] != url
+
+
+def test_repost_under_other_url_is_duplicate(index):
+    original = {'url': 'https://a.example/1', 'title': '원본', 'content': ARTICLE}
+    repost = {'url': 'https://b.example/9', 'title': '재게시',
+              'content': ARTICLE + ' 기자 reporter@example.com'}
+
+    assert index.check_and_add(original) is None
+    match = index.check_and_add(repost)
+    assert match is not None and match.url == original['url']
+    assert index.check_and_add(original) is None  # 같은 URL 재수집은 업데이트 경로
+    assert index.filter_article({'url': 'https://c.example/2', 'title': '다른 기사',
+                                 'content': '전혀 다른 내용의 기사 본문입니다. 원전 정비 일정이 발표되었다.'}) is not None
+
+
+def test_committed_fingerprints_survive_reopen(tmp_path):
+    path = str(tmp_path / 'near_dup.db')
+    index = NearDuplicateIndex(path, max_distance=3, min_length=20)
+    index.check_and_add({'url': 'https://a.example/1', 'title': '원본', 'content': ARTICLE})
+    index.check_and_add({'url': 'https://b.example/9', 'title': '재게시', 'content': ARTICLE})
+    assert index.commit() == 2
+    index.close()
+
+    reopened = NearDuplicateIndex(path, max_distance=3, min_length=20)
+    assert len(reopened) == 1
+    match = reopened.check_and_add({'url': 'https://b.example/9', 'title': '재게시', 'content': ARTICLE})
+    assert match is not None and match.url == 'https://a.example/1'
+    reopened.close()
+
+
+def test_simhash_ignores_spacing_and_punctuation():
+    spaced = ARTICLE.replace(' ', '  ').replace('.', ' .')
+    assert simhash(normalize_text(ARTICLE)) == simhash(normalize_text(spaced))
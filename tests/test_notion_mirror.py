@@ -0,0 +1,53 @@
+"""Notion 미러: 갱신 실패 시 읽기는 마지막 미러 사용, 쓰기용 URL 인덱스는 예외 전달"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from notion.notion_mirror import NotionMirror
+
+DATABASE_ID = 'db-0000-weekly'
+
+
+def _page(page_id, url):
+    return {
+        'id': page_id,
+        'created_time': '2025-06-01T09:00:00.000Z',
+        'last_edited_time': '2025-06-01T09:00:00.000Z',
+        'properties': {'제목': {'title': [{'plain_text': page_id}]}, '바로가기': {'url': url}},
+    }
+
+
+class FakeDatabases:
+    def __init__(self, pages):
+        self.pages = pages
+        self.fail = False
+
+    def query(self, **query):
+        if self.fail:
+            raise ConnectionError('Notion 응답 없음')
+        return {'results': list(self.pages), 'has_more': False}
+
+
+@pytest.fixture
+def databases():
+    return FakeDatabases([_page('page-a', 'https://example.com/a')])
+
+
+@pytest.fixture
+def mirror(tmp_path, databases):
+    mirror = NotionMirror(SimpleNamespace(databases=databases), path=str(tmp_path / 'mirror.db'), max_age=0)
+    mirror.refresh(DATABASE_ID)
+    databases.fail = True
+    yield mirror
+    mirror.close()
+
+
+def test_reads_fall_back_to_last_mirror(mirror):
+    assert [article['url'] for article in mirror.articles(DATABASE_ID)] == ['https://example.com/a']
+    assert set(mirror.page_index(DATABASE_ID)) == {'https://example.com/a'}
+
+
+def test_write_path_index_raises_when_refresh_fails(mirror):
+    with pytest.raises(ConnectionError):
+        mirror.page_index(DATABASE_ID, max_age=0, allow_stale=False)
@@ -0,0 +1,55 @@
+"""속도 제한기 httpx 전송 계층: 전송 오류도 서킷 상태에 반영"""
+
+import time
+
+import httpx
+import pytest
+
+from crawlers.rate_limiter import AdaptiveRateLimiter, CircuitOpenError, RateLimitedTransport
+
+HOST = 'api.notion.test'
+
+
+@pytest.fixture
+def limiter():
+    limiter = AdaptiveRateLimiter(host_overrides={})
+    limiter.configure_host(HOST, failure_threshold=1, cooldown=0.05, initial_rps=100, max_rps=100, burst=10)
+    return limiter
+
+
+def _client(limiter, responses):
+    def handler(request):
+        outcome = responses.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome)
+    return httpx.Client(transport=RateLimitedTransport(limiter, httpx.MockTransport(handler)))
+
+
+def test_probe_transport_error_reopens_circuit_instead_of_sticking(limiter):
+    client = _client(limiter, [503, httpx.ConnectTimeout('probe timed out'), 200])
+    url = f'https://{HOST}/v1/pages'
+
+    assert client.get(url).status_code == 503  # 서킷 차단
+    with pytest.raises(CircuitOpenError):
+        client.get(url)
+
+    time.sleep(0.06)
+    with pytest.raises(httpx.ConnectTimeout):
+        client.get(url)  # 반개방 시험 요청이 전송 오류로 실패 → 다시 차단
+    assert limiter.for_host(HOST).circuit == 'open'
+
+    time.sleep(0.06)
+    assert client.get(url).status_code == 200  # 새 시험 요청 허용 → 복구
+    assert limiter.for_host(HOST).circuit == 'closed'
+
+
+def test_non_transient_error_releases_probe(limiter):
+    client = _client(limiter, [503, ValueError('bad request body'), 200])
+    url = f'https://{HOST}/v1/pages'
+
+    client.get(url)
+    time.sleep(0.06)
+    with pytest.raises(ValueError):
+        client.get(url)
+    assert client.get(url).status_code == 200  # 시험 요청 자리가 반납됨
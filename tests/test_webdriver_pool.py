@@ -0,0 +1,52 @@
+"""WebDriver 풀: close_all() 이후 대여 중이던 드라이버는 반납 시 종료"""
+
+import pytest
+
+from crawlers.resource_managers import WebDriverPool
+
+
+class FakeDriver:
+    def __init__(self, number):
+        self.number = number
+        self.quit_count = 0
+
+    def quit(self):
+        self.quit_count += 1
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = WebDriverPool(size=2)
+    created = []
+
+    def create_driver():
+        created.append(FakeDriver(len(created)))
+        return created[-1]
+
+    monkeypatch.setattr(pool, '_create_driver', create_driver)
+    pool.created = created
+    return pool
+
+
+def test_close_all_quits_idle_now_and_borrowed_on_release(pool):
+    with pool.driver() as borrowed:
+        with pool.driver():
+            pass
+        idle = pool.created[1]  # 먼저 반납되어 대기 중
+
+        pool.close_all()
+        assert idle.quit_count == 1
+        assert borrowed.quit_count == 0  # 대여 중에는 종료하지 않음
+    assert borrowed.quit_count == 1  # 풀에 돌려놓지 않고 반납 시 종료
+
+    assert pool._count == 0 and pool._idle == [] and pool._all == []
+    pool.close_all()  # 두 번 호출해도 다시 종료하지 않음
+    assert [driver.quit_count for driver in pool.created] == [1, 1]
+
+
+def test_driver_after_close_all_raises(pool):
+    pool.close_all()
+    with pytest.raises(RuntimeError):
+        with pool.driver():
+            pass
+    assert pool.created == []
@@ -66,7 +66,7 @@ class InterestMonitor:
     def check_new_interests(self) -> List[Dict]:
         """새로운 관심 기사 확인"""
         try:
-            # 모든 주차의 관심 기사 가져오기
+            # 모든 주차의 관심 기사 가져오기 (로컬 미러 조회, 변경분만 Notion에서 갱신)
             logger.info("🔄 노션에서 관심 기사 확인 중...")
             interested = self.notion.get_interested_articles()
             